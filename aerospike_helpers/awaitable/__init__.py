@@ -13,3 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 ##########################################################################
+
+from .client import AsyncClient
+
+__all__ = ["AsyncClient"]
@@ -0,0 +1,100 @@
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+"""
+Coroutine facade over a connected :class:`aerospike.Client`.
+"""
+from aerospike_helpers.awaitable import io
+
+
+class AsyncClient:
+    """Expose the key-value and batch commands of a connected client as
+    coroutines.
+
+    Commands with an event loop binding in the C client are issued without
+    blocking the calling thread. ``batch_write``, ``batch_operate``,
+    ``batch_apply``, ``batch_remove`` and ``batch_get_ops`` have no such
+    binding and run in the event loop's default executor instead.
+
+    :meth:`aerospike.init_async` must be called before the client is connected.
+
+    .. code-block:: python
+
+        import aerospike
+        from aerospike_helpers.awaitable import AsyncClient
+
+        aerospike.init_async()
+        client = AsyncClient(aerospike.client(config).connect())
+
+        async def main():
+            await client.put(("test", "demo", 1), {"a": 1})
+            _, meta, bins = await client.get(("test", "demo", 1))
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    async def get(self, key, policy=None):
+        return await io.get(self.client, key, policy)
+
+    async def select(self, key, bins, policy=None):
+        return await io.select(self.client, key, bins, policy)
+
+    async def exists(self, key, policy=None):
+        return await io.exists(self.client, key, policy)
+
+    async def put(self, key, bins, meta=None, policy=None, serializer=None):
+        return await io.put(self.client, key, bins, meta, policy, serializer)
+
+    async def touch(self, key, val=0, meta=None, policy=None):
+        return await io.touch(self.client, key, val, meta, policy)
+
+    async def remove(self, key, meta=None, policy=None):
+        return await io.remove(self.client, key, meta, policy)
+
+    async def operate(self, key, list, meta=None, policy=None):
+        return await io.operate(self.client, key, list, meta, policy)
+
+    async def operate_ordered(self, key, list, meta=None, policy=None):
+        return await io.operate_ordered(self.client, key, list, meta, policy)
+
+    async def apply(self, key, module, function, args, policy=None):
+        return await io.apply(self.client, key, module, function, args, policy)
+
+    async def get_many(self, keys, policy=None):
+        return await io.get_many(self.client, keys, policy)
+
+    async def select_many(self, keys, bins, policy=None):
+        return await io.select_many(self.client, keys, bins, policy)
+
+    async def exists_many(self, keys, policy=None):
+        return await io.exists_many(self.client, keys, policy)
+
+    async def batch_get_ops(self, keys, ops, policy=None):
+        return await io._in_executor(self.client.batch_get_ops, keys, ops, policy)
+
+    async def batch_write(self, batch_records, policy_batch=None):
+        return await io._in_executor(self.client.batch_write, batch_records, policy_batch)
+
+    async def batch_operate(self, keys, ops, policy_batch=None, policy_batch_write=None):
+        return await io._in_executor(self.client.batch_operate, keys, ops, policy_batch, policy_batch_write)
+
+    async def batch_apply(self, keys, module, function, args, policy_batch=None, policy_batch_apply=None):
+        return await io._in_executor(
+            self.client.batch_apply, keys, module, function, args, policy_batch, policy_batch_apply
+        )
+
+    async def batch_remove(self, keys, policy_batch=None, policy_batch_remove=None):
+        return await io._in_executor(self.client.batch_remove, keys, policy_batch, policy_batch_remove)
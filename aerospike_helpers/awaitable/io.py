@@ -14,113 +14,193 @@
 # limitations under the License.
 ##########################################################################
 """
-Module with helper functions to do async get/put by
-the :mod:`aerospike.Client.awaitable` methods for the aerospike.client class.
+Module with coroutines wrapping the ``*_async`` methods of
+:class:`aerospike.Client`.
+
+Every call creates its own :class:`asyncio.Future` and hands the C client a
+callback closing over that future and the loop it belongs to. Nothing is shared
+between calls, so concurrent awaits on the same key, or on different event
+loops, cannot interfere with one another.
 """
 import asyncio
+import functools
 
-# TODO: fix ignored errors marked with noqa
+import aerospike
 
-_get_results = {}
-_get_cqd = 0
-_put_results = {}
-_put_cqd = 0
 
+def _resolve(fut, exception, result):
+    # Runs on the future's own loop. The awaiting task may have been cancelled
+    # while the command was in flight, in which case the result is dropped.
+    if fut.done():
+        return
+    if exception is not None:
+        fut.set_exception(exception)
+    else:
+        fut.set_result(result)
 
-async def _io_get_put(client, op=0, key=None, record=None, meta=None, policy=None, serialize=None):
-    global _get_cqd, _put_cqd
-    index = None
 
-    if key is not None:
-        if len(key) >= 3:
-            index = key[2]
-        if index is None:
-            if len(key) >= 4:
-                index = key[3]
+def _settle(loop, fut, exception, result):
+    # Callbacks run on the future's loop when the completion queue is drained
+    # there, otherwise on a C client event loop thread.
+    if asyncio._get_running_loop() is loop:
+        _resolve(fut, exception, result)
+    else:
+        loop.call_soon_threadsafe(_resolve, fut, exception, result)
 
-    if index is not None and isinstance(index, bytearray):
-        index = bytes(index)
 
-    # print(f"io:_io_get_put op:{op} key:{key} index:{index}")
+def attach_completion_queue(loop=None):
+    """Drain the async completion queue from ``loop``, or the running loop.
+
+    Requires :meth:`aerospike.init_async` to have been called with
+    ``completion_queue=True``. Must be called from the thread running the loop.
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    loop.add_reader(aerospike.async_completion_fd(), aerospike.process_async_completions)
 
-    def put_async_callback(key_tuple, err, exce):
-        global _put_cqd
 
-        _put_cqd -= 1
+def detach_completion_queue(loop=None):
+    """Stop draining the async completion queue from ``loop``."""
+    if loop is None:
+        loop = asyncio.get_running_loop()
+    loop.remove_reader(aerospike.async_completion_fd())
 
-        result = [key_tuple, err, exce]
-        _put_results[index]["result"] = result
 
-        # print(f"io:put_cb {_put_results[index]}")
+def _make_future():
+    loop = asyncio.get_running_loop()
+    return loop, loop.create_future()
 
-        loop = _put_results[index]["loop"]
-        fut = _put_results[index]["fut"]
 
-        if result[1][0] != 0:
-            # print(f"io:put_cb except:{result[2]}")
-            loop.call_soon_threadsafe(fut.set_exception, result[2])
+async def _call(method, *args):
+    """Issue a native ``*_async`` method whose callback receives
+    ``(result, err, exception)`` and wait for it."""
+    loop, fut = _make_future()
+
+    def callback(result, err, exce):
+        if exce is not None:
+            _settle(loop, fut, exce, None)
         else:
-            loop.call_soon_threadsafe(fut.set_result, result[1][0])
+            _settle(loop, fut, None, result)
+
+    method(callback, *args)
+    return await fut
+
+
+async def _in_executor(method, *args, **kwargs):
+    """Run a blocking client method in the loop's default executor.
+
+    Used for commands the C client has no event loop binding for.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(method, *args, **kwargs))
 
-    def get_async_callback(key_tuple, record_tuple, err, exce):
-        global _get_cqd
 
-        _get_cqd -= 1
+async def get(client, key=None, policy=None):
+    loop, fut = _make_future()
 
-        result = [key_tuple, record_tuple, err, exce]
-        _get_results[index]["result"] = result
+    def get_async_callback(key_tuple, record_tuple, err, exce):
+        if err[0] != 0:
+            _settle(loop, fut, exce, None)
+        else:
+            _settle(loop, fut, None, record_tuple)
 
-        # print(f"io:get_cb {_get_results[index]}")
+    client.get_async(get_async_callback, key, policy)
+    return await fut
 
-        loop = _get_results[index]["loop"]
-        fut = _get_results[index]["fut"]
 
-        if result[2][0] != 0:
-            # print(f"io:get_cb except:{result[3]}")
-            loop.call_soon_threadsafe(fut.set_exception, result[3])
+async def put(client, key=None, record=None, meta=None, policy=None, serialize=None):
+    loop, fut = _make_future()
+
+    def put_async_callback(key_tuple, err, exce):
+        if err[0] != 0:
+            _settle(loop, fut, exce, None)
         else:
-            loop.call_soon_threadsafe(fut.set_result, result[1])
+            _settle(loop, fut, None, err[0])
 
-    loop = asyncio.get_event_loop()
-    future = loop.create_future()
+    client.put_async(put_async_callback, key, record, meta, policy, serialize)
+    return await fut
 
-    context = {"loop": None, "fut": None, "result": None}
 
-    if index is not None:
-        if op == 0:
-            _put_results[index] = context
-            _put_results[index]["loop"] = loop
-            _put_results[index]["fut"] = future
-            _put_cqd += 1
-        elif op == 1:
-            _get_results[index] = context
-            _get_results[index]["loop"] = loop
-            _get_results[index]["fut"] = future
-            _get_cqd += 1
+async def select(client, key, bins, policy=None):
+    return await _call(client.select_async, key, bins, policy)
 
-    try:
-        if op == 0:
-            client.put_async(put_async_callback, key, record, meta, policy, serialize)
-        if op == 1:
-            client.get_async(get_async_callback, key, policy)
-    except Exception as e:
-        # print(f"io:post_get key:{key} except:{e} cqd:{[_get_cqd if op else _put_cqd]}")
-        raise e
 
-    await future
+async def exists(client, key, policy=None):
+    return await _call(client.exists_async, key, policy)
 
-    if index is not None:
-        if op == 0:
-            del _put_results[index]
-        if op == 1:
-            del _get_results[index]
 
-    return future.result()
+async def remove(client, key, meta=None, policy=None):
+    return await _call(client.remove_async, key, meta, policy)
 
 
-async def get(client, key=None, policy=None):
-    return await _io_get_put(client, 1, key, None, None, policy)
+async def operate(client, key, list, meta=None, policy=None):
+    return await _call(client.operate_async, key, list, meta, policy)
 
 
-async def put(client, key=None, record=None, meta=None, policy=None, serialize=None):
-    return await _io_get_put(client, 0, key, record, meta, policy, serialize)
+async def operate_ordered(client, key, list, meta=None, policy=None):
+    return await _call(client.operate_ordered_async, key, list, meta, policy)
+
+
+async def apply(client, key, module, function, args, policy=None):
+    return await _call(client.apply_async, key, module, function, args, policy)
+
+
+async def get_many(client, keys, policy=None):
+    return await _call(client.get_many_async, keys, policy)
+
+
+async def select_many(client, keys, bins, policy=None):
+    return await _call(client.select_many_async, keys, bins, policy)
+
+
+async def exists_many(client, keys, policy=None):
+    return await _call(client.exists_many_async, keys, policy)
+
+
+async def touch(client, key, val=0, meta=None, policy=None):
+    # The C client's touch is a single op operate, do the same here.
+    from aerospike_helpers.operations import operations
+
+    await _call(client.operate_async, key, [operations.touch(val)], meta, policy)
+    return 0
+
+
+async def iter_results(job, policy=None, queue_size=1000, batch_size=100, **kwargs):
+    """Asynchronously iterate over the records of a query or scan.
+
+    ``job`` is an :class:`aerospike.Query` or :class:`aerospike.Scan`. The job runs
+    on a background thread through its ``iter_results()`` method, buffering at
+    most ``queue_size`` records, and the event loop is woken through the
+    iterator's file descriptor whenever records are ready. Remaining keyword
+    arguments, ``options`` for a query or ``nodename`` for a scan, are passed on.
+
+    Leaving the ``async for`` early, or cancelling the task consuming it, aborts
+    the job.
+
+    .. code-block:: python
+
+        query = client.query("test", "demo")
+        async for key, meta, bins in io.iter_results(query):
+            ...
+    """
+    loop = asyncio.get_running_loop()
+    results = job.iter_results(policy, queue_size=queue_size, **kwargs)
+    fd = results.fileno()
+    try:
+        while True:
+            batch = results.next_batch(batch_size)
+            if batch is None:
+                return
+            if not batch:
+                fut = loop.create_future()
+                loop.add_reader(fd, _resolve, fut, None, None)
+                try:
+                    await fut
+                finally:
+                    loop.remove_reader(fd)
+                continue
+            for record in batch:
+                yield record
+    finally:
+        # Joining the job's thread can wait on in flight node commands.
+        await loop.run_in_executor(None, results.close)
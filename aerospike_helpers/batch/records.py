@@ -47,8 +47,13 @@ class BatchRecord:
             in_doubt (bool): Is it possible that the write transaction completed even though an error was generated. \
             This may be the case when a client error occurs (like timeout) after the command was sent \
             to the server.
+
+        The classes in this module use ``__slots__``, so attributes other than those listed cannot be added to \
+        their instances.
     """
 
+    __slots__ = ("key", "record", "result", "in_doubt")
+
     def __init__(self, key: tuple) -> None:
         self.key = key
         self.record = None
@@ -73,6 +78,10 @@ class Write(BatchRecord):
                 flags.
     """
 
+    __slots__ = ("ops", "meta", "policy")
+    _type = _Types.WRITE
+    _has_write = True
+
     def __init__(
         self, key: tuple, ops: "TypeOps", meta: "dict" = None, policy: "TypeBatchPolicyWrite" = None
     ) -> None:
@@ -101,8 +110,6 @@ class Write(BatchRecord):
         """
         super().__init__(key)
         self.ops = ops
-        self._type = _Types.WRITE
-        self._has_write = True
         self.meta = meta
         self.policy = policy
 
@@ -124,6 +131,10 @@ class Read(BatchRecord):
             policy (:ref:`aerospike_batch_read_policies`, optional): An optional dictionary of batch read policy flags.
     """
 
+    __slots__ = ("ops", "read_all_bins", "meta", "policy")
+    _type = _Types.READ
+    _has_write = False
+
     def __init__(
         self,
         key: tuple,
@@ -157,8 +168,6 @@ class Read(BatchRecord):
         super().__init__(key)
         self.ops = ops
         self.read_all_bins = read_all_bins
-        self._type = _Types.READ
-        self._has_write = False
         self.meta = meta
         self.policy = policy
 
@@ -183,6 +192,10 @@ class Apply(BatchRecord):
                 flags.
     """
 
+    __slots__ = ("module", "function", "args", "policy")
+    _type = _Types.APPLY
+    _has_write = True
+
     def __init__(
         self, key: tuple, module: str, function: str, args: "TypeUDFArgs", policy: "TypeBatchPolicyApply" = None
     ) -> None:
@@ -211,8 +224,6 @@ class Apply(BatchRecord):
             ba = Apply(key, module, function, args)
         """
         super().__init__(key)
-        self._type = _Types.APPLY
-        self._has_write = True
         self.module = module
         self.function = function
         self.args = args
@@ -235,6 +246,10 @@ class Remove(BatchRecord):
                 flags.
     """
 
+    __slots__ = ("policy",)
+    _type = _Types.REMOVE
+    _has_write = True
+
     def __init__(self, key: tuple, policy: "TypeBatchPolicyRemove" = None) -> None:
         """
         Example::
@@ -251,8 +266,6 @@ class Remove(BatchRecord):
             br = Remove(key, ops)
         """
         super().__init__(key)
-        self._type = _Types.REMOVE
-        self._has_write = True
         self.policy = policy
 
 
@@ -3,7 +3,6 @@ Resources used by all expressions.
 """
 
 # from __future__ import annotations
-from itertools import chain
 from typing import List, Optional, Tuple, Union, Dict, Any
 
 
@@ -138,6 +137,9 @@ TypeChildren = Tuple[TypeChild, ...]
 
 TypeAny = Union[_AtomExpr, Any]
 
+# Marks the end of a node's children on the _BaseExpr.compile work stack.
+_SUBTREE_END = object()
+
 
 class _BaseExpr(_AtomExpr):
     _op = 0
@@ -161,22 +163,51 @@ class _BaseExpr(_AtomExpr):
         )
 
     def compile(self) -> TypeExpression:
-        expression = [self._get_op()]
+        expression = []
         # type: 'TypeExpression'
-        work = chain(self._children)
-
-        while True:
-            try:
-                item = next(work)
-            except StopIteration:
-                break
 
-            if isinstance(item, _BaseExpr):
-                expression.append(item._get_op())
-                work = chain(item._children, work)
+        # Subtrees and literals that occur more than once are only compiled the first time, later
+        # occurrences copy the ops already emitted for them.
+        subtrees = {}
+        # type: Dict[int, Tuple[int, int]]
+        # Literals are matched by identity, equal values such as 0.0 and -0.0 or 1 and True inside a
+        # container must each keep their own op.
+        values = {}
+        # type: Dict[int, TypeCompiledOp]
+
+        # Explicit stack of nodes still to emit, children pushed in reverse so they pop in order.
+        # _SUBTREE_END entries mark where a node's subtree ends in expression.
+        work = [self]
+
+        while work:
+            item = work.pop()
+
+            if item is _SUBTREE_END:
+                node, start = work.pop()
+                subtrees[id(node)] = (start, len(expression))
+            elif isinstance(item, _BaseExpr):
+                span = subtrees.get(id(item))
+
+                if span is not None:
+                    expression.extend(expression[span[0]:span[1]])
+                    continue
+
+                children = item._children
+                expression.append((item._op, item._rt, item._fixed, len(children)))
+
+                if children:
+                    work.append((item, len(expression) - 1))
+                    work.append(_SUBTREE_END)
+                    work.extend(reversed(children))
             else:
                 # Should be a str, bin, int, float, etc.
-                expression.append(self._vop(item))
+                op = values.get(id(item))
+
+                if op is None:
+                    op = self._vop(item)
+                    values[id(item)] = op
+
+                expression.append(op)
 
         return expression
 
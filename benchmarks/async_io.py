@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+
+from __future__ import print_function
+
+import aerospike
+import asyncio
+import random
+import sys
+import time
+
+from optparse import OptionParser
+from aerospike_helpers.awaitable import io
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-k", "--keys", dest="keys", type="int", default=1000, metavar="<KEYS>",
+    help="Number of distinct keys. Fewer keys than in-flight requests means duplicate keys are awaited concurrently.")
+
+optparser.add_option(
+    "-i", "--in-flight", dest="in_flight", type="int", default=10000, metavar="<COUNT>",
+    help="Number of requests kept in flight at all times.")
+
+optparser.add_option(
+    "-d", "--duration", dest="duration", type="int", default=10, metavar="<SECONDS>",
+    help="How long to run the benchmark for.")
+
+optparser.add_option(
+    "--reads", dest="reads", type="int", default=50, metavar="<PERCENT>",
+    help="Percentage of operations that are reads.")
+
+
+optparser.add_option(
+    "--completion-queue", dest="completion_queue", action="store_true", default=False,
+    help="Run callbacks in batches on the asyncio loop instead of once per command on the C event loop thread.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+counts = {'read': 0, 'write': 0, 'error': 0}
+
+
+async def worker(client, deadline):
+    while time.time() < deadline:
+        key = (options.namespace, options.set, random.randrange(options.keys))
+        try:
+            if random.randrange(100) < options.reads:
+                await io.get(client, key)
+                counts['read'] += 1
+            else:
+                await io.put(client, key, {'v': key[2]})
+                counts['write'] += 1
+        except aerospike.exception.RecordNotFound:
+            counts['read'] += 1
+        except aerospike.exception.AerospikeError:
+            counts['error'] += 1
+
+
+async def run(client):
+    if options.completion_queue:
+        io.attach_completion_queue()
+    deadline = time.time() + options.duration
+    await asyncio.gather(*(worker(client, deadline) for _ in range(options.in_flight)))
+
+
+try:
+    aerospike.init_async(completion_queue=options.completion_queue)
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    start = time.time()
+    asyncio.run(run(client))
+    elapse = time.time() - start
+    total = counts['read'] + counts['write']
+
+    print()
+    print("Summary:")
+    print("     {0} requests in flight".format(options.in_flight))
+    print("     completion queue {0}".format("on" if options.completion_queue else "off"))
+    print("     {0} reads, {1} writes, {2} errors".format(counts['read'], counts['write'], counts['error']))
+    print("     {0} seconds for {1} operations".format(elapse, total))
+    print("     {0} operations per second".format(total / elapse))
+    print()
+
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import asyncio
+import random
+import sys
+import time
+
+from optparse import OptionParser
+from aerospike_helpers.awaitable import io
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-k", "--keys", dest="keys", type="int", default=10000, metavar="<KEYS>",
+    help="Number of distinct keys.")
+
+optparser.add_option(
+    "-i", "--in-flight", dest="in_flight", type="int", default=5000, metavar="<COUNT>",
+    help="Number of requests kept in flight at all times.")
+
+optparser.add_option(
+    "-d", "--duration", dest="duration", type="int", default=10, metavar="<SECONDS>",
+    help="How long to run each loop count for.")
+
+optparser.add_option(
+    "-l", "--max-loops", dest="max_loops", type="int", default=8, metavar="<LOOPS>",
+    help="Largest number of event loops to run with. Loop counts double from 1 up to this.")
+
+optparser.add_option(
+    "--partition", dest="partition", action="store_true", default=False,
+    help="Pin keys to loops by partition instead of round-robin.")
+
+optparser.add_option(
+    "--completion-queue", dest="completion_queue", action="store_true", default=False,
+    help="Run callbacks in batches on the asyncio loop.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+
+async def worker(client, deadline, counts):
+    while time.time() < deadline:
+        key = (options.namespace, options.set, random.randrange(options.keys))
+        try:
+            await io.get(client, key)
+        except aerospike.exception.RecordNotFound:
+            pass
+        except aerospike.exception.AerospikeError:
+            counts['error'] += 1
+            continue
+        counts['ops'] += 1
+
+
+async def run(client, counts):
+    if options.completion_queue:
+        io.attach_completion_queue()
+    deadline = time.time() + options.duration
+    await asyncio.gather(*(worker(client, deadline, counts) for _ in range(options.in_flight)))
+
+
+def measure(loops):
+    assignment = aerospike.ASYNC_LOOP_PARTITION if options.partition else aerospike.ASYNC_LOOP_ROUND_ROBIN
+    aerospike.init_async(loops=loops, loop_assignment=assignment, completion_queue=options.completion_queue)
+    client = aerospike.client(config).connect(options.username, options.password)
+    counts = {'ops': 0, 'error': 0}
+
+    start = time.time()
+    asyncio.run(run(client, counts))
+    elapse = time.time() - start
+
+    client.close()
+    return counts, elapse
+
+
+try:
+    print()
+    print("{0:>6} {1:>12} {2:>8} {3:>10}".format("loops", "ops/sec", "errors", "speedup"))
+
+    baseline = None
+    loops = 1
+    while loops <= options.max_loops:
+        counts, elapse = measure(loops)
+        rate = counts['ops'] / elapse
+        baseline = baseline or rate
+        print("{0:>6} {1:>12.0f} {2:>8} {3:>9.2f}x".format(loops, rate, counts['error'], rate / baseline))
+        loops *= 2
+    print()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
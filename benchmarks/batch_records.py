@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike_helpers.batch import records as br
+from aerospike_helpers.operations import operations
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="batch_records", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=100000, metavar="<RECORDS>",
+    help="Number of records in each batch.")
+
+optparser.add_option(
+    "-c", "--chunk", dest="chunk", type="int", default=5000, metavar="<KEYS>",
+    help="Keys sent per batch call, kept under the server's batch-max-requests.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def timed(label, fn):
+    start = time.time()
+    count = fn()
+    elapse = time.time() - start
+    print("     {0:>13}: {1:.3f} secs, {2:.0f} records/sec".format(label, elapse, count / elapse))
+
+
+def chunks(items):
+    for i in range(0, len(items), options.chunk):
+        yield items[i:i + options.chunk]
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    keys = [(options.namespace, options.set, i) for i in range(options.records)]
+    ops = [operations.write("value", 1), operations.read("value")]
+
+    def batch_write():
+        count = 0
+        for part in chunks(keys):
+            results = client.batch_write(br.BatchRecords([br.Write(key, ops) for key in part]))
+            count += len(results.batch_records)
+        return count
+
+    def batch_operate():
+        count = 0
+        for part in chunks(keys):
+            count += len(client.batch_operate(part, ops).batch_records)
+        return count
+
+    def batch_remove():
+        count = 0
+        for part in chunks(keys):
+            count += len(client.batch_remove(part).batch_records)
+        return count
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} per call".format(options.records, options.chunk))
+    timed("batch_write", batch_write)
+    timed("batch_operate", batch_operate)
+    timed("batch_remove", batch_remove)
+    print()
+
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike_helpers.batch import records as br
+from aerospike_helpers.operations import operations
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="batch_write_chunked", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=1000000, metavar="<RECORDS>",
+    help="Number of records written by each run.")
+
+optparser.add_option(
+    "-c", "--chunk-size", dest="chunk_size", type="int", default=5000, metavar="<RECORDS>",
+    help="Records per batch call, kept under the server's batch-max-requests.")
+
+optparser.add_option(
+    "-f", "--max-in-flight", dest="max_in_flight", type="int", default=[], action="append",
+    metavar="<CHUNKS>",
+    help="Chunks written at once while the next is converted. May be repeated, default 1 and 4.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def timed(label, fn):
+    start = time.time()
+    fn()
+    elapse = time.time() - start
+    print("     {0:>16}: {1:.3f} secs, {2:.0f} records/sec".format(
+        label, elapse, options.records / elapse))
+
+
+def make_records(keys):
+    return br.BatchRecords([
+        br.Write(key, [operations.write("value", i),
+                       operations.write("tags", {"a": i, "b": [i, str(i)]})])
+        for i, key in enumerate(keys)])
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    keys = [(options.namespace, options.set, i) for i in range(options.records)]
+
+    def sequential():
+        # Convert and send one chunk after the other, as batch_write
+        # without a chunk_size does for each call.
+        for i in range(0, len(keys), options.chunk_size):
+            client.batch_write(make_records(keys[i:i + options.chunk_size]))
+
+    def pipelined(max_in_flight):
+        client.batch_write(make_records(keys), None, options.chunk_size, max_in_flight)
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} per batch call".format(options.records, options.chunk_size))
+    timed("sequential", sequential)
+    for max_in_flight in options.max_in_flight or [1, 4]:
+        timed("in flight {0}".format(max_in_flight), lambda: pipelined(max_in_flight))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
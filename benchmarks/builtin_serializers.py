@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="builtin_serializers", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=10000, metavar="<RECORDS>",
+    help="Number of records written and then read back.")
+
+optparser.add_option(
+    "-e", "--entries", dest="entries", type="int", default=20, metavar="<ENTRIES>",
+    help="Number of entries in each level of the nested dict payload.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def payload(entries):
+    # The dict is wrapped in a tuple, which has no server type, so the whole
+    # structure goes through the serializer.
+    return ({
+        "id%d" % i: {
+            "name": "item-%d" % i,
+            "price": i * 1.25,
+            "tags": ["a", "b", "c"],
+            "stock": {"warehouse-%d" % j: j for j in range(5)},
+        }
+        for i in range(entries)
+    },)
+
+
+try:
+    keys = [(options.namespace, options.set, i) for i in range(options.records)]
+    bins = {"payload": payload(options.entries)}
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} entry nested dicts".format(
+        options.records, options.entries))
+    for name in ("pickle", "json", "msgpack"):
+        client_config = dict(config)
+        if name != "pickle":
+            client_config["serialization"] = name
+        client = aerospike.client(client_config).connect(
+            options.username, options.password)
+
+        start = time.time()
+        for key in keys:
+            client.put(key, bins)
+        put_elapse = time.time() - start
+
+        start = time.time()
+        for key in keys:
+            client.get(key)
+        get_elapse = time.time() - start
+
+        client.close()
+        print("     {0:>7}: put {1:.3f} secs ({2:.0f} TPS), get {3:.3f} secs ({4:.0f} TPS)".format(
+            name, put_elapse, options.records / put_elapse,
+            get_elapse, options.records / get_elapse))
+    print()
+
+    client = aerospike.client(config).connect(options.username, options.password)
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import sys
+import time
+
+from optparse import OptionParser
+from aerospike_helpers import expressions as exp
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "--sizes", dest="sizes", type="string", default="10,100,1000,10000,100000", metavar="<SIZES>",
+    help="Comma separated approximate node counts of the generated expressions.")
+
+optparser.add_option(
+    "-r", "--repeat", dest="repeat", type="int", default=5, metavar="<REPEAT>",
+    help="Number of times each expression is compiled, the best time is reported.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Synthetic Expressions
+##########################################################################
+
+
+def wide_or(nodes):
+    # Or(Eq(IntBin, n), ...), 3 nodes per term.
+    return exp.Or(*(exp.Eq(exp.IntBin("a"), i) for i in range(max(nodes // 3, 2))))
+
+
+def deep_add(nodes):
+    # Add(Add(...(IntBin, 1)..., 1), 1), 2 nodes per level.
+    expr = exp.IntBin("a")
+    for _ in range(max(nodes // 2, 1)):
+        expr = exp.Add(expr, 1)
+    return expr
+
+
+def shared_subtree(nodes):
+    # And of the same Or subtree repeated, exercises subtree reuse.
+    subtree = wide_or(100)
+    return exp.And(*(subtree for _ in range(max(nodes // 100, 2))))
+
+
+shapes = [
+    ("wide or", wide_or),
+    ("deep add", deep_add),
+    ("shared subtree", shared_subtree),
+]
+
+##########################################################################
+# Application
+##########################################################################
+
+sizes = [int(size) for size in options.sizes.split(",")]
+
+print()
+print("Summary (best of {0}):".format(options.repeat))
+
+for label, build in shapes:
+    print()
+    print("     {0}".format(label))
+
+    for size in sizes:
+        expr = build(size)
+        best = None
+
+        for _ in range(options.repeat):
+            start = time.time()
+            compiled = expr.compile()
+            elapse = time.time() - start
+            best = elapse if best is None else min(best, elapse)
+
+        print("     {0:>10} nodes {1:>10} ops {2:>12.6f} secs {3:>10.3f} us/op".format(
+            size, len(compiled), best, best / len(compiled) * 1e6))
+
+print()
+sys.exit(0)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+import tracemalloc
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="get_many_iter", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=100000, metavar="<RECORDS>",
+    help="Number of records written and then read back.")
+
+optparser.add_option(
+    "-c", "--chunk-size", dest="chunk_size", type="int", default=1000, metavar="<KEYS>",
+    help="Keys per batch request of get_many_iter.")
+
+optparser.add_option(
+    "-f", "--max-in-flight", dest="max_in_flight", type="int", default=[], action="append",
+    metavar="<REQUESTS>",
+    help="Batch requests of get_many_iter running at once. May be repeated, default 1 and 4.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def keys():
+    return ((options.namespace, options.set, i) for i in range(options.records))
+
+
+def measure(read):
+    tracemalloc.start()
+    start = time.time()
+    count = read()
+    elapse = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapse, peak
+
+
+def read_get_many():
+    records = client.get_many(list(keys()))
+    return sum(1 for _, meta, _ in records if meta is not None)
+
+
+def read_get_many_iter(max_in_flight):
+    records = client.get_many_iter(keys(), chunk_size=options.chunk_size,
+                                   max_in_flight=max_in_flight)
+    return sum(1 for _, meta, _ in records if meta is not None)
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    for i in range(options.records):
+        client.put((options.namespace, options.set, i), {"value": i})
+
+    print()
+    print("Summary:")
+    print("     {0} records".format(options.records))
+    count, elapse, peak = measure(read_get_many)
+    print("     {0:>26}: {1} found, {2:.3f} secs, {3:.0f} records/sec, {4:.1f} MiB peak".format(
+        "get_many", count, elapse, options.records / elapse, peak / 2**20))
+    for max_in_flight in options.max_in_flight or [1, 4]:
+        count, elapse, peak = measure(lambda: read_get_many_iter(max_in_flight))
+        print("     {0:>26}: {1} found, {2:.3f} secs, {3:.0f} records/sec, {4:.1f} MiB peak".format(
+            "get_many_iter in flight {0}".format(max_in_flight), count, elapse,
+            options.records / elapse, peak / 2**20))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
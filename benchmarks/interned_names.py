@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+import tracemalloc
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="interned_names", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=100000, metavar="<RECORDS>",
+    help="Number of records written and then scanned.")
+
+optparser.add_option(
+    "-b", "--bins", dest="bins", type="int", default=10, metavar="<BINS>",
+    help="Number of bins in each record.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    bins = {"bin_%d" % i: i for i in range(options.bins)}
+    for i in range(options.records):
+        client.put((options.namespace, options.set, i), bins)
+
+    scan = client.scan(options.namespace, options.set)
+
+    tracemalloc.start()
+    start = time.time()
+    records = scan.results()
+    elapse = time.time() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    names = set()
+    for key, _, rec_bins in records:
+        names.add(id(key[0]))
+        names.add(id(key[1]))
+        names.update(id(name) for name in rec_bins)
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} bins each".format(len(records), options.bins))
+    print("     {0:.3f} secs, {1:.0f} records/sec".format(elapse, len(records) / elapse))
+    print("     {0:.1f} MiB held, {1:.1f} MiB peak".format(current / 2**20, peak / 2**20))
+    print("     {0} distinct name objects".format(len(names)))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
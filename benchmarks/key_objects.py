@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="key_objects", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-k", "--keys", dest="keys", type="int", default=5000, metavar="<KEYS>",
+    help="Number of keys, reused by every round.")
+
+optparser.add_option(
+    "-r", "--rounds", dest="rounds", type="int", default=20, metavar="<ROUNDS>",
+    help="Number of times every key is read.")
+
+optparser.add_option(
+    "--key-type", dest="key_type", type="choice", choices=["str", "int"],
+    default="str", metavar="<TYPE>",
+    help="Type of the primary keys: 'str' or 'int'.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def run(name, read, keys):
+    start = time.time()
+    for _ in range(options.rounds):
+        read(keys)
+    elapse = time.time() - start
+    reads = options.rounds * len(keys)
+    print("     {0}".format(name))
+    print("     {0} reads, {1:.3f} secs, {2:.0f} reads/sec, {3:.2f} us/read".format(
+        reads, elapse, reads / elapse, elapse * 1e6 / reads))
+
+
+def exists_each(keys):
+    for key in keys:
+        client.exists(key)
+
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+
+    if options.key_type == "str":
+        values = ["key_objects_{0:012d}".format(i) for i in range(options.keys)]
+    else:
+        values = list(range(options.keys))
+
+    tuples = [(options.namespace, options.set, v) for v in values]
+    for key in tuples:
+        client.put(key, {"value": 1})
+
+    start = time.time()
+    objects = [aerospike.Key(options.namespace, options.set, v) for v in values]
+    elapse = time.time() - start
+
+    print()
+    print("Summary:")
+    print("     {0} Key objects created in {1:.3f} secs, {2:.2f} us/key".format(
+        options.keys, elapse, elapse * 1e6 / options.keys))
+
+    # The batch reads spend the least time on the network per key, so the
+    # cost of converting the keys shows the most there.
+    for read_name, read in (("get_many", client.get_many), ("exists", exists_each)):
+        for key_name, keys in (("tuples", tuples), ("Key objects", objects)):
+            run("{0} with {1}".format(read_name, key_name), read, keys)
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
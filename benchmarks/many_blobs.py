@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="many_blobs", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=100, metavar="<RECORDS>",
+    help="Number of records written for each blob count.")
+
+optparser.add_option(
+    "-b", "--blobs", dest="blobs", type="int", action="append", metavar="<BLOBS>",
+    help="Number of blobs in the list bin of each record, may be repeated. Defaults to 16, 1024 and 16384.")
+
+optparser.add_option(
+    "-l", "--length", dest="length", type="int", default=16, metavar="<LENGTH>",
+    help="Length in bytes of each blob.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+    keys = [(options.namespace, options.set, i) for i in range(options.records)]
+
+    print()
+    print("Summary:")
+    print("     {0} records, blobs of {1} bytes".format(options.records, options.length))
+    for count in options.blobs or [16, 1024, 16384]:
+        # Every bytearray in the list is converted through the bytes pool.
+        bins = {"blobs": [bytearray(options.length) for _ in range(count)]}
+
+        start = time.time()
+        for key in keys:
+            client.put(key, bins)
+        put_elapse = time.time() - start
+
+        start = time.time()
+        for key in keys:
+            client.get(key)
+        get_elapse = time.time() - start
+
+        blobs = options.records * count
+        print("     {0} blobs: put {1:.3f} secs ({2:.2f} us/blob), get {3:.3f} secs ({4:.2f} us/blob)".format(
+            count, put_elapse, put_elapse * 1e6 / blobs,
+            get_elapse, get_elapse * 1e6 / blobs))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from aerospike import exception as ex
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="missing_records", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--reads", dest="reads", type="int", default=100000, metavar="<READS>",
+    help="Number of gets issued.")
+
+optparser.add_option(
+    "-m", "--miss-ratio", dest="miss_ratio", type="float", default=0.9, metavar="<RATIO>",
+    help="Fraction of the gets for keys that do not exist.")
+
+optparser.add_option(
+    "--missing", dest="missing", type="choice", choices=["raise", "none", "both"],
+    default="both", metavar="<MISSING>",
+    help="How missing records are reported: 'raise', 'none' or 'both' to compare them.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+
+    hits = int(options.reads * (1 - options.miss_ratio))
+    existing = max(hits, 1)
+    for i in range(existing):
+        client.put((options.namespace, options.set, i), {"value": i})
+
+    # Keys from existing onward were never written, so their gets raise
+    # RecordNotFound, or return None with the 'none' option.
+    keys = [(options.namespace, options.set, i if i < hits else existing + i)
+            for i in range(options.reads)]
+
+    modes = ["raise", "none"] if options.missing == "both" else [options.missing]
+
+    print()
+    print("Summary:")
+    for mode in modes:
+        policy = {"missing": mode}
+        found = 0
+        missing = 0
+        start = time.time()
+        for key in keys:
+            try:
+                if client.get(key, policy=policy) is None:
+                    missing += 1
+                else:
+                    found += 1
+            except ex.RecordNotFound:
+                missing += 1
+        elapse = time.time() - start
+
+        print("     missing={0!r}".format(mode))
+        print("     {0} gets, {1} found, {2} not found".format(options.reads, found, missing))
+        print("     {0:.3f} secs, {1:.0f} gets/sec, {2:.2f} us/get".format(
+            elapse, options.reads / elapse, elapse * 1e6 / options.reads))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
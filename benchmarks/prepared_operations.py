@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+from aerospike_helpers.operations import map_operations
+from aerospike_helpers.operations import operations
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-c", "--calls", dest="calls", type="int", default=100000, metavar="<CALLS>",
+    help="Number of calls to time for each variant.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+
+def timed(label, fn):
+    start = time.time()
+    for _ in range(options.calls):
+        fn()
+    elapse = time.time() - start
+    print("     {0:<28} {1:>10.2f} us/call".format(label, elapse / options.calls * 1e6))
+    return elapse
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    key = (options.namespace, options.set, "prepared-operations-benchmark")
+    client.put(key, {"hits": 0, "board": {}})
+
+    # A counter and a leaderboard update, both with values fixed per call.
+    ops = [
+        operations.increment("hits", 1),
+        map_operations.map_increment("board", "player", 10),
+        map_operations.map_get_by_rank_range("board", -10, 10, aerospike.MAP_RETURN_KEY_VALUE),
+        operations.read("hits"),
+    ]
+    prepared = client.prepare_operations(ops)
+
+    print()
+    print("Summary ({0} calls):".format(options.calls))
+
+    listed = timed("operate with list", lambda: client.operate(key, ops))
+    packed = timed("operate with prepared", lambda: client.operate(key, prepared))
+
+    print()
+    print("     speedup {0:.2f}x".format(listed / packed))
+    print()
+
+    client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
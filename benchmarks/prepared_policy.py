@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+
+from optparse import OptionParser
+from aerospike_helpers import expressions as exp
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="demo", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-c", "--calls", dest="calls", type="int", default=100000, metavar="<CALLS>",
+    help="Number of calls to time for each variant.")
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+
+def timed(label, fn):
+    start = time.time()
+    for _ in range(options.calls):
+        fn()
+    elapse = time.time() - start
+    print("     {0:<28} {1:>10.2f} us/call".format(label, elapse / options.calls * 1e6))
+    return elapse
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    key = (options.namespace, options.set, "prepared-policy-benchmark")
+    client.put(key, {"a": 1})
+
+    policy = {
+        "total_timeout": 1000,
+        "socket_timeout": 500,
+        "max_retries": 2,
+        "sleep_between_retries": 0,
+        "key": aerospike.POLICY_KEY_DIGEST,
+        "replica": aerospike.POLICY_REPLICA_SEQUENCE,
+        "read_mode_ap": aerospike.POLICY_READ_MODE_AP_ONE,
+        "deserialize": True,
+        "expressions": exp.Eq(exp.IntBin("a"), 1).compile(),
+    }
+    prepared = client.prepare_policy(policy)
+
+    print()
+    print("Summary ({0} calls):".format(options.calls))
+
+    listed = timed("get with policy dict", lambda: client.get(key, policy))
+    packed = timed("get with prepared policy", lambda: client.get(key, prepared))
+
+    print()
+    print("     speedup {0:.2f}x".format(listed / packed))
+    print()
+
+    client.remove(key)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
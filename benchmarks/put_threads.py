@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import threading
+import time
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="put_threads", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=10000, metavar="<RECORDS>",
+    help="Number of records written by each thread.")
+
+optparser.add_option(
+    "-t", "--threads", dest="threads", type="int", action="append", metavar="<THREADS>",
+    help="Number of threads putting records, may be repeated. Defaults to 1, 2, 4 and 8.")
+
+optparser.add_option(
+    "-e", "--elements", dest="elements", type="int", default=50, metavar="<ELEMENTS>",
+    help="Number of entries in the nested list and map bins of each record.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+
+def put_records(client, thread_id, bins):
+    for i in range(options.records):
+        client.put((options.namespace, options.set, "%d-%d" % (thread_id, i)), bins)
+
+
+try:
+    client = aerospike.client(config).connect(options.username, options.password)
+    # Strings, floats and nested containers are all converted to as_val
+    # structs on every put.
+    bins = {
+        "name": "record",
+        "list": [[i, float(i), "v%d" % i] for i in range(options.elements)],
+        "map": {"k%d" % i: {"n": i, "s": "v%d" % i} for i in range(options.elements)},
+    }
+
+    print()
+    print("Summary:")
+    print("     {0} records per thread, {1} nested entries per bin".format(
+        options.records, options.elements))
+    for count in options.threads or [1, 2, 4, 8]:
+        threads = [threading.Thread(target=put_records, args=(client, t, bins))
+                   for t in range(count)]
+
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapse = time.time() - start
+
+        puts = count * options.records
+        print("     {0} threads: {1} puts in {2:.3f} secs, {3:.0f} puts/sec".format(
+            count, puts, elapse, puts / elapse))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import array
+import time
+import tracemalloc
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="results_columnar", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=100000, metavar="<RECORDS>",
+    help="Number of records written and then scanned.")
+
+optparser.add_option(
+    "-b", "--bins", dest="bins", type="int", default=4, metavar="<BINS>",
+    help="Number of numeric bins in each record, all of them are collected.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.time()
+    columns = fn()
+    elapse = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return columns, elapse, peak
+
+
+def from_records(scan, names):
+    columns = {name: (array.array("d"), bytearray()) for name in names}
+    for _, _, bins in scan.results():
+        for name in names:
+            values, valid = columns[name]
+            value = bins.get(name)
+            values.append(value if value is not None else 0)
+            valid.append(value is not None)
+    return columns
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+
+    names = ["bin_%d" % i for i in range(options.bins)]
+    for i in range(options.records):
+        client.put((options.namespace, options.set, i),
+                   {name: i * 0.5 for name in names})
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} numeric bins each".format(options.records, options.bins))
+    runs = (
+        ("results", lambda: from_records(client.scan(options.namespace, options.set), names)),
+        ("results_columnar", lambda: client.scan(options.namespace, options.set).results_columnar(names)),
+    )
+    for label, fn in runs:
+        columns, elapse, peak = measure(fn)
+        rows = len(columns[names[0]][0])
+        print("     {0:>16}: {1:.3f} secs, {2:.0f} records/sec, {3:.1f} MiB peak".format(
+            label, elapse, rows / elapse, peak / 2**20))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+##########################################################################
+# Copyright 2013-2021 Aerospike, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##########################################################################
+from __future__ import print_function
+
+import aerospike
+import sys
+import time
+import tracemalloc
+
+from optparse import OptionParser
+
+##########################################################################
+# Options Parsing
+##########################################################################
+
+usage = "usage: %prog [options]"
+
+optparser = OptionParser(usage=usage, add_help_option=False)
+
+optparser.add_option(
+    "--help", dest="help", action="store_true",
+    help="Displays this message.")
+
+optparser.add_option(
+    "-U", "--username", dest="username", type="string", metavar="<USERNAME>",
+    help="Username to connect to database.")
+
+optparser.add_option(
+    "-P", "--password", dest="password", type="string", metavar="<PASSWORD>",
+    help="Password to connect to database.")
+
+optparser.add_option(
+    "-h", "--host", dest="host", type="string", default="127.0.0.1", metavar="<ADDRESS>",
+    help="Address of Aerospike server.")
+
+optparser.add_option(
+    "-p", "--port", dest="port", type="int", default=3000, metavar="<PORT>",
+    help="Port of the Aerospike server.")
+
+optparser.add_option(
+    "-n", "--namespace", dest="namespace", type="string", default="test", metavar="<NS>",
+    help="Namespace that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-s", "--set", dest="set", type="string", default="zero_copy_blobs", metavar="<SET>",
+    help="Set that records will be stored and retrieved from.")
+
+optparser.add_option(
+    "-r", "--records", dest="records", type="int", default=20, metavar="<RECORDS>",
+    help="Number of blob records written and then read back.")
+
+optparser.add_option(
+    "-z", "--blob-size", dest="blob_size", type="int", default=512 * 1024, metavar="<BYTES>",
+    help="Size of the blob stored in each record, within the namespace write-block-size.")
+
+optparser.add_option(
+    "-i", "--iterations", dest="iterations", type="int", default=5, metavar="<ITERATIONS>",
+    help="Number of times every record is read.")
+
+
+(options, args) = optparser.parse_args()
+
+if options.help:
+    optparser.print_help()
+    print()
+    sys.exit(1)
+
+##########################################################################
+# Client Configuration
+##########################################################################
+
+config = {
+    'hosts': [(options.host, options.port)]
+}
+
+##########################################################################
+# Application
+##########################################################################
+
+def measure(client, keys):
+    tracemalloc.start()
+    start = time.time()
+    for _ in range(options.iterations):
+        for key in keys:
+            client.get(key)
+    elapse = time.time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapse, peak
+
+
+try:
+    client = aerospike.client(config).connect(
+        options.username, options.password)
+    view_config = dict(config, blob_memoryview=True)
+    view_client = aerospike.client(view_config).connect(
+        options.username, options.password)
+
+    payload = bytearray(options.blob_size)
+    keys = [(options.namespace, options.set, i) for i in range(options.records)]
+
+    start = time.time()
+    for key in keys:
+        client.put(key, {"blob": bytes(payload)})
+    bytes_elapse = time.time() - start
+
+    start = time.time()
+    for key in keys:
+        client.put(key, {"blob": memoryview(payload)})
+    view_elapse = time.time() - start
+
+    reads = options.records * options.iterations
+    mib = options.blob_size * reads / 2**20
+
+    print()
+    print("Summary:")
+    print("     {0} records, {1} byte blobs, {2} reads each".format(
+        options.records, options.blob_size, options.iterations))
+    print("     write bytes(bytearray): {0:.3f} secs".format(bytes_elapse))
+    print("     write memoryview:       {0:.3f} secs".format(view_elapse))
+    for name, read_client in (("bytes", client), ("memoryview", view_client)):
+        elapse, peak = measure(read_client, keys)
+        print("     read {0:>10}: {1:.3f} secs, {2:.1f} MiB/s, {3:.1f} MiB peak".format(
+            name, elapse, mib / max(elapse, 1e-9), peak / 2**20))
+    print()
+
+    client.truncate(options.namespace, options.set, 0)
+    view_client.close()
+    client.close()
+
+except Exception as eargs:
+    print("error: {0}".format(eargs), file=sys.stderr)
+    sys.exit(3)
+
+sys.exit(0)
@@ -240,7 +240,15 @@ setup(
                 'src/main/client/get.c',
                 'src/main/client/get_async.c',
                 'src/main/client/put_async.c',
+                'src/main/client/async.c',
+                'src/main/client/exists_async.c',
+                'src/main/client/select_async.c',
+                'src/main/client/remove_async.c',
+                'src/main/client/operate_async.c',
+                'src/main/client/apply_async.c',
+                'src/main/client/batch_read_async.c',
                 'src/main/client/get_many.c',
+                'src/main/client/get_many_iter.c',
                 'src/main/client/batch_get_ops.c',
                 'src/main/client/select_many.c',
                 'src/main/client/info_single_node.c',
@@ -261,6 +269,8 @@ setup(
                 'src/main/client/udf.c',
                 'src/main/client/sec_index.c',
                 'src/main/serializer.c',
+                'src/main/builtin_serializers.c',
+                'src/main/pool.c',
                 'src/main/client/remove_bin.c',
                 'src/main/client/get_key_digest.c',
                 'src/main/query/type.c',
@@ -270,12 +280,16 @@ setup(
                 'src/main/query/get_parts.c',
                 'src/main/query/foreach.c',
                 'src/main/query/results.c',
+                'src/main/query/iter_results.c',
+                'src/main/query/results_columnar.c',
                 'src/main/query/select.c',
                 'src/main/query/where.c',
                 'src/main/query/execute_background.c',
                 'src/main/scan/type.c',
                 'src/main/scan/foreach.c',
                 'src/main/scan/results.c',
+                'src/main/scan/iter_results.c',
+                'src/main/scan/results_columnar.c',
                 'src/main/scan/select.c',
                 'src/main/scan/execute_background.c',
                 'src/main/scan/apply.c',
@@ -289,6 +303,8 @@ setup(
                 'src/main/geospatial/dumps.c',
                 'src/main/policy.c',
                 'src/main/conversions.c',
+                'src/main/intern.c',
+                'src/main/columnar.c',
                 'src/main/convert_expressions.c',
                 'src/main/policy_config.c',
                 'src/main/calc_digest.c',
@@ -298,8 +314,19 @@ setup(
                 'src/main/nullobject/type.c',
                 'src/main/cdt_types/type.c',
                 'src/main/key_ordered_dict/type.c',
+                'src/main/results_iterator/type.c',
+                'src/main/compiled_expression/type.c',
+                'src/main/prepared_operations/type.c',
+                'src/main/prepared_policy/type.c',
+                'src/main/record/type.c',
+                'src/main/key/type.c',
+                'src/main/lazy_bins/type.c',
+                'src/main/blob/type.c',
                 'src/main/client/set_xdr_filter.c',
                 'src/main/client/get_expression_base64.c',
+                'src/main/client/compile_expression.c',
+                'src/main/client/prepare_operations.c',
+                'src/main/client/prepare_policy.c',
                 'src/main/client/get_cdtctx_base64.c',
                 'src/main/client/get_nodes.c',
                 'src/main/convert_partition_filter.c',
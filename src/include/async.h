@@ -0,0 +1,192 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_policy.h>
+#include <aerospike/as_record.h>
+#include <aerospike/aerospike_batch.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * Shape of the result handed to the Python callback by the record listener.
+ ******************************************************************************/
+
+// (key, meta, bins)
+#define ASYNC_RECORD_BINS 0
+// (key, meta, [(bin, value), ...]) as returned by operate_ordered
+#define ASYNC_RECORD_ORDERED_BINS 1
+// (key, meta), meta is None when the record does not exist
+#define ASYNC_RECORD_META 2
+
+// Same shapes for the batch read listener.
+#define ASYNC_BATCH_BINS 0
+#define ASYNC_BATCH_META 1
+
+/*******************************************************************************
+ * How commands are spread over the event loops created by init_async.
+ ******************************************************************************/
+
+// Let the C client pick the next loop.
+#define ASYNC_LOOP_ROUND_ROBIN 0
+// Pin every key to the loop owning its partition.
+#define ASYNC_LOOP_PARTITION 1
+
+/*******************************************************************************
+ * Per-command state passed through the C client as udata.
+ *
+ * One is allocated for every async call and freed once the Python callback
+ * has been invoked. It owns a reference to the callback, the converted key
+ * and, for batch reads, the heap allocated batch records.
+ ******************************************************************************/
+
+typedef struct {
+    as_key key;
+    bool key_initialised;
+    as_error error;
+    PyObject *callback;
+    AerospikeClient *client;
+    // One of the ASYNC_RECORD_* / ASYNC_BATCH_* values.
+    int result_format;
+    // The user key is not sent to the server, so it must not be returned.
+    bool digest_only_key;
+    // get_async/put_async callbacks take the key as their first argument.
+    bool legacy_callback;
+    as_batch_read_records *batch_records;
+    // Heap copies of bin names referenced by batch_records.
+    char **bin_names;
+    uint32_t n_bin_names;
+    // Whether the listener hands the result to the completion queue, fixed
+    // when the command is created so init_async does not change it in flight.
+    bool queued;
+    // Whether the C client allocates the record on the heap, in which case
+    // the listener owns and destroys it.
+    bool heap_rec;
+} AerospikeAsyncCommand;
+
+/**
+ * Returns true if async commands can be issued. Otherwise sets a Python
+ * exception and returns false.
+ */
+bool async_check_support(void);
+
+/**
+ * Allocates the per-command state. Takes a new reference to py_callback.
+ */
+AerospikeAsyncCommand *async_command_create(AerospikeClient *self,
+                                            PyObject *py_callback);
+
+/**
+ * Releases the per-command state. Must be called with the GIL held.
+ */
+void async_command_destroy(AerospikeAsyncCommand *cmd);
+
+/**
+ * Raises cmd->error as a Python exception in the calling thread, releases the
+ * command and returns NULL. Used when a command fails before it is queued.
+ */
+PyObject *async_command_fail(AerospikeAsyncCommand *cmd, PyObject *py_key);
+
+/**
+ * Invokes the Python callback with py_arglist and releases the command.
+ * Steals the reference to py_arglist. Must be called with the GIL held.
+ */
+void async_command_invoke(AerospikeAsyncCommand *cmd, PyObject *py_arglist);
+
+/**
+ * Builds the (err, exception) pair handed to Python callbacks. exception is
+ * None on success, otherwise a new exception instance with key set to py_key.
+ */
+void async_error_to_pyobjects(as_error *err, PyObject *py_key,
+                              PyObject **py_err, PyObject **py_exception);
+
+/**
+ * Replaces the C client event loops with new ones configured from the
+ * init_async arguments. max_commands_* of 0 means unlimited.
+ */
+as_status async_loops_init(as_error *err, uint32_t loops,
+                           uint32_t max_commands_in_process,
+                           uint32_t max_commands_in_queue, int assignment);
+
+/**
+ * Event loop a single-record command for key should run on, or NULL to let
+ * the C client choose.
+ */
+as_event_loop *async_event_loop(as_key *key);
+
+/**
+ * aerospike.async_loop_stats()
+ */
+PyObject *Aerospike_Async_Loop_Stats(PyObject *self, PyObject *args);
+
+/*******************************************************************************
+ * Completion queue. When enabled, listeners hand results to
+ * process_async_completions() instead of taking the GIL themselves.
+ ******************************************************************************/
+
+/**
+ * Enables or disables the completion queue, creating its wakeup pipe the
+ * first time it is enabled.
+ */
+as_status async_completion_queue_init(as_error *err, bool enable);
+
+bool async_completion_queue_enabled(void);
+
+/**
+ * Records handed to queued listeners must outlive the listener, so the C
+ * client has to allocate them on the heap. These return policy_p unchanged
+ * unless cmd is queued, in which case local holds a copy of the policy with
+ * async_heap_rec set. Either way they record in cmd->heap_rec whether the
+ * record will be on the heap.
+ */
+as_policy_read *async_policy_read(AerospikeAsyncCommand *cmd,
+                                  as_policy_read *policy_p,
+                                  as_policy_read *local);
+
+as_policy_operate *async_policy_operate(AerospikeAsyncCommand *cmd,
+                                        as_policy_operate *policy_p,
+                                        as_policy_operate *local);
+
+/**
+ * aerospike.async_completion_fd() and aerospike.process_async_completions().
+ */
+PyObject *Aerospike_Async_Completion_Fd(PyObject *self, PyObject *args);
+
+PyObject *Aerospike_Process_Async_Completions(PyObject *self, PyObject *args);
+
+/*******************************************************************************
+ * C client listeners. The Python callback receives (result, err, exception)
+ * where result matches the return value of the equivalent sync method.
+ ******************************************************************************/
+
+void async_record_listener(as_error *err, as_record *record, void *udata,
+                           as_event_loop *event_loop);
+
+void async_write_listener(as_error *err, void *udata,
+                          as_event_loop *event_loop);
+
+void async_value_listener(as_error *err, as_val *val, void *udata,
+                          as_event_loop *event_loop);
+
+void async_batch_listener(as_error *err, as_batch_read_records *records,
+                          void *udata, as_event_loop *event_loop);
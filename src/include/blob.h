@@ -0,0 +1,48 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+
+/*******************************************************************************
+ * aerospike.Blob, the read only buffer behind the memoryviews returned for
+ * AS_BYTES_BLOB values when the client is created with
+ * "blob_memoryview": True.
+ *
+ * It owns a cf_malloc'ed copy of the payload, or the C client's own buffer
+ * when that can be taken over, and frees it once the last view is released.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject_HEAD uint8_t *data;
+    Py_ssize_t size;
+} AerospikeBlob;
+
+PyTypeObject *AerospikeBlob_Ready(void);
+
+/**
+ * Returns a read only memoryview over the payload of bytes. The buffer is
+ * taken over instead of copied when bytes owns it and nothing else references
+ * bytes. Returns NULL and sets err on failure.
+ */
+PyObject *AerospikeBlob_MemoryView(as_error *err, as_bytes *bytes);
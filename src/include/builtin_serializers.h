@@ -0,0 +1,59 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * Serializers implemented by the client itself, selected per call with
+ * aerospike.SERIALIZER_JSON / SERIALIZER_MSGPACK or per client with the name
+ * given as the "serialization" config. Values are stored as AS_BYTES_BLOB.
+ *
+ * Raw blobs are stored as AS_BYTES_BLOB too, so every encoded value starts
+ * with a BUILTIN_HEADER_SIZE byte header naming its serializer. Only blobs
+ * with the header are decoded. The first header byte, 0xC1, is neither valid
+ * msgpack nor valid UTF-8.
+ ******************************************************************************/
+
+#define BUILTIN_HEADER_SIZE 4
+
+/**
+ * Returns the SERIALIZER_* value registered under name, or SERIALIZER_NONE if
+ * there is none.
+ */
+int builtin_serializer_from_name(const char *name);
+
+/**
+ * Encodes value into bytes with the given built-in serializer.
+ */
+as_status builtin_serialize(AerospikeClient *self, as_error *err,
+                            int serializer, PyObject *value, as_bytes *bytes);
+
+/**
+ * Decodes bytes with the given built-in serializer. Returns a new reference,
+ * or NULL without an exception set if bytes do not start with the header of
+ * that serializer or are not in its encoding.
+ */
+PyObject *builtin_deserialize(AerospikeClient *self, int serializer,
+                              as_bytes *bytes);
@@ -124,6 +124,24 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
                                     PyObject *kwds);
 
+/**
+ * Async check existence of a record in the database.
+ *
+ *		client.exists_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Exists_Async(AerospikeClient *self, PyObject *args,
+                                       PyObject *kwds);
+
+/**
+ * Async project specific bins of a record from the database.
+ *
+ *		client.select_async(callback, (x,y,z), (bin1, bin2, bin3))
+ *
+ */
+PyObject *AerospikeClient_Select_Async(AerospikeClient *self, PyObject *args,
+                                       PyObject *kwds);
+
 /**
  * Project specific bins of a record from the database.
  *
@@ -168,6 +186,36 @@ PyObject *AerospikeClient_Remove(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Remove_Invoke(AerospikeClient *self, PyObject *py_key,
                                         PyObject *py_meta, PyObject *py_policy);
 
+/**
+ * Async remove a record from the database.
+ *
+ *		client.remove_async(callback, (x,y,z))
+ *
+ */
+PyObject *AerospikeClient_Remove_Async(AerospikeClient *self, PyObject *args,
+                                       PyObject *kwds);
+
+/**
+ * Async apply a UDF on a record in the database.
+ *
+ *		client.apply_async(callback, (x,y,z), module, function, args)
+ *
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+                                      PyObject *kwds);
+
+/**
+ * Async perform multiple operations on a single record.
+ *
+ *		client.operate_async(callback, (x,y,z), [ops])
+ *		client.operate_ordered_async(callback, (x,y,z), [ops])
+ *
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds);
+PyObject *AerospikeClient_OperateOrdered_Async(AerospikeClient *self,
+                                               PyObject *args, PyObject *kwds);
+
 /**
  * Remove bin from the database.
  *
@@ -225,6 +273,15 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
                                          PyObject *kwds);
 
+/**
+ * Converts an operation list once for reuse by operate and operate_ordered
+ *
+ *		prepared = client.prepare_operations(ops)
+ *
+ */
+PyObject *AerospikeClient_PrepareOperations(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds);
+
 /*******************************************************************************
  * LIST FUNCTIONS(CDT)
  ******************************************************************************/
@@ -687,6 +744,30 @@ PyObject *AerospikeClient_Set_Log_Handler(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_Get_Many(AerospikeClient *self, PyObject *args,
                                    PyObject *kwds);
 
+/**
+ * Get the records of an iterable of keys in chunks
+ *
+ *		for record in client.get_many_iter(keys, policies):
+ *
+ */
+PyObject *AerospikeClient_Get_Many_Iter(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds);
+
+/**
+ * Async batch reads
+ *
+ *		client.get_many_async(callback, [keys], policies)
+ *		client.select_many_async(callback, [keys], [bins], policies)
+ *		client.exists_many_async(callback, [keys], policies)
+ *
+ */
+PyObject *AerospikeClient_Get_Many_Async(AerospikeClient *self, PyObject *args,
+                                         PyObject *kwds);
+PyObject *AerospikeClient_Select_Many_Async(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds);
+PyObject *AerospikeClient_Exists_Many_Async(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds);
+
 /**
  * Get records in a batch
  *
@@ -774,6 +855,24 @@ PyObject *AerospikeClient_SetXDRFilter(AerospikeClient *self, PyObject *args,
 PyObject *AerospikeClient_GetExpressionBase64(AerospikeClient *self,
                                               PyObject *args, PyObject *kwds);
 
+/**
+* Pack an aerospike expression once so it can be reused without conversion.
+*
+* compiled = client.compile_expression(expr.compile())
+*
+*/
+PyObject *AerospikeClient_CompileExpression(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds);
+
+/**
+* Freeze a policy dict so it is converted at most once per kind of command.
+*
+* prepared = client.prepare_policy(policy)
+*
+*/
+PyObject *AerospikeClient_PreparePolicy(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds);
+
 /**
  * Send an info request to the entire cluster
  * client.info_all("statistics", {}")
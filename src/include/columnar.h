@@ -0,0 +1,78 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+/*******************************************************************************
+ * Numeric columns filled straight from scan and query results.
+ *
+ * Each requested bin gets a contiguous buffer of 8 byte values and a validity
+ * mask with one byte per row. Integer columns switch to double, in place, the
+ * first time a float is seen. Any other value, or a missing bin, leaves the
+ * row invalid with a value of 0.
+ *
+ * The foreach callback touches no Python objects, so it runs without the GIL
+ * and only takes the columns' own lock.
+ ******************************************************************************/
+
+typedef struct {
+    as_bin_name name;
+    bool is_double;
+    // int64_t or double values, one per row.
+    void *values;
+    // 1 if the row holds a value for this bin, else 0.
+    uint8_t *valid;
+} columnar_column;
+
+typedef struct {
+    pthread_mutex_t lock;
+    columnar_column *columns;
+    uint32_t n_columns;
+    uint64_t rows;
+    uint64_t capacity;
+    // First error hit by the callback.
+    as_error error;
+} columnar_results;
+
+/**
+ * Sets up one column per bin name in py_bins, a list or tuple of str.
+ */
+as_status columnar_results_init(as_error *err, columnar_results *results,
+                                PyObject *py_bins);
+
+/**
+ * as_scan/as_query foreach callback appending one row per record to the
+ * columnar_results passed as udata.
+ */
+bool columnar_results_each(const as_val *val, void *udata);
+
+/**
+ * Returns {bin: (array.array, bytearray)}, the values as an array of typecode
+ * 'q' or 'd' and the validity mask. Requires the GIL.
+ */
+PyObject *columnar_results_to_pyobject(as_error *err,
+                                       columnar_results *results);
+
+void columnar_results_destroy(columnar_results *results);
@@ -0,0 +1,48 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_exp.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * aerospike.CompiledExpression, the packed form of an expression list.
+ *
+ * Created by client.compile_expression() and accepted anywhere an expression
+ * list is, so filters reused across calls are only converted once.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject_HEAD as_exp *exp;
+} AerospikeCompiledExpression;
+
+PyTypeObject *AerospikeCompiledExpression_Ready(void);
+
+/**
+ * Wraps exp, taking ownership of it.
+ */
+PyObject *AerospikeCompiledExpression_New(as_exp *exp);
+
+/**
+ * Returns the as_exp held by py_obj if it is a CompiledExpression, NULL
+ * otherwise. The as_exp is borrowed and lives as long as py_obj.
+ */
+as_exp *compiled_expression_exp(PyObject *py_obj);
@@ -128,6 +128,23 @@ as_status record_to_pyobject(AerospikeClient *self, as_error *err,
                              const as_record *rec, const as_key *key,
                              PyObject **obj);
 
+/**
+ * Converts rec to an aerospike.Record, the "record_format": "compact" form,
+ * with its bins as an aerospike.LazyBins when lazy_bins is true.
+ */
+as_status record_to_compact_pyobject(AerospikeClient *self, as_error *err,
+                                     const as_record *rec, const as_key *key,
+                                     bool lazy_bins, PyObject **obj);
+
+/**
+ * Converts a scan or query result. Records become an aerospike.Record unless
+ * record_format is RECORD_FORMAT_TUPLE, anything else goes through
+ * val_to_pyobject.
+ */
+as_status result_to_pyobject(AerospikeClient *self, as_error *err,
+                             const as_val *val, int record_format,
+                             PyObject **obj);
+
 as_status record_to_resultpyobject(AerospikeClient *self, as_error *err,
                                    const as_record *rec, PyObject **obj);
 
@@ -194,6 +211,7 @@ as_status as_batch_read_results_to_pyobject(as_error *err,
 
 as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err,
                                          as_batch_read_records *records,
+                                         int record_format,
                                          PyObject **py_recs);
 
 as_status string_and_pyuni_from_pystring(PyObject *py_string,
@@ -223,6 +241,22 @@ as_partitions_status_to_pyobject(as_error *err,
 as_status as_partition_status_to_pyobject(
     as_error *err, const as_partition_status *part_status, PyObject **py_tuple);
 
+/**
+ * Creates an instance of py_cls, aerospike_helpers.batch.records.BatchRecord
+ * or a subclass, for py_key without running its Python __init__. Returns NULL
+ * and sets err on failure.
+ */
+PyObject *batch_record_new(as_error *err, PyObject *py_cls, PyObject *py_key);
+
+/**
+ * Sets result and in_doubt on py_batch_record and, if result is AEROSPIKE_OK,
+ * record from rec.
+ */
+as_status batch_record_set_result(AerospikeClient *self, as_error *err,
+                                  PyObject *py_batch_record, as_status result,
+                                  bool in_doubt, const as_record *rec,
+                                  const as_key *key);
+
 as_status as_batch_result_to_BatchRecord(AerospikeClient *self, as_error *err,
                                          as_batch_result *bres,
                                          PyObject *py_batch_record);
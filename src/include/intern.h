@@ -0,0 +1,41 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+
+/*******************************************************************************
+ * Shared str objects for namespace, set and bin names.
+ *
+ * Every record converted to Python carries the same handful of names, so
+ * instead of building a new str for each one they are looked up in a small
+ * table keyed by the C string. All functions must be called with the GIL
+ * held.
+ ******************************************************************************/
+
+/**
+ * Returns a new reference to the str for name, creating and remembering it
+ * the first time. Once the table is full, names not already in it are
+ * created on every call as before. Returns NULL with a Python exception set
+ * if name is not valid UTF-8.
+ */
+PyObject *name_to_pyobject(const char *name);
+
+/**
+ * Number of names currently shared, for tests and benchmarks.
+ */
+Py_ssize_t name_table_size(void);
@@ -0,0 +1,54 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+/*******************************************************************************
+ * aerospike.Key, an immutable key accepted wherever a key tuple is.
+ *
+ * The key is validated once, when it is created, and keeps the converted
+ * as_key along with its digest and partition id. Passing it to a command
+ * copies the cached as_key, so the key tuple is not parsed again and the
+ * digest is not computed again.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *ns;
+    PyObject *set;
+    // A bytearray key is copied, so changing it later does not change the key.
+    PyObject *key;
+    // Owns its key value, with the digest computed.
+    as_key as_key;
+    uint32_t partition_id;
+} AerospikeKey;
+
+PyTypeObject *AerospikeKey_Ready(void);
+
+bool AerospikeKey_Check(PyObject *py_obj);
+
+/**
+ * Initialises key from py_key, an aerospike.Key, with the digest already set.
+ * Destroy key with as_key_destroy() once the command is done.
+ */
+as_status AerospikeKey_To_As_Key(as_error *err, PyObject *py_key, as_key *key);
@@ -0,0 +1,57 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * aerospike.LazyBins, the bins of a record returned with
+ * "record_format": "lazy".
+ *
+ * A read only mapping that keeps heap allocated bin values, lists, maps and
+ * the like, as the C client's as_val until the bin is first looked up. Values
+ * stored inside the record itself are converted up front since the record is
+ * freed once it has been converted.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject *py_name;
+    // Reserved value still to be converted, NULL once py_value is set.
+    as_val *val;
+    PyObject *py_value;
+} lazy_bin;
+
+typedef struct {
+    PyObject_HEAD AerospikeClient *client;
+    Py_ssize_t size;
+    lazy_bin *bins;
+} AerospikeLazyBins;
+
+PyTypeObject *AerospikeLazyBins_Ready(void);
+
+/**
+ * Builds the lazy bins of rec. Returns NULL and sets err on failure.
+ */
+PyObject *AerospikeLazyBins_New(AerospikeClient *client, as_error *err,
+                                const as_record *rec);
@@ -41,6 +41,7 @@ enum Aerospike_serializer_values {
     SERIALIZER_PYTHON, /* default handler for serializer type */
     SERIALIZER_JSON,
     SERIALIZER_USER,
+    SERIALIZER_MSGPACK,
 };
 
 enum Aerospike_send_bool_as_values {
@@ -49,6 +50,13 @@ enum Aerospike_send_bool_as_values {
     SEND_BOOL_AS_AS_BOOL,
 };
 
+/* How records are returned by scans, queries and batch reads */
+enum Aerospike_record_format_values {
+    RECORD_FORMAT_TUPLE, /* default, a (key, meta, bins) tuple */
+    RECORD_FORMAT_COMPACT, /* an aerospike.Record */
+    RECORD_FORMAT_LAZY, /* an aerospike.Record with aerospike.LazyBins */
+};
+
 enum Aerospike_list_operations {
     OP_LIST_APPEND = 1001,
     OP_LIST_APPEND_ITEMS,
@@ -307,4 +315,13 @@ as_status pyobject_to_batch_remove_policy(AerospikeClient *self, as_error *err,
                                           as_policy_batch_remove *policy,
                                           as_policy_batch_remove **policy_p,
                                           as_exp *exp_list,
-                                          as_exp **exp_list_p);
\ No newline at end of file
+                                          as_exp **exp_list_p);
+
+as_status pyobject_to_record_format(as_error *err, PyObject *py_policy,
+                                    int *record_format);
+
+as_status pyobject_to_missing(as_error *err, PyObject *py_missing,
+                              bool *missing_none);
+
+as_status pyobject_to_policy_missing(AerospikeClient *self, as_error *err,
+                                     PyObject *py_policy, bool *missing_none);
@@ -1,35 +1,109 @@
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+
 /*
  *******************************************************************************************************
- * Static pool maintained to avoid runtime mallocs.
- * It comprises of following pools:
- * 1. Pool for Arraylist
- * 2. Pool for Hashmap
- * 3. Pool for Strings
- * 4. Pool for Integers
- * 5. Pool for Bytes
+ * Pool of as_bytes used while converting Python values for a command.
+ *
+ * The first AS_STATIC_POOL_SIZE entries are kept in the pool itself so small
+ * commands do not allocate. Once they are used up, entries are taken from
+ * heap chunks, each twice the size of the previous one, so the number of
+ * blobs in a command is not limited. Entries never move once handed out and
+ * a zeroed pool is an empty pool.
+ *
+ * The pool also hands out scratch memory for the as_val structs, bins and
+ * strings built while converting a command, see POOL_ALLOC. Values using it
+ * are initialised so that destroying them does not free the struct itself,
+ * and must be destroyed before the pool is.
+ *
+ * POOL_DESTROY destroys every entry and releases the chunks. Where the entries
+ * are owned by the records or operations they were added to, and destroyed
+ * with them, POOL_FREE only releases the chunks, after those have been
+ * destroyed. The largest released chunks are kept by the calling thread and
+ * reused by its next command instead of being freed.
+ *
+ * Blobs may also borrow the memory of Python buffers held by the pool, see
+ * static_pool_hold_buffer. The buffers are released last, so values using
+ * them must be destroyed before the pool is, which needs the GIL.
  *******************************************************************************************************
  */
-#define AS_MAX_STORE_SIZE 4096
+#define AS_STATIC_POOL_SIZE 32
+
+typedef struct as_bytes_chunk_s {
+    struct as_bytes_chunk_s *next;
+    uint32_t capacity;
+    uint32_t size;
+    as_bytes entries[];
+} as_bytes_chunk;
+
+typedef struct as_scratch_chunk_s {
+    struct as_scratch_chunk_s *next;
+    size_t capacity;
+    size_t used;
+    uint64_t data[];
+} as_scratch_chunk;
 
 typedef struct bytes_static_pool {
-    as_bytes bytes_pool[AS_MAX_STORE_SIZE];
+    as_bytes bytes_pool[AS_STATIC_POOL_SIZE];
     uint32_t current_bytes_id;
+    // Chunks used once bytes_pool is full, the most recent first.
+    as_bytes_chunk *chunks;
+    // Scratch memory, the most recent chunk first.
+    as_scratch_chunk *scratch;
+    // Python buffers whose memory is used by blobs of the pool's values.
+    Py_buffer *buffers;
+    uint32_t buffers_size;
+    uint32_t buffers_capacity;
 } as_static_pool;
 
-#define BYTES_CNT(static_pool)                                                 \
-    (((as_static_pool *)static_pool)->current_bytes_id)
+/**
+ * Returns the next unused entry of the pool, or NULL if no memory is left.
+ */
+as_bytes *static_pool_get_bytes(as_static_pool *static_pool);
+
+/**
+ * Returns size bytes of scratch memory, 8 byte aligned, or NULL if no memory
+ * is left. The memory is valid until the pool is destroyed or freed.
+ */
+void *static_pool_alloc(as_static_pool *static_pool, size_t size);
+
+/**
+ * Keeps view acquired until the pool is destroyed or freed, so its memory can
+ * be used without a copy. Returns false if no memory is left, in which case
+ * the view is still owned by the caller.
+ */
+bool static_pool_hold_buffer(as_static_pool *static_pool, Py_buffer *view);
 
-#define BYTES_POOL(static_pool) ((as_static_pool *)static_pool)->bytes_pool
+/**
+ * Destroys every entry handed out by the pool if destroy_entries is set,
+ * releases its chunks and buffers and leaves it empty.
+ */
+void static_pool_release(as_static_pool *static_pool, bool destroy_entries);
 
 #define GET_BYTES_POOL(map_bytes, static_pool, err)                            \
-    if (AS_MAX_STORE_SIZE > BYTES_CNT(static_pool)) {                          \
-        map_bytes = &(BYTES_POOL(static_pool)[BYTES_CNT(static_pool)++]);      \
-    }                                                                          \
-    else {                                                                     \
-        as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");       \
-    }
+    do {                                                                       \
+        map_bytes = static_pool_get_bytes((as_static_pool *)static_pool);     \
+        if (!map_bytes) {                                                      \
+            as_error_update(err, AEROSPIKE_ERR, "Cannot allocate as_bytes");   \
+        }                                                                      \
+    } while (0)
 
 #define POOL_DESTROY(static_pool)                                              \
-    for (uint32_t iter = 0; iter < BYTES_CNT(static_pool); iter++) {           \
-        as_bytes_destroy(&BYTES_POOL(static_pool)[iter]);                      \
-    }
+    static_pool_release((as_static_pool *)static_pool, true)
+
+#define POOL_FREE(static_pool)                                                 \
+    static_pool_release((as_static_pool *)static_pool, false)
+
+/**
+ * Scratch memory for a value of the given type, or NULL when there is no pool
+ * or no memory left, in which case the value should be allocated on its own.
+ */
+#define POOL_ALLOC(static_pool, type)                                          \
+    ((static_pool) ? (type *)static_pool_alloc(static_pool, sizeof(type))     \
+                   : NULL)
@@ -0,0 +1,59 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+
+#include "pool.h"
+#include "types.h"
+
+/*******************************************************************************
+ * aerospike.PreparedOperations, an operation list converted once.
+ *
+ * Created by client.prepare_operations() and accepted by operate() and
+ * operate_ordered() in place of the list, so operation lists reused across
+ * calls skip the per-call dict parsing and value conversion.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject_HEAD as_operations ops;
+    // Strings and bytes referenced by ops.
+    as_vector *unicodeStrVector;
+    as_static_pool *static_pool;
+    // Private copies of the operation dicts, ops may borrow their values.
+    PyObject *py_ops;
+} AerospikePreparedOperations;
+
+PyTypeObject *AerospikePreparedOperations_Ready(void);
+
+/**
+ * Converts the operation dicts in py_list. Returns NULL and sets err on
+ * failure.
+ */
+PyObject *AerospikePreparedOperations_New(AerospikeClient *client,
+                                          as_error *err, PyObject *py_list);
+
+/**
+ * Returns the operations held by py_obj if it is a PreparedOperations, NULL
+ * otherwise. The operations are borrowed, read only and live as long as
+ * py_obj.
+ */
+as_operations *prepared_operations_ops(PyObject *py_obj);
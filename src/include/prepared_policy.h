@@ -0,0 +1,103 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include <aerospike/as_exp.h>
+
+/*******************************************************************************
+ * aerospike.PreparedPolicy, a policy dict converted at most once per command
+ * kind.
+ *
+ * Created by client.prepare_policy() and accepted anywhere a policy dict is.
+ * The first command of each kind converts it as usual and keeps the resulting
+ * as_policy_* struct, so later commands copy the struct instead of looking
+ * up every field again.
+ ******************************************************************************/
+
+enum Aerospike_prepared_policy_kinds {
+    PREPARED_POLICY_ADMIN,
+    PREPARED_POLICY_APPLY,
+    PREPARED_POLICY_QUERY,
+    PREPARED_POLICY_READ,
+    PREPARED_POLICY_REMOVE,
+    PREPARED_POLICY_SCAN,
+    PREPARED_POLICY_WRITE,
+    PREPARED_POLICY_OPERATE,
+    PREPARED_POLICY_BATCH,
+    PREPARED_POLICY_BATCH_WRITE,
+    PREPARED_POLICY_BATCH_READ,
+    PREPARED_POLICY_BATCH_APPLY,
+    PREPARED_POLICY_BATCH_REMOVE,
+    PREPARED_POLICY_KINDS
+};
+
+typedef struct {
+    // policy_generation of the client the policy was converted for, 0 if the
+    // slot is unused.
+    uint64_t owner;
+    void *policy;
+    // Filter expression converted along with the policy.
+    as_exp *exp;
+} AerospikePreparedPolicySlot;
+
+typedef struct {
+    PyObject_HEAD
+    // Private copy of the policy dict.
+    PyObject *py_policy;
+    AerospikePreparedPolicySlot slots[PREPARED_POLICY_KINDS];
+} AerospikePreparedPolicy;
+
+PyTypeObject *AerospikePreparedPolicy_Ready(void);
+
+/**
+ * Wraps a copy of the policy dict py_policy.
+ */
+PyObject *AerospikePreparedPolicy_New(PyObject *py_policy);
+
+bool prepared_policy_check(PyObject *py_obj);
+
+/**
+ * Returns the policy dict held by py_obj if it is a PreparedPolicy, py_obj
+ * itself otherwise. Borrowed.
+ */
+PyObject *prepared_policy_dict(PyObject *py_obj);
+
+/**
+ * Returns a new policy_generation, never returned before.
+ */
+uint64_t prepared_policy_next_generation(void);
+
+/**
+ * Copies the policy of the given kind converted for owner, a client's
+ * policy_generation, into policy. Returns false if it has not been converted
+ * yet.
+ */
+bool prepared_policy_get(PyObject *py_obj, int kind, uint64_t owner,
+                         void *policy, size_t size);
+
+/**
+ * Keeps a copy of a freshly converted policy. Takes ownership of the filter
+ * expression in *exp_list_p, clearing it, since the kept policy points to it.
+ * Nothing is kept if the slot is already used by another owner.
+ */
+void prepared_policy_set(PyObject *py_obj, int kind, uint64_t owner,
+                         const void *policy, size_t size, as_exp **exp_list_p);
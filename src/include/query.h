@@ -104,6 +104,27 @@ PyObject *AerospikeQuery_Foreach(AerospikeQuery *self, PyObject *args,
 PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
                                  PyObject *kwds);
 
+/**
+ * Execute the query and return an iterator over its results, buffering at
+ * most queue_size of them.
+ *
+ *		for result in query.iter_results():
+ *			print result
+ *
+ */
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+                                      PyObject *kwds);
+
+/**
+ * Execute the query and collect the numeric values of the given bins into
+ * columns, without building per record objects.
+ *
+ *		columns = query.results_columnar(["a", "b"])
+ *
+ */
+PyObject *AerospikeQuery_Results_Columnar(AerospikeQuery *self, PyObject *args,
+                                          PyObject *kwds);
+
 /**
  * Execute a UDF in the background. Returns the query id to allow status of the query to be monitored.
  * */
@@ -0,0 +1,49 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+/*******************************************************************************
+ * aerospike.Record, the compact form of a record returned when a policy sets
+ * "record_format": "compact".
+ *
+ * It keeps gen and ttl as C fields instead of a meta dict per record, and
+ * still unpacks and indexes like the (key, meta, bins) tuple.
+ ******************************************************************************/
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *key;
+    // dict or aerospike.LazyBins, None when the record was not found.
+    PyObject *bins;
+    uint32_t ttl;
+    uint16_t gen;
+    // False when the record was not found, gen and ttl are then None.
+    bool has_meta;
+} AerospikeRecord;
+
+PyTypeObject *AerospikeRecord_Ready(void);
+
+/**
+ * Steals the references to py_key and py_bins. py_bins may be NULL for a
+ * record that was not found.
+ */
+PyObject *AerospikeRecord_New(PyObject *py_key, PyObject *py_bins,
+                              uint16_t gen, uint32_t ttl, bool has_meta);
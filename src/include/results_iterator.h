@@ -0,0 +1,117 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#pragma once
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_val.h>
+
+#include "types.h"
+
+/*******************************************************************************
+ * Iterator over the results of a query, scan or batch reads run on a
+ * background thread.
+ *
+ * The C client callback threads convert each result and push it onto a
+ * bounded queue, blocking while it is full. The Python thread pops results
+ * off the queue with the GIL released while it waits. Closing or collecting
+ * the iterator aborts the job.
+ *
+ * Event loops can instead wait for fileno() to become readable, which it is
+ * whenever results are pending or the job has finished, and take whatever is
+ * buffered with next_batch() without blocking.
+ ******************************************************************************/
+
+typedef struct AerospikeResultsIterator_s AerospikeResultsIterator;
+
+/**
+ * Runs the query or scan to completion, passing results_iterator_each_result
+ * and the iterator as the callback and udata. Called without the GIL.
+ */
+typedef void (*results_iterator_run_fn)(AerospikeResultsIterator *self,
+                                        as_error *err);
+
+/**
+ * Releases the job. Called with the GIL held once the job has finished.
+ */
+typedef void (*results_iterator_destroy_fn)(void *job);
+
+struct AerospikeResultsIterator_s {
+    PyObject_HEAD AerospikeClient *client;
+    // The Query or Scan being run, kept alive until the job has finished.
+    PyObject *owner;
+    void *job;
+    results_iterator_run_fn run;
+    results_iterator_destroy_fn destroy;
+
+    pthread_t thread;
+    bool thread_started;
+    pthread_mutex_t lock;
+    pthread_cond_t not_empty;
+    pthread_cond_t not_full;
+
+    // Ring buffer of converted results, guarded by lock.
+    PyObject **queue;
+    uint32_t capacity;
+    uint32_t head;
+    uint32_t count;
+    // The job has returned.
+    bool done;
+    // The consumer has gone away, producers must stop.
+    bool closed;
+    // First error hit by the job, raised once the queue is drained.
+    as_error error;
+    // Wakeup pipe, created by the first call to fileno().
+    int notify_fds[2];
+    // One of the RECORD_FORMAT_* values.
+    int record_format;
+};
+
+PyTypeObject *AerospikeResultsIterator_Ready(void);
+
+/**
+ * Creates an iterator buffering at most queue_size results. Takes new
+ * references to client and owner.
+ */
+AerospikeResultsIterator *AerospikeResultsIterator_New(AerospikeClient *client,
+                                                       PyObject *owner,
+                                                       uint32_t queue_size);
+
+/**
+ * Hands job to the iterator and starts the background thread. On failure the
+ * job is released with destroy and err is set.
+ */
+as_status AerospikeResultsIterator_Start(AerospikeResultsIterator *self,
+                                         as_error *err, void *job,
+                                         results_iterator_run_fn run,
+                                         results_iterator_destroy_fn destroy);
+
+/**
+ * as_query/as_scan foreach callback feeding the iterator passed as udata.
+ */
+bool results_iterator_each_result(const as_val *val, void *udata);
+
+/**
+ * Queues a converted result, waiting while the queue is full. Steals the
+ * reference to py_result. Returns false, having released py_result, once the
+ * iterator is closed. Called without the GIL.
+ */
+bool results_iterator_push(AerospikeResultsIterator *self,
+                           PyObject *py_result);
@@ -82,6 +82,27 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
 PyObject *AerospikeScan_Results(AerospikeScan *self, PyObject *args,
                                 PyObject *kwds);
 
+/**
+ * Execute the scan and return an iterator over its results, buffering at
+ * most queue_size of them.
+ *
+ *    for result in scan.iter_results():
+ *      print result
+ *
+ */
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+                                     PyObject *kwds);
+
+/**
+ * Execute the scan and collect the numeric values of the given bins into
+ * columns, without building per record objects.
+ *
+ *    columns = scan.results_columnar(["a", "b"])
+ *
+ */
+PyObject *AerospikeScan_Results_Columnar(AerospikeScan *self, PyObject *args,
+                                         PyObject *kwds);
+
 /**
  * Execute the scan in the background.
  *
@@ -55,11 +55,28 @@ PyObject *AerospikeClient_Unset_Serializers(AerospikeClient *self,
  *		client.unset_serializers()
  *
  */
-extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
-                                                      int32_t serializer_policy,
-                                                      as_bytes **bytes,
-                                                      PyObject *value,
-                                                      as_error *error_p);
+extern as_status serialize_based_on_serializer_policy(
+    AerospikeClient *self, int32_t serializer_policy, as_bytes **bytes,
+    PyObject *value, as_static_pool *static_pool, as_error *error_p);
+
+/**
+ * Gets the memory of a buffer to be sent as a blob. It is used as is while
+ * static_pool keeps the buffer, or copied if static_pool is NULL.
+ */
+as_status pyobject_buffer_to_blob(as_error *error_p, PyObject *py_obj,
+                                  as_static_pool *static_pool, uint8_t **blob,
+                                  uint32_t *blob_len, bool *blob_free);
+
+/**
+ * pickle_protocol of a client that did not set one, dumps is then called
+ * with the pickle module's default protocol.
+ */
+#define PICKLE_PROTOCOL_DEFAULT -1
+
+/**
+ * Returns pickle.HIGHEST_PROTOCOL, or -1 if it cannot be looked up.
+ */
+int pickle_highest_protocol(void);
 
 /**
  * Deserializes Py_Object (value) into as_bytes using Deserialization logic
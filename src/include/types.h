@@ -73,6 +73,19 @@ typedef struct {
     bool has_connected;
     bool use_shared_connection;
     uint8_t send_bool_as;
+    // Return AS_BYTES_BLOB values as read only memoryviews.
+    bool blob_memoryview;
+    // Protocol passed to pickle.dumps, PICKLE_PROTOCOL_DEFAULT if not set.
+    int pickle_protocol;
+    // SERIALIZER_JSON or SERIALIZER_MSGPACK when "serialization" names a
+    // built-in serializer, SERIALIZER_NONE otherwise.
+    uint8_t builtin_serializer;
+    // Return None instead of raising RecordNotFound from get, select, exists
+    // and operate, unless their policy sets "missing".
+    bool missing_none;
+    // Identifies the defaults prepared policies are converted against. Set
+    // whenever as changes and never reused, unlike the address of as.
+    uint64_t policy_generation;
 } AerospikeClient;
 
 typedef struct {
@@ -33,6 +33,15 @@
 #include "module_functions.h"
 #include "nullobject.h"
 #include "cdt_types.h"
+#include "async.h"
+#include "results_iterator.h"
+#include "compiled_expression.h"
+#include "prepared_operations.h"
+#include "prepared_policy.h"
+#include "record.h"
+#include "key.h"
+#include "lazy_bins.h"
+#include "blob.h"
 #include <aerospike/as_log_macros.h>
 
 PyObject *py_global_hosts;
@@ -52,8 +61,32 @@ config = {\n\
 client = aerospike.client(config)");
 
 PyDoc_STRVAR(init_async_doc,
-             "init_async() -> initialize aerospike async eventloop library\n\
-aerospike.init_async()");
+             "init_async([loops[, max_commands_in_process[, max_commands_in_queue[, loop_assignment[, completion_queue]]]]]) -> initialize aerospike async eventloop library\n\
+aerospike.init_async(loops=4)\n\
+\n\
+Creates loops C client event loops, one thread each. max_commands_in_process \
+caps the commands running on each loop, with up to max_commands_in_queue \
+more waiting for a slot (0 means unlimited). loop_assignment is \
+ASYNC_LOOP_ROUND_ROBIN or ASYNC_LOOP_PARTITION, which keeps every key on the \
+loop owning its partition.\n\
+\n\
+If completion_queue is True, async callbacks are no longer run on the event \
+loop thread. Results are queued until process_async_completions() is called, \
+which async_completion_fd() becomes readable to signal.");
+
+PyDoc_STRVAR(async_loop_stats_doc, "async_loop_stats() -> list\n\
+\n\
+Per event loop dicts with the number of commands in process and queued.");
+
+PyDoc_STRVAR(async_completion_fd_doc,
+             "async_completion_fd() -> int\n\
+\n\
+File descriptor that becomes readable when async results are queued.");
+
+PyDoc_STRVAR(process_async_completions_doc,
+             "process_async_completions() -> int\n\
+\n\
+Invoke the callbacks of all queued async results, returns how many ran.");
 
 static PyMethodDef Aerospike_Methods[] = {
 
@@ -67,6 +100,13 @@ static PyMethodDef Aerospike_Methods[] = {
 
     {"init_async", (PyCFunction)AerospikeInitAsync,
      METH_VARARGS | METH_KEYWORDS, init_async_doc},
+    {"async_loop_stats", (PyCFunction)Aerospike_Async_Loop_Stats, METH_NOARGS,
+     async_loop_stats_doc},
+    {"async_completion_fd", (PyCFunction)Aerospike_Async_Completion_Fd,
+     METH_NOARGS, async_completion_fd_doc},
+    {"process_async_completions",
+     (PyCFunction)Aerospike_Process_Async_Completions, METH_NOARGS,
+     process_async_completions_doc},
     {"client", (PyCFunction)AerospikeClient_New, METH_VARARGS | METH_KEYWORDS,
      client_doc},
     {"set_log_level", (PyCFunction)Aerospike_Set_Log_Level,
@@ -190,6 +230,56 @@ MOD_INIT(aerospike)
     PyModule_AddObject(aerospike, "Scan", (PyObject *)scan);
     Aerospike_State(aerospike)->scan = scan;
 
+    PyTypeObject *results_iterator = AerospikeResultsIterator_Ready();
+    Py_INCREF(results_iterator);
+    PyModule_AddObject(aerospike, "ResultsIterator",
+                       (PyObject *)results_iterator);
+
+    PyTypeObject *compiled_expression = AerospikeCompiledExpression_Ready();
+    Py_INCREF(compiled_expression);
+    PyModule_AddObject(aerospike, "CompiledExpression",
+                       (PyObject *)compiled_expression);
+
+    PyTypeObject *prepared_operations = AerospikePreparedOperations_Ready();
+    Py_INCREF(prepared_operations);
+    PyModule_AddObject(aerospike, "PreparedOperations",
+                       (PyObject *)prepared_operations);
+
+    PyTypeObject *prepared_policy = AerospikePreparedPolicy_Ready();
+    Py_INCREF(prepared_policy);
+    PyModule_AddObject(aerospike, "PreparedPolicy",
+                       (PyObject *)prepared_policy);
+
+    PyTypeObject *record = AerospikeRecord_Ready();
+    Py_INCREF(record);
+    PyModule_AddObject(aerospike, "Record", (PyObject *)record);
+
+    PyTypeObject *key = AerospikeKey_Ready();
+    Py_INCREF(key);
+    PyModule_AddObject(aerospike, "Key", (PyObject *)key);
+
+    PyTypeObject *blob = AerospikeBlob_Ready();
+    Py_INCREF(blob);
+    PyModule_AddObject(aerospike, "Blob", (PyObject *)blob);
+
+    PyTypeObject *lazy_bins = AerospikeLazyBins_Ready();
+    Py_INCREF(lazy_bins);
+    PyModule_AddObject(aerospike, "LazyBins", (PyObject *)lazy_bins);
+    // isinstance(bins, collections.abc.Mapping) holds for every bins format.
+    PyObject *py_abc = PyImport_ImportModule("collections.abc");
+    PyObject *py_mapping =
+        py_abc ? PyObject_GetAttrString(py_abc, "Mapping") : NULL;
+    PyObject *py_rv =
+        py_mapping ? PyObject_CallMethod(py_mapping, "register", "O",
+                                         (PyObject *)lazy_bins)
+                   : NULL;
+    if (!py_rv) {
+        PyErr_Clear();
+    }
+    Py_XDECREF(py_rv);
+    Py_XDECREF(py_mapping);
+    Py_XDECREF(py_abc);
+
     PyTypeObject *kdict = AerospikeKeyOrderedDict_Ready();
     Py_INCREF(kdict);
     PyModule_AddObject(aerospike, "KeyOrderedDict", (PyObject *)kdict);
@@ -242,9 +332,39 @@ MOD_INIT(aerospike)
 PyObject *AerospikeInitAsync(PyObject *self, PyObject *args, PyObject *kwds)
 {
 #if AS_EVENT_LIB_DEFINED
+    unsigned int loops = 1;
+    unsigned int max_commands_in_process = 0;
+    unsigned int max_commands_in_queue = 0;
+    int loop_assignment = ASYNC_LOOP_ROUND_ROBIN;
+    int completion_queue = 0;
+    static char *kwlist[] = {"loops",
+                             "max_commands_in_process",
+                             "max_commands_in_queue",
+                             "loop_assignment",
+                             "completion_queue",
+                             NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "|IIIip:init_async", kwlist,
+                                    &loops, &max_commands_in_process,
+                                    &max_commands_in_queue, &loop_assignment,
+                                    &completion_queue) == false) {
+        return NULL;
+    }
+
     as_log_info("AerospikeInitAsync");
-    as_event_destroy_loops();
-    as_event_create_loops(1);
+
+    as_error err;
+    as_error_init(&err);
+    if (async_loops_init(&err, loops, max_commands_in_process,
+                         max_commands_in_queue,
+                         loop_assignment) != AEROSPIKE_OK ||
+        async_completion_queue_init(&err, completion_queue) != AEROSPIKE_OK) {
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyErr_SetObject(raise_exception(&err), py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
     async_support = true;
 #else
     as_error err;
@@ -0,0 +1,148 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_std.h>
+#include <aerospike/as_val.h>
+
+#include "blob.h"
+
+static PyTypeObject AerospikeBlob_Type;
+
+static void AerospikeBlob_Type_Dealloc(AerospikeBlob *self)
+{
+    cf_free(self->data);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * BUFFER
+ ******************************************************************************/
+
+static int AerospikeBlob_Type_GetBuffer(AerospikeBlob *self, Py_buffer *view,
+                                        int flags)
+{
+    return PyBuffer_FillInfo(view, (PyObject *)self, self->data, self->size,
+                             1, flags);
+}
+
+static PyBufferProcs AerospikeBlob_Type_Buffer = {
+    (getbufferproc)AerospikeBlob_Type_GetBuffer, // bf_getbuffer
+    0,                                           // bf_releasebuffer
+};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeBlob_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.Blob", // tp_name
+    sizeof(AerospikeBlob),                           // tp_basicsize
+    0,                                               // tp_itemsize
+    (destructor)AerospikeBlob_Type_Dealloc,          // tp_dealloc
+    0,                                               // tp_print
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_compare
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    0,                                               // tp_getattro
+    0,                                               // tp_setattro
+    &AerospikeBlob_Type_Buffer,                      // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                              // tp_flags
+    "Read only buffer backing the memoryviews returned with "
+    "\"blob_memoryview\": True.\n",
+    // tp_doc
+    0, // tp_traverse
+    0, // tp_clear
+    0, // tp_richcompare
+    0, // tp_weaklistoffset
+    0, // tp_iter
+    0, // tp_iternext
+    0, // tp_methods
+    0, // tp_members
+    0, // tp_getset
+    0, // tp_base
+    0, // tp_dict
+    0, // tp_descr_get
+    0, // tp_descr_set
+    0, // tp_dictoffset
+    0, // tp_init
+    0, // tp_alloc
+    0, // tp_new
+    0, // tp_free
+    0, // tp_is_gc
+    0  // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeBlob_Ready()
+{
+    return PyType_Ready(&AerospikeBlob_Type) == 0 ? &AerospikeBlob_Type
+                                                  : NULL;
+}
+
+PyObject *AerospikeBlob_MemoryView(as_error *err, as_bytes *bytes)
+{
+    AerospikeBlob *self = PyObject_New(AerospikeBlob, &AerospikeBlob_Type);
+    if (!self) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT, "Unable to create blob");
+        return NULL;
+    }
+
+    self->size = (Py_ssize_t)as_bytes_size(bytes);
+    self->data = NULL;
+
+    if (bytes->free && bytes->value && ((as_val *)bytes)->count == 1) {
+        // Nobody else can see bytes, take its buffer over. as_bytes_destroy
+        // leaves the buffer alone once free is cleared.
+        self->data = bytes->value;
+        bytes->free = false;
+    }
+    else if (self->size) {
+        self->data = cf_malloc(self->size);
+        if (!self->data) {
+            Py_DECREF(self);
+            as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                            "Unable to allocate blob");
+            return NULL;
+        }
+        memcpy(self->data, as_bytes_get(bytes), self->size);
+    }
+
+    PyObject *py_view = PyMemoryView_FromObject((PyObject *)self);
+    Py_DECREF(self);
+    if (!py_view) {
+        PyErr_Clear();
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to create memoryview");
+    }
+    return py_view;
+}
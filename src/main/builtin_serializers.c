@@ -0,0 +1,365 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_arraylist.h>
+#include <aerospike/as_boolean.h>
+#include <aerospike/as_buffer.h>
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_hashmap.h>
+#include <aerospike/as_msgpack.h>
+#include <aerospike/as_serializer.h>
+#include <aerospike/as_std.h>
+
+#include "builtin_serializers.h"
+#include "conversions.h"
+#include "policy.h"
+
+typedef struct {
+    const char *name;
+    int serializer;
+} builtin_serializer;
+
+static const builtin_serializer builtin_serializers[] = {
+    {"json", SERIALIZER_JSON},
+    {"msgpack", SERIALIZER_MSGPACK},
+};
+
+#define BUILTIN_SERIALIZERS_COUNT                                              \
+    (sizeof(builtin_serializers) / sizeof(builtin_serializer))
+
+static const uint8_t json_header[BUILTIN_HEADER_SIZE] = {0xC1, 'A', 'S', 'J'};
+static const uint8_t msgpack_header[BUILTIN_HEADER_SIZE] = {0xC1, 'A', 'S',
+                                                            'M'};
+
+/*
+ * Initialises bytes with header followed by size bytes of data.
+ */
+static void builtin_bytes_init(as_bytes *bytes, const uint8_t *header,
+                               const uint8_t *data, uint32_t size)
+{
+    as_bytes_init(bytes, BUILTIN_HEADER_SIZE + size);
+    as_bytes_set(bytes, 0, header, BUILTIN_HEADER_SIZE);
+    as_bytes_set(bytes, BUILTIN_HEADER_SIZE, data, size);
+    as_bytes_set_type(bytes, AS_BYTES_BLOB);
+}
+
+static bool builtin_bytes_check(as_bytes *bytes, const uint8_t *header)
+{
+    return as_bytes_size(bytes) >= BUILTIN_HEADER_SIZE &&
+           memcmp(as_bytes_get(bytes), header, BUILTIN_HEADER_SIZE) == 0;
+}
+
+int builtin_serializer_from_name(const char *name)
+{
+    for (size_t i = 0; i < BUILTIN_SERIALIZERS_COUNT; i++) {
+        if (!strcmp(builtin_serializers[i].name, name)) {
+            return builtin_serializers[i].serializer;
+        }
+    }
+    return SERIALIZER_NONE;
+}
+
+/*******************************************************************************
+ * JSON, through the json module's C accelerated encoder and decoder.
+ ******************************************************************************/
+
+// json.JSONEncoder(separators=(",", ":")).encode and json.JSONDecoder().decode
+static PyObject *py_json_encode = NULL;
+static PyObject *py_json_decode = NULL;
+
+static bool json_functions_init(void)
+{
+    if (py_json_encode && py_json_decode) {
+        return true;
+    }
+
+    PyObject *py_json = PyImport_ImportModule("json");
+    if (!py_json) {
+        return false;
+    }
+    // Compact separators, the defaults pad every item with a space.
+    PyObject *py_args = PyTuple_New(0);
+    PyObject *py_kwargs = Py_BuildValue("{s:(ss)}", "separators", ",", ":");
+    PyObject *py_encoder_cls = PyObject_GetAttrString(py_json, "JSONEncoder");
+    PyObject *py_encoder =
+        py_encoder_cls && py_args && py_kwargs
+            ? PyObject_Call(py_encoder_cls, py_args, py_kwargs)
+            : NULL;
+    PyObject *py_decoder = PyObject_CallMethod(py_json, "JSONDecoder", NULL);
+    Py_XDECREF(py_encoder_cls);
+    Py_XDECREF(py_kwargs);
+    Py_XDECREF(py_args);
+    Py_DECREF(py_json);
+
+    bool ok = false;
+    if (py_encoder && py_decoder) {
+        py_json_encode = PyObject_GetAttrString(py_encoder, "encode");
+        py_json_decode = PyObject_GetAttrString(py_decoder, "decode");
+        ok = py_json_encode && py_json_decode;
+        if (!ok) {
+            Py_CLEAR(py_json_encode);
+            Py_CLEAR(py_json_decode);
+        }
+    }
+    Py_XDECREF(py_encoder);
+    Py_XDECREF(py_decoder);
+    return ok;
+}
+
+static as_status json_serialize(as_error *err, PyObject *value,
+                                as_bytes *bytes)
+{
+    if (!json_functions_init()) {
+        PyErr_Clear();
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Unable to load json module");
+    }
+
+    PyObject *py_str = PyObject_CallFunctionObjArgs(py_json_encode, value, NULL);
+    if (!py_str) {
+        PyErr_Clear();
+        return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                               "Unable to serialize %s with the json serializer",
+                               Py_TYPE(value)->tp_name);
+    }
+
+    Py_ssize_t len = 0;
+    const char *str = PyUnicode_AsUTF8AndSize(py_str, &len);
+    if (!str) {
+        PyErr_Clear();
+        Py_DECREF(py_str);
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Unable to encode json as utf-8");
+    }
+
+    builtin_bytes_init(bytes, json_header, (const uint8_t *)str, (uint32_t)len);
+    Py_DECREF(py_str);
+    return AEROSPIKE_OK;
+}
+
+static PyObject *json_deserialize(as_bytes *bytes)
+{
+    if (!builtin_bytes_check(bytes, json_header)) {
+        return NULL;
+    }
+    if (!json_functions_init()) {
+        PyErr_Clear();
+        return NULL;
+    }
+
+    PyObject *py_str = PyUnicode_DecodeUTF8(
+        (const char *)as_bytes_get(bytes) + BUILTIN_HEADER_SIZE,
+        as_bytes_size(bytes) - BUILTIN_HEADER_SIZE, "strict");
+    PyObject *py_value =
+        py_str ? PyObject_CallFunctionObjArgs(py_json_decode, py_str, NULL)
+               : NULL;
+    Py_XDECREF(py_str);
+    if (!py_value) {
+        PyErr_Clear();
+    }
+    return py_value;
+}
+
+/*******************************************************************************
+ * msgpack, packed by the C client in the encoding the server uses for lists
+ * and maps.
+ ******************************************************************************/
+
+/**
+ * Converts a value handed to the msgpack serializer to an as_val. Containers
+ * are walked here rather than in pyobject_to_val so that nested tuples and
+ * sets are packed as lists instead of being serialized again.
+ */
+static as_status msgpack_pyobject_to_val(AerospikeClient *self, as_error *err,
+                                         PyObject *py_obj, as_val **val)
+{
+    if (PyBool_Check(py_obj)) {
+        *val = (as_val *)as_boolean_new(py_obj == Py_True);
+    }
+    else if (PyList_Check(py_obj) || PyTuple_Check(py_obj) ||
+             PyAnySet_Check(py_obj)) {
+        PyObject *py_seq = PySequence_Fast(py_obj, "not a sequence");
+        if (!py_seq) {
+            PyErr_Clear();
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Unable to iterate over value");
+        }
+        Py_ssize_t size = PySequence_Fast_GET_SIZE(py_seq);
+        as_arraylist *list = as_arraylist_new((uint32_t)size, 0);
+        for (Py_ssize_t i = 0; i < size; i++) {
+            as_val *item = NULL;
+            if (msgpack_pyobject_to_val(self, err,
+                                        PySequence_Fast_GET_ITEM(py_seq, i),
+                                        &item) != AEROSPIKE_OK) {
+                break;
+            }
+            as_arraylist_append(list, item);
+        }
+        Py_DECREF(py_seq);
+        if (err->code != AEROSPIKE_OK) {
+            as_arraylist_destroy(list);
+            return err->code;
+        }
+        *val = (as_val *)list;
+    }
+    else if (PyDict_Check(py_obj)) {
+        as_hashmap *map = as_hashmap_new((uint32_t)PyDict_Size(py_obj));
+        PyObject *py_key = NULL;
+        PyObject *py_value = NULL;
+        Py_ssize_t pos = 0;
+        while (PyDict_Next(py_obj, &pos, &py_key, &py_value)) {
+            as_val *key = NULL;
+            as_val *value = NULL;
+            if (msgpack_pyobject_to_val(self, err, py_key, &key) !=
+                AEROSPIKE_OK) {
+                break;
+            }
+            if (msgpack_pyobject_to_val(self, err, py_value, &value) !=
+                AEROSPIKE_OK) {
+                as_val_destroy(key);
+                break;
+            }
+            as_hashmap_set(map, key, value);
+        }
+        if (err->code != AEROSPIKE_OK) {
+            as_hashmap_destroy(map);
+            return err->code;
+        }
+        *val = (as_val *)map;
+    }
+    else if (PyObject_CheckBuffer(py_obj)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(py_obj, &view, PyBUF_SIMPLE) != 0) {
+            PyErr_Clear();
+            return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                                   "blob buffer must be C contiguous");
+        }
+        as_bytes *blob = as_bytes_new((uint32_t)view.len);
+        as_bytes_set(blob, 0, (const uint8_t *)view.buf, (uint32_t)view.len);
+        PyBuffer_Release(&view);
+        *val = (as_val *)blob;
+    }
+    else if (PyLong_Check(py_obj) || PyFloat_Check(py_obj) ||
+             PyUnicode_Check(py_obj) || py_obj == Py_None) {
+        return pyobject_to_val(self, err, py_obj, val, NULL, SERIALIZER_NONE);
+    }
+    else {
+        return as_error_update(
+            err, AEROSPIKE_ERR_PARAM,
+            "Unable to serialize %s with the msgpack serializer",
+            Py_TYPE(py_obj)->tp_name);
+    }
+
+    return err->code;
+}
+
+static as_status msgpack_serialize(AerospikeClient *self, as_error *err,
+                                   PyObject *value, as_bytes *bytes)
+{
+    as_val *val = NULL;
+    if (msgpack_pyobject_to_val(self, err, value, &val) != AEROSPIKE_OK) {
+        return err->code;
+    }
+
+    as_serializer serializer;
+    as_msgpack_init(&serializer);
+    as_buffer buffer;
+    as_buffer_init(&buffer);
+
+    int rc = as_serializer_serialize(&serializer, val, &buffer);
+    as_serializer_destroy(&serializer);
+    as_val_destroy(val);
+
+    if (rc != 0) {
+        as_buffer_destroy(&buffer);
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Unable to pack value with msgpack");
+    }
+
+    builtin_bytes_init(bytes, msgpack_header, buffer.data, buffer.size);
+    as_buffer_destroy(&buffer);
+    return AEROSPIKE_OK;
+}
+
+static PyObject *msgpack_deserialize(AerospikeClient *self, as_bytes *bytes)
+{
+    if (!builtin_bytes_check(bytes, msgpack_header)) {
+        return NULL;
+    }
+
+    as_unpacker unpacker = {
+        .buffer = as_bytes_get(bytes) + BUILTIN_HEADER_SIZE,
+        .offset = 0,
+        .length = as_bytes_size(bytes) - BUILTIN_HEADER_SIZE};
+    as_val *val = NULL;
+
+    // A packed value fills the rest of the blob.
+    if (unpacker.length == 0 || as_unpack_val(&unpacker, &val) != 0 ||
+        unpacker.offset != unpacker.length) {
+        if (val) {
+            as_val_destroy(val);
+        }
+        return NULL;
+    }
+
+    as_error err;
+    as_error_init(&err);
+    PyObject *py_value = NULL;
+    val_to_pyobject(self, &err, val, &py_value);
+    as_val_destroy(val);
+    if (err.code != AEROSPIKE_OK) {
+        PyErr_Clear();
+        Py_XDECREF(py_value);
+        return NULL;
+    }
+    return py_value;
+}
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+as_status builtin_serialize(AerospikeClient *self, as_error *err,
+                            int serializer, PyObject *value, as_bytes *bytes)
+{
+    switch (serializer) {
+    case SERIALIZER_JSON:
+        return json_serialize(err, value, bytes);
+    case SERIALIZER_MSGPACK:
+        return msgpack_serialize(self, err, value, bytes);
+    default:
+        return as_error_update(err, AEROSPIKE_ERR, "Unsupported serializer");
+    }
+}
+
+PyObject *builtin_deserialize(AerospikeClient *self, int serializer,
+                              as_bytes *bytes)
+{
+    switch (serializer) {
+    case SERIALIZER_JSON:
+        return json_deserialize(bytes);
+    case SERIALIZER_MSGPACK:
+        return msgpack_deserialize(self, bytes);
+    default:
+        return NULL;
+    }
+}
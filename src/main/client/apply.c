@@ -174,6 +174,7 @@ CLEANUP:
         as_key_destroy(&key);
     }
     as_list_destroy(arglist);
+    POOL_FREE(&static_pool);
     as_val_destroy(result);
 
     if (err.code != AEROSPIKE_OK) {
@@ -0,0 +1,176 @@
+/*******************************************************************************
+ * Copyright 2013-2020 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_list.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "serializer.h"
+
+/**
+ *******************************************************************************************************
+ * Applies a registered UDF module on a particular record, asynchronously.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (result, err, exception) where result is the
+ * value returned by the UDF.
+ * In case of error before the command is queued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Apply_Async(AerospikeClient *self, PyObject *args,
+                                      PyObject *kwds)
+{
+    // Python Function Arguments
+    PyObject *py_callback = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_module = NULL;
+    PyObject *py_function = NULL;
+    PyObject *py_arglist = NULL;
+    PyObject *py_policy = NULL;
+
+    as_policy_apply apply_policy;
+    as_policy_apply *apply_policy_p = NULL;
+    const char *module = NULL;
+    const char *function = NULL;
+    as_list *arglist = NULL;
+
+    // For converting expressions.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_static_pool static_pool;
+    memset(&static_pool, 0, sizeof(static_pool));
+
+    as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    // Python Function Keyword Arguments
+    static char *kwlist[] = {"callback", "key",  "module", "function",
+                             "args",     "policy", NULL};
+
+    // Python Function Argument Parsing
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OOOOO|O:apply_async", kwlist,
+                                    &py_callback, &py_key, &py_module,
+                                    &py_function, &py_arglist,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    if (!PyList_Check(py_arglist)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "expected UDF method arguments in a 'list'");
+        return NULL;
+    }
+
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+
+    if (!self || !self->as) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (!PyUnicode_Check(py_module)) {
+        as_error_update(
+            &cmd->error, AEROSPIKE_ERR_CLIENT,
+            "udf module argument must be a string or unicode string");
+        goto CLEANUP;
+    }
+    module = PyUnicode_AsUTF8(py_module);
+
+    if (!PyUnicode_Check(py_function)) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLIENT,
+                        "function name must be a string or unicode string");
+        goto CLEANUP;
+    }
+    function = PyUnicode_AsUTF8(py_function);
+
+    // Convert python key object to as_key
+    if (pyobject_to_key(&cmd->error, py_key, &cmd->key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    cmd->key_initialised = true;
+
+    // Convert python list to as_list
+    if (pyobject_to_list(self, &cmd->error, py_arglist, &arglist, &static_pool,
+                         SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    // Convert python policy object to as_policy_apply
+    if (pyobject_to_policy_apply(self, &cmd->error, py_policy, &apply_policy,
+                                 &apply_policy_p,
+                                 &self->as->config.policies.apply, &exp_list,
+                                 &exp_list_p) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    // Invoke operation
+    Py_BEGIN_ALLOW_THREADS
+    status = aerospike_key_apply_async(self->as, &err, apply_policy_p,
+                                       &cmd->key, module, function, arglist,
+                                       async_value_listener, cmd,
+                                       async_event_loop(&cmd->key), NULL);
+    Py_END_ALLOW_THREADS
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
+        goto CLEANUP;
+    }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
+
+CLEANUP:
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    // Destroying the list also releases the pooled bytes it references.
+    if (arglist) {
+        as_list_destroy(arglist);
+    }
+    POOL_FREE(&static_pool);
+
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
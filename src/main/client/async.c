@@ -0,0 +1,737 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <string.h>
+#include <unistd.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_event.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_partition.h>
+#include <aerospike/as_record.h>
+#include <aerospike/aerospike_batch.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+bool async_check_support(void)
+{
+    if (async_support) {
+        return true;
+    }
+
+    as_error err;
+    as_error_init(&err);
+    as_error_update(
+        &err, AEROSPIKE_ERR,
+        "Support for async is disabled, build software with async option");
+    PyObject *py_err = NULL, *exception_type = NULL;
+    error_to_pyobject(&err, &py_err);
+    exception_type = raise_exception(&err);
+    PyErr_SetObject(exception_type, py_err);
+    Py_DECREF(py_err);
+    return false;
+}
+
+AerospikeAsyncCommand *async_command_create(AerospikeClient *self,
+                                            PyObject *py_callback)
+{
+    AerospikeAsyncCommand *cmd = cf_malloc(sizeof(AerospikeAsyncCommand));
+    memset(cmd, 0, sizeof(AerospikeAsyncCommand));
+    as_error_init(&cmd->error);
+    cmd->client = self;
+    // The callback may be the only reference to a per-call closure, keep it
+    // alive until the command completes.
+    Py_INCREF(py_callback);
+    cmd->callback = py_callback;
+    // Holding the client keeps cmd->client->as valid while in flight.
+    Py_XINCREF((PyObject *)self);
+    cmd->queued = async_completion_queue_enabled();
+    return cmd;
+}
+
+void async_command_destroy(AerospikeAsyncCommand *cmd)
+{
+    if (!cmd) {
+        return;
+    }
+    if (cmd->key_initialised) {
+        as_key_destroy(&cmd->key);
+    }
+    if (cmd->batch_records) {
+        as_batch_read_destroy(cmd->batch_records);
+    }
+    if (cmd->bin_names) {
+        for (uint32_t i = 0; i < cmd->n_bin_names; i++) {
+            cf_free(cmd->bin_names[i]);
+        }
+        cf_free(cmd->bin_names);
+    }
+    Py_XDECREF(cmd->callback);
+    Py_XDECREF((PyObject *)cmd->client);
+    cf_free(cmd);
+}
+
+void async_error_to_pyobjects(as_error *err, PyObject *py_key,
+                              PyObject **py_err, PyObject **py_exception)
+{
+    error_to_pyobject(err, py_err);
+
+    if (err->code == AEROSPIKE_OK) {
+        Py_INCREF(Py_None);
+        *py_exception = Py_None;
+        return;
+    }
+
+    // Each command gets its own instance, built from the error tuple as when
+    // the error is raised, so callbacks running at the same time neither see
+    // each other's key nor stale class attributes.
+    PyObject *exception_type = raise_exception(err);
+    PyObject *py_instance = PyObject_Call(exception_type, *py_err, NULL);
+    if (!py_instance) {
+        // Still report the error with its class.
+        PyErr_Clear();
+        Py_INCREF(exception_type);
+        *py_exception = exception_type;
+        return;
+    }
+    if (PyObject_HasAttrString(py_instance, "key")) {
+        PyObject_SetAttrString(py_instance, "key", py_key ? py_key : Py_None);
+    }
+    if (PyObject_HasAttrString(py_instance, "bin")) {
+        PyObject_SetAttrString(py_instance, "bin", Py_None);
+    }
+    *py_exception = py_instance;
+}
+
+PyObject *async_command_fail(AerospikeAsyncCommand *cmd, PyObject *py_key)
+{
+    PyObject *py_err = NULL;
+    PyObject *py_exception = NULL;
+
+    async_error_to_pyobjects(&cmd->error, py_key, &py_err, &py_exception);
+    if (PyExceptionInstance_Check(py_exception)) {
+        PyErr_SetObject((PyObject *)Py_TYPE(py_exception), py_exception);
+    }
+    else {
+        PyErr_SetObject(py_exception, py_err);
+    }
+    Py_DECREF(py_err);
+    Py_DECREF(py_exception);
+
+    async_command_destroy(cmd);
+    return NULL;
+}
+
+void async_command_invoke(AerospikeAsyncCommand *cmd, PyObject *py_arglist)
+{
+    PyObject *py_return = NULL;
+
+    if (py_arglist) {
+        py_return = PyObject_Call(cmd->callback, py_arglist, NULL);
+        Py_DECREF(py_arglist);
+    }
+
+    if (!py_return) {
+        // There is no caller on the event loop thread to hand this to.
+        PyErr_WriteUnraisable(cmd->callback);
+    }
+    else {
+        Py_DECREF(py_return);
+    }
+
+    async_command_destroy(cmd);
+}
+
+/*
+ * Builds (result, err, exception) and invokes the callback. Steals py_result.
+ * Callbacks registered through get_async/put_async instead receive
+ * (key, result, err, exception) and (key, err, exception).
+ */
+static void async_command_complete(AerospikeAsyncCommand *cmd, as_error *err,
+                                   PyObject *py_result, bool has_result)
+{
+    PyObject *py_key = NULL;
+    PyObject *py_err = NULL;
+    PyObject *py_exception = NULL;
+    as_error key_err;
+
+    if (err->code != AEROSPIKE_OK) {
+        Py_CLEAR(py_result);
+    }
+    if ((err->code != AEROSPIKE_OK || cmd->legacy_callback) &&
+        cmd->key_initialised) {
+        key_to_pyobject(&key_err, &cmd->key, &py_key);
+    }
+
+    async_error_to_pyobjects(err, py_key, &py_err, &py_exception);
+
+    if (!py_result) {
+        Py_INCREF(Py_None);
+        py_result = Py_None;
+    }
+
+    if (!cmd->legacy_callback) {
+        Py_XDECREF(py_key);
+        async_command_invoke(cmd, Py_BuildValue("(NNN)", py_result, py_err,
+                                                py_exception));
+        return;
+    }
+
+    if (!py_key) {
+        Py_INCREF(Py_None);
+        py_key = Py_None;
+    }
+    if (has_result) {
+        async_command_invoke(cmd, Py_BuildValue("(NNNN)", py_key, py_result,
+                                                py_err, py_exception));
+    }
+    else {
+        Py_DECREF(py_result);
+        async_command_invoke(
+            cmd, Py_BuildValue("(NNN)", py_key, py_err, py_exception));
+    }
+}
+
+/*******************************************************************************
+ * Event loops.
+ ******************************************************************************/
+
+static int loop_assignment = ASYNC_LOOP_ROUND_ROBIN;
+
+as_status async_loops_init(as_error *err, uint32_t loops,
+                           uint32_t max_commands_in_process,
+                           uint32_t max_commands_in_queue, int assignment)
+{
+    if (loops == 0) {
+        return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                               "loops must be greater than 0");
+    }
+    if (assignment != ASYNC_LOOP_ROUND_ROBIN &&
+        assignment != ASYNC_LOOP_PARTITION) {
+        return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                               "loop_assignment is invalid");
+    }
+
+    as_policy_event policy;
+    as_policy_event_init(&policy);
+    policy.max_commands_in_process = max_commands_in_process;
+    policy.max_commands_in_queue = max_commands_in_queue;
+
+    as_event_destroy_loops();
+    if (as_create_event_loops(err, &policy, loops, NULL) != AEROSPIKE_OK) {
+        return err->code;
+    }
+    loop_assignment = assignment;
+    return AEROSPIKE_OK;
+}
+
+as_event_loop *async_event_loop(as_key *key)
+{
+    if (loop_assignment != ASYNC_LOOP_PARTITION || as_event_loop_size < 2) {
+        // The C client picks the next loop round-robin.
+        return NULL;
+    }
+
+    as_digest *digest = as_key_digest(key);
+    if (!digest) {
+        return NULL;
+    }
+    uint32_t partition_id = as_partition_getid(digest->value, 4096);
+    return as_event_loop_get_by_index(partition_id % as_event_loop_size);
+}
+
+PyObject *Aerospike_Async_Loop_Stats(PyObject *self, PyObject *args)
+{
+    PyObject *py_stats = PyList_New(as_event_loop_size);
+    if (!py_stats) {
+        return NULL;
+    }
+
+    for (uint32_t i = 0; i < as_event_loop_size; i++) {
+        as_event_loop *event_loop = as_event_loop_get_by_index(i);
+        PyObject *py_loop = Py_BuildValue(
+            "{s:I,s:i,s:i}", "index", i, "process_size",
+            as_event_loop_get_process_size(event_loop), "queue_size",
+            as_event_loop_get_queue_size(event_loop));
+        if (!py_loop) {
+            Py_DECREF(py_stats);
+            return NULL;
+        }
+        PyList_SET_ITEM(py_stats, i, py_loop);
+    }
+    return py_stats;
+}
+
+/*******************************************************************************
+ * Completion queue.
+ *
+ * When enabled, listeners never take the GIL. They push the raw C client
+ * result onto a lock-free stack and, if the stack was empty, write a byte to a
+ * pipe. The Python side watches the read end (e.g. with loop.add_reader) and
+ * calls process_async_completions(), which converts every pending result and
+ * invokes its callback under a single GIL hold.
+ ******************************************************************************/
+
+typedef enum {
+    ASYNC_COMPLETION_RECORD,
+    ASYNC_COMPLETION_WRITE,
+    ASYNC_COMPLETION_VALUE,
+    ASYNC_COMPLETION_BATCH
+} async_completion_kind;
+
+typedef struct async_completion_s {
+    struct async_completion_s *next;
+    AerospikeAsyncCommand *cmd;
+    async_completion_kind kind;
+    // NULL on success, heap copy of the command error otherwise.
+    as_error *err;
+    // Heap record, allocated by the C client because async_heap_rec is set.
+    as_record *record;
+    // Reserved reference to the UDF result.
+    as_val *val;
+    as_batch_read_records *records;
+} async_completion;
+
+static bool completion_queue_enabled = false;
+static async_completion *completion_head = NULL;
+static int completion_fds[2] = {-1, -1};
+
+static void completion_push(async_completion_kind kind, as_error *err,
+                            AerospikeAsyncCommand *cmd, as_record *record,
+                            as_val *val, as_batch_read_records *records)
+{
+    async_completion *c = cf_malloc(sizeof(async_completion));
+    c->cmd = cmd;
+    c->kind = kind;
+    c->err = NULL;
+    c->record = record;
+    c->val = val ? as_val_reserve(val) : NULL;
+    c->records = records;
+
+    if (err && err->code != AEROSPIKE_OK) {
+        c->err = cf_malloc(sizeof(as_error));
+        as_error_init(c->err);
+        as_error_copy(c->err, err);
+    }
+
+    async_completion *head = __atomic_load_n(&completion_head, __ATOMIC_RELAXED);
+    do {
+        c->next = head;
+    } while (!__atomic_compare_exchange_n(&completion_head, &head, c, true,
+                                          __ATOMIC_RELEASE, __ATOMIC_RELAXED));
+
+    // Only the push onto an empty stack needs to wake the reader, every later
+    // one is picked up by the same drain.
+    if (!head) {
+        char byte = 0;
+        ssize_t rv;
+        do {
+            rv = write(completion_fds[1], &byte, 1);
+        } while (rv < 0 && errno == EINTR);
+        // EAGAIN means the pipe is full of unread wakeups, nothing to do.
+    }
+}
+
+bool async_completion_queue_enabled(void)
+{
+    return __atomic_load_n(&completion_queue_enabled, __ATOMIC_ACQUIRE);
+}
+
+as_status async_completion_queue_init(as_error *err, bool enable)
+{
+    if (enable && completion_fds[0] == -1) {
+        if (pipe(completion_fds) != 0) {
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Failed to create completion queue pipe: %s",
+                                   strerror(errno));
+        }
+        for (int i = 0; i < 2; i++) {
+            fcntl(completion_fds[i], F_SETFL,
+                  fcntl(completion_fds[i], F_GETFL) | O_NONBLOCK);
+            fcntl(completion_fds[i], F_SETFD, FD_CLOEXEC);
+        }
+    }
+    // Results already queued stay drainable after the queue is disabled, and
+    // commands in flight keep the mode they were created with.
+    __atomic_store_n(&completion_queue_enabled, enable, __ATOMIC_RELEASE);
+    return AEROSPIKE_OK;
+}
+
+as_policy_read *async_policy_read(AerospikeAsyncCommand *cmd,
+                                  as_policy_read *policy_p,
+                                  as_policy_read *local)
+{
+    cmd->heap_rec = cmd->queued || policy_p->async_heap_rec;
+    if (!cmd->queued || policy_p->async_heap_rec) {
+        return policy_p;
+    }
+    if (policy_p != local) {
+        as_policy_read_copy(policy_p, local);
+    }
+    local->async_heap_rec = true;
+    return local;
+}
+
+as_policy_operate *async_policy_operate(AerospikeAsyncCommand *cmd,
+                                        as_policy_operate *policy_p,
+                                        as_policy_operate *local)
+{
+    cmd->heap_rec = cmd->queued || policy_p->async_heap_rec;
+    if (!cmd->queued || policy_p->async_heap_rec) {
+        return policy_p;
+    }
+    if (policy_p != local) {
+        as_policy_operate_copy(policy_p, local);
+    }
+    local->async_heap_rec = true;
+    return local;
+}
+
+/*******************************************************************************
+ * Result conversion, always called with the GIL held.
+ ******************************************************************************/
+
+static void record_complete(AerospikeAsyncCommand *cmd, as_error *cmd_err,
+                            as_record *record)
+{
+    AerospikeClient *self = cmd->client;
+    PyObject *py_result = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_meta = NULL;
+    PyObject *py_bins = NULL;
+    as_error local_err;
+    as_error_init(&local_err);
+
+    if (cmd_err) {
+        as_error_copy(&local_err, cmd_err);
+    }
+
+    // exists() reports a missing record as (key, None) instead of an error.
+    if (cmd->result_format == ASYNC_RECORD_META &&
+        local_err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND) {
+        as_error_reset(&local_err);
+        key_to_pyobject(&local_err, &cmd->key, &py_key);
+        if (local_err.code == AEROSPIKE_OK) {
+            Py_INCREF(Py_None);
+            py_result = Py_BuildValue("(NN)", py_key, Py_None);
+        }
+    }
+    else if (local_err.code == AEROSPIKE_OK && record) {
+        switch (cmd->result_format) {
+        case ASYNC_RECORD_META:
+            key_to_pyobject(&local_err, &cmd->key, &py_key);
+            if (local_err.code == AEROSPIKE_OK) {
+                metadata_to_pyobject(&local_err, record, &py_meta);
+            }
+            if (local_err.code == AEROSPIKE_OK) {
+                py_result = Py_BuildValue("(OO)", py_key, py_meta);
+            }
+            Py_XDECREF(py_key);
+            Py_XDECREF(py_meta);
+            break;
+        case ASYNC_RECORD_ORDERED_BINS:
+            key_to_pyobject(&local_err, &cmd->key, &py_key);
+            if (local_err.code == AEROSPIKE_OK) {
+                metadata_to_pyobject(&local_err, record, &py_meta);
+            }
+            if (local_err.code == AEROSPIKE_OK) {
+                operate_bins_to_pyobject(self, &local_err, record, &py_bins);
+            }
+            if (local_err.code == AEROSPIKE_OK) {
+                py_result = Py_BuildValue("(OOO)", py_key, py_meta, py_bins);
+            }
+            Py_XDECREF(py_key);
+            Py_XDECREF(py_meta);
+            Py_XDECREF(py_bins);
+            break;
+        default:
+            record_to_pyobject(self, &local_err, record, &cmd->key,
+                               &py_result);
+            if (py_result && cmd->digest_only_key) {
+                // The C client returns a NULL user key when only the digest
+                // was sent, hand back (<ns>, <set>, None, <digest>).
+                PyObject *py_rec_key = PyTuple_GetItem(py_result, 0);
+                Py_INCREF(Py_None);
+                PyTuple_SetItem(py_rec_key, 2, Py_None);
+            }
+            break;
+        }
+    }
+
+    async_command_complete(cmd, &local_err, py_result, true);
+}
+
+static void write_complete(AerospikeAsyncCommand *cmd, as_error *cmd_err)
+{
+    as_error local_err;
+    as_error_init(&local_err);
+
+    if (cmd_err) {
+        as_error_copy(&local_err, cmd_err);
+    }
+
+    async_command_complete(cmd, &local_err, PyLong_FromLong(0), false);
+}
+
+static void value_complete(AerospikeAsyncCommand *cmd, as_error *cmd_err,
+                           as_val *val)
+{
+    PyObject *py_result = NULL;
+    as_error local_err;
+    as_error_init(&local_err);
+
+    if (cmd_err) {
+        as_error_copy(&local_err, cmd_err);
+    }
+
+    if (local_err.code == AEROSPIKE_OK) {
+        val_to_pyobject(cmd->client, &local_err, val, &py_result);
+    }
+
+    async_command_complete(cmd, &local_err, py_result, true);
+}
+
+static as_status batch_meta_to_pyobject(as_error *err,
+                                        as_batch_read_records *records,
+                                        PyObject **py_recs)
+{
+    as_vector *list = &records->list;
+
+    *py_recs = PyList_New(list->size);
+    if (!(*py_recs)) {
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Failed to allocate return list of records");
+    }
+
+    for (uint32_t i = 0; i < list->size; i++) {
+        as_batch_read_record *batch = as_vector_get(list, i);
+        PyObject *py_key = NULL;
+        PyObject *py_meta = NULL;
+
+        key_to_pyobject(err, &batch->key, &py_key);
+        if (err->code != AEROSPIKE_OK) {
+            Py_CLEAR(*py_recs);
+            return err->code;
+        }
+
+        if (batch->result == AEROSPIKE_OK) {
+            metadata_to_pyobject(err, &batch->record, &py_meta);
+            if (err->code != AEROSPIKE_OK) {
+                Py_DECREF(py_key);
+                Py_CLEAR(*py_recs);
+                return err->code;
+            }
+        }
+        else {
+            Py_INCREF(Py_None);
+            py_meta = Py_None;
+        }
+
+        PyList_SET_ITEM(*py_recs, i, Py_BuildValue("(NN)", py_key, py_meta));
+    }
+    return AEROSPIKE_OK;
+}
+
+static void batch_complete(AerospikeAsyncCommand *cmd, as_error *cmd_err,
+                           as_batch_read_records *records)
+{
+    PyObject *py_result = NULL;
+    as_error local_err;
+    as_error_init(&local_err);
+
+    if (cmd_err) {
+        as_error_copy(&local_err, cmd_err);
+    }
+
+    if (local_err.code == AEROSPIKE_OK) {
+        if (cmd->result_format == ASYNC_BATCH_META) {
+            batch_meta_to_pyobject(&local_err, records, &py_result);
+        }
+        else {
+            batch_read_records_to_pyobject(cmd->client, &local_err, records,
+                                           RECORD_FORMAT_TUPLE, &py_result);
+        }
+    }
+
+    // records is cmd->batch_records, async_command_destroy releases it.
+    async_command_complete(cmd, &local_err, py_result, true);
+}
+
+/*******************************************************************************
+ * C client listeners, run on an event loop thread.
+ ******************************************************************************/
+
+void async_record_listener(as_error *err, as_record *record, void *udata,
+                           as_event_loop *event_loop)
+{
+    AerospikeAsyncCommand *cmd = (AerospikeAsyncCommand *)udata;
+
+    if (cmd->queued) {
+        // The command was issued with async_heap_rec, the record is ours.
+        completion_push(ASYNC_COMPLETION_RECORD, err, cmd, record, NULL, NULL);
+        return;
+    }
+
+    // Read before record_complete releases the command.
+    bool heap_rec = cmd->heap_rec;
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    // Unless the policy set async_heap_rec, the record is owned and destroyed
+    // by the C client once this returns.
+    record_complete(cmd, err, record);
+    PyGILState_Release(gstate);
+
+    if (heap_rec && record) {
+        as_record_destroy(record);
+    }
+}
+
+void async_write_listener(as_error *err, void *udata,
+                          as_event_loop *event_loop)
+{
+    AerospikeAsyncCommand *cmd = (AerospikeAsyncCommand *)udata;
+
+    if (cmd->queued) {
+        completion_push(ASYNC_COMPLETION_WRITE, err, cmd, NULL, NULL, NULL);
+        return;
+    }
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    write_complete(cmd, err);
+    PyGILState_Release(gstate);
+}
+
+void async_value_listener(as_error *err, as_val *val, void *udata,
+                          as_event_loop *event_loop)
+{
+    AerospikeAsyncCommand *cmd = (AerospikeAsyncCommand *)udata;
+
+    if (cmd->queued) {
+        completion_push(ASYNC_COMPLETION_VALUE, err, cmd, NULL, val, NULL);
+        return;
+    }
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    value_complete(cmd, err, val);
+    PyGILState_Release(gstate);
+}
+
+void async_batch_listener(as_error *err, as_batch_read_records *records,
+                          void *udata, as_event_loop *event_loop)
+{
+    AerospikeAsyncCommand *cmd = (AerospikeAsyncCommand *)udata;
+
+    if (cmd->queued) {
+        completion_push(ASYNC_COMPLETION_BATCH, err, cmd, NULL, NULL, records);
+        return;
+    }
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    batch_complete(cmd, err, records);
+    PyGILState_Release(gstate);
+}
+
+/*******************************************************************************
+ * Module functions for the completion queue.
+ ******************************************************************************/
+
+PyObject *Aerospike_Async_Completion_Fd(PyObject *self, PyObject *args)
+{
+    if (completion_fds[0] == -1) {
+        as_error err;
+        as_error_init(&err);
+        as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                        "Completion queue is not enabled, call "
+                        "init_async(completion_queue=True)");
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyErr_SetObject(raise_exception(&err), py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+    return PyLong_FromLong(completion_fds[0]);
+}
+
+PyObject *Aerospike_Process_Async_Completions(PyObject *self, PyObject *args)
+{
+    long count = 0;
+
+    if (completion_fds[0] == -1) {
+        return PyLong_FromLong(0);
+    }
+
+    // Consume wakeups before taking the stack, a push racing with this drain
+    // then either lands in the stack we take or writes a fresh wakeup.
+    char buf[256];
+    ssize_t rv;
+    do {
+        rv = read(completion_fds[0], buf, sizeof(buf));
+    } while (rv > 0 || (rv < 0 && errno == EINTR));
+
+    async_completion *c =
+        __atomic_exchange_n(&completion_head, NULL, __ATOMIC_ACQUIRE);
+
+    // The stack is LIFO, complete in arrival order.
+    async_completion *ordered = NULL;
+    while (c) {
+        async_completion *next = c->next;
+        c->next = ordered;
+        ordered = c;
+        c = next;
+    }
+
+    while (ordered) {
+        c = ordered;
+        ordered = c->next;
+
+        switch (c->kind) {
+        case ASYNC_COMPLETION_RECORD:
+            record_complete(c->cmd, c->err, c->record);
+            if (c->record) {
+                as_record_destroy(c->record);
+            }
+            break;
+        case ASYNC_COMPLETION_WRITE:
+            write_complete(c->cmd, c->err);
+            break;
+        case ASYNC_COMPLETION_VALUE:
+            value_complete(c->cmd, c->err, c->val);
+            if (c->val) {
+                as_val_destroy(c->val);
+            }
+            break;
+        case ASYNC_COMPLETION_BATCH:
+            batch_complete(c->cmd, c->err, c->records);
+            break;
+        }
+
+        if (c->err) {
+            cf_free(c->err);
+        }
+        cf_free(c);
+        count++;
+    }
+
+    return PyLong_FromLong(count);
+}
@@ -29,6 +29,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "key.h"
 
 #include <aerospike/as_double.h>
 #include <aerospike/as_integer.h>
@@ -80,7 +81,10 @@ static bool batch_read_operate_cb(const as_batch_read *results, uint32_t n,
             bins_to_pyobject(data->client, &err, rec, &py_rec_bins, false);
         }
         else {
+            // raise_exception() returns a borrowed reference, which the
+            // record tuple would steal.
             py_rec_meta = raise_exception(&err);
+            Py_INCREF(py_rec_meta);
             Py_INCREF(Py_None);
             py_rec_bins = Py_None;
         }
@@ -166,7 +170,7 @@ AerospikeClient_Batch_GetOps_Invoke(AerospikeClient *self, as_error *err,
 
     for (int i = 0; i < keys_size; i++) {
         PyObject *py_key = PyList_GetItem(py_keys, i);
-        if (!PyTuple_Check(py_key)) {
+        if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
             as_error_update(err, AEROSPIKE_ERR_PARAM, "Key should be a tuple.");
             goto CLEANUP;
         }
@@ -209,6 +213,7 @@ CLEANUP:
     as_vector_destroy(unicodeStrVector);
 
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
 
     as_batch_destroy(&batch);
 
@@ -0,0 +1,267 @@
+/*******************************************************************************
+ * Copyright 2013-2020 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_batch.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "key.h"
+
+/**
+ *******************************************************************************************************
+ * Shared implementation of get_many_async, select_many_async and
+ * exists_many_async.
+ *
+ * @param self                  AerospikeClient object
+ * @param py_callback           Invoked with (records, err, exception)
+ * @param py_keys               List or tuple of keys
+ * @param py_bins               Bins to read, NULL to read all bins
+ * @param read_bins             False to read only record metadata
+ * @param py_policy             The batch policy
+ * @param result_format         ASYNC_BATCH_BINS or ASYNC_BATCH_META
+ *
+ * The batch records are heap allocated and owned by the command until the
+ * listener has run.
+ *******************************************************************************************************
+ */
+static PyObject *batch_read_async_invoke(AerospikeClient *self,
+                                         PyObject *py_callback,
+                                         PyObject *py_keys, PyObject *py_bins,
+                                         bool read_bins, PyObject *py_policy,
+                                         int result_format)
+{
+    as_policy_batch policy;
+    as_policy_batch *batch_policy_p = NULL;
+
+    // For converting expressions.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
+
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+    cmd->result_format = result_format;
+
+    if (!self || !self->as) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (!py_keys || !(PyList_Check(py_keys) || PyTuple_Check(py_keys))) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Keys should be specified as a list or tuple.");
+        goto CLEANUP;
+    }
+
+    if (py_bins) {
+        if (!(PyList_Check(py_bins) || PyTuple_Check(py_bins))) {
+            as_error_update(
+                &cmd->error, AEROSPIKE_ERR_PARAM,
+                "Filter bins should be specified as a list or tuple.");
+            goto CLEANUP;
+        }
+
+        Py_ssize_t bins_size = PySequence_Fast_GET_SIZE(py_bins);
+        cmd->bin_names = cf_malloc(sizeof(char *) * (bins_size + 1));
+        for (Py_ssize_t i = 0; i < bins_size; i++) {
+            PyObject *py_bin = PySequence_Fast_GET_ITEM(py_bins, i);
+            if (!PyUnicode_Check(py_bin)) {
+                as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                                "Bin name should be a string or unicode "
+                                "string.");
+                goto CLEANUP;
+            }
+            cmd->bin_names[i] = cf_strdup(PyUnicode_AsUTF8(py_bin));
+            cmd->n_bin_names++;
+        }
+    }
+
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(py_keys);
+    cmd->batch_records = as_batch_read_create((uint32_t)size);
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *py_key = PySequence_Fast_GET_ITEM(py_keys, i);
+
+        if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
+            as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                            "Key should be a tuple.");
+            goto CLEANUP;
+        }
+
+        as_batch_read_record *record =
+            as_batch_read_reserve(cmd->batch_records);
+
+        if (pyobject_to_key(&cmd->error, py_key, &record->key) !=
+            AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+
+        if (!read_bins) {
+            continue;
+        }
+        if (cmd->n_bin_names) {
+            record->bin_names = cmd->bin_names;
+            record->n_bin_names = cmd->n_bin_names;
+        }
+        else {
+            record->read_all_bins = true;
+        }
+    }
+
+    // Convert python policy object to as_policy_batch
+    if (pyobject_to_policy_batch(self, &cmd->error, py_policy, &policy,
+                                 &batch_policy_p,
+                                 &self->as->config.policies.batch, &exp_list,
+                                 &exp_list_p) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    // Invoke C-client API
+    Py_BEGIN_ALLOW_THREADS
+    status = aerospike_batch_read_async(self->as, &err, batch_policy_p,
+                                        cmd->batch_records,
+                                        async_batch_listener, cmd, NULL);
+    Py_END_ALLOW_THREADS
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
+        goto CLEANUP;
+    }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
+
+CLEANUP:
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    if (cmd) {
+        return async_command_fail(cmd, py_keys);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Gets a batch of records asynchronously from the Aerospike DB.
+ *
+ * The callback is invoked with ([(key, meta, bins), ...], err, exception).
+ * Records which were not found are returned as (key, None, None).
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Get_Many_Async(AerospikeClient *self, PyObject *args,
+                                         PyObject *kwds)
+{
+    PyObject *py_callback = NULL;
+    PyObject *py_keys = NULL;
+    PyObject *py_policy = NULL;
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    static char *kwlist[] = {"callback", "keys", "policy", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:get_many_async", kwlist,
+                                    &py_callback, &py_keys,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    return batch_read_async_invoke(self, py_callback, py_keys, NULL, true,
+                                   py_policy, ASYNC_BATCH_BINS);
+}
+
+/**
+ *******************************************************************************************************
+ * Gets the given bins from a batch of records asynchronously.
+ *
+ * The callback is invoked with ([(key, meta, bins), ...], err, exception).
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Select_Many_Async(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds)
+{
+    PyObject *py_callback = NULL;
+    PyObject *py_keys = NULL;
+    PyObject *py_bins = NULL;
+    PyObject *py_policy = NULL;
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    static char *kwlist[] = {"callback", "keys", "bins", "policy", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|O:select_many_async",
+                                    kwlist, &py_callback, &py_keys, &py_bins,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    return batch_read_async_invoke(self, py_callback, py_keys, py_bins, true,
+                                   py_policy, ASYNC_BATCH_BINS);
+}
+
+/**
+ *******************************************************************************************************
+ * Checks existence of a batch of records asynchronously.
+ *
+ * The callback is invoked with ([(key, meta), ...], err, exception). meta is
+ * None for records which do not exist.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Exists_Many_Async(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds)
+{
+    PyObject *py_callback = NULL;
+    PyObject *py_keys = NULL;
+    PyObject *py_policy = NULL;
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    static char *kwlist[] = {"callback", "keys", "policy", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|O:exists_many_async",
+                                    kwlist, &py_callback, &py_keys,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    return batch_read_async_invoke(self, py_callback, py_keys, NULL, false,
+                                   py_policy, ASYNC_BATCH_META);
+}
@@ -30,12 +30,13 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "key.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
     PyObject *py_results;
-    PyObject *batch_records_module;
-    PyObject *func_name;
+    // aerospike_helpers.batch.records.BatchRecord
+    PyObject *batch_record_cls;
     AerospikeClient *client;
 } LocalData;
 
@@ -66,16 +67,15 @@ static bool batch_remove_cb(const as_batch_result *results, uint32_t n,
             break;
         }
 
-        py_batch_record = PyObject_CallMethodObjArgs(
-            data->batch_records_module, data->func_name, py_key, NULL);
+        py_batch_record =
+            batch_record_new(&err, data->batch_record_cls, py_key);
+        Py_DECREF(py_key);
         if (py_batch_record == NULL) {
             as_log_error("unable to instance BatchRecord at results index: %d",
                          i);
             success = false;
-            Py_DECREF(py_key);
             break;
         }
-        Py_DECREF(py_key);
 
         as_batch_result_to_BatchRecord(data->client, &err, res,
                                        py_batch_record);
@@ -152,7 +152,7 @@ static PyObject *AerospikeClient_Batch_Remove_Invoke(
         PyObject *py_key = PyList_GetItem(py_keys, i);
         as_key *tmp_key = (as_key *)as_vector_get(&tmp_keys, i);
 
-        if (!PyTuple_Check(py_key)) {
+        if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
             as_error_update(err, AEROSPIKE_ERR_PARAM,
                             "key should be an aerospike key tuple");
             goto CLEANUP;
@@ -228,9 +228,15 @@ static PyObject *AerospikeClient_Batch_Remove_Invoke(
     // Create and initialize callback user-data
     LocalData data;
     data.client = self;
-    data.func_name = PyUnicode_FromString("BatchRecord");
+    data.batch_record_cls = PyObject_GetAttrString(br_module, "BatchRecord");
+    if (!data.batch_record_cls) {
+        PyErr_Clear();
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to find BatchRecord");
+        Py_CLEAR(br_instance);
+        goto CLEANUP;
+    }
     data.py_results = PyObject_GetAttrString(br_instance, "batch_records");
-    data.batch_records_module = br_module;
 
     as_error batch_apply_err;
     as_error_init(&batch_apply_err);
@@ -244,7 +250,7 @@ static PyObject *AerospikeClient_Batch_Remove_Invoke(
     Py_END_ALLOW_THREADS
 
     Py_DECREF(data.py_results);
-    Py_DECREF(data.func_name);
+    Py_DECREF(data.batch_record_cls);
 
     PyObject *py_bw_res = PyLong_FromLong((long)batch_apply_err.code);
     PyObject_SetAttrString(br_instance, FIELD_NAME_BATCH_RESULT, py_bw_res);
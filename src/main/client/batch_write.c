@@ -14,6 +14,7 @@
  * limitations under the License.
  ******************************************************************************/
 #include <Python.h>
+#include <pthread.h>
 #include <stdbool.h>
 
 #include <aerospike/aerospike_index.h>
@@ -33,6 +34,11 @@
 #include "cdt_operation_utils.h"
 #include "geo.h"
 #include "cdt_types.h"
+#include "key.h"
+
+// Chunks being written while the next one is converted, unless
+// max_in_flight is given.
+#define DEFAULT_MAX_IN_FLIGHT 1
 
 #define GET_BATCH_POLICY_FROM_PYOBJECT(__policy, __policy_type,                \
                                        __conversion_func, __batch_type)        \
@@ -53,7 +59,7 @@
                         "batch_type: %s, failed to convert policy",            \
                         __batch_type);                                         \
                     Py_DECREF(py___policy);                                    \
-                    goto CLEANUP0;                                             \
+                    goto CLEANUP;                                              \
                 }                                                              \
                 garb->expressions_to_free = expr_p;                            \
             }                                                                  \
@@ -62,7 +68,7 @@
                                 "batch_type: %s, policy must be a dict",       \
                                 __batch_type);                                 \
                 Py_DECREF(py___policy);                                        \
-                goto CLEANUP0;                                                 \
+                goto CLEANUP;                                                  \
             }                                                                  \
         }                                                                      \
         Py_DECREF(py___policy);                                                \
@@ -110,422 +116,563 @@ void garbage_destroy(garbage *garb)
 }
 
 /*
-* AerospikeClient_BatchWriteInvoke
-* Converts Python BatchRecords objects into a C client as_batch_records struct.
-* Then calls aerospike_batch_records.
-*/
-static PyObject *AerospikeClient_BatchWriteInvoke(AerospikeClient *self,
-                                                  as_error *err,
-                                                  PyObject *py_policy,
-                                                  PyObject *py_obj)
+ * Converts one Python BatchRecord and adds it to batch_records. Whatever
+ * has to be freed once the batch is done is recorded in garb.
+ */
+static as_status batch_write_add_record(AerospikeClient *self, as_error *err,
+                                        PyObject *py_batch_record,
+                                        as_batch_records *batch_records,
+                                        garbage *garb,
+                                        as_vector *unicodeStrVector,
+                                        as_static_pool *static_pool)
 {
-    Py_ssize_t py_batch_records_size = 0;
-    as_batch_records batch_records;
-    as_batch_records *batch_records_p = NULL;
-
-    as_policy_batch batch_policy;
-    as_policy_batch *batch_policy_p = NULL;
-    as_exp exp_list;
-    as_exp *exp_list_p = NULL;
-
-    PyObject *py_batch_type = NULL;
     PyObject *py_key = NULL;
-    PyObject *py_batch_records = NULL;
-    PyObject *py_meta = NULL, *py_ops_list = NULL;
-
-    // setup for op conversion
-    as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
-    as_static_pool static_pool;
-    memset(&static_pool, 0, sizeof(static_pool));
-
-    as_vector garbage_list;
-    as_vector *garbage_list_p = NULL;
-
-    if (!self || !self->as) {
-        as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
-        goto CLEANUP4;
+    PyObject *py_batch_type = NULL;
+    PyObject *py_ops_list = NULL;
+    PyObject *py_meta = NULL;
+
+    // extract as_batch_base_record fields
+    // all batch_records classes should have these
+    py_key = PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_KEY);
+    if (py_key == NULL ||
+        !(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "py_key is NULL or not a tuple, %s must be a "
+                        "aerospike key tuple",
+                        FIELD_NAME_BATCH_KEY);
+        goto CLEANUP;
     }
 
-    if (!self->is_conn_16) {
-        as_error_update(err, AEROSPIKE_ERR_CLUSTER,
-                        "No connection to aerospike cluster");
-        goto CLEANUP4;
+    py_batch_type =
+        PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_TYPE);
+    if (py_batch_type == NULL ||
+        !PyLong_Check(
+            py_batch_type)) { // TODO figure away around this being an enum
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "py_batch_type is NULL or not an int, %s must be "
+                        "an int from batch_records._Types",
+                        FIELD_NAME_BATCH_TYPE);
+        goto CLEANUP;
     }
 
-    if (py_obj == NULL) {
-        as_error_update(err, AEROSPIKE_ERR_PARAM, "py_obj value is null");
-        goto CLEANUP4;
+    // Not checking for overflow here because type is private in python
+    // so we shouldn't get anything unexpected.
+    uint8_t batch_type = 0;
+    batch_type = PyLong_AsLong(py_batch_type);
+    if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_OverflowError)) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "py_batch_type aka %s is too large for C long",
+                        FIELD_NAME_BATCH_TYPE);
+        goto CLEANUP;
     }
 
-    if (py_policy != NULL) {
-        if (pyobject_to_policy_batch(self, err, py_policy, &batch_policy,
-                                     &batch_policy_p,
-                                     &self->as->config.policies.batch,
-                                     &exp_list, &exp_list_p) != AEROSPIKE_OK) {
-            goto CLEANUP4;
-        }
-    }
+    py_ops_list = PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_OPS);
+    if (py_ops_list == NULL || !PyList_Check(py_ops_list) ||
+        !PyList_Size(py_ops_list)) {
 
-    // TODO check that py_object is an instance of class
+        // batch Read can have None ops if it is using read_all_bins
+        if ((batch_type == BATCH_TYPE_READ && py_ops_list != Py_None) ||
+            batch_type == BATCH_TYPE_WRITE) {
+            as_error_update(err, AEROSPIKE_ERR_PARAM,
+                            "py_ops_list is NULL or not a list, %s must be "
+                            "a list of aerospike operation dicts",
+                            FIELD_NAME_BATCH_OPS);
 
-    py_batch_records = PyObject_GetAttrString(py_obj, FIELD_NAME_BATCH_RECORDS);
-    if (py_batch_records == NULL || !PyList_Check(py_batch_records)) {
-        as_error_update(err, AEROSPIKE_ERR_PARAM,
-                        "%s must be a list of BatchRecord",
-                        FIELD_NAME_BATCH_RECORDS);
-        goto CLEANUP4;
+            goto CLEANUP;
+        }
+
+        // the batch record object had no ops attribute but some don't, so this is ok.
+        if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+            PyErr_Clear();
+        }
     }
 
-    py_batch_records_size = PyList_Size(py_batch_records);
-    as_batch_records_init(&batch_records, py_batch_records_size);
-    batch_records_p = &batch_records;
+    if (batch_type == AS_BATCH_READ || batch_type == AS_BATCH_WRITE) {
+        py_meta = PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_META);
+    }
 
-    as_vector_init(&garbage_list, sizeof(garbage), py_batch_records_size);
-    for (Py_ssize_t i = 0; i < py_batch_records_size; i++) {
-        garbage garb_to_free = {0};
-        as_vector_set(&garbage_list, i, (void *)&garb_to_free);
+    Py_ssize_t py_ops_size = 0;
+    if (py_ops_list != NULL && py_ops_list != Py_None) {
+        py_ops_size = PyList_Size(py_ops_list);
     }
-    garbage_list_p = &garbage_list;
 
-    for (Py_ssize_t i = 0; i < py_batch_records_size; i++) {
-        garbage *garb = as_vector_get(&garbage_list, i);
-        PyObject *py_batch_record = PyList_GetItem(py_batch_records, i);
-        // TODO check that this is an instance/subclass on BatchRecord
-        if (py_batch_record == NULL) {
-            as_error_update(
-                err, AEROSPIKE_ERR_PARAM,
-                "py_batch_record is NULL, %s must be a list of BatchRecord",
-                FIELD_NAME_BATCH_RECORDS);
-            goto CLEANUP4;
-        }
+    long operation = 0;
+    long return_type = -1;
 
-        // extract as_batch_base_record fields
-        // all batch_records classes should have these
-        py_key = PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_KEY);
-        if (py_key == NULL || !PyTuple_Check(py_key)) {
-            as_error_update(err, AEROSPIKE_ERR_PARAM,
-                            "py_key is NULL or not a tuple, %s must be a "
-                            "aerospike key tuple",
-                            FIELD_NAME_BATCH_KEY);
-            goto CLEANUP3;
-        }
+    as_operations *ops = NULL;
+    if ((batch_type == AS_BATCH_READ || batch_type == AS_BATCH_WRITE) &&
+        (py_ops_size || (py_meta != NULL && py_meta != Py_None))) {
 
-        py_batch_type =
-            PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_TYPE);
-        if (py_batch_type == NULL ||
-            !PyLong_Check(
-                py_batch_type)) { // TODO figure away around this being an enum
-            as_error_update(err, AEROSPIKE_ERR_PARAM,
-                            "py_batch_type is NULL or not an int, %s must be "
-                            "an int from batch_records._Types",
-                            FIELD_NAME_BATCH_TYPE);
-            goto CLEANUP2;
-        }
+        ops = as_operations_new(py_ops_size);
+        garb->ops_to_free = ops;
 
-        // Not checking for overflow here because type is private in python
-        // so we shouldn't get anything unexpected.
-        uint8_t batch_type = 0;
-        batch_type = PyLong_AsLong(py_batch_type);
-        if (PyErr_Occurred() && PyErr_ExceptionMatches(PyExc_OverflowError)) {
-            as_error_update(err, AEROSPIKE_ERR_PARAM,
-                            "py_batch_type aka %s is too large for C long",
-                            FIELD_NAME_BATCH_TYPE);
-            goto CLEANUP1;
+        if (py_meta) {
+            if (check_and_set_meta(py_meta, ops, err) != AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
         }
 
-        py_ops_list =
-            PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_OPS);
-        if (py_ops_list == NULL || !PyList_Check(py_ops_list) ||
-            !PyList_Size(py_ops_list)) {
+        for (Py_ssize_t i = 0; i < py_ops_size; i++) {
 
-            // batch Read can have None ops if it is using read_all_bins
-            if ((batch_type == BATCH_TYPE_READ && py_ops_list != Py_None) ||
-                batch_type == BATCH_TYPE_WRITE) {
+            PyObject *py_op = PyList_GetItem(py_ops_list, i);
+            if (py_op == NULL || !PyDict_Check(py_op)) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
-                                "py_ops_list is NULL or not a list, %s must be "
-                                "a list of aerospike operation dicts",
+                                "py_op is NULL or not a dict, %s must be a dict \
+                                    produced by an aerospike operation helper",
                                 FIELD_NAME_BATCH_OPS);
-
-                goto CLEANUP1;
+                goto CLEANUP;
             }
 
-            // the batch record object had no ops attribute but some don't, so this is ok.
-            if (PyErr_Occurred() &&
-                PyErr_ExceptionMatches(PyExc_AttributeError)) {
-                PyErr_Clear();
+            if (add_op(self, err, py_op, unicodeStrVector, static_pool, ops,
+                       &operation, &return_type) != AEROSPIKE_OK) {
+                goto CLEANUP;
             }
         }
+    }
+    switch (batch_type) {
+    case AS_BATCH_READ:;
 
-        py_meta = NULL;
-        if (batch_type == AS_BATCH_READ || batch_type == AS_BATCH_WRITE) {
-            py_meta =
-                PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_META);
-        }
+        as_policy_batch_read *r_policy = NULL;
+        GET_BATCH_POLICY_FROM_PYOBJECT(r_policy, as_policy_batch_read,
+                                       pyobject_to_batch_read_policy, "Read")
 
-        Py_ssize_t py_ops_size = 0;
-        if (py_ops_list != NULL && py_ops_list != Py_None) {
-            py_ops_size = PyList_Size(py_ops_list);
+        PyObject *py_read_all_bins =
+            PyObject_GetAttrString(py_batch_record, "read_all_bins");
+        // Not checking for NULL since batch Read should always have read_all_bins
+        bool read_all_bins = PyObject_IsTrue(py_read_all_bins);
+        Py_DECREF(py_read_all_bins);
+
+        as_batch_read_record *rr;
+        rr = as_batch_read_reserve(batch_records);
+
+        if (pyobject_to_key(err, py_key, &rr->key) != AEROSPIKE_OK) {
+            goto CLEANUP;
         }
 
-        long operation = 0;
-        long return_type = -1;
+        rr->ops = ops;
+        rr->read_all_bins = read_all_bins;
+        rr->policy = r_policy;
 
-        as_operations *ops = NULL;
-        if ((batch_type == AS_BATCH_READ || batch_type == AS_BATCH_WRITE) &&
-            (py_ops_size || (py_meta != NULL && py_meta != Py_None))) {
+        break;
 
-            ops = as_operations_new(py_ops_size);
-            garb->ops_to_free = ops;
+    case AS_BATCH_WRITE:;
 
-            if (py_meta) {
-                if (check_and_set_meta(py_meta, ops, err) != AEROSPIKE_OK) {
-                    goto CLEANUP0;
-                }
-            }
+        as_policy_batch_write *w_policy = NULL;
+        GET_BATCH_POLICY_FROM_PYOBJECT(w_policy, as_policy_batch_write,
+                                       pyobject_to_batch_write_policy, "Write")
 
-            for (Py_ssize_t i = 0; i < py_ops_size; i++) {
+        as_batch_write_record *wr;
+        wr = as_batch_write_reserve(batch_records);
 
-                PyObject *py_op = PyList_GetItem(py_ops_list, i);
-                if (py_op == NULL || !PyDict_Check(py_op)) {
-                    as_error_update(
-                        err, AEROSPIKE_ERR_PARAM,
-                        "py_op is NULL or not a dict, %s must be a dict \
-                                    produced by an aerospike operation helper",
-                        FIELD_NAME_BATCH_OPS);
-                    goto CLEANUP0;
-                }
-
-                if (add_op(self, err, py_op, unicodeStrVector, &static_pool,
-                           ops, &operation, &return_type) != AEROSPIKE_OK) {
-                    goto CLEANUP0;
-                }
-            }
+        if (pyobject_to_key(err, py_key, &wr->key) != AEROSPIKE_OK) {
+            goto CLEANUP;
         }
-        switch (batch_type) {
-        case AS_BATCH_READ:;
 
-            as_policy_batch_read *r_policy = NULL;
-            GET_BATCH_POLICY_FROM_PYOBJECT(r_policy, as_policy_batch_read,
-                                           pyobject_to_batch_read_policy,
-                                           "Read")
+        wr->ops = ops;
+        wr->policy = w_policy;
 
-            PyObject *py_read_all_bins =
-                PyObject_GetAttrString(py_batch_record, "read_all_bins");
-            // Not checking for NULL since batch Read should always have read_all_bins
-            bool read_all_bins = PyObject_IsTrue(py_read_all_bins);
-            Py_DECREF(py_read_all_bins);
+        break;
 
-            as_batch_read_record *rr;
-            rr = as_batch_read_reserve(&batch_records);
+    case AS_BATCH_APPLY:;
 
-            if (pyobject_to_key(err, py_key, &rr->key) != AEROSPIKE_OK) {
-                goto CLEANUP0;
-            }
+        as_policy_batch_apply *a_policy = NULL;
+        GET_BATCH_POLICY_FROM_PYOBJECT(a_policy, as_policy_batch_apply,
+                                       pyobject_to_batch_apply_policy, "Apply")
 
-            rr->ops = ops;
-            rr->read_all_bins = read_all_bins;
-            rr->policy = r_policy;
+        PyObject *py_mod =
+            PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_MODULE);
+        if (py_mod == NULL || !PyUnicode_Check(py_mod)) {
+            as_error_update(err, AEROSPIKE_ERR_PARAM, "%s must be a string",
+                            FIELD_NAME_BATCH_MODULE);
+            Py_XDECREF(py_mod);
+            goto CLEANUP;
+        }
+        Py_DECREF(py_mod);
+        const char *mod = PyUnicode_AsUTF8(py_mod);
+
+        PyObject *py_func =
+            PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_FUNCTION);
+        if (py_func == NULL || !PyUnicode_Check(py_func)) {
+            as_error_update(err, AEROSPIKE_ERR_PARAM, "%s must be a string",
+                            FIELD_NAME_BATCH_FUNCTION);
+            Py_XDECREF(py_func);
+            goto CLEANUP;
+        }
+        Py_DECREF(py_func);
+        const char *func = PyUnicode_AsUTF8(py_func);
 
-            break;
+        PyObject *py_args =
+            PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_ARGS);
+        if (py_args == NULL || !PyList_Check(py_args)) {
+            as_error_update(err, AEROSPIKE_ERR_PARAM,
+                            "%s must be a list of arguments for the UDF",
+                            FIELD_NAME_BATCH_ARGS);
+            Py_XDECREF(py_args);
+            goto CLEANUP;
+        }
 
-        case AS_BATCH_WRITE:;
+        as_list *arglist = NULL;
+        pyobject_to_list(self, err, py_args, &arglist, static_pool,
+                         SERIALIZER_PYTHON);
+        if (err->code != AEROSPIKE_OK) {
+            Py_DECREF(py_args);
+            goto CLEANUP;
+        }
+        Py_DECREF(py_args);
+        garb->udf_args_to_free = arglist;
 
-            as_policy_batch_write *w_policy = NULL;
-            GET_BATCH_POLICY_FROM_PYOBJECT(w_policy, as_policy_batch_write,
-                                           pyobject_to_batch_write_policy,
-                                           "Write")
+        as_batch_apply_record *ar;
+        ar = as_batch_apply_reserve(batch_records);
 
-            as_batch_write_record *wr;
-            wr = as_batch_write_reserve(&batch_records);
+        if (pyobject_to_key(err, py_key, &ar->key) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
 
-            if (pyobject_to_key(err, py_key, &wr->key) != AEROSPIKE_OK) {
-                goto CLEANUP0;
-            }
+        ar->module = mod;
+        ar->function = func;
+        ar->arglist = arglist;
+        ar->policy = a_policy;
 
-            wr->ops = ops;
-            wr->policy = w_policy;
+        break;
 
-            break;
+    case AS_BATCH_REMOVE:;
 
-        case AS_BATCH_APPLY:;
+        as_policy_batch_remove *re_policy = NULL;
+        GET_BATCH_POLICY_FROM_PYOBJECT(re_policy, as_policy_batch_remove,
+                                       pyobject_to_batch_remove_policy,
+                                       "Remove")
 
-            as_policy_batch_apply *a_policy = NULL;
-            GET_BATCH_POLICY_FROM_PYOBJECT(a_policy, as_policy_batch_apply,
-                                           pyobject_to_batch_apply_policy,
-                                           "Apply")
+        as_batch_remove_record *rer;
+        rer = as_batch_remove_reserve(batch_records);
 
-            PyObject *py_mod = PyObject_GetAttrString(py_batch_record,
-                                                      FIELD_NAME_BATCH_MODULE);
-            if (py_mod == NULL || !PyUnicode_Check(py_mod)) {
-                as_error_update(err, AEROSPIKE_ERR_PARAM, "%s must be a string",
-                                FIELD_NAME_BATCH_MODULE);
-                Py_XDECREF(py_mod);
-                goto CLEANUP0;
-            }
-            Py_DECREF(py_mod);
-            const char *mod = PyUnicode_AsUTF8(py_mod);
-
-            PyObject *py_func = PyObject_GetAttrString(
-                py_batch_record, FIELD_NAME_BATCH_FUNCTION);
-            if (py_func == NULL || !PyUnicode_Check(py_func)) {
-                as_error_update(err, AEROSPIKE_ERR_PARAM, "%s must be a string",
-                                FIELD_NAME_BATCH_FUNCTION);
-                Py_XDECREF(py_func);
-                goto CLEANUP0;
-            }
-            Py_DECREF(py_func);
-            const char *func = PyUnicode_AsUTF8(py_func);
+        if (pyobject_to_key(err, py_key, &rer->key) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
 
-            PyObject *py_args =
-                PyObject_GetAttrString(py_batch_record, FIELD_NAME_BATCH_ARGS);
-            if (py_args == NULL || !PyList_Check(py_args)) {
-                as_error_update(err, AEROSPIKE_ERR_PARAM,
-                                "%s must be a list of arguments for the UDF",
-                                FIELD_NAME_BATCH_ARGS);
-                Py_XDECREF(py_args);
-                goto CLEANUP0;
-            }
+        rer->policy = re_policy;
 
-            as_list *arglist = NULL;
-            pyobject_to_list(self, err, py_args, &arglist, &static_pool,
-                             SERIALIZER_PYTHON);
-            if (err->code != AEROSPIKE_OK) {
-                Py_DECREF(py_args);
-                goto CLEANUP0;
-            }
-            Py_DECREF(py_args);
-            garb->udf_args_to_free = arglist;
+        break;
 
-            as_batch_apply_record *ar;
-            ar = as_batch_apply_reserve(&batch_records);
+    default:
+        as_error_update(err, AEROSPIKE_ERR_PARAM, "batch_type unkown: %d",
+                        batch_type);
+        goto CLEANUP;
+        break;
+    }
 
-            if (pyobject_to_key(err, py_key, &ar->key) != AEROSPIKE_OK) {
-                goto CLEANUP0;
-            }
+CLEANUP:
+    Py_XDECREF(py_meta);
+    Py_XDECREF(py_ops_list);
+    Py_XDECREF(py_batch_type);
+    Py_XDECREF(py_key);
+
+    return err->code;
+}
+
+/*
+ * A slice of the BatchRecords list sent with one aerospike_batch_write call.
+ * Its C records, and the memory they use, are released once the results have
+ * been set on the Python records.
+ */
+typedef struct {
+    AerospikeClient *client;
+    as_policy_batch *batch_policy_p;
+    Py_ssize_t start;
+    Py_ssize_t count;
+    as_batch_records batch_records;
+    garbage *garbage_list;
+    as_static_pool static_pool;
+    // Status of aerospike_batch_write, set by the thread sending the chunk.
+    as_error err;
+    pthread_t thread;
+    bool thread_started;
+} batch_write_chunk;
+
+/*
+ * Converts the records of chunk. Called with the GIL held.
+ */
+static as_status batch_write_chunk_init(batch_write_chunk *chunk,
+                                        AerospikeClient *self, as_error *err,
+                                        as_policy_batch *batch_policy_p,
+                                        PyObject *py_batch_records,
+                                        Py_ssize_t start, Py_ssize_t count,
+                                        as_vector *unicodeStrVector)
+{
+    memset(chunk, 0, sizeof(batch_write_chunk));
+    chunk->client = self;
+    chunk->batch_policy_p = batch_policy_p;
+    chunk->start = start;
+    chunk->count = count;
+    as_error_init(&chunk->err);
+    as_batch_records_init(&chunk->batch_records, count);
+    chunk->garbage_list = calloc(count ? count : 1, sizeof(garbage));
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *py_batch_record =
+            PyList_GetItem(py_batch_records, start + i);
+        // TODO check that this is an instance/subclass on BatchRecord
+        if (py_batch_record == NULL) {
+            return as_error_update(
+                err, AEROSPIKE_ERR_PARAM,
+                "py_batch_record is NULL, %s must be a list of BatchRecord",
+                FIELD_NAME_BATCH_RECORDS);
+        }
 
-            ar->module = mod;
-            ar->function = func;
-            ar->arglist = arglist;
-            ar->policy = a_policy;
+        if (batch_write_add_record(self, err, py_batch_record,
+                                   &chunk->batch_records,
+                                   &chunk->garbage_list[i], unicodeStrVector,
+                                   &chunk->static_pool) != AEROSPIKE_OK) {
+            return err->code;
+        }
+    }
+    return AEROSPIKE_OK;
+}
 
-            break;
+static void *batch_write_chunk_send(void *udata)
+{
+    batch_write_chunk *chunk = (batch_write_chunk *)udata;
 
-        case AS_BATCH_REMOVE:;
+    aerospike_batch_write(chunk->client->as, &chunk->err,
+                          chunk->batch_policy_p, &chunk->batch_records);
+    return NULL;
+}
 
-            as_policy_batch_remove *re_policy = NULL;
-            GET_BATCH_POLICY_FROM_PYOBJECT(re_policy, as_policy_batch_remove,
-                                           pyobject_to_batch_remove_policy,
-                                           "Remove")
+/*
+ * Sends chunk on its own thread if background is set, otherwise waits for it
+ * with the GIL released.
+ */
+static void batch_write_chunk_start(batch_write_chunk *chunk, bool background)
+{
+    if (background && pthread_create(&chunk->thread, NULL,
+                                     batch_write_chunk_send, chunk) == 0) {
+        chunk->thread_started = true;
+        return;
+    }
 
-            as_batch_remove_record *rer;
-            rer = as_batch_remove_reserve(&batch_records);
+    Py_BEGIN_ALLOW_THREADS
+    batch_write_chunk_send(chunk);
+    Py_END_ALLOW_THREADS
+}
 
-            if (pyobject_to_key(err, py_key, &rer->key) != AEROSPIKE_OK) {
-                goto CLEANUP0;
-            }
+/*
+ * Waits for chunk to be written, if it was started. Called with the GIL held.
+ */
+static void batch_write_chunk_wait(batch_write_chunk *chunk)
+{
+    if (chunk->thread_started) {
+        Py_BEGIN_ALLOW_THREADS
+        pthread_join(chunk->thread, NULL);
+        Py_END_ALLOW_THREADS
+        chunk->thread_started = false;
+    }
+}
 
-            rer->policy = re_policy;
+/*
+ * Sets the result of every record of a written chunk on its Python record.
+ */
+static as_status batch_write_chunk_set_results(batch_write_chunk *chunk,
+                                               as_error *err,
+                                               PyObject *py_batch_records)
+{
+    as_vector *res_list = &chunk->batch_records.list;
+
+    for (Py_ssize_t i = 0; i < chunk->count; i++) {
+        PyObject *py_batch_record =
+            PyList_GetItem(py_batch_records, chunk->start + i);
 
-            break;
+        as_batch_base_record *batch_record = as_vector_get(res_list, i);
 
-        default:
-            as_error_update(err, AEROSPIKE_ERR_PARAM, "batch_type unkown: %d",
-                            batch_type);
-            goto CLEANUP0;
-            break;
+        if (batch_record_set_result(chunk->client, err, py_batch_record,
+                                    batch_record->result,
+                                    batch_record->in_doubt,
+                                    &batch_record->record,
+                                    &batch_record->key) != AEROSPIKE_OK) {
+            return err->code;
         }
-        Py_DECREF(py_key);
-        Py_DECREF(py_batch_type);
-        Py_XDECREF(py_ops_list);
     }
+    return AEROSPIKE_OK;
+}
 
-    Py_BEGIN_ALLOW_THREADS
+/*
+ * Releases everything chunk_init allocated. Called with the GIL held once the
+ * chunk has been written, or was never started.
+ */
+static void batch_write_chunk_destroy(batch_write_chunk *chunk)
+{
+    if (chunk->garbage_list) {
+        for (Py_ssize_t i = 0; i < chunk->count; i++) {
+            garbage_destroy(&chunk->garbage_list[i]);
+        }
+        free(chunk->garbage_list);
+        chunk->garbage_list = NULL;
+    }
 
-    aerospike_batch_write(self->as, err, batch_policy_p, &batch_records);
+    as_batch_records_destroy(&chunk->batch_records);
 
-    Py_END_ALLOW_THREADS
+    POOL_FREE(&chunk->static_pool);
+}
 
-    PyObject *py_bw_res = PyLong_FromLong((long)err->code);
-    if (PyObject_HasAttrString(py_obj, FIELD_NAME_BATCH_RESULT)) {
-        PyObject_DelAttrString(py_obj, FIELD_NAME_BATCH_RESULT);
+/*
+* AerospikeClient_BatchWriteInvoke
+* Converts Python BatchRecords objects into a C client as_batch_records struct.
+* Then calls aerospike_batch_records.
+*
+* With a chunk_size, the records are sent chunk_size at a time. Each chunk is
+* sent on its own thread while the next one is converted, with up to
+* max_in_flight chunks being sent at once, and the results of a chunk are set
+* as soon as it has been written.
+*/
+static PyObject *AerospikeClient_BatchWriteInvoke(
+    AerospikeClient *self, as_error *err, PyObject *py_policy,
+    PyObject *py_obj, Py_ssize_t chunk_size, uint32_t max_in_flight)
+{
+    Py_ssize_t py_batch_records_size = 0;
+
+    as_policy_batch batch_policy;
+    as_policy_batch *batch_policy_p = NULL;
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    PyObject *py_batch_records = NULL;
+
+    // setup for op conversion
+    as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+    // Ring of chunks, oldest first, in_flight of them started.
+    batch_write_chunk *chunks = NULL;
+    uint32_t n_chunks = 0;
+    uint32_t oldest = 0;
+    uint32_t in_flight = 0;
+    as_status batch_status = AEROSPIKE_OK;
+
+    if (!self || !self->as) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+        goto CLEANUP;
     }
-    PyObject_SetAttrString(py_obj, FIELD_NAME_BATCH_RESULT, py_bw_res);
-    Py_DECREF(py_bw_res);
 
-    as_error_reset(err);
+    if (!self->is_conn_16) {
+        as_error_update(err, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
 
-    // populate results
-    as_vector *res_list = &batch_records.list;
+    if (py_obj == NULL) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM, "py_obj value is null");
+        goto CLEANUP;
+    }
 
-    for (Py_ssize_t i = 0; i < py_batch_records_size; i++) {
-        PyObject *py_batch_record = PyList_GetItem(py_batch_records, i);
+    if (chunk_size < 0) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "chunk_size must not be negative");
+        goto CLEANUP;
+    }
 
-        as_batch_base_record *batch_record = as_vector_get(res_list, i);
+    if (max_in_flight == 0) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "max_in_flight must be greater than 0");
+        goto CLEANUP;
+    }
 
-        as_status *result_code = &(batch_record->result);
-        as_key *requested_key = &(batch_record->key);
-        as_record *result_rec = &(batch_record->record);
-        bool in_doubt = batch_record->in_doubt;
+    if (py_policy != NULL) {
+        if (pyobject_to_policy_batch(self, err, py_policy, &batch_policy,
+                                     &batch_policy_p,
+                                     &self->as->config.policies.batch,
+                                     &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+    }
 
-        PyObject *py_res = PyLong_FromLong((long)*result_code);
-        if (PyObject_HasAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT)) {
-            PyObject_DelAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT);
+    // TODO check that py_object is an instance of class
+
+    py_batch_records = PyObject_GetAttrString(py_obj, FIELD_NAME_BATCH_RECORDS);
+    if (py_batch_records == NULL || !PyList_Check(py_batch_records)) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "%s must be a list of BatchRecord",
+                        FIELD_NAME_BATCH_RECORDS);
+        goto CLEANUP;
+    }
+
+    py_batch_records_size = PyList_Size(py_batch_records);
+    if (chunk_size == 0 || chunk_size > py_batch_records_size) {
+        chunk_size = py_batch_records_size;
+    }
+    // Only send on other threads if there is more than one chunk.
+    bool pipelined = chunk_size < py_batch_records_size;
+    // One more chunk than in flight, for the one being converted.
+    n_chunks = pipelined ? max_in_flight + 1 : 1;
+    chunks = calloc(n_chunks, sizeof(batch_write_chunk));
+
+    Py_ssize_t start = 0;
+    do {
+        batch_write_chunk *chunk = &chunks[(oldest + in_flight) % n_chunks];
+        Py_ssize_t count = py_batch_records_size - start < chunk_size
+                               ? py_batch_records_size - start
+                               : chunk_size;
+
+        if (batch_write_chunk_init(chunk, self, err, batch_policy_p,
+                                   py_batch_records, start,
+                                   count, unicodeStrVector) != AEROSPIKE_OK) {
+            batch_write_chunk_destroy(chunk);
+            goto CLEANUP;
         }
-        PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT,
-                               py_res);
-        Py_DECREF(py_res);
-
-        PyObject *py_in_doubt = PyBool_FromLong((long)in_doubt);
-        PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_INDOUBT,
-                               py_in_doubt);
-        Py_DECREF(py_in_doubt);
-
-        if (*result_code == AEROSPIKE_OK) {
-            PyObject *rec = NULL;
-
-            if (PyObject_HasAttrString(py_batch_record,
-                                       FIELD_NAME_BATCH_RECORD)) {
-                PyObject_DelAttrString(py_batch_record,
-                                       FIELD_NAME_BATCH_RECORD);
-            }
+        start += count;
 
-            if (result_rec) {
-                record_to_pyobject(self, err, result_rec, requested_key, &rec);
-                PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD,
-                                       rec);
-                Py_DECREF(rec);
+        if (in_flight == max_in_flight) {
+            batch_write_chunk *done = &chunks[oldest];
+            batch_write_chunk_wait(done);
+            if (batch_status == AEROSPIKE_OK) {
+                batch_status = done->err.code;
             }
-            else {
-                Py_INCREF(Py_None);
-                PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD,
-                                       Py_None);
+            batch_write_chunk_set_results(done, err, py_batch_records);
+            batch_write_chunk_destroy(done);
+            oldest = (oldest + 1) % n_chunks;
+            in_flight--;
+            if (err->code != AEROSPIKE_OK) {
+                batch_write_chunk_destroy(chunk);
+                goto CLEANUP;
             }
         }
-    }
 
-    goto CLEANUP3;
+        batch_write_chunk_start(chunk, pipelined);
+        in_flight++;
+    } while (start < py_batch_records_size);
 
-CLEANUP0:
-    Py_XDECREF(py_meta);
-    Py_XDECREF(py_ops_list);
-CLEANUP1:
-    Py_XDECREF(py_batch_type);
-CLEANUP2:
-    Py_XDECREF(py_key);
-CLEANUP3:
-    Py_XDECREF(py_batch_records);
-CLEANUP4:
-    if (garbage_list_p != NULL) {
-        for (int i = 0; i < py_batch_records_size; i++) {
-            garbage *garb_to_free = as_vector_get(&garbage_list, i);
-            garbage_destroy(garb_to_free);
+    while (in_flight > 0) {
+        batch_write_chunk *done = &chunks[oldest];
+        batch_write_chunk_wait(done);
+        if (batch_status == AEROSPIKE_OK) {
+            batch_status = done->err.code;
+        }
+        batch_write_chunk_set_results(done, err, py_batch_records);
+        batch_write_chunk_destroy(done);
+        oldest = (oldest + 1) % n_chunks;
+        in_flight--;
+        if (err->code != AEROSPIKE_OK) {
+            goto CLEANUP;
         }
-        as_vector_destroy(garbage_list_p);
     }
 
-    if (batch_records_p != NULL) {
-        as_batch_records_destroy(&batch_records);
+    PyObject *py_bw_res = PyLong_FromLong((long)batch_status);
+    if (PyObject_HasAttrString(py_obj, FIELD_NAME_BATCH_RESULT)) {
+        PyObject_DelAttrString(py_obj, FIELD_NAME_BATCH_RESULT);
     }
+    PyObject_SetAttrString(py_obj, FIELD_NAME_BATCH_RESULT, py_bw_res);
+    Py_DECREF(py_bw_res);
+
+CLEANUP:
+    // Chunks already sent can not be taken back, wait for them before
+    // releasing their records.
+    while (in_flight > 0) {
+        batch_write_chunk_wait(&chunks[oldest]);
+        batch_write_chunk_destroy(&chunks[oldest]);
+        oldest = (oldest + 1) % n_chunks;
+        in_flight--;
+    }
+    if (chunks) {
+        free(chunks);
+    }
+
+    Py_XDECREF(py_batch_records);
 
     for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
         free(as_vector_get_ptr(unicodeStrVector, i));
@@ -566,17 +713,22 @@ PyObject *AerospikeClient_BatchWrite(AerospikeClient *self, PyObject *args,
 {
     PyObject *py_policy = NULL;
     PyObject *py_batch_recs = NULL;
+    Py_ssize_t chunk_size = 0;
+    unsigned int max_in_flight = DEFAULT_MAX_IN_FLIGHT;
 
     as_error err;
     as_error_init(&err);
 
-    static char *kwlist[] = {"batch_records", "policy_batch", NULL};
+    static char *kwlist[] = {"batch_records", "policy_batch", "chunk_size",
+                             "max_in_flight", NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwds, "O|O:batch_write", kwlist,
-                                    &py_batch_recs, &py_policy) == false) {
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OnI:batch_write", kwlist,
+                                    &py_batch_recs, &py_policy, &chunk_size,
+                                    &max_in_flight) == false) {
         return NULL;
     }
 
     return AerospikeClient_BatchWriteInvoke(self, &err, py_policy,
-                                            py_batch_recs);
+                                            py_batch_recs, chunk_size,
+                                            max_in_flight);
 }
\ No newline at end of file
@@ -0,0 +1,72 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_exp.h>
+
+#include "client.h"
+#include "compiled_expression.h"
+#include "conversions.h"
+#include "exceptions.h"
+
+/**
+ *******************************************************************************************************
+ * Pack an expression list once, for reuse across calls.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.CompiledExpression.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_CompileExpression(AerospikeClient *self,
+                                            PyObject *args, PyObject *kwds)
+{
+    PyObject *py_expressions = NULL;
+    as_exp *exp_list_p = NULL;
+
+    as_error err;
+    as_error_init(&err);
+
+    static char *kwlist[] = {"expressions", NULL};
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "O:compile_expression", kwlist,
+                                    &py_expressions) == false) {
+        return NULL;
+    }
+
+    // Compiling twice is harmless, hand back the same object.
+    if (compiled_expression_exp(py_expressions)) {
+        Py_INCREF(py_expressions);
+        return py_expressions;
+    }
+
+    if (convert_exp_list(self, py_expressions, &exp_list_p, &err) !=
+        AEROSPIKE_OK) {
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return AerospikeCompiledExpression_New(exp_list_p);
+}
@@ -23,6 +23,7 @@
 #include "conversions.h"
 #include "global_hosts.h"
 #include "exceptions.h"
+#include "prepared_policy.h"
 
 #define MAX_PORT_SIZE 6
 /**
@@ -68,6 +69,8 @@ PyObject *AerospikeClientConnect(AerospikeClient *self)
                     aerospike_destroy(self->as);
                 }
                 self->as = as;
+                // The shared as has its own defaults.
+                self->policy_generation = prepared_policy_next_generation();
                 self->as->config.shm_key =
                     ((AerospikeGlobalHosts *)py_persistent_item)->shm_key;
 
@@ -58,6 +58,7 @@ extern PyObject *AerospikeClient_Exists_Invoke(AerospikeClient *self,
 
     // Initialisation flags
     bool key_initialised = false;
+    bool missing_none = false;
 
     // Initialize error
     as_error_init(&err);
@@ -89,6 +90,11 @@ extern PyObject *AerospikeClient_Exists_Invoke(AerospikeClient *self,
         goto CLEANUP;
     }
 
+    if (pyobject_to_policy_missing(self, &err, py_policy, &missing_none) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     // Invoke operation
     Py_BEGIN_ALLOW_THREADS
     aerospike_key_exists(self->as, &err, read_policy_p, &key, &rec);
@@ -105,6 +111,11 @@ extern PyObject *AerospikeClient_Exists_Invoke(AerospikeClient *self,
         PyTuple_SetItem(py_result, 0, py_result_key);
         PyTuple_SetItem(py_result, 1, py_result_meta);
     }
+    else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND && missing_none) {
+        as_error_reset(&err);
+        Py_INCREF(Py_None);
+        py_result = Py_None;
+    }
     else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND) {
         as_error_reset(&err);
 
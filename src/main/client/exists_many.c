@@ -28,6 +28,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "key.h"
 
 typedef struct _exists_many_cb_data {
     PyObject *py_recs;
@@ -164,7 +165,7 @@ batch_exists_aerospike_batch_exists(as_error *err, AerospikeClient *self,
 
             PyObject *py_key = PyList_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
@@ -195,7 +196,7 @@ batch_exists_aerospike_batch_exists(as_error *err, AerospikeClient *self,
         for (int i = 0; i < size; i++) {
             PyObject *py_key = PyTuple_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
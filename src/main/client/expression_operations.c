@@ -27,6 +27,7 @@
 #include "serializer.h"
 #include "expression_operations.h"
 #include "cdt_operation_utils.h"
+#include "compiled_expression.h"
 
 static as_status add_op_expr_read(AerospikeClient *self, as_error *err,
                                   PyObject *op_dict,
@@ -87,11 +88,16 @@ static as_status add_op_expr_write(AerospikeClient *self, as_error *err,
 
     py_exp_list = PyDict_GetItemString(op_dict, AS_EXPR_KEY);
 
-    if (convert_exp_list(self, py_exp_list, &exp_list_p, err) != AEROSPIKE_OK) {
-        return err->code;
+    as_exp *exp_p = compiled_expression_exp(py_exp_list);
+    if (!exp_p) {
+        if (convert_exp_list(self, py_exp_list, &exp_list_p, err) !=
+            AEROSPIKE_OK) {
+            return err->code;
+        }
+        exp_p = exp_list_p;
     }
 
-    if (!as_operations_exp_write(ops, bin, exp_list_p, exp_write_flags)) {
+    if (!as_operations_exp_write(ops, bin, exp_p, exp_write_flags)) {
         as_error_update(err, AEROSPIKE_ERR_CLIENT,
                         "Failed to pack write expression op.");
     }
@@ -124,11 +130,16 @@ static as_status add_op_expr_read(AerospikeClient *self, as_error *err,
 
     py_exp_list = PyDict_GetItemString(op_dict, AS_EXPR_KEY);
 
-    if (convert_exp_list(self, py_exp_list, &exp_list_p, err) != AEROSPIKE_OK) {
-        return err->code;
+    as_exp *exp_p = compiled_expression_exp(py_exp_list);
+    if (!exp_p) {
+        if (convert_exp_list(self, py_exp_list, &exp_list_p, err) !=
+            AEROSPIKE_OK) {
+            return err->code;
+        }
+        exp_p = exp_list_p;
     }
 
-    if (!as_operations_exp_read(ops, bin, exp_list_p, exp_read_flags)) {
+    if (!as_operations_exp_read(ops, bin, exp_p, exp_read_flags)) {
         as_error_update(err, AEROSPIKE_ERR_CLIENT,
                         "Failed to pack read expression op.");
     }
@@ -59,6 +59,7 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
 
     // Initialised flags
     bool key_initialised = false;
+    bool missing_none = false;
     bool record_initialised = false;
 
     // Initialize error
@@ -91,6 +92,11 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
         goto CLEANUP;
     }
 
+    if (pyobject_to_policy_missing(self, &err, py_policy, &missing_none) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     // Invoke operation
     Py_BEGIN_ALLOW_THREADS
     aerospike_key_get(self->as, &err, read_policy_p, &key, &rec);
@@ -114,6 +120,11 @@ PyObject *AerospikeClient_Get_Invoke(AerospikeClient *self, PyObject *py_key,
             PyTuple_SetItem(p_key, 2, Py_None);
         }
     }
+    else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND && missing_none) {
+        as_error_reset(&err);
+        Py_INCREF(Py_None);
+        py_rec = Py_None;
+    }
     else {
         as_error_update(&err, err.code, NULL);
     }
@@ -22,154 +22,12 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
 
+#include "async.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
 
-// Struct for Python User-Data for the Callback
-typedef struct {
-    as_key key;
-    as_error error;
-    PyObject *callback;
-    AerospikeClient *client;
-    as_policy_read read_policy;
-    as_policy_read *read_policy_p;
-} LocalData;
-
-LocalData *async_cb_create(void) { return cf_malloc(sizeof(LocalData)); }
-
-void async_cb_destroy(LocalData *uData) { cf_free(uData); }
-
-void read_async_callback_helper(as_error *cmd_error, as_record *record,
-                                void *udata, as_event_loop *event_loop, int cb)
-{
-    PyObject *py_rec = NULL;
-    PyObject *py_return = NULL;
-    PyObject *py_arglist = NULL;
-    PyObject *py_err = NULL;
-    as_error *error = NULL;
-    as_error temp_error;
-    PyObject *py_key = NULL;
-    PyObject *py_exception = NULL;
-
-    // Extract callback user-data
-    LocalData *data = (LocalData *)udata;
-    PyObject *py_callback = data->callback;
-
-    error = &data->error;
-    if (cmd_error) {
-        error = cmd_error;
-    }
-
-    // Lock Python State
-    PyGILState_STATE gstate;
-    if (cb) {
-        gstate = PyGILState_Ensure();
-    }
-    error_to_pyobject(error, &py_err);
-    // Convert as_key to python key object
-    key_to_pyobject(&temp_error, &data->key, &py_key);
-
-    if (error->code == AEROSPIKE_OK) {
-
-        if (record_to_pyobject(data->client, &temp_error, record, &data->key,
-                               &py_rec) != AEROSPIKE_OK) {
-            as_error_copy(error, &temp_error);
-        }
-    }
-
-    if (error->code == AEROSPIKE_OK) {
-        if (py_rec && (!data->read_policy_p ||
-                       (data->read_policy_p &&
-                        data->read_policy_p->key == AS_POLICY_KEY_DIGEST))) {
-            // This is a special case.
-            // C-client returns NULL key, so to the user
-            // response will be (<ns>, <set>, None, <digest>)
-            // Using the same input key, just making primary key part to be None
-            // Only in case of POLICY_KEY_DIGEST or no policy specified
-            PyObject *p_key = PyTuple_GetItem(py_rec, 0);
-            Py_INCREF(Py_None);
-            PyTuple_SetItem(p_key, 2, Py_None);
-        }
-    }
-
-    if (error->code != AEROSPIKE_OK) {
-        py_exception = raise_exception(error);
-        if (PyObject_HasAttrString(py_exception, "key")) {
-            PyObject_SetAttrString(py_exception, "key", py_key);
-        }
-        if (PyObject_HasAttrString(py_exception, "bin")) {
-            PyObject_SetAttrString(py_exception, "bin", Py_None);
-        }
-        if (!cb) {
-            PyErr_SetObject(py_exception, py_err);
-            Py_DECREF(py_err);
-        }
-    }
-
-    if (cb) {
-        // Build Python Function Arguments
-        py_arglist = PyTuple_New(4);
-
-        if (!py_rec) {
-            Py_INCREF(Py_None);
-            py_rec = Py_None;
-        }
-
-        if (!py_exception) {
-            Py_INCREF(Py_None);
-            py_exception = Py_None;
-        }
-
-        PyTuple_SetItem(py_arglist, 0,
-                        py_key); //0-key tuple (ns, set, key, hash)
-        PyTuple_SetItem(py_arglist, 1,
-                        py_rec); //1-record tuple (key-tuple, meta, bin)
-        PyTuple_SetItem(py_arglist, 2, py_err);       //2-error tuple
-        PyTuple_SetItem(py_arglist, 3, py_exception); //3-exception
-
-        // Invoke Python Callback
-        py_return = PyObject_Call(py_callback, py_arglist, NULL);
-
-        // Release Python Function Arguments
-        Py_DECREF(py_arglist);
-
-        // handle return value
-        if (!py_return) {
-            // an exception was raised, handle it (someday)
-            // for now, we bail from the loop
-            as_error_update(error, AEROSPIKE_ERR_CLIENT,
-                            "read_async_callback function raised an exception");
-        }
-        else {
-            Py_DECREF(py_return);
-        }
-    }
-
-    if (record) {
-        as_record_destroy(record);
-    }
-
-    if (udata) {
-        as_key_destroy(&data->key);
-        //todo: dont free cb data in case of retry logic
-        async_cb_destroy(udata);
-    }
-
-    if (cb) {
-        PyGILState_Release(gstate);
-    }
-
-    return;
-}
-
-void read_async_callback(as_error *error, as_record *record, void *udata,
-                         as_event_loop *event_loop)
-{
-    read_async_callback_helper(error, record, udata, event_loop, 1);
-}
-
 /**
  *******************************************************************************************************
  * Gets a record from the Aerospike DB.
@@ -191,17 +49,7 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
     PyObject *py_key = NULL;
     PyObject *py_policy = NULL;
 
-    if (!async_support) {
-        as_error err;
-        as_error_init(&err);
-        as_error_update(
-            &err, AEROSPIKE_ERR,
-            "Support for async is disabled, build software with async option");
-        PyObject *py_err = NULL, *exception_type = NULL;
-        error_to_pyobject(&err, &py_err);
-        exception_type = raise_exception(&err);
-        PyErr_SetObject(exception_type, py_err);
-        Py_DECREF(py_err);
+    if (!async_check_support()) {
         return NULL;
     }
 
@@ -216,55 +64,61 @@ PyObject *AerospikeClient_Get_Async(AerospikeClient *self, PyObject *args,
     }
 
     // Create and initialize callback user-data
-    LocalData *uData = async_cb_create();
-    uData->callback = py_callback;
-    uData->client = self;
-    uData->read_policy_p = NULL;
-    memset(&uData->key, 0, sizeof(uData->key));
-    as_error_init(&uData->error);
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+    as_policy_read read_policy;
+    as_policy_read *read_policy_p = NULL;
 
     // For converting expressions.
     as_exp exp_list;
     as_exp *exp_list_p = NULL;
 
     as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
 
     if (!self || !self->as) {
-        as_error_update(&uData->error, AEROSPIKE_ERR_PARAM,
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
                         "Invalid aerospike object");
         goto CLEANUP;
     }
 
     if (!self->is_conn_16) {
-        as_error_update(&uData->error, AEROSPIKE_ERR_CLUSTER,
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
                         "No connection to aerospike cluster");
         goto CLEANUP;
     }
 
     // Convert python key object to as_key
-    pyobject_to_key(&uData->error, py_key, &uData->key);
-    if (uData->error.code != AEROSPIKE_OK) {
+    pyobject_to_key(&cmd->error, py_key, &cmd->key);
+    if (cmd->error.code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
+    cmd->key_initialised = true;
 
     // Convert python policy object to as_policy_exists
-    pyobject_to_policy_read(self, &uData->error, py_policy, &uData->read_policy,
-                            &uData->read_policy_p,
+    pyobject_to_policy_read(self, &cmd->error, py_policy, &read_policy,
+                            &read_policy_p,
                             &self->as->config.policies.read, &exp_list,
                             &exp_list_p);
-    if (uData->error.code != AEROSPIKE_OK) {
+    if (cmd->error.code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
+    cmd->digest_only_key = read_policy_p->key == AS_POLICY_KEY_DIGEST;
+    cmd->legacy_callback = true;
+    read_policy_p = async_policy_read(cmd, read_policy_p, &read_policy);
 
     // Invoke operation
     Py_BEGIN_ALLOW_THREADS
-    status = aerospike_key_get_async(uData->client->as, &uData->error,
-                                     uData->read_policy_p, &uData->key,
-                                     read_async_callback, uData, NULL, NULL);
+    status = aerospike_key_get_async(self->as, &err, read_policy_p, &cmd->key,
+                                     async_record_listener, cmd,
+                                     async_event_loop(&cmd->key), NULL);
     Py_END_ALLOW_THREADS
-    if (status != AEROSPIKE_OK || uData->error.code != AEROSPIKE_OK) {
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
         goto CLEANUP;
     }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
 
 CLEANUP:
 
@@ -272,10 +126,8 @@ CLEANUP:
         as_exp_destroy(exp_list_p);
     }
 
-    if (status != AEROSPIKE_OK || uData->error.code != AEROSPIKE_OK) {
-        //todo does raising exception alone or need cab to python?
-        read_async_callback_helper(&uData->error, NULL, uData, NULL, 0);
-        return NULL;
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
     }
 
     Py_INCREF(Py_None);
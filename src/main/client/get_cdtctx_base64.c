@@ -46,6 +46,8 @@ PyObject *AerospikeClient_GetCDTCTXBase64(AerospikeClient *self, PyObject *args,
     PyObject *py_cdtctx = NULL;
     as_cdt_ctx ctx;
     bool ctx_in_use = false;
+    as_static_pool static_pool;
+    memset(&static_pool, 0, sizeof(static_pool));
 
     char *base64 = NULL;
     PyObject *py_response = NULL;
@@ -77,9 +79,6 @@ PyObject *AerospikeClient_GetCDTCTXBase64(AerospikeClient *self, PyObject *args,
         goto CLEANUP;
     }
 
-    as_static_pool static_pool;
-    memset(&static_pool, 0, sizeof(static_pool));
-
     if (get_cdt_ctx(self, &err, &ctx, py_cdtctx, &ctx_in_use, &static_pool,
                     SERIALIZER_PYTHON) != AEROSPIKE_OK) {
         goto CLEANUP;
@@ -108,6 +107,8 @@ CLEANUP:
         cf_free(base64);
     }
 
+    POOL_FREE(&static_pool);
+
     if (err.code != AEROSPIKE_OK) {
         PyObject *py_err = NULL;
         error_to_pyobject(&err, &py_err);
@@ -25,6 +25,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "compiled_expression.h"
 
 /**
  *******************************************************************************************************
@@ -61,7 +62,9 @@ PyObject *AerospikeClient_GetExpressionBase64(AerospikeClient *self,
     }
 
     //convert filter to base64
-    if (py_expression_filter == NULL || !PyList_Check(py_expression_filter)) {
+    if (py_expression_filter == NULL ||
+        (!PyList_Check(py_expression_filter) &&
+         !compiled_expression_exp(py_expression_filter))) {
         as_error_update(&err, AEROSPIKE_ERR_PARAM,
                         "expression must be a non empty list of 4 element "
                         "tuples, generated by a compiled aerospike expression");
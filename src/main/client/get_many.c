@@ -28,6 +28,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "key.h"
 
 #define MAX_STACK_ALLOCATION 4000
 
@@ -39,6 +40,7 @@
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param batch_policy_p        as_policy_batch object
+ * @param record_format         One of the RECORD_FORMAT_* values
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
@@ -46,7 +48,8 @@
 static PyObject *batch_get_aerospike_batch_read(as_error *err,
                                                 AerospikeClient *self,
                                                 PyObject *py_keys,
-                                                as_policy_batch *batch_policy_p)
+                                                as_policy_batch *batch_policy_p,
+                                                int record_format)
 {
     PyObject *py_recs = NULL;
 
@@ -75,7 +78,7 @@ static PyObject *batch_get_aerospike_batch_read(as_error *err,
 
             PyObject *py_key = PyList_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
@@ -106,7 +109,7 @@ static PyObject *batch_get_aerospike_batch_read(as_error *err,
         for (int i = 0; i < size; i++) {
             PyObject *py_key = PyTuple_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
@@ -135,7 +138,8 @@ static PyObject *batch_get_aerospike_batch_read(as_error *err,
     if (err->code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
-    batch_read_records_to_pyobject(self, err, &records, &py_recs);
+    batch_read_records_to_pyobject(self, err, &records, record_format,
+                                   &py_recs);
 
 CLEANUP:
     if (batch_initialised == true) {
@@ -180,6 +184,7 @@ static PyObject *AerospikeClient_Get_Many_Invoke(AerospikeClient *self,
     as_error err;
     as_policy_batch policy;
     as_policy_batch *batch_policy_p = NULL;
+    int record_format = RECORD_FORMAT_TUPLE;
     // Initialize error
     as_error_init(&err);
 
@@ -207,8 +212,13 @@ static PyObject *AerospikeClient_Get_Many_Invoke(AerospikeClient *self,
         goto CLEANUP;
     }
 
-    py_recs =
-        batch_get_aerospike_batch_read(&err, self, py_keys, batch_policy_p);
+    if (pyobject_to_record_format(&err, py_policy, &record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    py_recs = batch_get_aerospike_batch_read(&err, self, py_keys,
+                                             batch_policy_p, record_format);
 
 CLEANUP:
 
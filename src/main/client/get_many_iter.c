@@ -0,0 +1,462 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+#include <aerospike/aerospike_batch.h>
+#include <aerospike/as_batch.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "prepared_policy.h"
+#include "results_iterator.h"
+#include "key.h"
+
+// Keys sent in each batch request unless chunk_size is given.
+#define DEFAULT_CHUNK_SIZE 1000
+// Batch requests running at the same time unless max_in_flight is given.
+#define DEFAULT_MAX_IN_FLIGHT 2
+// No chunk has failed.
+#define NO_CHUNK UINT64_MAX
+
+/*
+ * Everything the worker threads need once get_many_iter() has returned.
+ *
+ * Each worker takes the next chunk_size keys, reads them with one batch
+ * request and queues the records. Chunks are numbered in the order their keys
+ * were taken and queued in that order, so records come out in key order while
+ * up to max_in_flight requests run at once.
+ */
+typedef struct {
+    AerospikeClient *client;
+    // Iterator over the keys, owned by the results iterator.
+    PyObject *py_keys;
+    as_policy_batch policy;
+    as_policy_batch *policy_p;
+    as_exp exp_list;
+    as_exp *exp_list_p;
+    // Owner of a filter expression borrowed by policy.
+    PyObject *py_exp_owner;
+    int record_format;
+    uint32_t chunk_size;
+    uint32_t max_in_flight;
+
+    // Serialises taking keys so chunk numbers follow the keys. Always taken
+    // before the GIL, since py_keys may release it.
+    pthread_mutex_t keys_lock;
+    // Guarded by keys_lock.
+    uint64_t next_chunk;
+    bool exhausted;
+
+    // Guarded by the results iterator lock. Workers wait on its not_full
+    // condition for their turn.
+    uint64_t next_queued;
+    uint64_t failed_chunk;
+    // Error of failed_chunk, raised once the earlier chunks are consumed.
+    as_error error;
+} BatchIterJob;
+
+/*
+ * Moves the exception raised by the key iterable to err. Called with the GIL
+ * held.
+ */
+static void batch_iter_key_error(as_error *err)
+{
+    PyObject *py_type = NULL;
+    PyObject *py_value = NULL;
+    PyObject *py_traceback = NULL;
+    PyErr_Fetch(&py_type, &py_value, &py_traceback);
+
+    PyObject *py_str = py_value ? PyObject_Str(py_value) : NULL;
+    const char *msg = py_str ? PyUnicode_AsUTF8(py_str) : NULL;
+    as_error_update(err, AEROSPIKE_ERR_PARAM, "Key iterable raised %s: %s",
+                    ((PyTypeObject *)py_type)->tp_name, msg ? msg : "");
+    PyErr_Clear();
+
+    Py_XDECREF(py_str);
+    Py_XDECREF(py_type);
+    Py_XDECREF(py_value);
+    Py_XDECREF(py_traceback);
+}
+
+/*
+ * Adds up to chunk_size keys to records, and appends them to py_chunk_keys.
+ * Keys such as bytearrays are borrowed by records, so py_chunk_keys must be
+ * kept until the chunk is read. Called with keys_lock and the GIL held.
+ */
+static as_status batch_iter_take_keys(BatchIterJob *job, as_error *err,
+                                      as_batch_read_records *records,
+                                      PyObject *py_chunk_keys)
+{
+    while (records->list.size < job->chunk_size) {
+        PyObject *py_key = PyIter_Next(job->py_keys);
+        if (!py_key) {
+            job->exhausted = true;
+            if (PyErr_Occurred()) {
+                batch_iter_key_error(err);
+            }
+            return err->code;
+        }
+
+        if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
+            Py_DECREF(py_key);
+            job->exhausted = true;
+            return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                                   "Key should be a tuple.");
+        }
+
+        if (PyList_Append(py_chunk_keys, py_key) == -1) {
+            Py_DECREF(py_key);
+            job->exhausted = true;
+            PyErr_Clear();
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Cannot allocate keys");
+        }
+
+        as_batch_read_record *record = as_batch_read_reserve(records);
+        pyobject_to_key(err, py_key, &record->key);
+        record->read_all_bins = true;
+        Py_DECREF(py_key);
+
+        if (err->code != AEROSPIKE_OK) {
+            job->exhausted = true;
+            return err->code;
+        }
+    }
+    return AEROSPIKE_OK;
+}
+
+/*
+ * Records the error of chunk, unless an earlier chunk failed already, and
+ * wakes the workers waiting for their turn.
+ */
+static void batch_iter_fail(AerospikeResultsIterator *iterator, uint64_t chunk,
+                            as_error *err)
+{
+    BatchIterJob *job = (BatchIterJob *)iterator->job;
+
+    pthread_mutex_lock(&iterator->lock);
+    if (chunk < job->failed_chunk) {
+        job->failed_chunk = chunk;
+        as_error_copy(&job->error, err);
+    }
+    pthread_cond_broadcast(&iterator->not_full);
+    pthread_mutex_unlock(&iterator->lock);
+}
+
+/*
+ * Whether chunk will never be queued, because the iterator was closed or an
+ * earlier chunk failed.
+ */
+static bool batch_iter_cancelled(AerospikeResultsIterator *iterator,
+                                 uint64_t chunk)
+{
+    BatchIterJob *job = (BatchIterJob *)iterator->job;
+
+    pthread_mutex_lock(&iterator->lock);
+    bool cancelled = iterator->closed || chunk > job->failed_chunk;
+    pthread_mutex_unlock(&iterator->lock);
+    return cancelled;
+}
+
+static void *batch_iter_worker(void *udata)
+{
+    AerospikeResultsIterator *iterator = (AerospikeResultsIterator *)udata;
+    BatchIterJob *job = (BatchIterJob *)iterator->job;
+    PyGILState_STATE gstate;
+
+    while (true) {
+        as_error err;
+        as_error_init(&err);
+        as_batch_read_records records;
+        uint64_t chunk;
+        PyObject **py_results = NULL;
+        Py_ssize_t n_results = 0;
+        PyObject *py_chunk_keys = NULL;
+
+        pthread_mutex_lock(&job->keys_lock);
+        if (job->exhausted || batch_iter_cancelled(iterator, job->next_chunk)) {
+            pthread_mutex_unlock(&job->keys_lock);
+            break;
+        }
+        chunk = job->next_chunk++;
+        as_batch_read_init(&records, job->chunk_size);
+        gstate = PyGILState_Ensure();
+        py_chunk_keys = PyList_New(0);
+        if (py_chunk_keys) {
+            batch_iter_take_keys(job, &err, &records, py_chunk_keys);
+        }
+        else {
+            PyErr_Clear();
+            job->exhausted = true;
+            as_error_update(&err, AEROSPIKE_ERR_CLIENT, "Cannot allocate keys");
+        }
+        PyGILState_Release(gstate);
+        pthread_mutex_unlock(&job->keys_lock);
+
+        if (err.code == AEROSPIKE_OK && records.list.size > 0) {
+            aerospike_batch_read(job->client->as, &err, job->policy_p,
+                                 &records);
+        }
+
+        gstate = PyGILState_Ensure();
+        if (err.code == AEROSPIKE_OK && records.list.size > 0) {
+            PyObject *py_recs = NULL;
+            batch_read_records_to_pyobject(job->client, &err, &records,
+                                           job->record_format, &py_recs);
+            if (py_recs) {
+                // Take the records out of the list so they can be queued
+                // without the GIL.
+                n_results = PyList_GET_SIZE(py_recs);
+                py_results = cf_malloc(sizeof(PyObject *) * n_results);
+                for (Py_ssize_t i = 0; i < n_results; i++) {
+                    py_results[i] = PyList_GET_ITEM(py_recs, i);
+                    Py_INCREF(py_results[i]);
+                }
+                Py_DECREF(py_recs);
+            }
+        }
+        as_batch_read_destroy(&records);
+        Py_XDECREF(py_chunk_keys);
+        PyGILState_Release(gstate);
+
+        if (err.code != AEROSPIKE_OK) {
+            batch_iter_fail(iterator, chunk, &err);
+            break;
+        }
+
+        // Wait for the earlier chunks to be queued.
+        pthread_mutex_lock(&iterator->lock);
+        while (job->next_queued != chunk && !iterator->closed &&
+               chunk < job->failed_chunk) {
+            pthread_cond_wait(&iterator->not_full, &iterator->lock);
+        }
+        bool turn = job->next_queued == chunk && !iterator->closed;
+        pthread_mutex_unlock(&iterator->lock);
+
+        Py_ssize_t queued = 0;
+        if (turn) {
+            while (queued < n_results &&
+                   results_iterator_push(iterator, py_results[queued])) {
+                queued++;
+            }
+            if (queued < n_results) {
+                // The push that returned false released its result.
+                queued++;
+            }
+        }
+
+        if (queued < n_results) {
+            gstate = PyGILState_Ensure();
+            for (Py_ssize_t i = queued; i < n_results; i++) {
+                Py_DECREF(py_results[i]);
+            }
+            PyGILState_Release(gstate);
+        }
+        if (py_results) {
+            cf_free(py_results);
+        }
+
+        if (!turn) {
+            break;
+        }
+
+        pthread_mutex_lock(&iterator->lock);
+        job->next_queued++;
+        pthread_cond_broadcast(&iterator->not_full);
+        pthread_mutex_unlock(&iterator->lock);
+    }
+
+    return NULL;
+}
+
+static void batch_iter_job_run(AerospikeResultsIterator *iterator,
+                               as_error *err)
+{
+    BatchIterJob *job = (BatchIterJob *)iterator->job;
+    pthread_t *threads = cf_malloc(sizeof(pthread_t) * job->max_in_flight);
+    uint32_t n_threads = 0;
+
+    // This thread is the first worker.
+    while (n_threads + 1 < job->max_in_flight &&
+           pthread_create(&threads[n_threads], NULL, batch_iter_worker,
+                          iterator) == 0) {
+        n_threads++;
+    }
+    batch_iter_worker(iterator);
+
+    for (uint32_t i = 0; i < n_threads; i++) {
+        pthread_join(threads[i], NULL);
+    }
+    cf_free(threads);
+
+    if (job->failed_chunk != NO_CHUNK) {
+        as_error_copy(err, &job->error);
+    }
+}
+
+static void batch_iter_job_destroy(void *udata)
+{
+    BatchIterJob *job = (BatchIterJob *)udata;
+
+    if (job->exp_list_p) {
+        as_exp_destroy(job->exp_list_p);
+    }
+    Py_XDECREF(job->py_exp_owner);
+    pthread_mutex_destroy(&job->keys_lock);
+
+    cf_free(job);
+}
+
+/**
+ *******************************************************************************************************
+ * Reads the records of an iterable of keys in chunks, returning an iterator
+ * over the records.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.ResultsIterator yielding a record for every key, in
+ * the order of the keys.
+ * In case of error,appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Get_Many_Iter(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds)
+{
+    PyObject *py_keys = NULL;
+    PyObject *py_policy = NULL;
+    PyObject *py_iter = NULL;
+    unsigned int chunk_size = DEFAULT_CHUNK_SIZE;
+    unsigned int max_in_flight = DEFAULT_MAX_IN_FLIGHT;
+    AerospikeResultsIterator *iterator = NULL;
+    BatchIterJob *job = NULL;
+
+    static char *kwlist[] = {"keys", "policy", "chunk_size", "max_in_flight",
+                             NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OII:get_many_iter", kwlist,
+                                    &py_keys, &py_policy, &chunk_size,
+                                    &max_in_flight) == false) {
+        return NULL;
+    }
+
+    as_error err;
+    as_error_init(&err);
+
+    if (!self || !self->as) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (chunk_size == 0) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                        "chunk_size must be greater than 0");
+        goto CLEANUP;
+    }
+
+    if (max_in_flight == 0) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                        "max_in_flight must be greater than 0");
+        goto CLEANUP;
+    }
+
+    py_iter = PyObject_GetIter(py_keys);
+    if (!py_iter) {
+        PyErr_Clear();
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "Keys should be iterable.");
+        goto CLEANUP;
+    }
+
+    job = cf_malloc(sizeof(BatchIterJob));
+    memset(job, 0, sizeof(BatchIterJob));
+    job->client = self;
+    job->py_keys = py_iter;
+    job->record_format = RECORD_FORMAT_TUPLE;
+    job->chunk_size = chunk_size;
+    job->max_in_flight = max_in_flight;
+    job->failed_chunk = NO_CHUNK;
+    as_error_init(&job->error);
+    pthread_mutex_init(&job->keys_lock, NULL);
+
+    // Convert python policy object to as_policy_batch
+    pyobject_to_policy_batch(self, &err, py_policy, &job->policy,
+                             &job->policy_p, &self->as->config.policies.batch,
+                             &job->exp_list, &job->exp_list_p);
+    if (err.code != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    if (job->policy.base.filter_exp && !job->exp_list_p) {
+        // Either a PreparedPolicy or a CompiledExpression owns the
+        // expression.
+        job->py_exp_owner =
+            prepared_policy_check(py_policy)
+                ? py_policy
+                : PyDict_GetItemString(py_policy, "expressions");
+        Py_INCREF(job->py_exp_owner);
+    }
+
+    if (pyobject_to_record_format(&err, py_policy, &job->record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    // Room for one chunk while the next ones are read.
+    iterator = AerospikeResultsIterator_New(self, py_iter, chunk_size);
+    if (!iterator) {
+        goto CLEANUP;
+    }
+    iterator->record_format = job->record_format;
+
+    // The iterator owns the job from here on, even if starting fails.
+    AerospikeResultsIterator_Start(iterator, &err, job, batch_iter_job_run,
+                                   batch_iter_job_destroy);
+    job = NULL;
+
+CLEANUP:
+
+    if (job) {
+        batch_iter_job_destroy(job);
+    }
+    Py_XDECREF(py_iter);
+
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(iterator);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return (PyObject *)iterator;
+}
@@ -28,6 +28,7 @@
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
+#include "prepared_operations.h"
 #include "policy.h"
 #include "serializer.h"
 #include "geo.h"
@@ -548,8 +549,8 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
             GET_BYTES_POOL(bytes, static_pool, err);
             if (err->code == AEROSPIKE_OK) {
                 if (serialize_based_on_serializer_policy(
-                        self, SERIALIZER_PYTHON, &bytes, py_value, err) !=
-                    AEROSPIKE_OK) {
+                        self, SERIALIZER_PYTHON, &bytes, py_value, static_pool,
+                        err) != AEROSPIKE_OK) {
                     return err->code;
                 }
                 as_operations_add_append_rawp(ops, bin, bytes->value,
@@ -581,8 +582,8 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
             GET_BYTES_POOL(bytes, static_pool, err);
             if (err->code == AEROSPIKE_OK) {
                 if (serialize_based_on_serializer_policy(
-                        self, SERIALIZER_PYTHON, &bytes, py_value, err) !=
-                    AEROSPIKE_OK) {
+                        self, SERIALIZER_PYTHON, &bytes, py_value, static_pool,
+                        err) != AEROSPIKE_OK) {
                     return err->code;
                 }
                 as_operations_add_prepend_rawp(ops, bin, bytes->value,
@@ -825,16 +826,17 @@ as_status add_op(AerospikeClient *self, as_error *err, PyObject *py_val,
  * @param err                   The as_error to be populated by the function
  *                              with the encountered error if any.
  * @param key                   The C client's as_key that identifies the record.
- * @param py_list               The list containing op, bin and value.
+ * @param py_list               The list containing op, bin and value, or a
+ *                              PreparedOperations.
  * @param py_meta               The metadata for the operation.
  * @param py_policy      		Python dict used to populate the operate_policy or map_policy.
+ * @param missing_none          Return None instead of raising if the record
+ *                              does not exist.
  *******************************************************************************************************
  */
-static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
-                                                as_error *err, as_key *key,
-                                                PyObject *py_list,
-                                                PyObject *py_meta,
-                                                PyObject *py_policy)
+static PyObject *AerospikeClient_Operate_Invoke(
+    AerospikeClient *self, as_error *err, as_key *key, PyObject *py_list,
+    PyObject *py_meta, PyObject *py_policy, bool missing_none)
 {
     int i = 0;
     long operation;
@@ -852,8 +854,16 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
     as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
     as_operations ops;
-    Py_ssize_t size = PyList_Size(py_list);
-    as_operations_inita(&ops, size);
+    Py_ssize_t size = 0;
+    as_operations *prepared_ops = prepared_operations_ops(py_list);
+    if (prepared_ops) {
+        // Shallow copy, the binops are only read and meta may differ per call.
+        ops = *prepared_ops;
+    }
+    else {
+        size = PyList_Size(py_list);
+        as_operations_inita(&ops, size);
+    }
 
     if (py_policy) {
         if (pyobject_to_policy_operate(
@@ -893,6 +903,12 @@ static PyObject *AerospikeClient_Operate_Invoke(AerospikeClient *self,
     aerospike_key_operate(self->as, err, operate_policy_p, key, &ops, &rec);
     Py_END_ALLOW_THREADS
 
+    if (err->code == AEROSPIKE_ERR_RECORD_NOT_FOUND && missing_none) {
+        as_error_reset(err);
+        Py_INCREF(Py_None);
+        py_rec = Py_None;
+        goto CLEANUP;
+    }
     if (err->code != AEROSPIKE_OK) {
         as_error_update(err, err->code, NULL);
         goto CLEANUP;
@@ -922,7 +938,10 @@ CLEANUP:
         as_key_destroy(key);
     }
 
-    as_operations_destroy(&ops);
+    if (!prepared_ops) {
+        as_operations_destroy(&ops);
+    }
+    POOL_FREE(&static_pool);
 
     if (err->code != AEROSPIKE_OK) {
         PyObject *py_err = NULL;
@@ -960,6 +979,7 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
     BASE_VARIABLES
     PyObject *py_list = NULL;
     PyObject *py_bin = NULL;
+    bool missing_none = false;
 
     // Python Function Keyword Arguments
     static char *kwlist[] = {"key", "list", "meta", "policy", NULL};
@@ -971,13 +991,19 @@ PyObject *AerospikeClient_Operate(AerospikeClient *self, PyObject *args,
 
     CHECK_CONNECTED(&err);
 
+    if (pyobject_to_policy_missing(self, &err, py_policy, &missing_none) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     if (pyobject_to_key(&err, py_key, &key) != AEROSPIKE_OK) {
         goto CLEANUP;
     }
 
-    if (py_list && PyList_Check(py_list)) {
-        py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-                                                   py_meta, py_policy);
+    if (py_list &&
+        (PyList_Check(py_list) || prepared_operations_ops(py_list))) {
+        py_result = AerospikeClient_Operate_Invoke(
+            self, &err, &key, py_list, py_meta, py_policy, missing_none);
     }
     else {
         as_error_update(&err, AEROSPIKE_ERR_PARAM,
@@ -998,15 +1024,17 @@ CLEANUP:
  * @param err                   The as_error to be populated by the function
  *                              with the encountered error if any.
  * @param key                   The C client's as_key that identifies the record.
- * @param py_list               The list containing op, bin and value.
+ * @param py_list               The list containing op, bin and value, or a
+ *                              PreparedOperations.
  * @param py_meta               The metadata for the operation.
  * @param operate_policy_p      The value for operate policy.
+ * @param missing_none          Return None instead of raising if the record
+ *                              does not exist.
  *******************************************************************************************************
  */
-static PyObject *
-AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
-                                      as_key *key, PyObject *py_list,
-                                      PyObject *py_meta, PyObject *py_policy)
+static PyObject *AerospikeClient_OperateOrdered_Invoke(
+    AerospikeClient *self, as_error *err, as_key *key, PyObject *py_list,
+    PyObject *py_meta, PyObject *py_policy, bool missing_none)
 {
     long operation;
     long return_type = -1;
@@ -1023,8 +1051,16 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
     memset(&static_pool, 0, sizeof(static_pool));
 
     as_operations ops;
-    Py_ssize_t ops_list_size = PyList_Size(py_list);
-    as_operations_inita(&ops, ops_list_size);
+    Py_ssize_t ops_list_size = 0;
+    as_operations *prepared_ops = prepared_operations_ops(py_list);
+    if (prepared_ops) {
+        // Shallow copy, the binops are only read and meta may differ per call.
+        ops = *prepared_ops;
+    }
+    else {
+        ops_list_size = PyList_Size(py_list);
+        as_operations_inita(&ops, ops_list_size);
+    }
 
     // For expressions conversion.
     as_exp exp_list;
@@ -1079,6 +1115,12 @@ AerospikeClient_OperateOrdered_Invoke(AerospikeClient *self, as_error *err,
     aerospike_key_operate(self->as, err, operate_policy_p, key, &ops, &rec);
     Py_END_ALLOW_THREADS
 
+    if (err->code == AEROSPIKE_ERR_RECORD_NOT_FOUND && missing_none) {
+        as_error_reset(err);
+        Py_INCREF(Py_None);
+        py_rec = Py_None;
+        goto CLEANUP;
+    }
     if (err->code != AEROSPIKE_OK) {
         as_error_update(err, err->code, NULL);
         goto CLEANUP;
@@ -1140,7 +1182,10 @@ CLEANUP:
         as_key_destroy(key);
     }
 
-    as_operations_destroy(&ops);
+    if (!prepared_ops) {
+        as_operations_destroy(&ops);
+    }
+    POOL_FREE(&static_pool);
 
     if (err->code != AEROSPIKE_OK) {
         PyObject *py_err = NULL;
@@ -1188,6 +1233,7 @@ PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
     PyObject *py_meta = NULL;
 
     as_key key;
+    bool missing_none = false;
 
     // Python Function Keyword Arguments
     static char *kwlist[] = {"key", "list", "meta", "policy", NULL};
@@ -1201,13 +1247,19 @@ PyObject *AerospikeClient_OperateOrdered(AerospikeClient *self, PyObject *args,
 
     CHECK_CONNECTED(&err);
 
+    if (pyobject_to_policy_missing(self, &err, py_policy, &missing_none) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     if (pyobject_to_key(&err, py_key, &key) != AEROSPIKE_OK) {
         goto CLEANUP;
     }
 
-    if (py_list && PyList_Check(py_list)) {
+    if (py_list &&
+        (PyList_Check(py_list) || prepared_operations_ops(py_list))) {
         py_result = AerospikeClient_OperateOrdered_Invoke(
-            self, &err, &key, py_list, py_meta, py_policy);
+            self, &err, &key, py_list, py_meta, py_policy, missing_none);
     }
     else {
         as_error_update(&err, AEROSPIKE_ERR_PARAM,
@@ -1267,7 +1319,7 @@ PyObject *AerospikeClient_Append(AerospikeClient *self, PyObject *args,
     PyObject *py_list = NULL;
     py_list = create_pylist(py_list, AS_OPERATOR_APPEND, py_bin, py_append_str);
     py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-                                               py_meta, py_policy);
+                                               py_meta, py_policy, false);
 
     DECREF_LIST_AND_RESULT();
 
@@ -1315,7 +1367,7 @@ PyObject *AerospikeClient_Prepend(AerospikeClient *self, PyObject *args,
     py_list =
         create_pylist(py_list, AS_OPERATOR_PREPEND, py_bin, py_prepend_str);
     py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-                                               py_meta, py_policy);
+                                               py_meta, py_policy, false);
 
     DECREF_LIST_AND_RESULT();
 
@@ -1362,7 +1414,7 @@ PyObject *AerospikeClient_Increment(AerospikeClient *self, PyObject *args,
     PyObject *py_list = NULL;
     py_list = create_pylist(py_list, AS_OPERATOR_INCR, py_bin, py_offset_value);
     py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-                                               py_meta, py_policy);
+                                               py_meta, py_policy, false);
 
     DECREF_LIST_AND_RESULT();
 
@@ -1409,7 +1461,7 @@ PyObject *AerospikeClient_Touch(AerospikeClient *self, PyObject *args,
     PyObject *py_list = NULL;
     py_list = create_pylist(py_list, AS_OPERATOR_TOUCH, NULL, py_touchvalue);
     py_result = AerospikeClient_Operate_Invoke(self, &err, &key, py_list,
-                                               py_meta, py_policy);
+                                               py_meta, py_policy, false);
 
     DECREF_LIST_AND_RESULT();
 
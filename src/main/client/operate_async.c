@@ -0,0 +1,254 @@
+/*******************************************************************************
+ * Copyright 2013-2020 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_operations.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "operate.h"
+#include "policy.h"
+#include "prepared_operations.h"
+
+/**
+ *******************************************************************************************************
+ * Shared implementation of operate_async and operate_ordered_async.
+ *
+ * The operations are serialized into the command buffer before
+ * aerospike_key_operate_async returns, so everything converted here is
+ * released before returning to Python. Only the key travels with the command.
+ *******************************************************************************************************
+ */
+static PyObject *AerospikeClient_Operate_Async_Invoke(AerospikeClient *self,
+                                                      PyObject *py_callback,
+                                                      PyObject *py_key,
+                                                      PyObject *py_list,
+                                                      PyObject *py_meta,
+                                                      PyObject *py_policy,
+                                                      int result_format)
+{
+    long operation;
+    long return_type = -1;
+    as_policy_operate operate_policy;
+    as_policy_operate *operate_policy_p = NULL;
+
+    // For expressions conversion.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_static_pool static_pool;
+    memset(&static_pool, 0, sizeof(static_pool));
+
+    as_vector *unicodeStrVector = as_vector_create(sizeof(char *), 128);
+
+    as_operations ops;
+    bool ops_initialised = false;
+    as_operations *prepared_ops = prepared_operations_ops(py_list);
+
+    as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
+
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+    cmd->result_format = result_format;
+
+    if (!self || !self->as) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (!py_list || (!PyList_Check(py_list) && !prepared_ops)) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Operations should be of type list");
+        goto CLEANUP;
+    }
+
+    // Convert python key object to as_key
+    if (pyobject_to_key(&cmd->error, py_key, &cmd->key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    cmd->key_initialised = true;
+
+    if (pyobject_to_policy_operate(self, &cmd->error, py_policy,
+                                   &operate_policy, &operate_policy_p,
+                                   &self->as->config.policies.operate,
+                                   &exp_list, &exp_list_p) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    operate_policy_p =
+        async_policy_operate(cmd, operate_policy_p, &operate_policy);
+
+    Py_ssize_t size = 0;
+    if (prepared_ops) {
+        // Shallow copy, the binops are only read and meta may differ per call.
+        ops = *prepared_ops;
+    }
+    else {
+        size = PyList_Size(py_list);
+        as_operations_inita(&ops, size);
+        ops_initialised = true;
+    }
+
+    if (py_meta) {
+        if (check_and_set_meta(py_meta, &ops, &cmd->error) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+    }
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *py_val = PyList_GetItem(py_list, i);
+
+        if (!PyDict_Check(py_val)) {
+            as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                            "Operation must be a dict");
+            goto CLEANUP;
+        }
+        if (add_op(self, &cmd->error, py_val, unicodeStrVector, &static_pool,
+                   &ops, &operation, &return_type) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+    }
+
+    // Invoke operation
+    Py_BEGIN_ALLOW_THREADS
+    status = aerospike_key_operate_async(self->as, &err, operate_policy_p,
+                                         &cmd->key, &ops, async_record_listener,
+                                         cmd, async_event_loop(&cmd->key),
+                                         NULL);
+    Py_END_ALLOW_THREADS
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
+        goto CLEANUP;
+    }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
+
+CLEANUP:
+    for (unsigned int i = 0; i < unicodeStrVector->size; i++) {
+        free(as_vector_get_ptr(unicodeStrVector, i));
+    }
+    as_vector_destroy(unicodeStrVector);
+
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    if (ops_initialised) {
+        as_operations_destroy(&ops);
+    }
+    POOL_FREE(&static_pool);
+
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record, asynchronously.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with ((key, meta, bins), err, exception).
+ * In case of error before the command is queued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Operate_Async(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds)
+{
+    PyObject *py_callback = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_list = NULL;
+    PyObject *py_meta = NULL;
+    PyObject *py_policy = NULL;
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    // Python Function Keyword Arguments
+    static char *kwlist[] = {"callback", "key", "list", "meta", "policy", NULL};
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate_async", kwlist,
+                                    &py_callback, &py_key, &py_list, &py_meta,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    return AerospikeClient_Operate_Async_Invoke(self, py_callback, py_key,
+                                                py_list, py_meta, py_policy,
+                                                ASYNC_RECORD_BINS);
+}
+
+/**
+ *******************************************************************************************************
+ * Multiple operations on a single record, asynchronously. Results are
+ * returned in operation order.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with ((key, meta, [(bin, value), ...]), err, exception).
+ * In case of error before the command is queued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_OperateOrdered_Async(AerospikeClient *self,
+                                               PyObject *args, PyObject *kwds)
+{
+    PyObject *py_callback = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_list = NULL;
+    PyObject *py_meta = NULL;
+    PyObject *py_policy = NULL;
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    // Python Function Keyword Arguments
+    static char *kwlist[] = {"callback", "key", "list", "meta", "policy", NULL};
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|OO:operate_ordered_async",
+                                    kwlist, &py_callback, &py_key, &py_list,
+                                    &py_meta, &py_policy) == false) {
+        return NULL;
+    }
+
+    return AerospikeClient_Operate_Async_Invoke(self, py_callback, py_key,
+                                                py_list, py_meta, py_policy,
+                                                ASYNC_RECORD_ORDERED_BINS);
+}
@@ -185,6 +185,7 @@ PyObject *AerospikeClient_ListAppend(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
     EXCEPTION_ON_ERROR();
 
     return PyLong_FromLong(0);
@@ -245,6 +246,7 @@ PyObject *AerospikeClient_ListExtend(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
     EXCEPTION_ON_ERROR();
 
     return PyLong_FromLong(0);
@@ -301,6 +303,7 @@ PyObject *AerospikeClient_ListInsert(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
     EXCEPTION_ON_ERROR();
 
     return PyLong_FromLong(0);
@@ -363,6 +366,7 @@ PyObject *AerospikeClient_ListInsertItems(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
     EXCEPTION_ON_ERROR();
 
     return PyLong_FromLong(0);
@@ -740,6 +744,7 @@ PyObject *AerospikeClient_ListSet(AerospikeClient *self, PyObject *args,
 
 CLEANUP:
     as_operations_destroy(&ops);
+    POOL_FREE(&static_pool);
     EXCEPTION_ON_ERROR();
 
     return PyLong_FromLong(0);
@@ -123,12 +123,14 @@
                         "Unexpected empty return");                            \
     }
 
-#define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)                                  \
+#define CLEANUP_OPERATION()                                                    \
     as_operations_destroy(&ops);                                               \
     as_record_destroy(rec);                                                    \
     if (key_created) {                                                         \
         as_key_destroy(&key);                                                  \
-    }                                                                          \
+    }
+
+#define EXCEPTION_ON_ERROR(__err)                                              \
     if (__err.code != AEROSPIKE_OK) {                                          \
         PyObject *py_err = NULL;                                               \
         error_to_pyobject(&__err, &py_err);                                    \
@@ -138,6 +140,10 @@
         return NULL;                                                           \
     }
 
+#define CLEANUP_AND_EXCEPTION_ON_ERROR(__err)                                  \
+    CLEANUP_OPERATION();                                                       \
+    EXCEPTION_ON_ERROR(__err)
+
 /* Forward declaration for function which inverts an operation */
 static as_status invertIfSpecified(as_error *err, PyObject *py_inverted,
                                    uint64_t *returnType);
@@ -231,7 +237,10 @@ PyObject *AerospikeClient_MapPut(AerospikeClient *self, PyObject *args,
     DO_OPERATION();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&static_pool);
+    EXCEPTION_ON_ERROR(err);
 
     if (error_occured) {
         return NULL;
@@ -283,7 +292,10 @@ PyObject *AerospikeClient_MapPutItems(AerospikeClient *self, PyObject *args,
     DO_OPERATION();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&static_pool);
+    EXCEPTION_ON_ERROR(err);
     if (error_occured) {
         return NULL;
     }
@@ -341,7 +353,10 @@ PyObject *AerospikeClient_MapIncrement(AerospikeClient *self, PyObject *args,
     DO_OPERATION();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     if (error_occured) {
         return NULL;
@@ -398,7 +413,10 @@ PyObject *AerospikeClient_MapDecrement(AerospikeClient *self, PyObject *args,
     DO_OPERATION();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     if (error_occured) {
         return NULL;
@@ -530,7 +548,10 @@ PyObject *AerospikeClient_MapRemoveByKey(AerospikeClient *self, PyObject *args,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -590,7 +611,10 @@ PyObject *AerospikeClient_MapRemoveByKeyList(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -653,7 +677,10 @@ PyObject *AerospikeClient_MapRemoveByKeyRange(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -706,7 +733,10 @@ PyObject *AerospikeClient_MapRemoveByValue(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -767,7 +797,10 @@ PyObject *AerospikeClient_MapRemoveByValueList(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -830,7 +863,10 @@ PyObject *AerospikeClient_MapRemoveByValueRange(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -1062,7 +1098,10 @@ PyObject *AerospikeClient_MapGetByKey(AerospikeClient *self, PyObject *args,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -1116,7 +1155,10 @@ PyObject *AerospikeClient_MapGetByValue(AerospikeClient *self, PyObject *args,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -1178,7 +1220,10 @@ PyObject *AerospikeClient_MapGetByKeyRange(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -1240,7 +1285,10 @@ PyObject *AerospikeClient_MapGetByValueRange(AerospikeClient *self,
     SETUP_RETURN_VAL();
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
 
     return py_result;
 }
@@ -1321,7 +1369,10 @@ PyObject *AerospikeClient_MapGetByValueList(AerospikeClient *self,
     SETUP_RETURN_VAL()
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
     return py_result;
 }
 
@@ -1401,7 +1452,10 @@ PyObject *AerospikeClient_MapGetByKeyList(AerospikeClient *self, PyObject *args,
     SETUP_RETURN_VAL()
 
 CLEANUP:
-    CLEANUP_AND_EXCEPTION_ON_ERROR(err);
+    CLEANUP_OPERATION();
+    // The pooled values are destroyed with ops, only the pool is freed.
+    POOL_FREE(&pool);
+    EXCEPTION_ON_ERROR(err);
     return py_result;
 }
 
@@ -0,0 +1,69 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+
+#include <aerospike/as_error.h>
+
+#include "client.h"
+#include "exceptions.h"
+#include "prepared_policy.h"
+
+/**
+ *******************************************************************************************************
+ * Freeze a policy dict, for reuse across calls.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * Returns an aerospike.PreparedPolicy.
+ * In case of error, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_PreparePolicy(AerospikeClient *self, PyObject *args,
+                                        PyObject *kwds)
+{
+    PyObject *py_policy = NULL;
+
+    as_error err;
+    as_error_init(&err);
+
+    static char *kwlist[] = {"policy", NULL};
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "O:prepare_policy", kwlist,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    // Preparing twice is harmless, hand back the same object.
+    if (prepared_policy_check(py_policy)) {
+        Py_INCREF(py_policy);
+        return py_policy;
+    }
+
+    if (!PyDict_Check(py_policy)) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "policy must be a dict");
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return AerospikePreparedPolicy_New(py_policy);
+}
@@ -116,8 +116,6 @@ PyObject *AerospikeClient_Put_Invoke(AerospikeClient *self, PyObject *py_key,
     }
 
 CLEANUP:
-    POOL_DESTROY(&static_pool);
-
     if (exp_list_p) {
         as_exp_destroy(exp_list_p);
     }
@@ -130,6 +128,8 @@ CLEANUP:
         // Destroy the record if it is initialised.
         as_record_destroy(&rec);
     }
+    // The record may use memory from the pool, so it goes first.
+    POOL_DESTROY(&static_pool);
 
     // If an error occurred, tell Python.
     if (err.code != AEROSPIKE_OK) {
@@ -22,116 +22,12 @@
 #include <aerospike/as_error.h>
 #include <aerospike/as_record.h>
 
+#include "async.h"
 #include "client.h"
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
 
-// Struct for Python User-Data for the Callback
-typedef struct {
-    as_key key;
-    as_error error;
-    PyObject *callback;
-    AerospikeClient *client;
-} LocalData;
-
-LocalData *put_async_cb_create(void) { return cf_malloc(sizeof(LocalData)); }
-
-void put_async_cb_destroy(LocalData *uData) { cf_free(uData); }
-
-void write_async_callback_helper(as_error *cmd_error, void *udata,
-                                 as_event_loop *event_loop, int cb)
-{
-    PyObject *py_key = NULL;
-    PyObject *py_return = NULL;
-    PyObject *py_arglist = NULL;
-    PyObject *py_err = NULL;
-    as_error *error = NULL;
-    as_error temp_error;
-    PyObject *py_exception = NULL;
-
-    // Extract callback user-data
-    LocalData *data = (LocalData *)udata;
-    PyObject *py_callback = data->callback;
-
-    error = &data->error;
-    if (cmd_error) {
-        error = cmd_error;
-    }
-    // Lock Python State
-    PyGILState_STATE gstate;
-    if (cb) {
-        gstate = PyGILState_Ensure();
-    }
-
-    error_to_pyobject(error, &py_err);
-    // Convert as_key to python key object
-    key_to_pyobject(&temp_error, &data->key, &py_key);
-
-    if (error->code != AEROSPIKE_OK) {
-        py_exception = raise_exception(error);
-        if (PyObject_HasAttrString(py_exception, "key")) {
-            PyObject_SetAttrString(py_exception, "key", py_key);
-        }
-        if (PyObject_HasAttrString(py_exception, "bin")) {
-            PyObject_SetAttrString(py_exception, "bin", Py_None);
-        }
-        if (!cb) {
-            PyErr_SetObject(py_exception, py_err);
-            Py_DECREF(py_err);
-        }
-    }
-
-    if (cb) {
-        // Build Python Function Arguments
-        py_arglist = PyTuple_New(3);
-
-        if (!py_exception) {
-            Py_INCREF(Py_None);
-            py_exception = Py_None;
-        }
-
-        PyTuple_SetItem(py_arglist, 0, py_key);
-        PyTuple_SetItem(py_arglist, 1, py_err);
-        PyTuple_SetItem(py_arglist, 2, py_exception);
-
-        // Invoke Python Callback
-        py_return = PyObject_Call(py_callback, py_arglist, NULL);
-
-        // Release Python Function Arguments
-        Py_DECREF(py_arglist);
-
-        // handle return value
-        if (!py_return) {
-            // an exception was raised, handle it (someday)
-            // for now, we bail from the loop
-            as_error_update(error, AEROSPIKE_ERR_CLIENT,
-                            "read_async_callback function raised an exception");
-        }
-        else {
-            Py_DECREF(py_return);
-        }
-    }
-
-    if (udata) {
-        as_key_destroy(&data->key);
-        //todo: dont free cb data in case of retry logic
-        put_async_cb_destroy(udata);
-    }
-
-    if (cb) {
-        PyGILState_Release(gstate);
-    }
-
-    return;
-}
-
-void write_async_callback(as_error *error, void *udata,
-                          as_event_loop *event_loop)
-{
-    write_async_callback_helper(error, udata, event_loop, 1);
-}
-
 /**
  *******************************************************************************************************
  * Puts a record asynchronously to the Aerospike DB.
@@ -176,19 +72,10 @@ PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
     PyObject *py_serializer_option = NULL;
     long serializer_option = SERIALIZER_PYTHON;
 
-    if (!async_support) {
-        as_error err;
-        as_error_init(&err);
-        as_error_update(
-            &err, AEROSPIKE_ERR,
-            "Support for async is disabled, build software with async option");
-        PyObject *py_err = NULL, *exception_type = NULL;
-        error_to_pyobject(&err, &py_err);
-        exception_type = raise_exception(&err);
-        PyErr_SetObject(exception_type, py_err);
-        Py_DECREF(py_err);
+    if (!async_check_support()) {
         return NULL;
     }
+
     // Python Function Keyword Arguments
     static char *kwlist[] = {"put_callback", "key",        "bins", "meta",
                              "policy",       "serializer", NULL};
@@ -201,14 +88,11 @@ PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
     }
 
     // Create and initialize callback user-data
-    LocalData *uData = put_async_cb_create();
-    uData->callback = py_callback;
-    uData->client = self;
-    memset(&uData->key, 0, sizeof(uData->key));
-
-    as_error_init(&uData->error);
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
 
     as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
 
     if (py_serializer_option) {
         if (PyLong_Check(py_serializer_option)) {
@@ -221,51 +105,54 @@ PyObject *AerospikeClient_Put_Async(AerospikeClient *self, PyObject *args,
     }
 
     if (!self || !self->as) {
-        as_error_update(&uData->error, AEROSPIKE_ERR_PARAM,
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
                         "Invalid aerospike object");
         goto CLEANUP;
     }
 
     if (!self->is_conn_16) {
-        as_error_update(&uData->error, AEROSPIKE_ERR_CLUSTER,
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
                         "No connection to aerospike cluster");
         goto CLEANUP;
     }
 
     // Convert python key object to as_key
-    pyobject_to_key(&uData->error, py_key, &uData->key);
-    if (uData->error.code != AEROSPIKE_OK) {
+    pyobject_to_key(&cmd->error, py_key, &cmd->key);
+    if (cmd->error.code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
+    cmd->key_initialised = true;
+    cmd->legacy_callback = true;
 
     // Convert python bins and metadata objects to as_record
-    pyobject_to_record(self, &uData->error, py_bins, py_meta, &rec,
+    pyobject_to_record(self, &cmd->error, py_bins, py_meta, &rec,
                        serializer_option, &static_pool);
-    if (uData->error.code != AEROSPIKE_OK) {
+    if (cmd->error.code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
 
     // Convert python policy object to as_policy_write
-    pyobject_to_policy_write(self, &uData->error, py_policy, &write_policy,
+    pyobject_to_policy_write(self, &cmd->error, py_policy, &write_policy,
                              &write_policy_p, &self->as->config.policies.write,
                              &exp_list, &exp_list_p);
-    if (uData->error.code != AEROSPIKE_OK) {
+    if (cmd->error.code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
 
     // Invoke operation
     Py_BEGIN_ALLOW_THREADS
-    status = aerospike_key_put_async(self->as, &uData->error, write_policy_p,
-                                     &uData->key, &rec, write_async_callback,
-                                     uData, NULL, NULL);
+    status = aerospike_key_put_async(self->as, &err, write_policy_p, &cmd->key,
+                                     &rec, async_write_listener, cmd,
+                                     async_event_loop(&cmd->key), NULL);
     Py_END_ALLOW_THREADS
-    if (status != AEROSPIKE_OK || uData->error.code != AEROSPIKE_OK) {
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
         goto CLEANUP;
     }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
 
 CLEANUP:
-    POOL_DESTROY(&static_pool);
-
     if (exp_list_p) {
         as_exp_destroy(exp_list_p);
     }
@@ -274,11 +161,12 @@ CLEANUP:
         // Destroy the record if it is initialised.
         as_record_destroy(&rec);
     }
+    // The record may use memory from the pool, so it goes first.
+    POOL_DESTROY(&static_pool);
 
     // If an error occurred, tell Python.
-    if (uData->error.code != AEROSPIKE_OK) {
-        write_async_callback_helper(&uData->error, uData, NULL, 0);
-        return NULL;
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
     }
 
     Py_INCREF(Py_None);
@@ -484,6 +484,8 @@ CLEANUP:
         as_query_destroy(&query);
     }
 
+    POOL_FREE(&static_pool);
+
     if (err.code != AEROSPIKE_OK) {
         PyObject *py_err = NULL;
         error_to_pyobject(&err, &py_err);
@@ -0,0 +1,149 @@
+/*******************************************************************************
+ * Copyright 2013-2020 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Removes a record asynchronously from the Aerospike DB.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with (0, err, exception).
+ * In case of error before the command is queued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Remove_Async(AerospikeClient *self, PyObject *args,
+                                       PyObject *kwds)
+{
+    // Python Function Arguments
+    PyObject *py_callback = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_meta = NULL;
+    PyObject *py_policy = NULL;
+
+    as_policy_remove remove_policy;
+    as_policy_remove *remove_policy_p = NULL;
+
+    // For converting expressions.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    // Python Function Keyword Arguments
+    static char *kwlist[] = {"callback", "key", "meta", "policy", NULL};
+
+    // Python Function Argument Parsing
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:remove_async", kwlist,
+                                    &py_callback, &py_key, &py_meta,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+
+    if (!self || !self->as) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    // Convert python key object to as_key
+    if (pyobject_to_key(&cmd->error, py_key, &cmd->key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    cmd->key_initialised = true;
+
+    // Convert python policy object to as_policy_remove
+    if (pyobject_to_policy_remove(
+            self, &cmd->error, py_policy, &remove_policy, &remove_policy_p,
+            &self->as->config.policies.remove, &exp_list,
+            &exp_list_p) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (py_meta && PyDict_Check(py_meta)) {
+        PyObject *py_gen = PyDict_GetItemString(py_meta, "gen");
+
+        if (py_gen) {
+            if (!PyLong_Check(py_gen)) {
+                as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                                "Generation should be an int or long");
+                goto CLEANUP;
+            }
+            remove_policy_p->generation = (uint16_t)PyLong_AsLongLong(py_gen);
+            if ((uint16_t)-1 == remove_policy_p->generation &&
+                PyErr_Occurred()) {
+                PyErr_Clear();
+                as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                                "integer value for gen exceeds sys.maxsize");
+                goto CLEANUP;
+            }
+        }
+    }
+
+    // Invoke operation
+    Py_BEGIN_ALLOW_THREADS
+    status = aerospike_key_remove_async(self->as, &err, remove_policy_p,
+                                        &cmd->key, async_write_listener, cmd,
+                                        async_event_loop(&cmd->key), NULL);
+    Py_END_ALLOW_THREADS
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
+        goto CLEANUP;
+    }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
+
+CLEANUP:
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
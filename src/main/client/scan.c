@@ -243,6 +243,8 @@ CLEANUP:
         as_scan_destroy(&scan);
     }
 
+    POOL_FREE(&static_pool);
+
     if (err.code != AEROSPIKE_OK) {
         PyObject *py_err = NULL;
         error_to_pyobject(&err, &py_err);
@@ -158,6 +158,8 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
     PyObject *py_ctx = NULL;
     as_cdt_ctx ctx;
     bool ctx_in_use = false;
+    as_static_pool static_pool;
+    memset(&static_pool, 0, sizeof(static_pool));
     PyObject *py_obj = NULL;
     as_index_datatype data_type;
     as_index_type index_type;
@@ -183,9 +185,6 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
         goto CLEANUP;
     }
 
-    as_static_pool static_pool;
-    memset(&static_pool, 0, sizeof(static_pool));
-
     if (get_cdt_ctx(self, &err, &ctx, py_ctx, &ctx_in_use, &static_pool,
                     SERIALIZER_PYTHON) != AEROSPIKE_OK) {
         goto CLEANUP;
@@ -199,10 +198,12 @@ PyObject *AerospikeClient_Index_Cdt_Create(AerospikeClient *self,
                                                   index_type, data_type, &ctx);
 
     as_cdt_ctx_destroy(&ctx);
+    POOL_FREE(&static_pool);
 
     return py_obj;
 
 CLEANUP:
+    POOL_FREE(&static_pool);
     if (py_obj == NULL) {
         PyObject *py_err = NULL;
         error_to_pyobject(&err, &py_err);
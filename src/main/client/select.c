@@ -62,6 +62,7 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
 
     // Initialisation flags
     bool key_initialised = false;
+    bool missing_none = false;
 
     // Initialize error
     as_error_init(&err);
@@ -151,6 +152,11 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
         goto CLEANUP;
     }
 
+    if (pyobject_to_policy_missing(self, &err, py_policy, &missing_none) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     // Invoke operation
     Py_BEGIN_ALLOW_THREADS
     aerospike_key_select(self->as, &err, read_policy_p, &key,
@@ -161,6 +167,11 @@ PyObject *AerospikeClient_Select_Invoke(AerospikeClient *self, PyObject *py_key,
         select_succeeded = true;
         record_to_pyobject(self, &err, rec, &key, &py_rec);
     }
+    else if (err.code == AEROSPIKE_ERR_RECORD_NOT_FOUND && missing_none) {
+        as_error_reset(&err);
+        Py_INCREF(Py_None);
+        py_rec = Py_None;
+    }
     else {
         as_error_update(&err, err.code, NULL);
     }
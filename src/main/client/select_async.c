@@ -0,0 +1,161 @@
+/*******************************************************************************
+ * Copyright 2013-2020 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_key.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+
+#include "async.h"
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+
+/**
+ *******************************************************************************************************
+ * Reads specific bins of a record asynchronously from the Aerospike DB.
+ *
+ * @param self                  AerospikeClient object
+ * @param args                  The args is a tuple object containing an argument
+ *                              list passed from Python to a C function
+ * @param kwds                  Dictionary of keywords
+ *
+ * The callback is invoked with ((key, meta, bins), err, exception).
+ * In case of error before the command is queued, appropriate exceptions will be raised.
+ *******************************************************************************************************
+ */
+PyObject *AerospikeClient_Select_Async(AerospikeClient *self, PyObject *args,
+                                       PyObject *kwds)
+{
+    // Python Function Arguments
+    PyObject *py_callback = NULL;
+    PyObject *py_key = NULL;
+    PyObject *py_bins = NULL;
+    PyObject *py_policy = NULL;
+
+    as_policy_read read_policy;
+    as_policy_read *read_policy_p = NULL;
+    const char **bins = NULL;
+
+    // For converting expressions.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_status status = AEROSPIKE_OK;
+    as_error err;
+    as_error_init(&err);
+
+    if (!async_check_support()) {
+        return NULL;
+    }
+
+    // Python Function Keyword Arguments
+    static char *kwlist[] = {"callback", "key", "bins", "policy", NULL};
+
+    // Python Function Argument Parsing
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OOO|O:select_async", kwlist,
+                                    &py_callback, &py_key, &py_bins,
+                                    &py_policy) == false) {
+        return NULL;
+    }
+
+    AerospikeAsyncCommand *cmd = async_command_create(self, py_callback);
+
+    if (!self || !self->as) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->is_conn_16) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    // Convert python key object to as_key
+    if (pyobject_to_key(&cmd->error, py_key, &cmd->key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    cmd->key_initialised = true;
+
+    // Convert python bins list to a NULL terminated char * array. The strings
+    // are borrowed from py_bins, the bin names are copied into the command
+    // buffer before aerospike_key_select_async returns.
+    if (!py_bins || !(PyList_Check(py_bins) || PyTuple_Check(py_bins))) {
+        as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                        "not a list or tuple");
+        goto CLEANUP;
+    }
+
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(py_bins);
+    bins = (const char **)alloca(sizeof(char *) * (size + 1));
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *py_val = PySequence_Fast_GET_ITEM(py_bins, i);
+        if (!PyUnicode_Check(py_val)) {
+            as_error_update(&cmd->error, AEROSPIKE_ERR_PARAM,
+                            "Bin name must be a string");
+            goto CLEANUP;
+        }
+        bins[i] = PyUnicode_AsUTF8(py_val);
+        if (!bins[i] || strlen(bins[i]) > AS_BIN_NAME_MAX_LEN) {
+            PyErr_Clear();
+            as_error_update(&cmd->error, AEROSPIKE_ERR_BIN_NAME,
+                            "A bin name should not exceed 15 characters limit");
+            goto CLEANUP;
+        }
+    }
+    bins[size] = NULL;
+
+    // Convert python policy object to as_policy_read
+    if (pyobject_to_policy_read(self, &cmd->error, py_policy, &read_policy,
+                                &read_policy_p,
+                                &self->as->config.policies.read, &exp_list,
+                                &exp_list_p) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    cmd->digest_only_key = read_policy_p->key == AS_POLICY_KEY_DIGEST;
+    read_policy_p = async_policy_read(cmd, read_policy_p, &read_policy);
+
+    // Invoke operation
+    Py_BEGIN_ALLOW_THREADS
+    status = aerospike_key_select_async(self->as, &err, read_policy_p,
+                                        &cmd->key, bins, async_record_listener,
+                                        cmd, async_event_loop(&cmd->key), NULL);
+    Py_END_ALLOW_THREADS
+    if (status != AEROSPIKE_OK) {
+        as_error_copy(&cmd->error, &err);
+        goto CLEANUP;
+    }
+    // The command now belongs to the listener, which may already have run.
+    cmd = NULL;
+
+CLEANUP:
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    if (cmd) {
+        return async_command_fail(cmd, py_key);
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
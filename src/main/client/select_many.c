@@ -28,6 +28,7 @@
 #include "conversions.h"
 #include "exceptions.h"
 #include "policy.h"
+#include "key.h"
 
 /**
  *************************************************************************
@@ -55,13 +56,15 @@ PyObject *store_unicode_bins(UnicodePyObjects *u_obj, PyObject *py_uobj)
  * @param self                  AerospikeClient object
  * @param py_keys               The list of keys
  * @param batch_policy_p        as_policy_batch object
+ * @param record_format         One of the RECORD_FORMAT_* values
  *
  * Returns the record if key exists otherwise NULL.
  *******************************************************************************************************
  */
 static PyObject *batch_select_aerospike_batch_read(
     as_error *err, AerospikeClient *self, PyObject *py_keys,
-    as_policy_batch *batch_policy_p, char **filter_bins, Py_ssize_t bins_size)
+    as_policy_batch *batch_policy_p, char **filter_bins, Py_ssize_t bins_size,
+    int record_format)
 {
     PyObject *py_recs = NULL;
 
@@ -83,7 +86,7 @@ static PyObject *batch_select_aerospike_batch_read(
         for (int i = 0; i < size; i++) {
             PyObject *py_key = PyList_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
@@ -115,7 +118,7 @@ static PyObject *batch_select_aerospike_batch_read(
         for (int i = 0; i < size; i++) {
             PyObject *py_key = PyTuple_GetItem(py_keys, i);
 
-            if (!PyTuple_Check(py_key)) {
+            if (!(PyTuple_Check(py_key) || AerospikeKey_Check(py_key))) {
                 as_error_update(err, AEROSPIKE_ERR_PARAM,
                                 "Key should be a tuple.");
                 goto CLEANUP;
@@ -150,7 +153,8 @@ static PyObject *batch_select_aerospike_batch_read(
     if (err->code != AEROSPIKE_OK) {
         goto CLEANUP;
     }
-    batch_read_records_to_pyobject(self, err, &records, &py_recs);
+    batch_read_records_to_pyobject(self, err, &records, record_format,
+                                   &py_recs);
 
 CLEANUP:
     if (batch_initialised == true) {
@@ -187,6 +191,7 @@ static PyObject *AerospikeClient_Select_Many_Invoke(AerospikeClient *self,
     as_error err;
     as_policy_batch policy;
     as_policy_batch *batch_policy_p = NULL;
+    int record_format = RECORD_FORMAT_TUPLE;
     Py_ssize_t bins_size = 0;
     char **filter_bins = NULL;
 
@@ -262,8 +267,14 @@ static PyObject *AerospikeClient_Select_Many_Invoke(AerospikeClient *self,
         goto CLEANUP;
     }
 
-    py_recs = batch_select_aerospike_batch_read(
-        &err, self, py_keys, batch_policy_p, filter_bins, bins_size);
+    if (pyobject_to_record_format(&err, py_policy, &record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    py_recs = batch_select_aerospike_batch_read(&err, self, py_keys,
+                                                batch_policy_p, filter_bins,
+                                                bins_size, record_format);
 
 CLEANUP:
 
@@ -31,6 +31,9 @@
 #include "exceptions.h"
 #include "tls_config.h"
 #include "policy_config.h"
+#include "serializer.h"
+#include "builtin_serializers.h"
+#include "prepared_policy.h"
 
 static int set_rack_aware_config(as_config *conf, PyObject *config_dict);
 static int set_use_services_alternate(as_config *conf, PyObject *config_dict);
@@ -48,7 +51,8 @@ enum {
     INIT_DESERIALIZE_ERR,
     INIT_COMPRESSION_ERR,
     INIT_POLICY_PARAM_ERR,
-    INIT_INVALID_AUTHMODE_ERR
+    INIT_INVALID_AUTHMODE_ERR,
+    INIT_UNKNOWN_SERIALIZER_ERR
 };
 
 /*******************************************************************************
@@ -89,6 +93,39 @@ PyDoc_STRVAR(put_async_doc, "put(key, bins[, meta[, policy[, serializer]]])\n\
 \n\
 Write a record asynchronously with a given key to the cluster.");
 
+PyDoc_STRVAR(exists_async_doc, "exists_async(callback, key[, policy])\n\
+\n\
+Check asynchronously if a record with a given key exists in the cluster. \
+callback is invoked with ((key, meta), err, exception).");
+
+PyDoc_STRVAR(select_async_doc, "select_async(callback, key, bins[, policy])\n\
+\n\
+Read the specified bins of a record asynchronously. \
+callback is invoked with ((key, meta, bins), err, exception).");
+
+PyDoc_STRVAR(remove_async_doc, "remove_async(callback, key[, meta[, policy]])\n\
+\n\
+Remove a record matching the key from the cluster asynchronously. \
+callback is invoked with (0, err, exception).");
+
+PyDoc_STRVAR(apply_async_doc,
+             "apply_async(callback, key, module, function, args[, policy])\n\
+\n\
+Apply a registered record UDF to a particular record asynchronously. \
+callback is invoked with (result, err, exception).");
+
+PyDoc_STRVAR(operate_async_doc,
+             "operate_async(callback, key, list[, meta[, policy]])\n\
+\n\
+Perform multiple bin operations on a record asynchronously. \
+callback is invoked with ((key, meta, bins), err, exception).");
+
+PyDoc_STRVAR(operate_ordered_async_doc,
+             "operate_ordered_async(callback, key, list[, meta[, policy]])\n\
+\n\
+Perform multiple bin operations on a record asynchronously, with results in operation order. \
+callback is invoked with ((key, meta, [(bin, value), ...]), err, exception).");
+
 PyDoc_STRVAR(remove_doc, "remove(key[, policy])\n\
 \n\
 Remove a record matching the key from the cluster.");
@@ -134,6 +171,12 @@ PyDoc_STRVAR(
 Perform multiple bin operations on a record with the results being returned as a list of (bin-name, result) tuples. \
 The order of the elements in the list will correspond to the order of the operations from the input parameters.");
 
+PyDoc_STRVAR(prepare_operations_doc,
+             "prepare_operations(list) -> PreparedOperations\n\
+\n\
+Convert a list of operations once. The result can be passed to operate() and operate_ordered() \
+in place of the list and skips converting the operations on every call.");
+
 PyDoc_STRVAR(list_append_doc, "list_append(key, bin, val[, meta[, policy]])\n\
 \n\
 Append a single element to a list value in bin.");
@@ -413,6 +456,18 @@ PyDoc_STRVAR(get_expression_base64_doc,
 \n\
 Get the base64 representation of a compiled aerospike expression.");
 
+PyDoc_STRVAR(compile_expression_doc,
+             "compile_expression(expressions: list) -> CompiledExpression\n\
+\n\
+Pack a compiled aerospike expression once. The result can be used wherever the expression \
+list is accepted and skips converting it on every call.");
+
+PyDoc_STRVAR(prepare_policy_doc,
+             "prepare_policy(policy: dict) -> PreparedPolicy\n\
+\n\
+Freeze a policy dict. The result can be used wherever the policy dict is accepted and is only \
+converted the first time it is used for each kind of command.");
+
 PyDoc_STRVAR(info_all_doc, "info_all(command[, policy]]) -> {}\n\
 \n\
 Send an info *command* to all nodes in the cluster to which the client is connected.\n\
@@ -515,6 +570,12 @@ PyDoc_STRVAR(get_many_doc, "get_many(keys[, policy]) -> [ (key, meta, bins)]\n\
 Batch-read multiple records with applying list of operations and returns them as a list. \
 Any record that does not exist will have a None value for metadata and status in the record tuple.");
 
+PyDoc_STRVAR(get_many_iter_doc, "get_many_iter(keys[, policy[, chunk_size[, max_in_flight]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Batch-read the records of an iterable of keys, chunk_size keys per request with up to max_in_flight requests \
+running at once, and return an iterator over them in the order of the keys. \
+Any record that does not exist will have a None value for metadata and status in the record tuple.");
+
 PyDoc_STRVAR(batch_get_ops_doc,
              "batch_get_ops(keys, ops, meta, policy) -> [ (key, meta, bins)]\n\
 \n\
@@ -533,15 +594,34 @@ PyDoc_STRVAR(exists_many_doc, "exists_many(keys[, policy]) -> [ (key, meta)]\n\
 Batch-read metadata for multiple keys, and return it as a list. \
 Any record that does not exist will have a None value for metadata in the result tuple.");
 
+PyDoc_STRVAR(get_many_async_doc, "get_many_async(callback, keys[, policy])\n\
+\n\
+Batch-read multiple records asynchronously. \
+callback is invoked with ([(key, meta, bins), ...], err, exception).");
+
+PyDoc_STRVAR(select_many_async_doc,
+             "select_many_async(callback, keys, bins[, policy])\n\
+\n\
+Batch-read the specified bins of multiple records asynchronously. \
+callback is invoked with ([(key, meta, bins), ...], err, exception).");
+
+PyDoc_STRVAR(exists_many_async_doc,
+             "exists_many_async(callback, keys[, policy])\n\
+\n\
+Batch-read metadata for multiple keys asynchronously. \
+callback is invoked with ([(key, meta), ...], err, exception).");
+
 PyDoc_STRVAR(get_key_digest_doc, "get_key_digest(ns, set, key) -> bytearray\n\
 \n\
 Calculate the digest of a particular key. See: Key Tuple.");
 
-PyDoc_STRVAR(batch_write_doc, "batch_write(batch_records, policy) -> None\n\
+PyDoc_STRVAR(batch_write_doc, "batch_write(batch_records, policy[, chunk_size[, max_in_flight]]) -> None\n\
 \n\
 Read/Write multiple records for specified batch keys in one batch call. \
 This method allows different sub-commands for each key in the batch. \
 The returned records are located in the same list. \
+With a chunk_size the records are sent in batches of chunk_size, each converted while up to max_in_flight \
+earlier ones are being written. \
 Requires server version 6.0+");
 
 PyDoc_STRVAR(
@@ -663,6 +743,18 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
      put_doc},
     {"put_async", (PyCFunction)AerospikeClient_Put_Async,
      METH_VARARGS | METH_KEYWORDS, put_async_doc},
+    {"exists_async", (PyCFunction)AerospikeClient_Exists_Async,
+     METH_VARARGS | METH_KEYWORDS, exists_async_doc},
+    {"select_async", (PyCFunction)AerospikeClient_Select_Async,
+     METH_VARARGS | METH_KEYWORDS, select_async_doc},
+    {"remove_async", (PyCFunction)AerospikeClient_Remove_Async,
+     METH_VARARGS | METH_KEYWORDS, remove_async_doc},
+    {"apply_async", (PyCFunction)AerospikeClient_Apply_Async,
+     METH_VARARGS | METH_KEYWORDS, apply_async_doc},
+    {"operate_async", (PyCFunction)AerospikeClient_Operate_Async,
+     METH_VARARGS | METH_KEYWORDS, operate_async_doc},
+    {"operate_ordered_async", (PyCFunction)AerospikeClient_OperateOrdered_Async,
+     METH_VARARGS | METH_KEYWORDS, operate_ordered_async_doc},
     {"get_key_partition_id", (PyCFunction)AerospikeClient_Get_Key_PartitionID,
      METH_VARARGS | METH_KEYWORDS, get_key_partition_id_doc},
     {"remove", (PyCFunction)AerospikeClient_Remove,
@@ -683,6 +775,8 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
      METH_VARARGS | METH_KEYWORDS, operate_doc},
     {"operate_ordered", (PyCFunction)AerospikeClient_OperateOrdered,
      METH_VARARGS | METH_KEYWORDS, operate_ordered_doc},
+    {"prepare_operations", (PyCFunction)AerospikeClient_PrepareOperations,
+     METH_VARARGS | METH_KEYWORDS, prepare_operations_doc},
 
     // LIST OPERATIONS
 
@@ -804,6 +898,10 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
      METH_VARARGS | METH_KEYWORDS, set_xdr_filter_doc},
     {"get_expression_base64", (PyCFunction)AerospikeClient_GetExpressionBase64,
      METH_VARARGS | METH_KEYWORDS, get_expression_base64_doc},
+    {"compile_expression", (PyCFunction)AerospikeClient_CompileExpression,
+     METH_VARARGS | METH_KEYWORDS, compile_expression_doc},
+    {"prepare_policy", (PyCFunction)AerospikeClient_PreparePolicy,
+     METH_VARARGS | METH_KEYWORDS, prepare_policy_doc},
     {"info_all", (PyCFunction)AerospikeClient_InfoAll,
      METH_VARARGS | METH_KEYWORDS, info_all_doc},
     {"info_single_node", (PyCFunction)AerospikeClient_InfoSingleNode,
@@ -856,12 +954,20 @@ static PyMethodDef AerospikeClient_Type_Methods[] = {
 
     {"get_many", (PyCFunction)AerospikeClient_Get_Many,
      METH_VARARGS | METH_KEYWORDS, get_many_doc},
+    {"get_many_iter", (PyCFunction)AerospikeClient_Get_Many_Iter,
+     METH_VARARGS | METH_KEYWORDS, get_many_iter_doc},
     {"batch_get_ops", (PyCFunction)AerospikeClient_Batch_GetOps,
      METH_VARARGS | METH_KEYWORDS, batch_get_ops_doc},
     {"select_many", (PyCFunction)AerospikeClient_Select_Many,
      METH_VARARGS | METH_KEYWORDS, select_many_doc},
     {"exists_many", (PyCFunction)AerospikeClient_Exists_Many,
      METH_VARARGS | METH_KEYWORDS, exists_many_doc},
+    {"get_many_async", (PyCFunction)AerospikeClient_Get_Many_Async,
+     METH_VARARGS | METH_KEYWORDS, get_many_async_doc},
+    {"select_many_async", (PyCFunction)AerospikeClient_Select_Many_Async,
+     METH_VARARGS | METH_KEYWORDS, select_many_async_doc},
+    {"exists_many_async", (PyCFunction)AerospikeClient_Exists_Many_Async,
+     METH_VARARGS | METH_KEYWORDS, exists_many_async_doc},
     {"get_key_digest", (PyCFunction)AerospikeClient_Get_Key_Digest,
      METH_VARARGS | METH_KEYWORDS, get_key_digest_doc},
     {"batch_write", (PyCFunction)AerospikeClient_BatchWrite,
@@ -906,6 +1012,9 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
     self->use_shared_connection = false;
     self->as = NULL;
     self->send_bool_as = SEND_BOOL_AS_AS_BOOL;
+    self->blob_memoryview = false;
+    self->pickle_protocol = PICKLE_PROTOCOL_DEFAULT;
+    self->missing_none = false;
 
     if (PyArg_ParseTupleAndKeywords(args, kwds, "O:client", kwlist,
                                     &py_config) == false) {
@@ -1085,6 +1194,7 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
     self->is_client_put_serializer = false;
     self->user_serializer_call_info.callback = NULL;
     self->user_deserializer_call_info.callback = NULL;
+    self->builtin_serializer = SERIALIZER_NONE;
     PyObject *py_serializer_option =
         PyDict_GetItemString(py_config, "serialization");
     if (py_serializer_option && PyTuple_Check(py_serializer_option)) {
@@ -1109,6 +1219,17 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
             self->user_deserializer_call_info.callback = py_deserializer;
         }
     }
+    else if (py_serializer_option && PyUnicode_Check(py_serializer_option)) {
+        const char *name = PyUnicode_AsUTF8(py_serializer_option);
+        if (name) {
+            self->builtin_serializer = builtin_serializer_from_name(name);
+        }
+        if (self->builtin_serializer == SERIALIZER_NONE) {
+            PyErr_Clear();
+            error_code = INIT_UNKNOWN_SERIALIZER_ERR;
+            goto CONSTRUCTOR_ERROR;
+        }
+    }
 
     as_policies_init(&config.policies);
     //Set default value of use_batch_direct
@@ -1374,6 +1495,42 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
         }
     }
 
+    PyObject *py_blob_memoryview =
+        PyDict_GetItemString(py_config, "blob_memoryview");
+    if (py_blob_memoryview && PyBool_Check(py_blob_memoryview)) {
+        self->blob_memoryview = (Py_True == py_blob_memoryview);
+    }
+
+    PyObject *py_pickle_protocol =
+        PyDict_GetItemString(py_config, "pickle_protocol");
+    if (py_pickle_protocol && py_pickle_protocol != Py_None) {
+        int highest = pickle_highest_protocol();
+        if (highest < 0 || !PyLong_Check(py_pickle_protocol) ||
+            PyBool_Check(py_pickle_protocol)) {
+            error_code = INIT_POLICY_PARAM_ERR;
+            goto CONSTRUCTOR_ERROR;
+        }
+        long protocol = PyLong_AsLong(py_pickle_protocol);
+        if (PyErr_Occurred() || protocol > highest) {
+            PyErr_Clear();
+            error_code = INIT_POLICY_PARAM_ERR;
+            goto CONSTRUCTOR_ERROR;
+        }
+        // A negative protocol selects the highest one, as with pickle.
+        self->pickle_protocol = protocol < 0 ? highest : (int)protocol;
+    }
+
+    PyObject *py_missing = PyDict_GetItemString(py_config, "missing");
+    if (py_missing && py_missing != Py_None) {
+        as_error missing_err;
+        as_error_init(&missing_err);
+        if (pyobject_to_missing(&missing_err, py_missing,
+                                &self->missing_none) != AEROSPIKE_OK) {
+            error_code = INIT_POLICY_PARAM_ERR;
+            goto CONSTRUCTOR_ERROR;
+        }
+    }
+
     if (set_rack_aware_config(&config, py_config) != INIT_SUCCESS) {
         error_code = INIT_POLICY_PARAM_ERR;
         goto CONSTRUCTOR_ERROR;
@@ -1409,6 +1566,7 @@ static int AerospikeClient_Type_Init(AerospikeClient *self, PyObject *args,
     }
 
     self->as = aerospike_new(&config);
+    self->policy_generation = prepared_policy_next_generation();
 
     if (AerospikeClientConnect(self) == NULL) {
         return -1;
@@ -1483,6 +1641,11 @@ CONSTRUCTOR_ERROR:
                         "Specify valid auth_mode");
         break;
     }
+    case INIT_UNKNOWN_SERIALIZER_ERR: {
+        as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM,
+                        "Unknown built-in serializer, use 'json' or 'msgpack'");
+        break;
+    }
     default:
         // If a generic error was caught during init, use this message
         as_error_update(&constructor_err, AEROSPIKE_ERR_PARAM,
@@ -0,0 +1,296 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_boolean.h>
+#include <aerospike/as_double.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_integer.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_std.h>
+
+#include "columnar.h"
+
+#define COLUMNAR_INITIAL_ROWS 1024
+
+as_status columnar_results_init(as_error *err, columnar_results *results,
+                                PyObject *py_bins)
+{
+    memset(results, 0, sizeof(columnar_results));
+    pthread_mutex_init(&results->lock, NULL);
+    as_error_init(&results->error);
+
+    if (!py_bins || !(PyList_Check(py_bins) || PyTuple_Check(py_bins))) {
+        return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                               "bins must be a list or tuple of bin names");
+    }
+
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(py_bins);
+    if (size == 0) {
+        return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                               "bins must not be empty");
+    }
+
+    results->columns = cf_calloc(size, sizeof(columnar_column));
+    results->n_columns = (uint32_t)size;
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *py_bin = PySequence_Fast_GET_ITEM(py_bins, i);
+        if (!PyUnicode_Check(py_bin)) {
+            return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                                   "Bin name should be a string");
+        }
+
+        Py_ssize_t len = 0;
+        const char *name = PyUnicode_AsUTF8AndSize(py_bin, &len);
+        if (!name) {
+            PyErr_Clear();
+            return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                                   "Invalid unicode bin name");
+        }
+        if (len >= AS_BIN_NAME_MAX_SIZE) {
+            return as_error_update(err, AEROSPIKE_ERR_BIN_NAME,
+                                   "A bin name should not exceed 15 characters "
+                                   "limit");
+        }
+
+        for (Py_ssize_t j = 0; j < i; j++) {
+            if (strcmp(results->columns[j].name, name) == 0) {
+                return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                                       "Bin %s is requested more than once",
+                                       name);
+            }
+        }
+        strcpy(results->columns[i].name, name);
+    }
+
+    return AEROSPIKE_OK;
+}
+
+static bool columnar_results_reserve(columnar_results *results)
+{
+    if (results->rows < results->capacity) {
+        return true;
+    }
+
+    uint64_t capacity = results->capacity ? results->capacity * 2
+                                          : COLUMNAR_INITIAL_ROWS;
+
+    for (uint32_t i = 0; i < results->n_columns; i++) {
+        columnar_column *column = &results->columns[i];
+        void *values = cf_realloc(column->values, capacity * sizeof(int64_t));
+        if (!values) {
+            return false;
+        }
+        column->values = values;
+
+        uint8_t *valid = cf_realloc(column->valid, capacity);
+        if (!valid) {
+            return false;
+        }
+        column->valid = valid;
+    }
+
+    results->capacity = capacity;
+    return true;
+}
+
+static void columnar_column_set(columnar_column *column, uint64_t row,
+                                const as_val *val)
+{
+    int64_t *ints = (int64_t *)column->values;
+    double *doubles = (double *)column->values;
+
+    switch (as_val_type(val)) {
+    case AS_INTEGER: {
+        int64_t value = as_integer_get((as_integer *)val);
+        if (column->is_double) {
+            doubles[row] = (double)value;
+        }
+        else {
+            ints[row] = value;
+        }
+        break;
+    }
+    case AS_BOOLEAN: {
+        bool value = as_boolean_get((as_boolean *)val);
+        if (column->is_double) {
+            doubles[row] = value ? 1.0 : 0.0;
+        }
+        else {
+            ints[row] = value ? 1 : 0;
+        }
+        break;
+    }
+    case AS_DOUBLE: {
+        if (!column->is_double) {
+            // Both are 8 bytes wide, so earlier rows convert in place.
+            for (uint64_t i = 0; i < row; i++) {
+                doubles[i] = (double)ints[i];
+            }
+            column->is_double = true;
+        }
+        doubles[row] = as_double_get((as_double *)val);
+        break;
+    }
+    default:
+        ints[row] = 0;
+        column->valid[row] = 0;
+        return;
+    }
+
+    column->valid[row] = 1;
+}
+
+bool columnar_results_each(const as_val *val, void *udata)
+{
+    if (!val) {
+        return false;
+    }
+
+    columnar_results *results = (columnar_results *)udata;
+
+    if (as_val_type(val) != AS_REC) {
+        pthread_mutex_lock(&results->lock);
+        if (results->error.code == AEROSPIKE_OK) {
+            as_error_update(&results->error, AEROSPIKE_ERR_PARAM,
+                            "Columnar results require record results");
+        }
+        pthread_mutex_unlock(&results->lock);
+        return false;
+    }
+
+    as_record *rec = as_record_fromval(val);
+
+    pthread_mutex_lock(&results->lock);
+
+    if (!columnar_results_reserve(results)) {
+        if (results->error.code == AEROSPIKE_OK) {
+            as_error_update(&results->error, AEROSPIKE_ERR_CLIENT,
+                            "Failed to grow result columns");
+        }
+        pthread_mutex_unlock(&results->lock);
+        return false;
+    }
+
+    uint64_t row = results->rows++;
+    for (uint32_t i = 0; i < results->n_columns; i++) {
+        columnar_column *column = &results->columns[i];
+        as_bin_value *value = as_record_get(rec, column->name);
+        if (value) {
+            columnar_column_set(column, row, (as_val *)value);
+        }
+        else {
+            ((int64_t *)column->values)[row] = 0;
+            column->valid[row] = 0;
+        }
+    }
+
+    pthread_mutex_unlock(&results->lock);
+    return true;
+}
+
+PyObject *columnar_results_to_pyobject(as_error *err,
+                                       columnar_results *results)
+{
+    PyObject *py_array_type = NULL;
+    PyObject *py_columns = NULL;
+
+    PyObject *py_array_module = PyImport_ImportModule("array");
+    if (!py_array_module) {
+        goto FAIL;
+    }
+    py_array_type = PyObject_GetAttrString(py_array_module, "array");
+    Py_DECREF(py_array_module);
+    if (!py_array_type) {
+        goto FAIL;
+    }
+
+    py_columns = PyDict_New();
+    if (!py_columns) {
+        goto FAIL;
+    }
+
+    for (uint32_t i = 0; i < results->n_columns; i++) {
+        columnar_column *column = &results->columns[i];
+        Py_ssize_t size = (Py_ssize_t)results->rows;
+
+        PyObject *py_values = PyObject_CallFunction(
+            py_array_type, "s", column->is_double ? "d" : "q");
+        if (!py_values) {
+            goto FAIL;
+        }
+
+        // One copy, straight from the column buffer into the array.
+        if (size) {
+            PyObject *py_view = PyMemoryView_FromMemory(
+                (char *)column->values, size * (Py_ssize_t)sizeof(int64_t),
+                PyBUF_READ);
+            PyObject *py_rv =
+                py_view ? PyObject_CallMethod(py_values, "frombytes", "O",
+                                              py_view)
+                        : NULL;
+            Py_XDECREF(py_view);
+            if (!py_rv) {
+                Py_DECREF(py_values);
+                goto FAIL;
+            }
+            Py_DECREF(py_rv);
+        }
+
+        PyObject *py_valid =
+            PyByteArray_FromStringAndSize((const char *)column->valid, size);
+        if (!py_valid) {
+            Py_DECREF(py_values);
+            goto FAIL;
+        }
+
+        PyObject *py_column = Py_BuildValue("NN", py_values, py_valid);
+        if (!py_column ||
+            PyDict_SetItemString(py_columns, column->name, py_column) != 0) {
+            Py_XDECREF(py_column);
+            goto FAIL;
+        }
+        Py_DECREF(py_column);
+    }
+
+    Py_DECREF(py_array_type);
+    return py_columns;
+
+FAIL:
+    PyErr_Clear();
+    Py_XDECREF(py_array_type);
+    Py_XDECREF(py_columns);
+    as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                    "Unable to convert result columns");
+    return NULL;
+}
+
+void columnar_results_destroy(columnar_results *results)
+{
+    for (uint32_t i = 0; i < results->n_columns; i++) {
+        cf_free(results->columns[i].values);
+        cf_free(results->columns[i].valid);
+    }
+    cf_free(results->columns);
+    results->columns = NULL;
+    results->n_columns = 0;
+    pthread_mutex_destroy(&results->lock);
+}
@@ -0,0 +1,121 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_exp.h>
+
+#include "compiled_expression.h"
+
+static void
+AerospikeCompiledExpression_Type_Dealloc(AerospikeCompiledExpression *self)
+{
+    if (self->exp) {
+        as_exp_destroy(self->exp);
+    }
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+AerospikeCompiledExpression_Type_Repr(AerospikeCompiledExpression *self)
+{
+    return PyUnicode_FromFormat("<aerospike.CompiledExpression %u bytes>",
+                                self->exp->packed_sz);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeCompiledExpression_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.CompiledExpression", // tp_name
+    sizeof(AerospikeCompiledExpression), // tp_basicsize
+    0,                                   // tp_itemsize
+    (destructor)AerospikeCompiledExpression_Type_Dealloc,
+    // tp_dealloc
+    0,                                                  // tp_print
+    0,                                                  // tp_getattr
+    0,                                                  // tp_setattr
+    0,                                                  // tp_compare
+    (reprfunc)AerospikeCompiledExpression_Type_Repr,    // tp_repr
+    0,                                                  // tp_as_number
+    0,                                                  // tp_as_sequence
+    0,                                                  // tp_as_mapping
+    0,                                                  // tp_hash
+    0,                                                  // tp_call
+    0,                                                  // tp_str
+    0,                                                  // tp_getattro
+    0,                                                  // tp_setattro
+    0,                                                  // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,
+    // tp_flags
+    "An expression packed once by Client.compile_expression(), usable "
+    "wherever an expression list is accepted.\n",
+    // tp_doc
+    0, // tp_traverse
+    0, // tp_clear
+    0, // tp_richcompare
+    0, // tp_weaklistoffset
+    0, // tp_iter
+    0, // tp_iternext
+    0, // tp_methods
+    0, // tp_members
+    0, // tp_getset
+    0, // tp_base
+    0, // tp_dict
+    0, // tp_descr_get
+    0, // tp_descr_set
+    0, // tp_dictoffset
+    0, // tp_init
+    0, // tp_alloc
+    0, // tp_new
+    0, // tp_free
+    0, // tp_is_gc
+    0  // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeCompiledExpression_Ready()
+{
+    return PyType_Ready(&AerospikeCompiledExpression_Type) == 0
+               ? &AerospikeCompiledExpression_Type
+               : NULL;
+}
+
+PyObject *AerospikeCompiledExpression_New(as_exp *exp)
+{
+    AerospikeCompiledExpression *self =
+        (AerospikeCompiledExpression *)AerospikeCompiledExpression_Type
+            .tp_alloc(&AerospikeCompiledExpression_Type, 0);
+    if (!self) {
+        as_exp_destroy(exp);
+        return NULL;
+    }
+    self->exp = exp;
+    return (PyObject *)self;
+}
+
+as_exp *compiled_expression_exp(PyObject *py_obj)
+{
+    if (py_obj && Py_TYPE(py_obj) == &AerospikeCompiledExpression_Type) {
+        return ((AerospikeCompiledExpression *)py_obj)->exp;
+    }
+    return NULL;
+}
@@ -46,6 +46,10 @@
 #include "cdt_types.h"
 #include "cdt_operation_utils.h"
 #include "key_ordered_dict.h"
+#include "intern.h"
+#include "record.h"
+#include "key.h"
+#include "lazy_bins.h"
 
 #define PY_KEYT_NAMESPACE 0
 #define PY_KEYT_SET 1
@@ -712,6 +716,22 @@ as_status pyobject_to_strArray(as_error *err, PyObject *py_list, char **arr,
     return err->code;
 }
 
+/**
+ * Copies a string of len bytes, and its terminating NUL, into the pool.
+ * Returns NULL when there is no pool or no memory left.
+ */
+static char *pool_strdup(as_static_pool *static_pool, const char *str,
+                         Py_ssize_t len)
+{
+    char *copy = static_pool
+                     ? static_pool_alloc(static_pool, (size_t)len + 1)
+                     : NULL;
+    if (copy) {
+        memcpy(copy, str, (size_t)len + 1);
+    }
+    return copy;
+}
+
 as_status pyobject_to_list(AerospikeClient *self, as_error *err,
                            PyObject *py_list, as_list **list,
                            as_static_pool *static_pool, int serializer_type)
@@ -721,7 +741,10 @@ as_status pyobject_to_list(AerospikeClient *self, as_error *err,
     Py_ssize_t size = PyList_Size(py_list);
 
     if (*list == NULL) {
-        *list = (as_list *)as_arraylist_new((uint32_t)size, 0);
+        as_arraylist *arraylist = POOL_ALLOC(static_pool, as_arraylist);
+        *list = arraylist ? (as_list *)as_arraylist_init(arraylist,
+                                                         (uint32_t)size, 0)
+                          : (as_list *)as_arraylist_new((uint32_t)size, 0);
     }
 
     for (int i = 0; i < size; i++) {
@@ -753,7 +776,9 @@ as_status pyobject_to_map(AerospikeClient *self, as_error *err,
     Py_ssize_t size = PyDict_Size(py_dict);
 
     if (*map == NULL) {
-        *map = (as_map *)as_hashmap_new((uint32_t)size);
+        as_hashmap *hashmap = POOL_ALLOC(static_pool, as_hashmap);
+        *map = hashmap ? (as_map *)as_hashmap_init(hashmap, (uint32_t)size)
+                       : (as_map *)as_hashmap_new((uint32_t)size);
     }
 
     while (PyDict_Next(py_dict, &pos, &py_key, &py_val)) {
@@ -832,7 +857,9 @@ as_status pyobject_to_val(AerospikeClient *self, as_error *err,
                                        "integer value exceeds sys.maxsize");
             }
         }
-        *val = (as_val *)as_integer_new(i);
+        as_integer *integer = POOL_ALLOC(static_pool, as_integer);
+        *val = integer ? (as_val *)as_integer_init(integer, i)
+                       : (as_val *)as_integer_new(i);
     }
     else if (PyLong_Check(py_obj)) {
         int64_t l = (int64_t)PyLong_AsLongLong(py_obj);
@@ -842,22 +869,40 @@ as_status pyobject_to_val(AerospikeClient *self, as_error *err,
                                        "integer value exceeds sys.maxsize");
             }
         }
-        *val = (as_val *)as_integer_new(l);
+        as_integer *integer = POOL_ALLOC(static_pool, as_integer);
+        *val = integer ? (as_val *)as_integer_init(integer, l)
+                       : (as_val *)as_integer_new(l);
     }
     else if (PyUnicode_Check(py_obj)) {
-        PyObject *py_ustr = PyUnicode_AsUTF8String(py_obj);
-        char *str = PyBytes_AsString(py_ustr);
-        *val = (as_val *)as_string_new(strdup(str), true);
-        Py_DECREF(py_ustr);
+        Py_ssize_t len = 0;
+        const char *str = PyUnicode_AsUTF8AndSize(py_obj, &len);
+        if (!str) {
+            PyErr_Clear();
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Unicode value not encoded in utf-8.");
+        }
+        as_string *string = POOL_ALLOC(static_pool, as_string);
+        char *copy = string ? pool_strdup(static_pool, str, len) : NULL;
+        if (copy) {
+            *val = (as_val *)as_string_init(string, copy, false);
+        }
+        else {
+            *val = (as_val *)as_string_new(strdup(str), true);
+        }
     }
     else if (PyString_Check(py_obj)) {
         char *s = PyString_AsString(py_obj);
         *val = (as_val *)as_string_new(s, false);
     }
     else if (PyBytes_Check(py_obj)) {
-        uint8_t *b = (uint8_t *)PyBytes_AsString(py_obj);
-        uint32_t b_len = (uint32_t)PyBytes_Size(py_obj);
-        *val = (as_val *)as_bytes_new_wrap(b, b_len, false);
+        uint8_t *b = NULL;
+        uint32_t b_len = 0;
+        bool b_free = false;
+        if (pyobject_buffer_to_blob(err, py_obj, static_pool, &b, &b_len,
+                                    &b_free) != AEROSPIKE_OK) {
+            return err->code;
+        }
+        *val = (as_val *)as_bytes_new_wrap(b, b_len, b_free);
     }
     else if (!strcmp(py_obj->ob_type->tp_name, "aerospike.Geospatial")) {
         PyObject *py_parameter = PyString_FromString("geo_data");
@@ -872,9 +917,9 @@ as_status pyobject_to_val(AerospikeClient *self, as_error *err,
         as_bytes *bytes;
         GET_BYTES_POOL(bytes, static_pool, err);
         if (err->code == AEROSPIKE_OK) {
-            if (serialize_based_on_serializer_policy(self, serializer_type,
-                                                     &bytes, py_obj,
-                                                     err) != AEROSPIKE_OK) {
+            if (serialize_based_on_serializer_policy(
+                    self, serializer_type, &bytes, py_obj, static_pool, err) !=
+                AEROSPIKE_OK) {
                 return err->code;
             }
             *val = (as_val *)bytes;
@@ -916,15 +961,17 @@ as_status pyobject_to_val(AerospikeClient *self, as_error *err,
     else {
         if (PyFloat_Check(py_obj)) {
             double d = PyFloat_AsDouble(py_obj);
-            *val = (as_val *)as_double_new(d);
+            as_double *dbl = POOL_ALLOC(static_pool, as_double);
+            *val = dbl ? (as_val *)as_double_init(dbl, d)
+                       : (as_val *)as_double_new(d);
         }
         else {
             as_bytes *bytes;
             GET_BYTES_POOL(bytes, static_pool, err);
             if (err->code == AEROSPIKE_OK) {
-                if (serialize_based_on_serializer_policy(self, serializer_type,
-                                                         &bytes, py_obj,
-                                                         err) != AEROSPIKE_OK) {
+                if (serialize_based_on_serializer_policy(
+                        self, serializer_type, &bytes, py_obj, static_pool,
+                        err) != AEROSPIKE_OK) {
                     return err->code;
                 }
                 *val = (as_val *)bytes;
@@ -957,7 +1004,20 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
         char *name = NULL;
         long ret_val = 0;
 
-        as_record_init(rec, size);
+        as_bin *entries =
+            static_pool ? static_pool_alloc(static_pool, sizeof(as_bin) * size)
+                        : NULL;
+        if (entries) {
+            // Same as as_record_inita(), with the bins in the pool.
+            as_record_init(rec, 0);
+            rec->bins._free = false;
+            rec->bins.capacity = (uint16_t)size;
+            rec->bins.size = 0;
+            rec->bins.entries = entries;
+        }
+        else {
+            as_record_init(rec, size);
+        }
 
         while (PyDict_Next(py_rec, &pos, &key, &value)) {
 
@@ -1085,15 +1145,18 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
                 Py_DECREF(py_dumps);
             }
             else if (PyUnicode_Check(value)) {
-                PyObject *py_ustr = PyUnicode_AsUTF8String(value);
-                if (!py_ustr) {
+                Py_ssize_t len = 0;
+                const char *val = PyUnicode_AsUTF8AndSize(value, &len);
+                if (!val) {
+                    PyErr_Clear();
                     return as_error_update(
                         err, AEROSPIKE_ERR_CLIENT,
                         "Unicode value not encoded in utf-8.");
                 }
-                char *val = PyBytes_AsString(py_ustr);
-                ret_val = as_record_set_strp(rec, name, strdup(val), true);
-                Py_DECREF(py_ustr);
+                char *copy = pool_strdup(static_pool, val, len);
+                ret_val = copy ? as_record_set_strp(rec, name, copy, false)
+                               : as_record_set_strp(rec, name, strdup(val),
+                                                    true);
             }
             else if (PyString_Check(value)) {
                 char *val = PyString_AsString(value);
@@ -1104,8 +1167,8 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
                 GET_BYTES_POOL(bytes, static_pool, err);
                 if (err->code == AEROSPIKE_OK) {
                     if (serialize_based_on_serializer_policy(
-                            self, serializer_type, &bytes, value, err) !=
-                        AEROSPIKE_OK) {
+                            self, serializer_type, &bytes, value, static_pool,
+                            err) != AEROSPIKE_OK) {
                         return err->code;
                     }
                     ret_val = as_record_set_bytes(rec, name, bytes);
@@ -1144,8 +1207,8 @@ as_status pyobject_to_record(AerospikeClient *self, as_error *err,
                     GET_BYTES_POOL(bytes, static_pool, err);
                     if (err->code == AEROSPIKE_OK) {
                         if (serialize_based_on_serializer_policy(
-                                self, serializer_type, &bytes, value, err) !=
-                            AEROSPIKE_OK) {
+                                self, serializer_type, &bytes, value,
+                                static_pool, err) != AEROSPIKE_OK) {
                             return err->code;
                         }
                         ret_val = as_record_set_bytes(rec, name, bytes);
@@ -1260,6 +1323,10 @@ as_status pyobject_to_key(as_error *err, PyObject *py_keytuple, as_key *key)
         // this should never happen, but if it did...
         return as_error_update(err, AEROSPIKE_ERR_PARAM, "key is null");
     }
+    else if (AerospikeKey_Check(py_keytuple)) {
+        // Already validated, and its digest is copied instead of computed.
+        return AerospikeKey_To_As_Key(err, py_keytuple, key);
+    }
     else if (PyTuple_Check(py_keytuple)) {
         size = PyTuple_Size(py_keytuple);
 
@@ -1801,6 +1868,61 @@ as_status do_record_to_pyobject(AerospikeClient *self, as_error *err,
     return err->code;
 }
 
+as_status record_to_compact_pyobject(AerospikeClient *self, as_error *err,
+                                     const as_record *rec, const as_key *key,
+                                     bool lazy_bins, PyObject **obj)
+{
+    as_error_reset(err);
+    *obj = NULL;
+
+    if (!rec) {
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT, "record is null");
+    }
+
+    PyObject *py_rec_key = NULL;
+    PyObject *py_rec_bins = NULL;
+
+    if (key_to_pyobject(err, key ? key : &rec->key, &py_rec_key) !=
+        AEROSPIKE_OK) {
+        return err->code;
+    }
+
+    if (lazy_bins) {
+        py_rec_bins = AerospikeLazyBins_New(self, err, rec);
+    }
+    else {
+        bins_to_pyobject(self, err, rec, &py_rec_bins, false);
+    }
+    if (err->code != AEROSPIKE_OK) {
+        Py_CLEAR(py_rec_key);
+        return err->code;
+    }
+
+    *obj = AerospikeRecord_New(py_rec_key, py_rec_bins, rec->gen, rec->ttl,
+                               true);
+    if (!*obj) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Failed to create a compact record");
+    }
+    return err->code;
+}
+
+as_status result_to_pyobject(AerospikeClient *self, as_error *err,
+                             const as_val *val, int record_format,
+                             PyObject **obj)
+{
+    if (record_format != RECORD_FORMAT_TUPLE && val &&
+        as_val_type(val) == AS_REC) {
+        as_record *rec = as_record_fromval(val);
+        if (rec) {
+            return record_to_compact_pyobject(
+                self, err, rec, NULL, record_format == RECORD_FORMAT_LAZY,
+                obj);
+        }
+    }
+    return val_to_pyobject(self, err, val, obj);
+}
+
 as_status record_to_resultpyobject(AerospikeClient *self, as_error *err,
                                    const as_record *rec, PyObject **obj)
 {
@@ -1872,12 +1994,12 @@ as_status key_to_pyobject(as_error *err, const as_key *key, PyObject **obj)
     PyObject *py_key = NULL;
     PyObject *py_digest = NULL;
 
-    if (strlen(key->ns) > 0) {
-        py_namespace = PyString_FromString(key->ns);
+    if (key->ns[0]) {
+        py_namespace = name_to_pyobject(key->ns);
     }
 
-    if (strlen(key->set) > 0) {
-        py_set = PyString_FromString(key->set);
+    if (key->set[0]) {
+        py_set = name_to_pyobject(key->set);
     }
 
     if (key->valuep) {
@@ -1980,8 +2102,18 @@ static bool do_bins_to_pyobject_each(const char *name, const as_val *val,
         return false;
     }
 
-    PyDict_SetItemString(py_bins, name, py_val);
+    PyObject *py_name = name_to_pyobject(name);
+    if (!py_name) {
+        PyErr_Clear();
+        Py_DECREF(py_val);
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to convert bin name");
+        return false;
+    }
 
+    PyDict_SetItem(py_bins, py_name, py_val);
+
+    Py_DECREF(py_name);
     Py_DECREF(py_val);
 
     convd->count++;
@@ -2073,7 +2205,9 @@ as_status operate_bins_to_pyobject(AerospikeClient *self, as_error *err,
                             "Null entry in operate ordered conversion");
             goto CLEANUP;
         }
-        py_bin_pair = Py_BuildValue("sO", as_bin_get_name(bin), py_bin_value);
+        py_bin_pair =
+            Py_BuildValue("NO", name_to_pyobject(as_bin_get_name(bin)),
+                          py_bin_value);
         if (!py_bin_pair) {
             as_error_update(err, AEROSPIKE_ERR_CLIENT,
                             "Unable to build bin entry");
@@ -2215,7 +2349,7 @@ void initialize_bin_for_strictypes(AerospikeClient *self, as_error *err,
         as_bytes *bytes;
         GET_BYTES_POOL(bytes, static_pool, err);
         serialize_based_on_serializer_policy(self, SERIALIZER_PYTHON, &bytes,
-                                             py_value, err);
+                                             py_value, static_pool, err);
         as_bytes_init_wrap((as_bytes *)&binop_bin->value, bytes->value,
                            bytes->size, true);
         binop_bin->valuep = &binop_bin->value;
@@ -2224,7 +2358,7 @@ void initialize_bin_for_strictypes(AerospikeClient *self, as_error *err,
         as_bytes *bytes;
         GET_BYTES_POOL(bytes, static_pool, err);
         serialize_based_on_serializer_policy(self, SERIALIZER_PYTHON, &bytes,
-                                             py_value, err);
+                                             py_value, static_pool, err);
         ((as_val *)&binop_bin->value)->type = AS_UNKNOWN;
         binop_bin->valuep = (as_bin_value *)bytes;
     }
@@ -2423,6 +2557,7 @@ as_status as_batch_read_results_to_pyobject(as_error *err,
 
 as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err,
                                          as_batch_read_records *records,
+                                         int record_format,
                                          PyObject **py_recs)
 {
     *py_recs = PyList_New(0);
@@ -2440,7 +2575,16 @@ as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err,
 
         /* There should be a record, so convert it to a tuple */
         if (batch->result == AEROSPIKE_OK) {
-            record_to_pyobject(self, err, &batch->record, &batch->key, &py_rec);
+            if (record_format != RECORD_FORMAT_TUPLE) {
+                record_to_compact_pyobject(self, err, &batch->record,
+                                           &batch->key,
+                                           record_format == RECORD_FORMAT_LAZY,
+                                           &py_rec);
+            }
+            else {
+                record_to_pyobject(self, err, &batch->record, &batch->key,
+                                   &py_rec);
+            }
             if (!py_rec || err->code != AEROSPIKE_OK) {
                 Py_CLEAR(*py_recs);
                 return err->code;
@@ -2453,8 +2597,13 @@ as_status batch_read_records_to_pyobject(AerospikeClient *self, as_error *err,
                 Py_CLEAR(*py_recs);
                 return err->code;
             }
-            py_rec = Py_BuildValue("OOO", py_key, Py_None, Py_None);
-            Py_DECREF(py_key);
+            if (record_format != RECORD_FORMAT_TUPLE) {
+                py_rec = AerospikeRecord_New(py_key, NULL, 0, 0, false);
+            }
+            else {
+                py_rec = Py_BuildValue("OOO", py_key, Py_None, Py_None);
+                Py_DECREF(py_key);
+            }
             if (!py_rec) {
                 as_error_update(err, AEROSPIKE_ERR_CLIENT,
                                 "Failed to create a record tuple");
@@ -2665,7 +2814,8 @@ static as_status py_bool_to_py_bytes_blob(AerospikeClient *self, as_error *err,
     }
 
     if (serialize_based_on_serializer_policy(self, serializer_type, target,
-                                             py_bool, err) != AEROSPIKE_OK) {
+                                             py_bool, static_pool,
+                                             err) != AEROSPIKE_OK) {
         return err->code;
     }
 
@@ -2754,29 +2904,133 @@ as_status get_int_from_py_int(as_error *err, PyObject *py_long,
     return AEROSPIKE_OK;
 }
 
-as_status as_batch_result_to_BatchRecord(AerospikeClient *self, as_error *err,
-                                         as_batch_result *bres,
-                                         PyObject *py_batch_record)
+// BatchRecord attribute names, interned once so setting them hits the type's
+// attribute cache instead of building a str for every record.
+enum {
+    BATCH_RECORD_KEY,
+    BATCH_RECORD_RECORD,
+    BATCH_RECORD_RESULT,
+    BATCH_RECORD_IN_DOUBT,
+    BATCH_RECORD_FIELDS
+};
+
+static PyObject *batch_record_fields[BATCH_RECORD_FIELDS];
+
+static as_status batch_record_fields_init(as_error *err)
+{
+    static const char *names[BATCH_RECORD_FIELDS] = {
+        FIELD_NAME_BATCH_KEY, FIELD_NAME_BATCH_RECORD, FIELD_NAME_BATCH_RESULT,
+        FIELD_NAME_BATCH_INDOUBT};
+
+    for (int i = 0; i < BATCH_RECORD_FIELDS; i++) {
+        if (!batch_record_fields[i]) {
+            batch_record_fields[i] = PyUnicode_InternFromString(names[i]);
+            if (!batch_record_fields[i]) {
+                PyErr_Clear();
+                return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                       "Unable to create BatchRecord fields");
+            }
+        }
+    }
+    return AEROSPIKE_OK;
+}
+
+static as_status batch_record_set(as_error *err, PyObject *py_batch_record,
+                                  int field, PyObject *py_value)
+{
+    if (!py_value ||
+        PyObject_SetAttr(py_batch_record, batch_record_fields[field],
+                         py_value) != 0) {
+        PyErr_Clear();
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Unable to set BatchRecord.%s",
+                               PyUnicode_AsUTF8(batch_record_fields[field]));
+    }
+    return AEROSPIKE_OK;
+}
+
+PyObject *batch_record_new(as_error *err, PyObject *py_cls, PyObject *py_key)
+{
+    if (batch_record_fields_init(err) != AEROSPIKE_OK) {
+        return NULL;
+    }
+
+    if (!PyType_Check(py_cls)) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "BatchRecord must be a class");
+        return NULL;
+    }
+
+    // object.__new__, the fields BatchRecord.__init__ would set follow.
+    PyObject *py_args = PyTuple_New(0);
+    PyObject *py_batch_record =
+        py_args ? PyBaseObject_Type.tp_new((PyTypeObject *)py_cls, py_args,
+                                           NULL)
+                : NULL;
+    Py_XDECREF(py_args);
+    if (!py_batch_record) {
+        PyErr_Clear();
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to instance BatchRecord");
+        return NULL;
+    }
+
+    if (batch_record_set(err, py_batch_record, BATCH_RECORD_KEY, py_key) !=
+            AEROSPIKE_OK ||
+        batch_record_set(err, py_batch_record, BATCH_RECORD_RECORD,
+                         Py_None) != AEROSPIKE_OK) {
+        Py_DECREF(py_batch_record);
+        return NULL;
+    }
+
+    return py_batch_record;
+}
+
+as_status batch_record_set_result(AerospikeClient *self, as_error *err,
+                                  PyObject *py_batch_record, as_status result,
+                                  bool in_doubt, const as_record *rec,
+                                  const as_key *key)
 {
-    as_status *result_code = &(bres->result);
-    as_record *result_rec = &(bres->record);
-    bool in_doubt = bres->in_doubt;
+    if (batch_record_fields_init(err) != AEROSPIKE_OK) {
+        return err->code;
+    }
 
-    PyObject *py_res = PyLong_FromLong((long)*result_code);
-    PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RESULT, py_res);
-    Py_DECREF(py_res);
+    PyObject *py_res = PyLong_FromLong((long)result);
+    batch_record_set(err, py_batch_record, BATCH_RECORD_RESULT, py_res);
+    Py_XDECREF(py_res);
+    if (err->code != AEROSPIKE_OK) {
+        return err->code;
+    }
+
+    if (batch_record_set(err, py_batch_record, BATCH_RECORD_IN_DOUBT,
+                         in_doubt ? Py_True : Py_False) != AEROSPIKE_OK) {
+        return err->code;
+    }
 
-    PyObject *py_in_doubt = PyBool_FromLong((long)in_doubt);
-    PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_INDOUBT,
-                           py_in_doubt);
-    Py_DECREF(py_in_doubt);
+    if (result != AEROSPIKE_OK) {
+        return AEROSPIKE_OK;
+    }
 
-    if (*result_code == AEROSPIKE_OK) {
-        PyObject *rec = NULL;
-        record_to_pyobject(self, err, result_rec, bres->key, &rec);
-        PyObject_SetAttrString(py_batch_record, FIELD_NAME_BATCH_RECORD, rec);
-        Py_DECREF(rec);
+    PyObject *py_rec = NULL;
+    if (rec) {
+        if (record_to_pyobject(self, err, rec, key, &py_rec) != AEROSPIKE_OK) {
+            return err->code;
+        }
+    }
+    else {
+        Py_INCREF(Py_None);
+        py_rec = Py_None;
     }
 
+    batch_record_set(err, py_batch_record, BATCH_RECORD_RECORD, py_rec);
+    Py_DECREF(py_rec);
     return err->code;
 }
+
+as_status as_batch_result_to_BatchRecord(AerospikeClient *self, as_error *err,
+                                         as_batch_result *bres,
+                                         PyObject *py_batch_record)
+{
+    return batch_record_set_result(self, err, py_batch_record, bres->result,
+                                   bres->in_doubt, &bres->record, bres->key);
+}
@@ -32,6 +32,7 @@
 #include "cdt_operation_utils.h"
 #include "geo.h"
 #include "cdt_types.h"
+#include "compiled_expression.h"
 
 // EXPR OPS
 enum expr_ops {
@@ -503,9 +504,9 @@ get_exp_val_from_pyval(AerospikeClient *self, as_static_pool *static_pool,
         as_bytes *bytes;
         GET_BYTES_POOL(bytes, static_pool, err);
         if (err->code == AEROSPIKE_OK) {
-            if (serialize_based_on_serializer_policy(self, serializer_type,
-                                                     &bytes, py_obj,
-                                                     err) != AEROSPIKE_OK) {
+            if (serialize_based_on_serializer_policy(
+                    self, serializer_type, &bytes, py_obj, static_pool, err) !=
+                AEROSPIKE_OK) {
                 return err->code;
             }
             as_exp_entry tmp_entry = as_exp_val(
@@ -563,9 +564,9 @@ get_exp_val_from_pyval(AerospikeClient *self, as_static_pool *static_pool,
             as_bytes *bytes;
             GET_BYTES_POOL(bytes, static_pool, err);
             if (err->code == AEROSPIKE_OK) {
-                if (serialize_based_on_serializer_policy(self, serializer_type,
-                                                         &bytes, py_obj,
-                                                         err) != AEROSPIKE_OK) {
+                if (serialize_based_on_serializer_policy(
+                        self, serializer_type, &bytes, py_obj, static_pool,
+                        err) != AEROSPIKE_OK) {
                     return err->code;
                 }
 
@@ -1497,6 +1498,15 @@ as_status convert_exp_list(AerospikeClient *self, PyObject *py_exp_list,
 {
     int bottom = 0;
 
+    // Already packed, hand back a copy the caller can destroy as usual.
+    as_exp *compiled = compiled_expression_exp(py_exp_list);
+    if (compiled) {
+        size_t exp_size = sizeof(as_exp) + compiled->packed_sz;
+        *exp_list = cf_malloc(exp_size);
+        memcpy(*exp_list, compiled, exp_size);
+        return AEROSPIKE_OK;
+    }
+
     if (py_exp_list == NULL || !PyList_Check(py_exp_list)) {
         as_error_update(err, AEROSPIKE_ERR_PARAM,
                         "Expressions must be a non empty list of 4 element "
@@ -28,6 +28,102 @@
 
 static PyObject *module;
 
+// Range of status codes kept in exceptions_by_code. Most codes fall in it,
+// the few others, such as the UDF ones, are kept in exceptions_by_other_code.
+#define EXCEPTION_CODE_MIN -128
+#define EXCEPTION_CODE_MAX 511
+
+// Exception class for each status code, built once the module is created.
+// The references are borrowed from the module.
+static PyObject
+    *exceptions_by_code[EXCEPTION_CODE_MAX - EXCEPTION_CODE_MIN + 1];
+static PyObject *exceptions_by_other_code;
+static PyObject *aerospike_error;
+
+// Attributes set from the tuple built by error_to_pyobject(), in its order.
+static const char *error_attr_names[] = {"code", "msg", "file", "line",
+                                         "in_doubt"};
+
+#define ERROR_ATTR_COUNT                                                       \
+    (sizeof(error_attr_names) / sizeof(error_attr_names[0]))
+
+/**
+ * AerospikeError.__init__(self, *args)
+ *
+ * Errors are raised with the error tuple as args. Its fields are also set on
+ * the instance, so errors raised at the same time in different threads do not
+ * see each other's message.
+ */
+static PyObject *AerospikeError_Init(PyObject *unused, PyObject *args)
+{
+    Py_ssize_t size = PyTuple_Size(args);
+    if (size < 1) {
+        PyErr_SetString(PyExc_TypeError, "__init__ requires an instance");
+        return NULL;
+    }
+
+    PyObject *self = PyTuple_GetItem(args, 0);
+    PyObject *py_args = PyTuple_GetSlice(args, 1, size);
+    if (!py_args) {
+        return NULL;
+    }
+
+    if (((PyTypeObject *)PyExc_Exception)->tp_init(self, py_args, NULL) < 0) {
+        Py_DECREF(py_args);
+        return NULL;
+    }
+
+    if (PyTuple_Size(py_args) == ERROR_ATTR_COUNT) {
+        for (Py_ssize_t i = 0; i < (Py_ssize_t)ERROR_ATTR_COUNT; i++) {
+            if (PyObject_SetAttrString(self, error_attr_names[i],
+                                       PyTuple_GetItem(py_args, i)) < 0) {
+                Py_DECREF(py_args);
+                return NULL;
+            }
+        }
+    }
+    Py_DECREF(py_args);
+
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef AerospikeError_Init_Def = {
+    "__init__", (PyCFunction)AerospikeError_Init, METH_VARARGS, NULL};
+
+/**
+ * Indexes every exception class of the module by its code. The first class
+ * found for a code wins, as when the module was searched for each error.
+ */
+static void build_exceptions_by_code(void)
+{
+    PyObject *py_key = NULL, *py_value = NULL;
+    Py_ssize_t pos = 0;
+    PyObject *py_module_dict = PyModule_GetDict(module);
+
+    aerospike_error = PyDict_GetItemString(py_module_dict, "AerospikeError");
+    exceptions_by_other_code = PyDict_New();
+
+    while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
+        PyObject *py_code = PyObject_GetAttrString(py_value, "code");
+        if (!py_code) {
+            PyErr_Clear();
+            continue;
+        }
+        if (PyLong_Check(py_code)) {
+            long code = PyLong_AsLong(py_code);
+            if (code >= EXCEPTION_CODE_MIN && code <= EXCEPTION_CODE_MAX) {
+                if (!exceptions_by_code[code - EXCEPTION_CODE_MIN]) {
+                    exceptions_by_code[code - EXCEPTION_CODE_MIN] = py_value;
+                }
+            }
+            else if (exceptions_by_other_code) {
+                PyDict_SetDefault(exceptions_by_other_code, py_code, py_value);
+            }
+        }
+        Py_DECREF(py_code);
+    }
+}
+
 PyObject *AerospikeException_New(void)
 {
     MOD_DEF(module, "aerospike.exception", "Exception objects", -1, NULL, NULL);
@@ -157,6 +253,12 @@ PyObject *AerospikeException_New(void)
     PyDict_SetItemString(py_dict, "file", Py_None);
     PyDict_SetItemString(py_dict, "msg", Py_None);
     PyDict_SetItemString(py_dict, "line", Py_None);
+    PyDict_SetItemString(py_dict, "in_doubt", Py_False);
+    PyObject *py_init = PyCFunction_New(&AerospikeError_Init_Def, NULL);
+    PyObject *py_init_method = PyInstanceMethod_New(py_init);
+    PyDict_SetItemString(py_dict, "__init__", py_init_method);
+    Py_DECREF(py_init_method);
+    Py_DECREF(py_init);
 
     exceptions_array.AerospikeError =
         PyErr_NewException("exception.AerospikeError", NULL, py_dict);
@@ -532,6 +634,8 @@ PyObject *AerospikeException_New(void)
     PyObject_SetAttrString(exceptions_array.QueryTimeout, "code", py_code);
     Py_DECREF(py_code);
 
+    build_exceptions_by_code();
+
     return module;
 }
 
@@ -548,58 +652,21 @@ void remove_exception(as_error *err)
 
 PyObject *raise_exception(as_error *err)
 {
-    PyObject *py_key = NULL, *py_value = NULL;
-    Py_ssize_t pos = 0;
-    PyObject *py_module_dict = PyModule_GetDict(module);
-    bool found = false;
-
-    while (PyDict_Next(py_module_dict, &pos, &py_key, &py_value)) {
-        if (PyObject_HasAttrString(py_value, "code")) {
-            PyObject *py_code = PyObject_GetAttrString(py_value, "code");
-            if (py_code == Py_None) {
-                continue;
-            }
-            if (err->code == PyInt_AsLong(py_code)) {
-                found = true;
-                PyObject *py_attr = NULL;
-                py_attr = PyString_FromString(err->message);
-                PyObject_SetAttrString(py_value, "msg", py_attr);
-                Py_DECREF(py_attr);
-
-                // as_error.file is a char* so this may be null
-                if (err->file) {
-                    py_attr = PyString_FromString(err->file);
-                    PyObject_SetAttrString(py_value, "file", py_attr);
-                    Py_DECREF(py_attr);
-                }
-                else {
-                    PyObject_SetAttrString(py_value, "file", Py_None);
-                }
-                // If the line is 0, set it as None
-                if (err->line > 0) {
-                    py_attr = PyInt_FromLong(err->line);
-                    PyObject_SetAttrString(py_value, "line", py_attr);
-                    Py_DECREF(py_attr);
-                }
-                else {
-                    PyObject_SetAttrString(py_value, "line", Py_None);
-                }
-
-                PyObject_SetAttrString(py_value, "in_doubt",
-                                       PyBool_FromLong(err->in_doubt));
-
-                break;
-            }
+    PyObject *py_value = NULL;
+    if (err->code >= EXCEPTION_CODE_MIN && err->code <= EXCEPTION_CODE_MAX) {
+        py_value = exceptions_by_code[err->code - EXCEPTION_CODE_MIN];
+    }
+    else if (exceptions_by_other_code) {
+        PyObject *py_code = PyLong_FromLong(err->code);
+        if (py_code) {
+            py_value = PyDict_GetItem(exceptions_by_other_code, py_code);
             Py_DECREF(py_code);
         }
     }
+
     // We haven't found the right exception, just use AerospikeError
-    if (!found) {
-        PyObject *base_exception =
-            PyDict_GetItemString(py_module_dict, "AerospikeError");
-        if (base_exception) {
-            py_value = base_exception;
-        }
+    if (!py_value) {
+        py_value = aerospike_error;
     }
     return py_value;
 }
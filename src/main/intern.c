@@ -0,0 +1,104 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+#include "intern.h"
+
+// Power of two. Namespaces, sets and bins in use by one application rarely
+// come close, and past the load limit names are simply not shared.
+#define NAME_TABLE_SIZE 2048
+#define NAME_TABLE_MAX_LOAD (NAME_TABLE_SIZE / 4 * 3)
+
+// Longest name worth sharing, set names are the longest at 63 bytes.
+#define NAME_MAX_LEN 63
+
+typedef struct {
+    uint32_t hash;
+    uint32_t len;
+    // UTF-8 buffer owned by py_name.
+    const char *name;
+    PyObject *py_name;
+} name_entry;
+
+static name_entry name_table[NAME_TABLE_SIZE];
+static Py_ssize_t name_table_count = 0;
+
+// FNV-1a, also yields the length so the name is only walked once.
+static inline uint32_t name_hash(const char *name, uint32_t *len)
+{
+    uint32_t hash = 2166136261u;
+    const char *p = name;
+
+    while (*p) {
+        hash ^= (uint8_t)*p++;
+        hash *= 16777619u;
+    }
+    *len = (uint32_t)(p - name);
+    return hash;
+}
+
+PyObject *name_to_pyobject(const char *name)
+{
+    uint32_t len;
+    uint32_t hash = name_hash(name, &len);
+
+    if (len > NAME_MAX_LEN) {
+        return PyUnicode_FromStringAndSize(name, len);
+    }
+
+    uint32_t i = hash & (NAME_TABLE_SIZE - 1);
+
+    // Linear probing, entries are never removed.
+    while (name_table[i].py_name) {
+        name_entry *entry = &name_table[i];
+        if (entry->hash == hash && entry->len == len &&
+            memcmp(entry->name, name, len) == 0) {
+            Py_INCREF(entry->py_name);
+            return entry->py_name;
+        }
+        i = (i + 1) & (NAME_TABLE_SIZE - 1);
+    }
+
+    PyObject *py_name = PyUnicode_FromStringAndSize(name, len);
+    if (!py_name || name_table_count >= NAME_TABLE_MAX_LOAD) {
+        return py_name;
+    }
+
+    // Interning lets names we share match ones already in use by the
+    // application, which makes dict lookups on them a pointer compare.
+    PyUnicode_InternInPlace(&py_name);
+
+    const char *utf8 = PyUnicode_AsUTF8(py_name);
+    if (!utf8) {
+        PyErr_Clear();
+        return py_name;
+    }
+
+    name_table[i].hash = hash;
+    name_table[i].len = len;
+    name_table[i].name = utf8;
+    name_table[i].py_name = py_name;
+    name_table_count++;
+
+    // One reference for the table, one for the caller.
+    Py_INCREF(py_name);
+    return py_name;
+}
+
+Py_ssize_t name_table_size() { return name_table_count; }
@@ -0,0 +1,394 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_key.h>
+#include <aerospike/as_partition.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "key.h"
+
+static PyTypeObject AerospikeKey_Type;
+
+/*******************************************************************************
+ * KEY COPY
+ ******************************************************************************/
+
+/*
+ * Initialises dst with its own copy of the value of src, and the digest of src
+ * if it was computed.
+ */
+static as_status key_copy(as_error *err, const as_key *src, as_key *dst)
+{
+    as_error_reset(err);
+
+    as_key *rv = NULL;
+    as_val *value = (as_val *)src->valuep;
+
+    if (!value) {
+        rv = as_key_init_digest(dst, src->ns, src->set, src->digest.value);
+    }
+    else if (as_val_type(value) == AS_INTEGER) {
+        rv = as_key_init_int64(dst, src->ns, src->set,
+                               as_integer_get((as_integer *)value));
+    }
+    else if (as_val_type(value) == AS_STRING) {
+        char *str = strdup(as_string_get((as_string *)value));
+        if (!str) {
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Cannot allocate key");
+        }
+        rv = as_key_init_strp(dst, src->ns, src->set, str, true);
+    }
+    else if (as_val_type(value) == AS_BYTES) {
+        uint32_t size = as_bytes_size((as_bytes *)value);
+        uint8_t *bytes = malloc(size);
+        if (!bytes) {
+            return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                                   "Cannot allocate key");
+        }
+        memcpy(bytes, as_bytes_get((as_bytes *)value), size);
+        rv = as_key_init_rawp(dst, src->ns, src->set, bytes, size, true);
+    }
+
+    if (!rv) {
+        return as_error_update(err, AEROSPIKE_ERR_PARAM, "key is invalid");
+    }
+
+    if (src->digest.init) {
+        dst->digest = src->digest;
+    }
+
+    return AEROSPIKE_OK;
+}
+
+/*******************************************************************************
+ * TYPE FUNCTIONS
+ ******************************************************************************/
+
+static PyObject *AerospikeKey_Type_New(PyTypeObject *type, PyObject *args,
+                                       PyObject *kwds)
+{
+    PyObject *py_ns = NULL;
+    PyObject *py_set = NULL;
+    PyObject *py_key = Py_None;
+    PyObject *py_digest = Py_None;
+    PyObject *py_keytuple = NULL;
+    AerospikeKey *self = NULL;
+
+    as_error err;
+    as_error_init(&err);
+
+    as_key key;
+    bool key_initialised = false;
+
+    static char *kwlist[] = {"namespace", "set", "key", "digest", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "OO|OO:Key", kwlist, &py_ns,
+                                    &py_set, &py_key, &py_digest) == false) {
+        return NULL;
+    }
+
+    // A digest read back from a record is a bytearray, accept bytes too.
+    if (PyBytes_Check(py_digest)) {
+        py_digest = PyByteArray_FromObject(py_digest);
+        if (!py_digest) {
+            return NULL;
+        }
+    }
+    else {
+        Py_INCREF(py_digest);
+    }
+
+    py_keytuple = PyTuple_Pack(4, py_ns, py_set, py_key, py_digest);
+    Py_DECREF(py_digest);
+    if (!py_keytuple) {
+        return NULL;
+    }
+
+    if (pyobject_to_key(&err, py_keytuple, &key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    key_initialised = true;
+
+    self = (AerospikeKey *)type->tp_alloc(type, 0);
+    if (!self) {
+        goto CLEANUP;
+    }
+
+    if (key_copy(&err, &key, &self->as_key) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (!as_key_digest(&self->as_key)->init) {
+        as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+                        "Digest could not be calculated");
+        goto CLEANUP;
+    }
+    self->partition_id = as_partition_getid(self->as_key.digest.value,
+                                            CLUSTER_NPARTITIONS);
+
+    Py_INCREF(py_ns);
+    self->ns = py_ns;
+    Py_INCREF(py_set);
+    self->set = py_set;
+    if (PyByteArray_Check(py_key)) {
+        self->key = PyByteArray_FromObject(py_key);
+        if (!self->key) {
+            goto CLEANUP;
+        }
+    }
+    else {
+        Py_INCREF(py_key);
+        self->key = py_key;
+    }
+
+CLEANUP:
+    if (key_initialised) {
+        as_key_destroy(&key);
+    }
+    Py_DECREF(py_keytuple);
+
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(self);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    if (PyErr_Occurred()) {
+        Py_XDECREF(self);
+        return NULL;
+    }
+
+    return (PyObject *)self;
+}
+
+static void AerospikeKey_Type_Dealloc(AerospikeKey *self)
+{
+    // A zeroed as_key has nothing to destroy.
+    as_key_destroy(&self->as_key);
+    Py_XDECREF(self->ns);
+    Py_XDECREF(self->set);
+    Py_XDECREF(self->key);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *AerospikeKey_Get_Digest(AerospikeKey *self, void *closure)
+{
+    return PyByteArray_FromStringAndSize(
+        (const char *)self->as_key.digest.value, AS_DIGEST_VALUE_SIZE);
+}
+
+static PyObject *AerospikeKey_Type_Repr(AerospikeKey *self)
+{
+    if (self->key != Py_None) {
+        return PyUnicode_FromFormat("Key(%R, %R, %R)", self->ns, self->set,
+                                    self->key);
+    }
+
+    PyObject *py_digest = AerospikeKey_Get_Digest(self, NULL);
+    if (!py_digest) {
+        return NULL;
+    }
+    PyObject *py_repr = PyUnicode_FromFormat("Key(%R, %R, digest=%R)",
+                                             self->ns, self->set, py_digest);
+    Py_DECREF(py_digest);
+    return py_repr;
+}
+
+// Digests are uniformly distributed, so part of one is as good a hash as any.
+static Py_hash_t AerospikeKey_Type_Hash(AerospikeKey *self)
+{
+    Py_hash_t hash;
+    memcpy(&hash, self->as_key.digest.value, sizeof(hash));
+    return hash == -1 ? -2 : hash;
+}
+
+// Two keys are the same record when their namespaces and digests are.
+static PyObject *AerospikeKey_Type_RichCompare(PyObject *py_a, PyObject *py_b,
+                                               int op)
+{
+    if ((op != Py_EQ && op != Py_NE) || !AerospikeKey_Check(py_a) ||
+        !AerospikeKey_Check(py_b)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    as_key *a = &((AerospikeKey *)py_a)->as_key;
+    as_key *b = &((AerospikeKey *)py_b)->as_key;
+    bool equal = strcmp(a->ns, b->ns) == 0 &&
+                 memcmp(a->digest.value, b->digest.value,
+                        AS_DIGEST_VALUE_SIZE) == 0;
+
+    if (equal == (op == Py_EQ)) {
+        Py_RETURN_TRUE;
+    }
+    Py_RETURN_FALSE;
+}
+
+/*******************************************************************************
+ * ATTRIBUTES
+ ******************************************************************************/
+
+static PyObject *AerospikeKey_Get_Namespace(AerospikeKey *self, void *closure)
+{
+    Py_INCREF(self->ns);
+    return self->ns;
+}
+
+static PyObject *AerospikeKey_Get_Set(AerospikeKey *self, void *closure)
+{
+    Py_INCREF(self->set);
+    return self->set;
+}
+
+static PyObject *AerospikeKey_Get_Key(AerospikeKey *self, void *closure)
+{
+    // Copied again, so the key can not be changed through it.
+    if (PyByteArray_Check(self->key)) {
+        return PyByteArray_FromObject(self->key);
+    }
+    Py_INCREF(self->key);
+    return self->key;
+}
+
+static PyObject *AerospikeKey_Get_Partition_Id(AerospikeKey *self,
+                                               void *closure)
+{
+    return PyLong_FromUnsignedLong(self->partition_id);
+}
+
+static PyGetSetDef AerospikeKey_Type_GetSet[] = {
+    {"namespace", (getter)AerospikeKey_Get_Namespace, NULL,
+     "The namespace of the key.", NULL},
+    {"set", (getter)AerospikeKey_Get_Set, NULL, "The set of the key.", NULL},
+    {"key", (getter)AerospikeKey_Get_Key, NULL,
+     "The user key, None for a key created from a digest.", NULL},
+    {"digest", (getter)AerospikeKey_Get_Digest, NULL,
+     "The digest of the key, a new bytearray on every access.", NULL},
+    {"partition_id", (getter)AerospikeKey_Get_Partition_Id, NULL,
+     "The partition the key belongs to.", NULL},
+    {NULL}};
+
+/*******************************************************************************
+ * SEQUENCE, so ns, set, key, digest = key keeps working.
+ ******************************************************************************/
+
+static Py_ssize_t AerospikeKey_Type_Len(AerospikeKey *self) { return 4; }
+
+static PyObject *AerospikeKey_Type_Item(AerospikeKey *self, Py_ssize_t i)
+{
+    switch (i) {
+    case 0:
+        return AerospikeKey_Get_Namespace(self, NULL);
+    case 1:
+        return AerospikeKey_Get_Set(self, NULL);
+    case 2:
+        return AerospikeKey_Get_Key(self, NULL);
+    case 3:
+        return AerospikeKey_Get_Digest(self, NULL);
+    default:
+        PyErr_SetString(PyExc_IndexError, "key index out of range");
+        return NULL;
+    }
+}
+
+static PySequenceMethods AerospikeKey_Type_Sequence = {
+    (lenfunc)AerospikeKey_Type_Len,       // sq_length
+    0,                                    // sq_concat
+    0,                                    // sq_repeat
+    (ssizeargfunc)AerospikeKey_Type_Item, // sq_item
+};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeKey_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.Key", // tp_name
+    sizeof(AerospikeKey),                           // tp_basicsize
+    0,                                              // tp_itemsize
+    (destructor)AerospikeKey_Type_Dealloc,          // tp_dealloc
+    0,                                              // tp_print
+    0,                                              // tp_getattr
+    0,                                              // tp_setattr
+    0,                                              // tp_compare
+    (reprfunc)AerospikeKey_Type_Repr,               // tp_repr
+    0,                                              // tp_as_number
+    &AerospikeKey_Type_Sequence,                    // tp_as_sequence
+    0,                                              // tp_as_mapping
+    (hashfunc)AerospikeKey_Type_Hash,               // tp_hash
+    0,                                              // tp_call
+    0,                                              // tp_str
+    0,                                              // tp_getattro
+    0,                                              // tp_setattro
+    0,                                              // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                             // tp_flags
+    "Key(namespace, set, key=None, digest=None)\n\n"
+    "An immutable key, accepted wherever a key tuple is. It is validated "
+    "and hashed once, when it is created.\n",
+    // tp_doc
+    0,                             // tp_traverse
+    0,                             // tp_clear
+    AerospikeKey_Type_RichCompare, // tp_richcompare
+    0,                             // tp_weaklistoffset
+    0,                             // tp_iter
+    0,                             // tp_iternext
+    0,                             // tp_methods
+    0,                             // tp_members
+    AerospikeKey_Type_GetSet,      // tp_getset
+    0,                             // tp_base
+    0,                             // tp_dict
+    0,                             // tp_descr_get
+    0,                             // tp_descr_set
+    0,                             // tp_dictoffset
+    0,                             // tp_init
+    0,                             // tp_alloc
+    AerospikeKey_Type_New,         // tp_new
+    0,                             // tp_free
+    0,                             // tp_is_gc
+    0                              // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeKey_Ready()
+{
+    return PyType_Ready(&AerospikeKey_Type) == 0 ? &AerospikeKey_Type : NULL;
+}
+
+bool AerospikeKey_Check(PyObject *py_obj)
+{
+    return Py_TYPE(py_obj) == &AerospikeKey_Type;
+}
+
+as_status AerospikeKey_To_As_Key(as_error *err, PyObject *py_key, as_key *key)
+{
+    return key_copy(err, &((AerospikeKey *)py_key)->as_key, key);
+}
@@ -0,0 +1,468 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/as_bin.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_record.h>
+#include <aerospike/as_std.h>
+#include <aerospike/as_val.h>
+
+#include "conversions.h"
+#include "exceptions.h"
+#include "intern.h"
+#include "lazy_bins.h"
+
+static PyTypeObject AerospikeLazyBins_Type;
+
+/**
+ * Returns a borrowed reference to the value of bin i, converting it first if
+ * needed. Returns NULL with a Python exception set on failure.
+ */
+static PyObject *lazy_bins_value(AerospikeLazyBins *self, Py_ssize_t i)
+{
+    lazy_bin *bin = &self->bins[i];
+
+    if (bin->py_value) {
+        return bin->py_value;
+    }
+
+    as_error err;
+    as_error_init(&err);
+
+    PyObject *py_value = NULL;
+    val_to_pyobject(self->client, &err, bin->val, &py_value);
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(py_value);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    bin->py_value = py_value;
+    as_val_destroy(bin->val);
+    bin->val = NULL;
+    return py_value;
+}
+
+/**
+ * Index of the bin named py_name, or -1.
+ */
+static Py_ssize_t lazy_bins_find(AerospikeLazyBins *self, PyObject *py_name)
+{
+    // Names are shared, so most lookups match on identity.
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        if (self->bins[i].py_name == py_name) {
+            return i;
+        }
+    }
+
+    if (!PyUnicode_Check(py_name)) {
+        return -1;
+    }
+
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        if (PyUnicode_Compare(self->bins[i].py_name, py_name) == 0) {
+            return i;
+        }
+    }
+    return -1;
+}
+
+static PyObject *lazy_bins_to_dict(AerospikeLazyBins *self)
+{
+    PyObject *py_dict = PyDict_New();
+    if (!py_dict) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        PyObject *py_value = lazy_bins_value(self, i);
+        if (!py_value ||
+            PyDict_SetItem(py_dict, self->bins[i].py_name, py_value) != 0) {
+            Py_DECREF(py_dict);
+            return NULL;
+        }
+    }
+    return py_dict;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+static PyObject *AerospikeLazyBins_Keys(AerospikeLazyBins *self,
+                                        PyObject *Py_UNUSED(ignored))
+{
+    PyObject *py_keys = PyList_New(self->size);
+    if (!py_keys) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_INCREF(self->bins[i].py_name);
+        PyList_SET_ITEM(py_keys, i, self->bins[i].py_name);
+    }
+    return py_keys;
+}
+
+static PyObject *AerospikeLazyBins_Values(AerospikeLazyBins *self,
+                                          PyObject *Py_UNUSED(ignored))
+{
+    PyObject *py_values = PyList_New(self->size);
+    if (!py_values) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        PyObject *py_value = lazy_bins_value(self, i);
+        if (!py_value) {
+            Py_DECREF(py_values);
+            return NULL;
+        }
+        Py_INCREF(py_value);
+        PyList_SET_ITEM(py_values, i, py_value);
+    }
+    return py_values;
+}
+
+static PyObject *AerospikeLazyBins_Items(AerospikeLazyBins *self,
+                                         PyObject *Py_UNUSED(ignored))
+{
+    PyObject *py_items = PyList_New(self->size);
+    if (!py_items) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        PyObject *py_value = lazy_bins_value(self, i);
+        PyObject *py_item =
+            py_value ? PyTuple_Pack(2, self->bins[i].py_name, py_value) : NULL;
+        if (!py_item) {
+            Py_DECREF(py_items);
+            return NULL;
+        }
+        PyList_SET_ITEM(py_items, i, py_item);
+    }
+    return py_items;
+}
+
+static PyObject *AerospikeLazyBins_Get(AerospikeLazyBins *self,
+                                       PyObject *args)
+{
+    PyObject *py_name = NULL;
+    PyObject *py_default = Py_None;
+
+    if (!PyArg_ParseTuple(args, "O|O:get", &py_name, &py_default)) {
+        return NULL;
+    }
+
+    Py_ssize_t i = lazy_bins_find(self, py_name);
+    PyObject *py_value = i < 0 ? py_default : lazy_bins_value(self, i);
+    Py_XINCREF(py_value);
+    return py_value;
+}
+
+static PyObject *AerospikeLazyBins_To_Dict(AerospikeLazyBins *self,
+                                           PyObject *Py_UNUSED(ignored))
+{
+    return lazy_bins_to_dict(self);
+}
+
+PyDoc_STRVAR(keys_doc, "keys() -> list\n\
+\n\
+Return the bin names, without converting any value.");
+
+PyDoc_STRVAR(values_doc, "values() -> list\n\
+\n\
+Return the bin values, converting those not accessed yet.");
+
+PyDoc_STRVAR(items_doc, "items() -> list of (name, value)\n\
+\n\
+Return the (name, value) pairs, converting values not accessed yet.");
+
+PyDoc_STRVAR(get_doc, "get(name[, default]) -> value\n\
+\n\
+Return the value of the bin, or default if the record has no such bin.");
+
+PyDoc_STRVAR(to_dict_doc, "to_dict() -> dict\n\
+\n\
+Return the bins as a new dict, converting values not accessed yet.");
+
+static PyMethodDef AerospikeLazyBins_Type_Methods[] = {
+    {"keys", (PyCFunction)AerospikeLazyBins_Keys, METH_NOARGS, keys_doc},
+    {"values", (PyCFunction)AerospikeLazyBins_Values, METH_NOARGS,
+     values_doc},
+    {"items", (PyCFunction)AerospikeLazyBins_Items, METH_NOARGS, items_doc},
+    {"get", (PyCFunction)AerospikeLazyBins_Get, METH_VARARGS, get_doc},
+    {"to_dict", (PyCFunction)AerospikeLazyBins_To_Dict, METH_NOARGS,
+     to_dict_doc},
+    {NULL}};
+
+/*******************************************************************************
+ * MAPPING
+ ******************************************************************************/
+
+static Py_ssize_t AerospikeLazyBins_Type_Len(AerospikeLazyBins *self)
+{
+    return self->size;
+}
+
+static PyObject *AerospikeLazyBins_Type_Subscript(AerospikeLazyBins *self,
+                                                  PyObject *py_name)
+{
+    Py_ssize_t i = lazy_bins_find(self, py_name);
+    if (i < 0) {
+        PyErr_SetObject(PyExc_KeyError, py_name);
+        return NULL;
+    }
+
+    PyObject *py_value = lazy_bins_value(self, i);
+    Py_XINCREF(py_value);
+    return py_value;
+}
+
+static int AerospikeLazyBins_Type_Contains(AerospikeLazyBins *self,
+                                           PyObject *py_name)
+{
+    return lazy_bins_find(self, py_name) >= 0;
+}
+
+static PyMappingMethods AerospikeLazyBins_Type_Mapping = {
+    (lenfunc)AerospikeLazyBins_Type_Len,             // mp_length
+    (binaryfunc)AerospikeLazyBins_Type_Subscript,    // mp_subscript
+    0,                                               // mp_ass_subscript
+};
+
+static PySequenceMethods AerospikeLazyBins_Type_Sequence = {
+    0,                                          // sq_length
+    0,                                          // sq_concat
+    0,                                          // sq_repeat
+    0,                                          // sq_item
+    0,                                          // was_sq_slice
+    0,                                          // sq_ass_item
+    0,                                          // was_sq_ass_slice
+    (objobjproc)AerospikeLazyBins_Type_Contains, // sq_contains
+};
+
+static PyObject *AerospikeLazyBins_Type_Iter(AerospikeLazyBins *self)
+{
+    PyObject *py_keys = AerospikeLazyBins_Keys(self, NULL);
+    if (!py_keys) {
+        return NULL;
+    }
+    PyObject *py_iter = PyObject_GetIter(py_keys);
+    Py_DECREF(py_keys);
+    return py_iter;
+}
+
+// Compares equal to a dict, or another LazyBins, with the same bins.
+static PyObject *AerospikeLazyBins_Type_RichCompare(AerospikeLazyBins *self,
+                                                    PyObject *py_other, int op)
+{
+    if ((op != Py_EQ && op != Py_NE) ||
+        !(PyDict_Check(py_other) ||
+          PyObject_TypeCheck(py_other, &AerospikeLazyBins_Type))) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+
+    PyObject *py_dict = lazy_bins_to_dict(self);
+    if (!py_dict) {
+        return NULL;
+    }
+
+    PyObject *py_result = NULL;
+    if (PyDict_Check(py_other)) {
+        py_result = PyObject_RichCompare(py_dict, py_other, op);
+    }
+    else {
+        PyObject *py_other_dict =
+            lazy_bins_to_dict((AerospikeLazyBins *)py_other);
+        if (py_other_dict) {
+            py_result = PyObject_RichCompare(py_dict, py_other_dict, op);
+            Py_DECREF(py_other_dict);
+        }
+    }
+    Py_DECREF(py_dict);
+    return py_result;
+}
+
+static PyObject *AerospikeLazyBins_Type_Repr(AerospikeLazyBins *self)
+{
+    PyObject *py_dict = lazy_bins_to_dict(self);
+    if (!py_dict) {
+        return NULL;
+    }
+    PyObject *py_repr = PyUnicode_FromFormat("LazyBins(%R)", py_dict);
+    Py_DECREF(py_dict);
+    return py_repr;
+}
+
+static int AerospikeLazyBins_Type_Traverse(AerospikeLazyBins *self,
+                                           visitproc visit, void *arg)
+{
+    Py_VISIT(self->client);
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_VISIT(self->bins[i].py_value);
+    }
+    return 0;
+}
+
+static int AerospikeLazyBins_Type_Clear(AerospikeLazyBins *self)
+{
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_CLEAR(self->bins[i].py_name);
+        Py_CLEAR(self->bins[i].py_value);
+        if (self->bins[i].val) {
+            as_val_destroy(self->bins[i].val);
+            self->bins[i].val = NULL;
+        }
+    }
+    Py_CLEAR(self->client);
+    return 0;
+}
+
+static void AerospikeLazyBins_Type_Dealloc(AerospikeLazyBins *self)
+{
+    PyObject_GC_UnTrack(self);
+    AerospikeLazyBins_Type_Clear(self);
+    cf_free(self->bins);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeLazyBins_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.LazyBins", // tp_name
+    sizeof(AerospikeLazyBins),                           // tp_basicsize
+    0,                                                   // tp_itemsize
+    (destructor)AerospikeLazyBins_Type_Dealloc,          // tp_dealloc
+    0,                                                   // tp_print
+    0,                                                   // tp_getattr
+    0,                                                   // tp_setattr
+    0,                                                   // tp_compare
+    (reprfunc)AerospikeLazyBins_Type_Repr,               // tp_repr
+    0,                                                   // tp_as_number
+    &AerospikeLazyBins_Type_Sequence,                    // tp_as_sequence
+    &AerospikeLazyBins_Type_Mapping,                     // tp_as_mapping
+    PyObject_HashNotImplemented,                         // tp_hash
+    0,                                                   // tp_call
+    0,                                                   // tp_str
+    0,                                                   // tp_getattro
+    0,                                                   // tp_setattro
+    0,                                                   // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,             // tp_flags
+    "The bins of a record returned with \"record_format\": \"lazy\". Values "
+    "are converted when first looked up.\n",
+    // tp_doc
+    (traverseproc)AerospikeLazyBins_Type_Traverse,       // tp_traverse
+    (inquiry)AerospikeLazyBins_Type_Clear,               // tp_clear
+    (richcmpfunc)AerospikeLazyBins_Type_RichCompare,     // tp_richcompare
+    0,                                                   // tp_weaklistoffset
+    (getiterfunc)AerospikeLazyBins_Type_Iter,            // tp_iter
+    0,                                                   // tp_iternext
+    AerospikeLazyBins_Type_Methods,                      // tp_methods
+    0,                                                   // tp_members
+    0,                                                   // tp_getset
+    0,                                                   // tp_base
+    0,                                                   // tp_dict
+    0,                                                   // tp_descr_get
+    0,                                                   // tp_descr_set
+    0,                                                   // tp_dictoffset
+    0,                                                   // tp_init
+    0,                                                   // tp_alloc
+    0,                                                   // tp_new
+    0,                                                   // tp_free
+    0,                                                   // tp_is_gc
+    0                                                    // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeLazyBins_Ready()
+{
+    return PyType_Ready(&AerospikeLazyBins_Type) == 0 ? &AerospikeLazyBins_Type
+                                                      : NULL;
+}
+
+PyObject *AerospikeLazyBins_New(AerospikeClient *client, as_error *err,
+                                const as_record *rec)
+{
+    AerospikeLazyBins *self =
+        PyObject_GC_New(AerospikeLazyBins, &AerospikeLazyBins_Type);
+    if (!self) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Failed to create lazy bins");
+        return NULL;
+    }
+
+    Py_INCREF(client);
+    self->client = client;
+    self->size = 0;
+    self->bins = NULL;
+
+    uint16_t n_bins = rec->bins.size;
+    if (n_bins) {
+        self->bins = cf_calloc(n_bins, sizeof(lazy_bin));
+    }
+
+    for (uint16_t i = 0; i < n_bins; i++) {
+        as_bin *bin = &rec->bins.entries[i];
+        as_val *val = (as_val *)bin->valuep;
+        if (!val) {
+            continue;
+        }
+
+        lazy_bin *entry = &self->bins[self->size];
+        entry->py_name = name_to_pyobject(bin->name);
+        if (!entry->py_name) {
+            PyErr_Clear();
+            as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                            "Unable to convert bin name");
+            goto FAIL;
+        }
+        self->size++;
+
+        if (val->free) {
+            // Heap allocated, so it can outlive the record.
+            entry->val = as_val_reserve(val);
+        }
+        else {
+            // Stored inside the record, convert it while it exists.
+            val_to_pyobject(client, err, val, &entry->py_value);
+            if (err->code != AEROSPIKE_OK) {
+                goto FAIL;
+            }
+        }
+    }
+
+    PyObject_GC_Track(self);
+    return (PyObject *)self;
+
+FAIL:
+    PyObject_GC_Track(self);
+    Py_DECREF(self);
+    return NULL;
+}
@@ -31,6 +31,9 @@
 
 #include "conversions.h"
 #include "policy.h"
+#include "async.h"
+#include "compiled_expression.h"
+#include "prepared_policy.h"
 #include "macros.h"
 
 #define MAP_WRITE_FLAGS_KEY "map_write_flags"
@@ -49,6 +52,29 @@
 
 #define POLICY_UPDATE() *policy_p = policy;
 
+/*
+ * A PreparedPolicy is converted from its dict by __convert the first time it
+ * is used for a kind of command and copied from the kept struct after that.
+ * __owner is the policy_generation of the client, so a kept struct is never
+ * used with the defaults of another client.
+ */
+#define POLICY_FROM_PREPARED(__kind, __owner, __convert)                       \
+    if (prepared_policy_check(py_policy)) {                                    \
+        as_error_reset(err);                                                   \
+        if (!prepared_policy_get(py_policy, __kind, __owner, policy,           \
+                                 sizeof(*policy))) {                           \
+            PyObject *py_prepared = py_policy;                                 \
+            py_policy = prepared_policy_dict(py_prepared);                     \
+            if (__convert != AEROSPIKE_OK) {                                   \
+                return err->code;                                              \
+            }                                                                  \
+            prepared_policy_set(py_prepared, __kind, __owner, policy,          \
+                                sizeof(*policy), exp_list_p);                  \
+        }                                                                      \
+        POLICY_UPDATE();                                                       \
+        return err->code;                                                      \
+    }
+
 #define POLICY_SET_FIELD(__field, __type)                                      \
     {                                                                          \
         PyObject *py_field = PyDict_GetItemString(py_policy, #__field);        \
@@ -82,7 +108,12 @@
         if (exp_list) {                                                        \
             PyObject *py_exp_list =                                            \
                 PyDict_GetItemString(py_policy, "expressions");                \
-            if (py_exp_list) {                                                 \
+            as_exp *compiled = compiled_expression_exp(py_exp_list);           \
+            if (compiled) {                                                    \
+                /* Borrowed, py_policy keeps it alive for the call. */         \
+                policy->base.filter_exp = compiled;                            \
+            }                                                                  \
+            else if (py_exp_list) {                                            \
                 if (convert_exp_list(self, py_exp_list, &exp_list, err) ==     \
                     AEROSPIKE_OK) {                                            \
                     policy->base.filter_exp = exp_list;                        \
@@ -96,7 +127,12 @@
     {                                                                          \
         PyObject *py_exp_list =                                                \
             PyDict_GetItemString(py_policy, "expressions");                    \
-        if (py_exp_list) {                                                     \
+        as_exp *compiled = compiled_expression_exp(py_exp_list);               \
+        if (compiled) {                                                        \
+            /* Borrowed, py_policy keeps it alive for the call. */             \
+            policy->filter_exp = compiled;                                     \
+        }                                                                      \
+        else if (py_exp_list) {                                                \
             if (convert_exp_list(self, py_exp_list, &exp_list, err) ==         \
                 AEROSPIKE_OK) {                                                \
                 policy->filter_exp = exp_list;                                 \
@@ -169,10 +205,13 @@ static AerospikeConstants aerospike_constants[] = {
     {SERIALIZER_PYTHON, "SERIALIZER_PYTHON"},
     {SERIALIZER_USER, "SERIALIZER_USER"},
     {SERIALIZER_JSON, "SERIALIZER_JSON"},
+    {SERIALIZER_MSGPACK, "SERIALIZER_MSGPACK"},
     {SERIALIZER_NONE, "SERIALIZER_NONE"},
     {SEND_BOOL_AS_PY_BYTES, "PY_BYTES"},
     {SEND_BOOL_AS_INTEGER, "INTEGER"},
     {SEND_BOOL_AS_AS_BOOL, "AS_BOOL"},
+    {ASYNC_LOOP_ROUND_ROBIN, "ASYNC_LOOP_ROUND_ROBIN"},
+    {ASYNC_LOOP_PARTITION, "ASYNC_LOOP_PARTITION"},
     {AS_INDEX_STRING, "INDEX_STRING"},
     {AS_INDEX_NUMERIC, "INDEX_NUMERIC"},
     {AS_INDEX_GEO2DSPHERE, "INDEX_GEO2DSPHERE"},
@@ -598,6 +637,11 @@ as_status pyobject_to_policy_admin(AerospikeClient *self, as_error *err,
                                    as_policy_admin **policy_p,
                                    as_policy_admin *config_admin_policy)
 {
+    as_exp **exp_list_p = NULL;
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_ADMIN, self->policy_generation,
+        pyobject_to_policy_admin(self, err, py_policy, policy, policy_p,
+                                 config_admin_policy));
 
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
@@ -628,6 +672,11 @@ as_status pyobject_to_policy_apply(AerospikeClient *self, as_error *err,
                                    as_policy_apply *config_apply_policy,
                                    as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_APPLY, self->policy_generation,
+        pyobject_to_policy_apply(self, err, py_policy, policy, policy_p,
+                                 config_apply_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_apply);
@@ -672,6 +721,9 @@ as_status pyobject_to_policy_info(as_error *err, PyObject *py_policy,
                                   as_policy_info **policy_p,
                                   as_policy_info *config_info_policy)
 {
+    // No client to key a kept copy on, and only three fields to convert.
+    py_policy = prepared_policy_dict(py_policy);
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_info);
@@ -704,6 +756,11 @@ as_status pyobject_to_policy_query(AerospikeClient *self, as_error *err,
                                    as_policy_query *config_query_policy,
                                    as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_QUERY, self->policy_generation,
+        pyobject_to_policy_query(self, err, py_policy, policy, policy_p,
+                                 config_query_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_query);
@@ -747,6 +804,11 @@ as_status pyobject_to_policy_read(AerospikeClient *self, as_error *err,
                                   as_policy_read *config_read_policy,
                                   as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_READ, self->policy_generation,
+        pyobject_to_policy_read(self, err, py_policy, policy, policy_p,
+                                config_read_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_read);
@@ -796,6 +858,11 @@ as_status pyobject_to_policy_remove(AerospikeClient *self, as_error *err,
                                     as_policy_remove *config_remove_policy,
                                     as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_REMOVE, self->policy_generation,
+        pyobject_to_policy_remove(self, err, py_policy, policy, policy_p,
+                                  config_remove_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_remove);
@@ -843,6 +910,11 @@ as_status pyobject_to_policy_scan(AerospikeClient *self, as_error *err,
                                   as_policy_scan *config_scan_policy,
                                   as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_SCAN, self->policy_generation,
+        pyobject_to_policy_scan(self, err, py_policy, policy, policy_p,
+                                config_scan_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_scan);
@@ -887,6 +959,11 @@ as_status pyobject_to_policy_write(AerospikeClient *self, as_error *err,
                                    as_policy_write *config_write_policy,
                                    as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_WRITE, self->policy_generation,
+        pyobject_to_policy_write(self, err, py_policy, policy, policy_p,
+                                 config_write_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_write);
@@ -936,6 +1013,12 @@ as_status pyobject_to_policy_operate(AerospikeClient *self, as_error *err,
                                      as_policy_operate *config_operate_policy,
                                      as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_OPERATE, self->policy_generation,
+        pyobject_to_policy_operate(self, err, py_policy, policy, policy_p,
+                                   config_operate_policy, exp_list,
+                                   exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_operate);
@@ -987,6 +1070,11 @@ as_status pyobject_to_policy_batch(AerospikeClient *self, as_error *err,
                                    as_policy_batch *config_batch_policy,
                                    as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_BATCH, self->policy_generation,
+        pyobject_to_policy_batch(self, err, py_policy, policy, policy_p,
+                                 config_batch_policy, exp_list, exp_list_p));
+
     if (py_policy && py_policy != Py_None) {
         // Initialize Policy
         POLICY_INIT(as_policy_batch);
@@ -1034,6 +1122,11 @@ as_status pyobject_to_batch_write_policy(AerospikeClient *self, as_error *err,
                                          as_policy_batch_write **policy_p,
                                          as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_BATCH_WRITE, self->policy_generation,
+        pyobject_to_batch_write_policy(self, err, py_policy, policy, policy_p,
+                                       exp_list, exp_list_p));
+
     POLICY_INIT(as_policy_batch_write);
 
     // Set policy fields
@@ -1059,6 +1152,11 @@ as_status pyobject_to_batch_read_policy(AerospikeClient *self, as_error *err,
                                         as_policy_batch_read **policy_p,
                                         as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_BATCH_READ, self->policy_generation,
+        pyobject_to_batch_read_policy(self, err, py_policy, policy, policy_p,
+                                      exp_list, exp_list_p));
+
     POLICY_INIT(as_policy_batch_read);
 
     // Set policy fields
@@ -1081,6 +1179,11 @@ as_status pyobject_to_batch_apply_policy(AerospikeClient *self, as_error *err,
                                          as_policy_batch_apply **policy_p,
                                          as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_BATCH_APPLY, self->policy_generation,
+        pyobject_to_batch_apply_policy(self, err, py_policy, policy, policy_p,
+                                       exp_list, exp_list_p));
+
     POLICY_INIT(as_policy_batch_apply);
 
     // Set policy fields
@@ -1105,6 +1208,11 @@ as_status pyobject_to_batch_remove_policy(AerospikeClient *self, as_error *err,
                                           as_policy_batch_remove **policy_p,
                                           as_exp *exp_list, as_exp **exp_list_p)
 {
+    POLICY_FROM_PREPARED(
+        PREPARED_POLICY_BATCH_REMOVE, self->policy_generation,
+        pyobject_to_batch_remove_policy(self, err, py_policy, policy, policy_p,
+                                        exp_list, exp_list_p));
+
     POLICY_INIT(as_policy_batch_remove);
 
     // Set policy fields
@@ -1293,3 +1401,93 @@ as_status pyobject_to_hll_policy(as_error *err, PyObject *py_policy,
 
     return AEROSPIKE_OK;
 }
+
+/**
+ * Reads the "record_format" entry of a scan, query or batch policy, which may
+ * be a prepared policy. A missing entry or None means the tuple form.
+ */
+as_status pyobject_to_record_format(as_error *err, PyObject *py_policy,
+                                    int *record_format)
+{
+    *record_format = RECORD_FORMAT_TUPLE;
+
+    if (!py_policy || py_policy == Py_None) {
+        return AEROSPIKE_OK;
+    }
+
+    py_policy = prepared_policy_dict(py_policy);
+    if (!PyDict_Check(py_policy)) {
+        return AEROSPIKE_OK;
+    }
+
+    PyObject *py_format = PyDict_GetItemString(py_policy, "record_format");
+    if (!py_format || py_format == Py_None) {
+        return AEROSPIKE_OK;
+    }
+
+    if (PyUnicode_Check(py_format)) {
+        if (PyUnicode_CompareWithASCIIString(py_format, "tuple") == 0) {
+            return AEROSPIKE_OK;
+        }
+        if (PyUnicode_CompareWithASCIIString(py_format, "compact") == 0) {
+            *record_format = RECORD_FORMAT_COMPACT;
+            return AEROSPIKE_OK;
+        }
+        if (PyUnicode_CompareWithASCIIString(py_format, "lazy") == 0) {
+            *record_format = RECORD_FORMAT_LAZY;
+            return AEROSPIKE_OK;
+        }
+    }
+
+    return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                           "record_format must be 'tuple', 'compact' or 'lazy'");
+}
+
+/**
+ * Converts a "missing" option, 'raise' or 'none', to whether a missing record
+ * is returned as None.
+ */
+as_status pyobject_to_missing(as_error *err, PyObject *py_missing,
+                              bool *missing_none)
+{
+    if (PyUnicode_Check(py_missing)) {
+        if (PyUnicode_CompareWithASCIIString(py_missing, "raise") == 0) {
+            *missing_none = false;
+            return AEROSPIKE_OK;
+        }
+        if (PyUnicode_CompareWithASCIIString(py_missing, "none") == 0) {
+            *missing_none = true;
+            return AEROSPIKE_OK;
+        }
+    }
+
+    return as_error_update(err, AEROSPIKE_ERR_PARAM,
+                           "missing must be 'raise' or 'none'");
+}
+
+/**
+ * Reads the "missing" entry of a read or operate policy, which may be a
+ * prepared policy. A missing entry or None means the client's "missing"
+ * setting.
+ */
+as_status pyobject_to_policy_missing(AerospikeClient *self, as_error *err,
+                                     PyObject *py_policy, bool *missing_none)
+{
+    *missing_none = self->missing_none;
+
+    if (!py_policy || py_policy == Py_None) {
+        return AEROSPIKE_OK;
+    }
+
+    py_policy = prepared_policy_dict(py_policy);
+    if (!PyDict_Check(py_policy)) {
+        return AEROSPIKE_OK;
+    }
+
+    PyObject *py_missing = PyDict_GetItemString(py_policy, "missing");
+    if (!py_missing || py_missing == Py_None) {
+        return AEROSPIKE_OK;
+    }
+
+    return pyobject_to_missing(err, py_missing, missing_none);
+}
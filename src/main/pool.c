@@ -0,0 +1,245 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include <aerospike/as_bytes.h>
+#include <aerospike/as_std.h>
+
+#include "pool.h"
+
+// Size of the first scratch chunk of a pool.
+#define AS_SCRATCH_CHUNK_SIZE 4096
+
+// Largest chunk, in bytes, a thread keeps for its next command.
+#define AS_POOL_CACHE_MAX (1024 * 1024)
+
+/*
+ * Chunks released by the last command of a thread, reused by its next one.
+ * Conversions run with the GIL held but the converted values are used after
+ * it is released, so each thread needs its own.
+ */
+typedef struct {
+    as_bytes_chunk *bytes;
+    as_scratch_chunk *scratch;
+} pool_cache;
+
+static pthread_key_t pool_cache_key;
+static pthread_once_t pool_cache_once = PTHREAD_ONCE_INIT;
+static bool pool_cache_ready = false;
+
+static void pool_cache_destroy(void *udata)
+{
+    pool_cache *cache = udata;
+    cf_free(cache->bytes);
+    cf_free(cache->scratch);
+    cf_free(cache);
+}
+
+static void pool_cache_key_create(void)
+{
+    pool_cache_ready =
+        pthread_key_create(&pool_cache_key, pool_cache_destroy) == 0;
+}
+
+/**
+ * Returns the cache of the calling thread, or NULL if it cannot be created,
+ * in which case chunks are simply allocated and freed.
+ */
+static pool_cache *get_pool_cache(void)
+{
+    pthread_once(&pool_cache_once, pool_cache_key_create);
+    if (!pool_cache_ready) {
+        return NULL;
+    }
+
+    pool_cache *cache = pthread_getspecific(pool_cache_key);
+    if (!cache) {
+        cache = cf_calloc(1, sizeof(pool_cache));
+        if (cache && pthread_setspecific(pool_cache_key, cache) != 0) {
+            cf_free(cache);
+            cache = NULL;
+        }
+    }
+    return cache;
+}
+
+static as_bytes_chunk *bytes_chunk_new(uint32_t capacity)
+{
+    pool_cache *cache = get_pool_cache();
+    if (cache && cache->bytes && cache->bytes->capacity >= capacity) {
+        as_bytes_chunk *chunk = cache->bytes;
+        cache->bytes = NULL;
+        return chunk;
+    }
+
+    as_bytes_chunk *chunk =
+        cf_malloc(sizeof(as_bytes_chunk) + capacity * sizeof(as_bytes));
+    if (chunk) {
+        chunk->capacity = capacity;
+    }
+    return chunk;
+}
+
+static as_scratch_chunk *scratch_chunk_new(size_t capacity)
+{
+    pool_cache *cache = get_pool_cache();
+    if (cache && cache->scratch && cache->scratch->capacity >= capacity) {
+        as_scratch_chunk *chunk = cache->scratch;
+        cache->scratch = NULL;
+        return chunk;
+    }
+
+    as_scratch_chunk *chunk = cf_malloc(sizeof(as_scratch_chunk) + capacity);
+    if (chunk) {
+        chunk->capacity = capacity;
+    }
+    return chunk;
+}
+
+as_bytes *static_pool_get_bytes(as_static_pool *static_pool)
+{
+    if (static_pool->current_bytes_id < AS_STATIC_POOL_SIZE) {
+        return &static_pool->bytes_pool[static_pool->current_bytes_id++];
+    }
+
+    as_bytes_chunk *chunk = static_pool->chunks;
+    if (!chunk || chunk->size == chunk->capacity) {
+        as_bytes_chunk *next = bytes_chunk_new(
+            chunk ? chunk->capacity * 2 : AS_STATIC_POOL_SIZE * 2);
+        if (!next) {
+            return NULL;
+        }
+        next->next = chunk;
+        next->size = 0;
+        static_pool->chunks = next;
+        chunk = next;
+    }
+
+    static_pool->current_bytes_id++;
+    return &chunk->entries[chunk->size++];
+}
+
+void *static_pool_alloc(as_static_pool *static_pool, size_t size)
+{
+    size = (size + 7) & ~(size_t)7;
+
+    as_scratch_chunk *chunk = static_pool->scratch;
+    if (!chunk || chunk->capacity - chunk->used < size) {
+        size_t capacity = chunk ? chunk->capacity * 2 : AS_SCRATCH_CHUNK_SIZE;
+        while (capacity < size) {
+            capacity *= 2;
+        }
+        as_scratch_chunk *next = scratch_chunk_new(capacity);
+        if (!next) {
+            return NULL;
+        }
+        next->next = chunk;
+        next->used = 0;
+        static_pool->scratch = next;
+        chunk = next;
+    }
+
+    void *ptr = (char *)chunk->data + chunk->used;
+    chunk->used += size;
+    return ptr;
+}
+
+bool static_pool_hold_buffer(as_static_pool *static_pool, Py_buffer *view)
+{
+    if (static_pool->buffers_size == static_pool->buffers_capacity) {
+        uint32_t capacity = static_pool->buffers_capacity
+                                ? static_pool->buffers_capacity * 2
+                                : 4;
+        Py_buffer *buffers = cf_realloc(static_pool->buffers,
+                                        capacity * sizeof(Py_buffer));
+        if (!buffers) {
+            return false;
+        }
+        static_pool->buffers = buffers;
+        static_pool->buffers_capacity = capacity;
+    }
+
+    static_pool->buffers[static_pool->buffers_size++] = *view;
+    return true;
+}
+
+void static_pool_release(as_static_pool *static_pool, bool destroy_entries)
+{
+    if (destroy_entries) {
+        uint32_t count = static_pool->current_bytes_id < AS_STATIC_POOL_SIZE
+                             ? static_pool->current_bytes_id
+                             : AS_STATIC_POOL_SIZE;
+        for (uint32_t i = 0; i < count; i++) {
+            as_bytes_destroy(&static_pool->bytes_pool[i]);
+        }
+    }
+
+    // Keep the largest chunk of each kind that is not too large for the next
+    // command of this thread, and free the others.
+    pool_cache *cache = get_pool_cache();
+
+    as_bytes_chunk *chunk = static_pool->chunks;
+    while (chunk) {
+        as_bytes_chunk *next = chunk->next;
+        if (destroy_entries) {
+            for (uint32_t i = 0; i < chunk->size; i++) {
+                as_bytes_destroy(&chunk->entries[i]);
+            }
+        }
+        if (cache &&
+            chunk->capacity * sizeof(as_bytes) <= AS_POOL_CACHE_MAX &&
+            (!cache->bytes || cache->bytes->capacity < chunk->capacity)) {
+            cf_free(cache->bytes);
+            cache->bytes = chunk;
+        }
+        else {
+            cf_free(chunk);
+        }
+        chunk = next;
+    }
+
+    as_scratch_chunk *scratch = static_pool->scratch;
+    while (scratch) {
+        as_scratch_chunk *next = scratch->next;
+        if (cache && scratch->capacity <= AS_POOL_CACHE_MAX &&
+            (!cache->scratch || cache->scratch->capacity < scratch->capacity)) {
+            cf_free(cache->scratch);
+            cache->scratch = scratch;
+        }
+        else {
+            cf_free(scratch);
+        }
+        scratch = next;
+    }
+
+    // Released last, the destroyed entries may have used their memory.
+    for (uint32_t i = 0; i < static_pool->buffers_size; i++) {
+        PyBuffer_Release(&static_pool->buffers[i]);
+    }
+    cf_free(static_pool->buffers);
+
+    static_pool->chunks = NULL;
+    static_pool->scratch = NULL;
+    static_pool->current_bytes_id = 0;
+    static_pool->buffers = NULL;
+    static_pool->buffers_size = 0;
+    static_pool->buffers_capacity = 0;
+}
@@ -0,0 +1,212 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+#include <aerospike/as_error.h>
+#include <aerospike/as_operations.h>
+#include <aerospike/as_vector.h>
+#include <aerospike/as_std.h>
+
+#include "operate.h"
+#include "prepared_operations.h"
+
+static void
+AerospikePreparedOperations_Type_Dealloc(AerospikePreparedOperations *self)
+{
+    as_operations_destroy(&self->ops);
+
+    if (self->unicodeStrVector) {
+        for (unsigned int i = 0; i < self->unicodeStrVector->size; i++) {
+            free(as_vector_get_ptr(self->unicodeStrVector, i));
+        }
+        as_vector_destroy(self->unicodeStrVector);
+    }
+
+    // Pooled bytes are owned by the operations they were added to, so the
+    // pool itself is only freed, as in operate().
+    if (self->static_pool) {
+        POOL_FREE(self->static_pool);
+        cf_free(self->static_pool);
+    }
+
+    Py_CLEAR(self->py_ops);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+AerospikePreparedOperations_Type_Repr(AerospikePreparedOperations *self)
+{
+    return PyUnicode_FromFormat("<aerospike.PreparedOperations %u ops>",
+                                self->ops.binops.size);
+}
+
+static Py_ssize_t
+AerospikePreparedOperations_Type_Len(AerospikePreparedOperations *self)
+{
+    return (Py_ssize_t)self->ops.binops.size;
+}
+
+static PySequenceMethods AerospikePreparedOperations_Type_Sequence = {
+    (lenfunc)AerospikePreparedOperations_Type_Len, // sq_length
+};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikePreparedOperations_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.PreparedOperations", // tp_name
+    sizeof(AerospikePreparedOperations), // tp_basicsize
+    0,                                   // tp_itemsize
+    (destructor)AerospikePreparedOperations_Type_Dealloc,
+    // tp_dealloc
+    0,                                                // tp_print
+    0,                                                // tp_getattr
+    0,                                                // tp_setattr
+    0,                                                // tp_compare
+    (reprfunc)AerospikePreparedOperations_Type_Repr,  // tp_repr
+    0,                                                // tp_as_number
+    &AerospikePreparedOperations_Type_Sequence,       // tp_as_sequence
+    0,                                                // tp_as_mapping
+    0,                                                // tp_hash
+    0,                                                // tp_call
+    0,                                                // tp_str
+    0,                                                // tp_getattro
+    0,                                                // tp_setattro
+    0,                                                // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,
+    // tp_flags
+    "An operation list converted once by Client.prepare_operations(), "
+    "usable in place of the list in operate() and operate_ordered().\n",
+    // tp_doc
+    0, // tp_traverse
+    0, // tp_clear
+    0, // tp_richcompare
+    0, // tp_weaklistoffset
+    0, // tp_iter
+    0, // tp_iternext
+    0, // tp_methods
+    0, // tp_members
+    0, // tp_getset
+    0, // tp_base
+    0, // tp_dict
+    0, // tp_descr_get
+    0, // tp_descr_set
+    0, // tp_dictoffset
+    0, // tp_init
+    0, // tp_alloc
+    0, // tp_new
+    0, // tp_free
+    0, // tp_is_gc
+    0  // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikePreparedOperations_Ready()
+{
+    return PyType_Ready(&AerospikePreparedOperations_Type) == 0
+               ? &AerospikePreparedOperations_Type
+               : NULL;
+}
+
+PyObject *AerospikePreparedOperations_New(AerospikeClient *client,
+                                          as_error *err, PyObject *py_list)
+{
+    long operation;
+    long return_type = -1;
+
+    if (!py_list || !PyList_Check(py_list)) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "Operations should be of type list");
+        return NULL;
+    }
+
+    Py_ssize_t size = PyList_Size(py_list);
+    if (size == 0) {
+        as_error_update(err, AEROSPIKE_ERR_PARAM,
+                        "Operations list should not be empty");
+        return NULL;
+    }
+
+    AerospikePreparedOperations *self =
+        (AerospikePreparedOperations *)AerospikePreparedOperations_Type
+            .tp_alloc(&AerospikePreparedOperations_Type, 0);
+    if (!self) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to allocate prepared operations");
+        return NULL;
+    }
+
+    as_operations_init(&self->ops, (uint16_t)size);
+    self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
+    self->static_pool = cf_calloc(1, sizeof(as_static_pool));
+    self->py_ops = PyTuple_New(size);
+
+    if (!self->static_pool || !self->py_ops) {
+        as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                        "Unable to allocate prepared operations");
+        goto CLEANUP;
+    }
+
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *py_op = PyList_GetItem(py_list, i);
+
+        if (!PyDict_Check(py_op)) {
+            as_error_update(err, AEROSPIKE_ERR_PARAM,
+                            "Operation must be a dict");
+            goto CLEANUP;
+        }
+
+        // The caller may mutate or drop its dicts after preparing, while the
+        // converted operations still point into their strings.
+        PyObject *py_op_copy = PyDict_Copy(py_op);
+        if (!py_op_copy) {
+            PyErr_Clear();
+            as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                            "Unable to copy operation");
+            goto CLEANUP;
+        }
+        PyTuple_SET_ITEM(self->py_ops, i, py_op_copy);
+
+        if (add_op(client, err, py_op_copy, self->unicodeStrVector,
+                   self->static_pool, &self->ops, &operation,
+                   &return_type) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+    }
+
+CLEANUP:
+    if (err->code != AEROSPIKE_OK) {
+        Py_DECREF(self);
+        return NULL;
+    }
+
+    return (PyObject *)self;
+}
+
+as_operations *prepared_operations_ops(PyObject *py_obj)
+{
+    if (py_obj && Py_TYPE(py_obj) == &AerospikePreparedOperations_Type) {
+        return &((AerospikePreparedOperations *)py_obj)->ops;
+    }
+    return NULL;
+}
@@ -0,0 +1,182 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+#include <string.h>
+
+#include <aerospike/as_exp.h>
+#include <aerospike/as_std.h>
+
+#include "prepared_policy.h"
+
+static void AerospikePreparedPolicy_Type_Dealloc(AerospikePreparedPolicy *self)
+{
+    for (int i = 0; i < PREPARED_POLICY_KINDS; i++) {
+        AerospikePreparedPolicySlot *slot = &self->slots[i];
+        if (slot->exp) {
+            as_exp_destroy(slot->exp);
+        }
+        cf_free(slot->policy);
+    }
+
+    Py_CLEAR(self->py_policy);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *AerospikePreparedPolicy_Type_Repr(AerospikePreparedPolicy *self)
+{
+    return PyUnicode_FromFormat("<aerospike.PreparedPolicy %R>",
+                                self->py_policy);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikePreparedPolicy_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.PreparedPolicy", // tp_name
+    sizeof(AerospikePreparedPolicy), // tp_basicsize
+    0,                               // tp_itemsize
+    (destructor)AerospikePreparedPolicy_Type_Dealloc,
+    // tp_dealloc
+    0,                                            // tp_print
+    0,                                            // tp_getattr
+    0,                                            // tp_setattr
+    0,                                            // tp_compare
+    (reprfunc)AerospikePreparedPolicy_Type_Repr,  // tp_repr
+    0,                                            // tp_as_number
+    0,                                            // tp_as_sequence
+    0,                                            // tp_as_mapping
+    0,                                            // tp_hash
+    0,                                            // tp_call
+    0,                                            // tp_str
+    0,                                            // tp_getattro
+    0,                                            // tp_setattro
+    0,                                            // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,
+    // tp_flags
+    "A policy dict frozen by Client.prepare_policy(), usable wherever a "
+    "policy dict is accepted.\n",
+    // tp_doc
+    0, // tp_traverse
+    0, // tp_clear
+    0, // tp_richcompare
+    0, // tp_weaklistoffset
+    0, // tp_iter
+    0, // tp_iternext
+    0, // tp_methods
+    0, // tp_members
+    0, // tp_getset
+    0, // tp_base
+    0, // tp_dict
+    0, // tp_descr_get
+    0, // tp_descr_set
+    0, // tp_dictoffset
+    0, // tp_init
+    0, // tp_alloc
+    0, // tp_new
+    0, // tp_free
+    0, // tp_is_gc
+    0  // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikePreparedPolicy_Ready()
+{
+    return PyType_Ready(&AerospikePreparedPolicy_Type) == 0
+               ? &AerospikePreparedPolicy_Type
+               : NULL;
+}
+
+PyObject *AerospikePreparedPolicy_New(PyObject *py_policy)
+{
+    AerospikePreparedPolicy *self =
+        (AerospikePreparedPolicy *)AerospikePreparedPolicy_Type.tp_alloc(
+            &AerospikePreparedPolicy_Type, 0);
+    if (!self) {
+        return NULL;
+    }
+
+    // Copied so later changes to the caller's dict cannot leave the kept
+    // policies stale.
+    self->py_policy = PyDict_Copy(py_policy);
+    if (!self->py_policy) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    return (PyObject *)self;
+}
+
+bool prepared_policy_check(PyObject *py_obj)
+{
+    return py_obj && Py_TYPE(py_obj) == &AerospikePreparedPolicy_Type;
+}
+
+PyObject *prepared_policy_dict(PyObject *py_obj)
+{
+    if (prepared_policy_check(py_obj)) {
+        return ((AerospikePreparedPolicy *)py_obj)->py_policy;
+    }
+    return py_obj;
+}
+
+uint64_t prepared_policy_next_generation(void)
+{
+    static uint64_t generation = 0;
+    return __atomic_add_fetch(&generation, 1, __ATOMIC_RELAXED);
+}
+
+bool prepared_policy_get(PyObject *py_obj, int kind, uint64_t owner,
+                         void *policy, size_t size)
+{
+    AerospikePreparedPolicySlot *slot =
+        &((AerospikePreparedPolicy *)py_obj)->slots[kind];
+
+    if (!slot->policy || slot->owner != owner) {
+        return false;
+    }
+    memcpy(policy, slot->policy, size);
+    return true;
+}
+
+void prepared_policy_set(PyObject *py_obj, int kind, uint64_t owner,
+                         const void *policy, size_t size, as_exp **exp_list_p)
+{
+    AerospikePreparedPolicySlot *slot =
+        &((AerospikePreparedPolicy *)py_obj)->slots[kind];
+
+    // A policy shared by several clients is only kept for the first one.
+    // Replacing it could free an expression a running command still uses.
+    if (slot->policy) {
+        return;
+    }
+
+    slot->policy = cf_malloc(size);
+    if (!slot->policy) {
+        return;
+    }
+    memcpy(slot->policy, policy, size);
+    slot->owner = owner;
+
+    if (exp_list_p && *exp_list_p) {
+        slot->exp = *exp_list_p;
+        *exp_list_p = NULL;
+    }
+}
@@ -47,10 +47,6 @@ AerospikeQuery *AerospikeQuery_Add_Ops(AerospikeQuery *self, PyObject *args,
     long operation;
     self->unicodeStrVector = as_vector_create(sizeof(char *), 128);
 
-    as_static_pool static_pool;
-    memset(&static_pool, 0, sizeof(static_pool));
-    self->static_pool = &static_pool;
-
     as_error err;
     as_error_init(&err);
 
@@ -0,0 +1,202 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_query.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_query.h>
+#include <aerospike/as_arraylist.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "query.h"
+#include "policy.h"
+#include "results_iterator.h"
+#include "prepared_policy.h"
+
+// Results buffered by iter_results() unless queue_size is given.
+#define DEFAULT_QUEUE_SIZE 1000
+
+// Everything the background thread needs once iter_results() has returned.
+typedef struct {
+    AerospikeQuery *query;
+    as_policy_query policy;
+    as_policy_query *policy_p;
+    as_exp exp_list;
+    as_exp *exp_list_p;
+    as_partition_filter partition_filter;
+    as_partition_filter *partition_filter_p;
+    as_partitions_status *ps;
+    // Owner of a filter expression borrowed by policy.
+    PyObject *py_exp_owner;
+} QueryJob;
+
+static void query_job_run(AerospikeResultsIterator *iterator, as_error *err)
+{
+    QueryJob *job = (QueryJob *)iterator->job;
+    AerospikeQuery *self = job->query;
+
+    if (job->partition_filter_p) {
+        if (job->ps) {
+            as_partition_filter_set_partitions(job->partition_filter_p,
+                                               job->ps);
+        }
+        aerospike_query_partitions(self->client->as, err, job->policy_p,
+                                   &self->query, job->partition_filter_p,
+                                   results_iterator_each_result, iterator);
+    }
+    else {
+        aerospike_query_foreach(self->client->as, err, job->policy_p,
+                                &self->query, results_iterator_each_result,
+                                iterator);
+    }
+}
+
+static void query_job_destroy(void *udata)
+{
+    QueryJob *job = (QueryJob *)udata;
+
+    if (job->exp_list_p) {
+        as_exp_destroy(job->exp_list_p);
+    }
+    if (job->ps) {
+        as_partitions_status_release(job->ps);
+    }
+    Py_XDECREF(job->py_exp_owner);
+    if (job->query->query.apply.arglist) {
+        as_arraylist_destroy((as_arraylist *)job->query->query.apply.arglist);
+    }
+    job->query->query.apply.arglist = NULL;
+
+    cf_free(job);
+}
+
+PyObject *AerospikeQuery_Iter_Results(AerospikeQuery *self, PyObject *args,
+                                      PyObject *kwds)
+{
+    PyObject *py_policy = NULL;
+    PyObject *py_options = NULL;
+    unsigned int queue_size = DEFAULT_QUEUE_SIZE;
+    AerospikeResultsIterator *iterator = NULL;
+    int record_format = RECORD_FORMAT_TUPLE;
+    QueryJob *job = NULL;
+
+    static char *kwlist[] = {"policy", "options", "queue_size", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOI:iter_results", kwlist,
+                                    &py_policy, &py_options,
+                                    &queue_size) == false) {
+        return NULL;
+    }
+
+    as_error err;
+    as_error_init(&err);
+
+    if (!self || !self->client->as) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+        goto CLEANUP;
+    }
+
+    if (!self->client->is_conn_16) {
+        as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (queue_size == 0) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                        "queue_size must be greater than 0");
+        goto CLEANUP;
+    }
+
+    job = cf_malloc(sizeof(QueryJob));
+    memset(job, 0, sizeof(QueryJob));
+    job->query = self;
+
+    // Convert python policy object to as_policy_query
+    pyobject_to_policy_query(self->client, &err, py_policy, &job->policy,
+                             &job->policy_p,
+                             &self->client->as->config.policies.query,
+                             &job->exp_list, &job->exp_list_p);
+    if (err.code != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    if (job->policy.base.filter_exp && !job->exp_list_p) {
+        // Either a PreparedPolicy or a CompiledExpression owns the
+        // expression.
+        job->py_exp_owner =
+            prepared_policy_check(py_policy)
+                ? py_policy
+                : PyDict_GetItemString(py_policy, "expressions");
+        Py_INCREF(job->py_exp_owner);
+    }
+
+    if (pyobject_to_record_format(&err, py_policy, &record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (set_query_options(&err, py_options, &self->query) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (py_policy) {
+        PyObject *py_partition_filter = PyDict_GetItemString(
+            prepared_policy_dict(py_policy), "partition_filter");
+        if (py_partition_filter) {
+            if (convert_partition_filter(self->client, py_partition_filter,
+                                         &job->partition_filter, &job->ps,
+                                         &err) != AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
+            job->partition_filter_p = &job->partition_filter;
+        }
+    }
+    as_error_reset(&err);
+
+    iterator = AerospikeResultsIterator_New(self->client, (PyObject *)self,
+                                            queue_size);
+    if (!iterator) {
+        goto CLEANUP;
+    }
+    iterator->record_format = record_format;
+
+    // The iterator owns the job from here on, even if starting fails.
+    AerospikeResultsIterator_Start(iterator, &err, job, query_job_run,
+                                   query_job_destroy);
+    job = NULL;
+
+CLEANUP:
+
+    if (job) {
+        query_job_destroy(job);
+    }
+
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(iterator);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return (PyObject *)iterator;
+}
@@ -28,6 +28,7 @@
 #include "exceptions.h"
 #include "query.h"
 #include "policy.h"
+#include "prepared_policy.h"
 
 #undef TRACE
 #define TRACE()
@@ -35,6 +36,7 @@
 typedef struct {
     PyObject *py_results;
     AerospikeClient *client;
+    int record_format;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -53,7 +55,8 @@ static bool each_result(const as_val *val, void *udata)
     PyGILState_STATE gstate;
     gstate = PyGILState_Ensure();
 
-    val_to_pyobject(data->client, &err, val, &py_result);
+    result_to_pyobject(data->client, &err, val, data->record_format,
+                       &py_result);
 
     if (py_result) {
         PyList_Append(py_results, py_result);
@@ -114,13 +117,18 @@ PyObject *AerospikeQuery_Results(AerospikeQuery *self, PyObject *args,
         goto CLEANUP;
     }
 
+    if (pyobject_to_record_format(&err, py_policy, &data.record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     if (set_query_options(&err, py_options, &self->query) != AEROSPIKE_OK) {
         goto CLEANUP;
     }
 
     if (py_policy) {
-        PyObject *py_partition_filter =
-            PyDict_GetItemString(py_policy, "partition_filter");
+        PyObject *py_partition_filter = PyDict_GetItemString(
+            prepared_policy_dict(py_policy), "partition_filter");
         if (py_partition_filter) {
             if (convert_partition_filter(self->client, py_partition_filter,
                                          &partition_filter, &ps,
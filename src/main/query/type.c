@@ -52,6 +52,18 @@ PyDoc_STRVAR(results_doc, "results([policy]) -> list of (key, meta, bins)\n\
 \n\
 Buffer the records resulting from the query, and return them as a list of records.");
 
+PyDoc_STRVAR(results_columnar_doc,
+             "results_columnar(bins[, policy[, options]]) -> {bin: (array, bytearray)}\n\
+\n\
+Collect the numeric values of the given bins from the query into one array per bin, with a \
+bytearray marking which rows hold a value.");
+
+PyDoc_STRVAR(iter_results_doc,
+             "iter_results([policy [, options [, queue_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Return an iterator over the records resulting from the query. At most queue_size records are \
+buffered, the query is paused while the buffer is full and aborted when the iterator is closed.");
+
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
 Set a filter on the record bins resulting from results() or foreach(). \
@@ -98,6 +110,12 @@ static PyMethodDef AerospikeQuery_Type_Methods[] = {
     {"results", (PyCFunction)AerospikeQuery_Results,
      METH_VARARGS | METH_KEYWORDS, results_doc},
 
+    {"iter_results", (PyCFunction)AerospikeQuery_Iter_Results,
+     METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
+    {"results_columnar", (PyCFunction)AerospikeQuery_Results_Columnar,
+     METH_VARARGS | METH_KEYWORDS, results_columnar_doc},
+
     {"select", (PyCFunction)AerospikeQuery_Select, METH_VARARGS | METH_KEYWORDS,
      select_doc},
 
@@ -213,7 +231,14 @@ static int AerospikeQuery_Type_Init(AerospikeQuery *self, PyObject *args,
     }
 
     self->unicodeStrVector = NULL;
-    self->static_pool = NULL;
+    // Values converted by where(), add_ops() and apply() are kept in the
+    // query, so the bytes they reference live as long as the query object.
+    self->static_pool = cf_calloc(1, sizeof(as_static_pool));
+    if (!self->static_pool) {
+        as_error_update(&err, AEROSPIKE_ERR_CLIENT,
+                        "Cannot allocate the query bytes pool");
+        goto CLEANUP;
+    }
     as_query_init(&self->query, namespace, set);
 
 CLEANUP:
@@ -258,6 +283,12 @@ static void AerospikeQuery_Type_Dealloc(AerospikeQuery *self)
 
     as_query_destroy(&self->query);
 
+    // The pooled bytes were destroyed along with the query.
+    if (self->static_pool) {
+        POOL_FREE(self->static_pool);
+        cf_free(self->static_pool);
+    }
+
     if (self->unicodeStrVector != NULL) {
         for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
             free(as_vector_get_ptr(self->unicodeStrVector, i));
@@ -58,12 +58,10 @@ static int AerospikeQuery_Where_Add(AerospikeQuery *self, PyObject *py_ctx,
     int rc = 0;
 
     if (py_ctx) {
-        as_static_pool static_pool;
-        memset(&static_pool, 0, sizeof(static_pool));
         pctx = cf_malloc(sizeof(as_cdt_ctx));
         memset(pctx, 0, sizeof(as_cdt_ctx));
         if (get_cdt_ctx(self->client, &err, pctx, py_ctx, &ctx_in_use,
-                        &static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
+                        self->static_pool, SERIALIZER_PYTHON) != AEROSPIKE_OK) {
             return err.code;
         }
         if (!ctx_in_use) {
@@ -0,0 +1,228 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <structmember.h>
+#include <stdbool.h>
+
+#include "record.h"
+
+static int AerospikeRecord_Type_Traverse(AerospikeRecord *self,
+                                         visitproc visit, void *arg)
+{
+    Py_VISIT(self->key);
+    Py_VISIT(self->bins);
+    return 0;
+}
+
+static int AerospikeRecord_Type_Clear(AerospikeRecord *self)
+{
+    Py_CLEAR(self->key);
+    Py_CLEAR(self->bins);
+    return 0;
+}
+
+static void AerospikeRecord_Type_Dealloc(AerospikeRecord *self)
+{
+    PyObject_GC_UnTrack(self);
+    AerospikeRecord_Type_Clear(self);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *AerospikeRecord_Type_Repr(AerospikeRecord *self)
+{
+    if (!self->has_meta) {
+        return PyUnicode_FromFormat(
+            "Record(key=%R, gen=None, ttl=None, bins=%R)", self->key,
+            self->bins);
+    }
+    return PyUnicode_FromFormat("Record(key=%R, gen=%u, ttl=%u, bins=%R)",
+                                self->key, (unsigned int)self->gen,
+                                (unsigned int)self->ttl, self->bins);
+}
+
+/*******************************************************************************
+ * ATTRIBUTES
+ ******************************************************************************/
+
+static PyObject *AerospikeRecord_Get_Key(AerospikeRecord *self, void *closure)
+{
+    Py_INCREF(self->key);
+    return self->key;
+}
+
+static PyObject *AerospikeRecord_Get_Bins(AerospikeRecord *self, void *closure)
+{
+    Py_INCREF(self->bins);
+    return self->bins;
+}
+
+static PyObject *AerospikeRecord_Get_Gen(AerospikeRecord *self, void *closure)
+{
+    if (!self->has_meta) {
+        Py_RETURN_NONE;
+    }
+    return PyLong_FromUnsignedLong(self->gen);
+}
+
+static PyObject *AerospikeRecord_Get_TTL(AerospikeRecord *self, void *closure)
+{
+    if (!self->has_meta) {
+        Py_RETURN_NONE;
+    }
+    return PyLong_FromUnsignedLong(self->ttl);
+}
+
+// Built on every access, like the meta dict of the tuple form.
+static PyObject *AerospikeRecord_Get_Meta(AerospikeRecord *self, void *closure)
+{
+    if (!self->has_meta) {
+        Py_RETURN_NONE;
+    }
+    return Py_BuildValue("{s:k,s:k}", "ttl", (unsigned long)self->ttl, "gen",
+                         (unsigned long)self->gen);
+}
+
+static PyGetSetDef AerospikeRecord_Type_GetSet[] = {
+    {"key", (getter)AerospikeRecord_Get_Key, NULL,
+     "The key tuple of the record.", NULL},
+    {"gen", (getter)AerospikeRecord_Get_Gen, NULL,
+     "The generation of the record, None if it was not found.", NULL},
+    {"ttl", (getter)AerospikeRecord_Get_TTL, NULL,
+     "The time to live of the record, None if it was not found.", NULL},
+    {"meta", (getter)AerospikeRecord_Get_Meta, NULL,
+     "A {'ttl': ..., 'gen': ...} dict, None if the record was not found.",
+     NULL},
+    {"bins", (getter)AerospikeRecord_Get_Bins, NULL,
+     "The bins of the record, None if it was not found.", NULL},
+    {NULL}};
+
+/*******************************************************************************
+ * SEQUENCE, so key, meta, bins = record keeps working.
+ ******************************************************************************/
+
+static Py_ssize_t AerospikeRecord_Type_Len(AerospikeRecord *self) { return 3; }
+
+static PyObject *AerospikeRecord_Type_Item(AerospikeRecord *self,
+                                           Py_ssize_t i)
+{
+    switch (i) {
+    case 0:
+        return AerospikeRecord_Get_Key(self, NULL);
+    case 1:
+        return AerospikeRecord_Get_Meta(self, NULL);
+    case 2:
+        return AerospikeRecord_Get_Bins(self, NULL);
+    default:
+        PyErr_SetString(PyExc_IndexError, "record index out of range");
+        return NULL;
+    }
+}
+
+static PySequenceMethods AerospikeRecord_Type_Sequence = {
+    (lenfunc)AerospikeRecord_Type_Len,       // sq_length
+    0,                                       // sq_concat
+    0,                                       // sq_repeat
+    (ssizeargfunc)AerospikeRecord_Type_Item, // sq_item
+};
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeRecord_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.Record", // tp_name
+    sizeof(AerospikeRecord),                           // tp_basicsize
+    0,                                                 // tp_itemsize
+    (destructor)AerospikeRecord_Type_Dealloc,          // tp_dealloc
+    0,                                                 // tp_print
+    0,                                                 // tp_getattr
+    0,                                                 // tp_setattr
+    0,                                                 // tp_compare
+    (reprfunc)AerospikeRecord_Type_Repr,               // tp_repr
+    0,                                                 // tp_as_number
+    &AerospikeRecord_Type_Sequence,                    // tp_as_sequence
+    0,                                                 // tp_as_mapping
+    0,                                                 // tp_hash
+    0,                                                 // tp_call
+    0,                                                 // tp_str
+    0,                                                 // tp_getattro
+    0,                                                 // tp_setattro
+    0,                                                 // tp_as_buffer
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,           // tp_flags
+    "A record returned with \"record_format\": \"compact\". Unpacks as "
+    "(key, meta, bins).\n",
+    // tp_doc
+    (traverseproc)AerospikeRecord_Type_Traverse, // tp_traverse
+    (inquiry)AerospikeRecord_Type_Clear,         // tp_clear
+    0,                                           // tp_richcompare
+    0,                                           // tp_weaklistoffset
+    0,                                           // tp_iter
+    0,                                           // tp_iternext
+    0,                                           // tp_methods
+    0,                                           // tp_members
+    AerospikeRecord_Type_GetSet,                 // tp_getset
+    0,                                           // tp_base
+    0,                                           // tp_dict
+    0,                                           // tp_descr_get
+    0,                                           // tp_descr_set
+    0,                                           // tp_dictoffset
+    0,                                           // tp_init
+    0,                                           // tp_alloc
+    0,                                           // tp_new
+    0,                                           // tp_free
+    0,                                           // tp_is_gc
+    0                                            // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeRecord_Ready()
+{
+    return PyType_Ready(&AerospikeRecord_Type) == 0 ? &AerospikeRecord_Type
+                                                    : NULL;
+}
+
+PyObject *AerospikeRecord_New(PyObject *py_key, PyObject *py_bins,
+                              uint16_t gen, uint32_t ttl, bool has_meta)
+{
+    AerospikeRecord *self = PyObject_GC_New(AerospikeRecord, &AerospikeRecord_Type);
+    if (!self) {
+        Py_XDECREF(py_key);
+        Py_XDECREF(py_bins);
+        return NULL;
+    }
+
+    if (!py_key) {
+        Py_INCREF(Py_None);
+        py_key = Py_None;
+    }
+    if (!py_bins) {
+        Py_INCREF(Py_None);
+        py_bins = Py_None;
+    }
+
+    self->key = py_key;
+    self->bins = py_bins;
+    self->gen = gen;
+    self->ttl = ttl;
+    self->has_meta = has_meta;
+
+    PyObject_GC_Track(self);
+    return (PyObject *)self;
+}
@@ -0,0 +1,514 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <errno.h>
+#include <fcntl.h>
+#include <pthread.h>
+#include <stdbool.h>
+#include <time.h>
+#include <unistd.h>
+
+#include <aerospike/as_error.h>
+
+#include "conversions.h"
+#include "exceptions.h"
+#include "results_iterator.h"
+
+// How long next() waits before checking for signals, in milliseconds.
+#define RESULTS_ITERATOR_POLL_MS 100
+
+/*******************************************************************************
+ * PRODUCER
+ ******************************************************************************/
+
+/*
+ * Makes fileno() readable, if anyone asked for it. Called with lock held.
+ */
+static void results_iterator_notify(AerospikeResultsIterator *self)
+{
+    if (self->notify_fds[1] == -1) {
+        return;
+    }
+    char byte = 0;
+    ssize_t rv;
+    do {
+        rv = write(self->notify_fds[1], &byte, 1);
+    } while (rv < 0 && errno == EINTR);
+}
+
+bool results_iterator_each_result(const as_val *val, void *udata)
+{
+    AerospikeResultsIterator *self = (AerospikeResultsIterator *)udata;
+    PyObject *py_result = NULL;
+    as_error err;
+    as_error_init(&err);
+
+    if (!val) {
+        return false;
+    }
+
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    result_to_pyobject(self->client, &err, val, self->record_format,
+                       &py_result);
+    PyGILState_Release(gstate);
+
+    if (!py_result) {
+        pthread_mutex_lock(&self->lock);
+        if (self->error.code == AEROSPIKE_OK) {
+            as_error_copy(&self->error, &err);
+        }
+        pthread_mutex_unlock(&self->lock);
+        return false;
+    }
+
+    return results_iterator_push(self, py_result);
+}
+
+bool results_iterator_push(AerospikeResultsIterator *self,
+                           PyObject *py_result)
+{
+    pthread_mutex_lock(&self->lock);
+
+    // Backpressure, wait for the consumer to make room.
+    while (self->count == self->capacity && !self->closed) {
+        pthread_cond_wait(&self->not_full, &self->lock);
+    }
+
+    if (self->closed) {
+        pthread_mutex_unlock(&self->lock);
+        PyGILState_STATE gstate = PyGILState_Ensure();
+        Py_DECREF(py_result);
+        PyGILState_Release(gstate);
+        return false;
+    }
+
+    self->queue[(self->head + self->count) % self->capacity] = py_result;
+    self->count++;
+    if (self->count == 1) {
+        results_iterator_notify(self);
+    }
+    pthread_cond_signal(&self->not_empty);
+    pthread_mutex_unlock(&self->lock);
+
+    return true;
+}
+
+static void *results_iterator_thread(void *udata)
+{
+    AerospikeResultsIterator *self = (AerospikeResultsIterator *)udata;
+    as_error err;
+    as_error_init(&err);
+
+    self->run(self, &err);
+
+    pthread_mutex_lock(&self->lock);
+    // An abort requested through close() is not an error.
+    if (!self->closed && self->error.code == AEROSPIKE_OK &&
+        err.code != AEROSPIKE_OK) {
+        as_error_copy(&self->error, &err);
+    }
+    self->done = true;
+    results_iterator_notify(self);
+    pthread_cond_broadcast(&self->not_empty);
+    pthread_mutex_unlock(&self->lock);
+
+    return NULL;
+}
+
+/*******************************************************************************
+ * CONSUMER
+ ******************************************************************************/
+
+/*
+ * Stops the producer if it is still running, waits for it and releases the
+ * job and every result still queued. Called with the GIL held.
+ */
+static void results_iterator_stop(AerospikeResultsIterator *self)
+{
+    pthread_mutex_lock(&self->lock);
+    self->closed = true;
+    pthread_cond_broadcast(&self->not_full);
+    pthread_cond_broadcast(&self->not_empty);
+    pthread_mutex_unlock(&self->lock);
+
+    if (self->thread_started) {
+        // Producers may be waiting for the GIL to convert a last result.
+        Py_BEGIN_ALLOW_THREADS
+        pthread_join(self->thread, NULL);
+        Py_END_ALLOW_THREADS
+        self->thread_started = false;
+    }
+
+    while (self->count > 0) {
+        Py_DECREF(self->queue[self->head]);
+        self->head = (self->head + 1) % self->capacity;
+        self->count--;
+    }
+
+    if (self->job) {
+        self->destroy(self->job);
+        self->job = NULL;
+    }
+}
+
+/*
+ * Raises the job's error, once. Returns true if an exception was set.
+ */
+static bool results_iterator_raise(AerospikeResultsIterator *self)
+{
+    if (self->error.code == AEROSPIKE_OK) {
+        return false;
+    }
+
+    PyObject *py_err = NULL;
+    error_to_pyobject(&self->error, &py_err);
+    PyObject *exception_type = raise_exception(&self->error);
+    PyErr_SetObject(exception_type, py_err);
+    Py_DECREF(py_err);
+    as_error_reset(&self->error);
+    return true;
+}
+
+static PyObject *AerospikeResultsIterator_Next(AerospikeResultsIterator *self)
+{
+    PyObject *py_result = NULL;
+    bool finished = false;
+
+    while (!py_result && !finished) {
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&self->lock);
+
+        if (self->count == 0 && !self->done && !self->closed) {
+            struct timespec deadline;
+            clock_gettime(CLOCK_REALTIME, &deadline);
+            deadline.tv_nsec += RESULTS_ITERATOR_POLL_MS * 1000000L;
+            if (deadline.tv_nsec >= 1000000000L) {
+                deadline.tv_sec++;
+                deadline.tv_nsec -= 1000000000L;
+            }
+            pthread_cond_timedwait(&self->not_empty, &self->lock, &deadline);
+        }
+
+        if (self->count > 0) {
+            py_result = self->queue[self->head];
+            self->head = (self->head + 1) % self->capacity;
+            self->count--;
+            // Producers may also wait on not_full for their turn to push.
+            pthread_cond_broadcast(&self->not_full);
+        }
+        else {
+            finished = self->done || self->closed;
+        }
+
+        pthread_mutex_unlock(&self->lock);
+        Py_END_ALLOW_THREADS
+
+        if (!py_result && !finished && PyErr_CheckSignals() != 0) {
+            return NULL;
+        }
+    }
+
+    if (py_result) {
+        return py_result;
+    }
+
+    results_iterator_stop(self);
+    results_iterator_raise(self);
+
+    // Returning NULL without an exception set ends the iteration.
+    return NULL;
+}
+
+static PyObject *
+AerospikeResultsIterator_Next_Batch(AerospikeResultsIterator *self,
+                                    PyObject *args, PyObject *kwds)
+{
+    unsigned int max_records = 100;
+    static char *kwlist[] = {"max_records", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "|I:next_batch", kwlist,
+                                    &max_records) == false) {
+        return NULL;
+    }
+
+    PyObject *py_batch = PyList_New(0);
+    if (!py_batch) {
+        return NULL;
+    }
+
+    bool finished = false;
+
+    pthread_mutex_lock(&self->lock);
+
+    if (self->notify_fds[0] != -1) {
+        char buf[64];
+        ssize_t rv;
+        do {
+            rv = read(self->notify_fds[0], buf, sizeof(buf));
+        } while (rv > 0 || (rv < 0 && errno == EINTR));
+    }
+
+    while (self->count > 0 && PyList_GET_SIZE(py_batch) < (Py_ssize_t)max_records) {
+        PyObject *py_result = self->queue[self->head];
+        self->head = (self->head + 1) % self->capacity;
+        self->count--;
+        PyList_Append(py_batch, py_result);
+        Py_DECREF(py_result);
+    }
+
+    if (PyList_GET_SIZE(py_batch) > 0) {
+        pthread_cond_broadcast(&self->not_full);
+        // Stay readable while anything is left for the next call.
+        if (self->count > 0) {
+            results_iterator_notify(self);
+        }
+    }
+    else {
+        finished = self->done || self->closed;
+    }
+
+    pthread_mutex_unlock(&self->lock);
+
+    if (!finished) {
+        return py_batch;
+    }
+
+    Py_DECREF(py_batch);
+    results_iterator_stop(self);
+    if (results_iterator_raise(self)) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *AerospikeResultsIterator_Fileno(AerospikeResultsIterator *self,
+                                                 PyObject *args)
+{
+    pthread_mutex_lock(&self->lock);
+
+    if (self->notify_fds[0] == -1) {
+        if (pipe(self->notify_fds) != 0) {
+            self->notify_fds[0] = self->notify_fds[1] = -1;
+            pthread_mutex_unlock(&self->lock);
+            return PyErr_SetFromErrno(PyExc_OSError);
+        }
+        for (int i = 0; i < 2; i++) {
+            fcntl(self->notify_fds[i], F_SETFL,
+                  fcntl(self->notify_fds[i], F_GETFL) | O_NONBLOCK);
+            fcntl(self->notify_fds[i], F_SETFD, FD_CLOEXEC);
+        }
+        // Anything that happened before the pipe existed still counts.
+        if (self->count > 0 || self->done) {
+            results_iterator_notify(self);
+        }
+    }
+
+    int fd = self->notify_fds[0];
+    pthread_mutex_unlock(&self->lock);
+
+    return PyLong_FromLong(fd);
+}
+
+static PyObject *AerospikeResultsIterator_Close(AerospikeResultsIterator *self,
+                                                PyObject *args)
+{
+    results_iterator_stop(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *AerospikeResultsIterator_Enter(AerospikeResultsIterator *self,
+                                                PyObject *args)
+{
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *AerospikeResultsIterator_Exit(AerospikeResultsIterator *self,
+                                               PyObject *args)
+{
+    results_iterator_stop(self);
+    Py_RETURN_FALSE;
+}
+
+/*******************************************************************************
+ * PYTHON TYPE METHODS
+ ******************************************************************************/
+
+PyDoc_STRVAR(close_doc, "close()\n\
+\n\
+Abort the query, scan or batch reads and discard any buffered results.");
+
+PyDoc_STRVAR(next_batch_doc, "next_batch([max_records]) -> list\n\
+\n\
+Return up to max_records buffered results without waiting. The list is empty \
+if none are buffered yet, None is returned once the results are exhausted.");
+
+PyDoc_STRVAR(fileno_doc, "fileno() -> int\n\
+\n\
+File descriptor that is readable while next_batch() has something to return.");
+
+static PyMethodDef AerospikeResultsIterator_Type_Methods[] = {
+    {"close", (PyCFunction)AerospikeResultsIterator_Close, METH_NOARGS,
+     close_doc},
+    {"next_batch", (PyCFunction)AerospikeResultsIterator_Next_Batch,
+     METH_VARARGS | METH_KEYWORDS, next_batch_doc},
+    {"fileno", (PyCFunction)AerospikeResultsIterator_Fileno, METH_NOARGS,
+     fileno_doc},
+    {"__enter__", (PyCFunction)AerospikeResultsIterator_Enter, METH_NOARGS,
+     NULL},
+    {"__exit__", (PyCFunction)AerospikeResultsIterator_Exit, METH_VARARGS,
+     NULL},
+    {NULL}};
+
+/*******************************************************************************
+ * PYTHON TYPE HOOKS
+ ******************************************************************************/
+
+static void AerospikeResultsIterator_Type_Dealloc(AerospikeResultsIterator *self)
+{
+    results_iterator_stop(self);
+
+    pthread_mutex_destroy(&self->lock);
+    pthread_cond_destroy(&self->not_empty);
+    pthread_cond_destroy(&self->not_full);
+
+    if (self->queue) {
+        cf_free(self->queue);
+    }
+    if (self->notify_fds[0] != -1) {
+        close(self->notify_fds[0]);
+        close(self->notify_fds[1]);
+    }
+    Py_XDECREF(self->owner);
+    Py_XDECREF((PyObject *)self->client);
+
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+/*******************************************************************************
+ * PYTHON TYPE DESCRIPTOR
+ ******************************************************************************/
+
+static PyTypeObject AerospikeResultsIterator_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "aerospike.ResultsIterator", // tp_name
+    sizeof(AerospikeResultsIterator), // tp_basicsize
+    0,                                // tp_itemsize
+    (destructor)AerospikeResultsIterator_Type_Dealloc,
+    // tp_dealloc
+    0, // tp_print
+    0, // tp_getattr
+    0, // tp_setattr
+    0, // tp_compare
+    0, // tp_repr
+    0, // tp_as_number
+    0, // tp_as_sequence
+    0, // tp_as_mapping
+    0, // tp_hash
+    0, // tp_call
+    0, // tp_str
+    0, // tp_getattro
+    0, // tp_setattro
+    0, // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,
+    // tp_flags
+    "Iterator over the results of Query.iter_results(), "
+    "Scan.iter_results() or Client.get_many_iter().\n",
+    // tp_doc
+    0,                                             // tp_traverse
+    0,                                             // tp_clear
+    0,                                             // tp_richcompare
+    0,                                             // tp_weaklistoffset
+    PyObject_SelfIter,                             // tp_iter
+    (iternextfunc)AerospikeResultsIterator_Next,   // tp_iternext
+    AerospikeResultsIterator_Type_Methods,         // tp_methods
+    0,                                             // tp_members
+    0,                                             // tp_getset
+    0,                                             // tp_base
+    0,                                             // tp_dict
+    0,                                             // tp_descr_get
+    0,                                             // tp_descr_set
+    0,                                             // tp_dictoffset
+    0,                                             // tp_init
+    0,                                             // tp_alloc
+    0,                                             // tp_new
+    0,                                             // tp_free
+    0,                                             // tp_is_gc
+    0                                              // tp_bases
+};
+
+/*******************************************************************************
+ * PUBLIC FUNCTIONS
+ ******************************************************************************/
+
+PyTypeObject *AerospikeResultsIterator_Ready()
+{
+    return PyType_Ready(&AerospikeResultsIterator_Type) == 0
+               ? &AerospikeResultsIterator_Type
+               : NULL;
+}
+
+AerospikeResultsIterator *AerospikeResultsIterator_New(AerospikeClient *client,
+                                                       PyObject *owner,
+                                                       uint32_t queue_size)
+{
+    AerospikeResultsIterator *self =
+        (AerospikeResultsIterator *)AerospikeResultsIterator_Type.tp_alloc(
+            &AerospikeResultsIterator_Type, 0);
+    if (!self) {
+        return NULL;
+    }
+
+    Py_INCREF(client);
+    self->client = client;
+    Py_INCREF(owner);
+    self->owner = owner;
+
+    pthread_mutex_init(&self->lock, NULL);
+    pthread_cond_init(&self->not_empty, NULL);
+    pthread_cond_init(&self->not_full, NULL);
+
+    self->capacity = queue_size;
+    self->queue = cf_malloc(sizeof(PyObject *) * queue_size);
+    // Nothing to wait for until a job is started.
+    self->done = true;
+    self->notify_fds[0] = self->notify_fds[1] = -1;
+    as_error_init(&self->error);
+
+    return self;
+}
+
+as_status AerospikeResultsIterator_Start(AerospikeResultsIterator *self,
+                                         as_error *err, void *job,
+                                         results_iterator_run_fn run,
+                                         results_iterator_destroy_fn destroy)
+{
+    self->job = job;
+    self->run = run;
+    self->destroy = destroy;
+    self->done = false;
+
+    if (pthread_create(&self->thread, NULL, results_iterator_thread, self) !=
+        0) {
+        self->done = true;
+        self->destroy(self->job);
+        self->job = NULL;
+        return as_error_update(err, AEROSPIKE_ERR_CLIENT,
+                               "Failed to start results iterator thread");
+    }
+    self->thread_started = true;
+    return AEROSPIKE_OK;
+}
@@ -50,9 +50,6 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
         return NULL;
     }
 
-    as_static_pool static_pool;
-    memset(&static_pool, 0, sizeof(static_pool));
-
     as_error err;
     as_error_init(&err);
 
@@ -116,8 +113,8 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
         for (int i = 0; i < size; i++) {
             PyObject *py_val = PyList_GetItem(py_args, (Py_ssize_t)i);
             as_val *val = NULL;
-            pyobject_to_val(self->client, &err, py_val, &val, &static_pool,
-                            SERIALIZER_PYTHON);
+            pyobject_to_val(self->client, &err, py_val, &val,
+                            self->static_pool, SERIALIZER_PYTHON);
             if (err.code != AEROSPIKE_OK) {
                 as_error_update(&err, err.code, NULL);
                 as_arraylist_destroy(arglist);
@@ -140,7 +137,6 @@ AerospikeScan *AerospikeScan_Apply(AerospikeScan *self, PyObject *args,
     Py_END_ALLOW_THREADS
 
 CLEANUP:
-    POOL_DESTROY(&static_pool);
 
     if (py_ufunction) {
         Py_DECREF(py_ufunction);
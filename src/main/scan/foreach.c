@@ -27,6 +27,7 @@
 #include "exceptions.h"
 #include "scan.h"
 #include "policy.h"
+#include "prepared_policy.h"
 
 // Struct for Python User-Data for the Callback
 typedef struct {
@@ -34,6 +35,7 @@ typedef struct {
     PyObject *callback;
     AerospikeClient *client;
     int partition_scan;
+    int record_format;
 } LocalData;
 
 static bool each_result(const as_val *val, void *udata)
@@ -68,7 +70,8 @@ static bool each_result(const as_val *val, void *udata)
     gstate = PyGILState_Ensure();
 
     // Convert as_val to a Python Object
-    val_to_pyobject(data->client, err, val, &py_result);
+    result_to_pyobject(data->client, err, val, data->record_format,
+                       &py_result);
 
     if (!py_result) {
         PyGILState_Release(gstate);
@@ -182,9 +185,14 @@ PyObject *AerospikeScan_Foreach(AerospikeScan *self, PyObject *args,
         goto CLEANUP;
     }
 
+    if (pyobject_to_record_format(&data.error, py_policy,
+                                  &data.record_format) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
     if (py_policy) {
-        PyObject *py_partition_filter =
-            PyDict_GetItemString(py_policy, "partition_filter");
+        PyObject *py_partition_filter = PyDict_GetItemString(
+            prepared_policy_dict(py_policy), "partition_filter");
         if (py_partition_filter) {
             if (convert_partition_filter(self->client, py_partition_filter,
                                          &partition_filter, &ps,
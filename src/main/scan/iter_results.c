@@ -0,0 +1,219 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_scan.h>
+#include <aerospike/as_partition.h>
+
+#include "client.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "results_iterator.h"
+#include "scan.h"
+#include "prepared_policy.h"
+
+// Results buffered by iter_results() unless queue_size is given.
+#define DEFAULT_QUEUE_SIZE 1000
+
+// Everything the background thread needs once iter_results() has returned.
+typedef struct {
+    AerospikeScan *scan;
+    as_policy_scan policy;
+    as_policy_scan *policy_p;
+    as_exp exp_list;
+    as_exp *exp_list_p;
+    as_partition_filter partition_filter;
+    as_partition_filter *partition_filter_p;
+    as_partitions_status *ps;
+    // Owner of a filter expression borrowed by policy.
+    PyObject *py_exp_owner;
+    char *nodename;
+} ScanJob;
+
+static void scan_job_run(AerospikeResultsIterator *iterator, as_error *err)
+{
+    ScanJob *job = (ScanJob *)iterator->job;
+    AerospikeScan *self = job->scan;
+
+    if (job->partition_filter_p) {
+        if (job->ps) {
+            as_partition_filter_set_partitions(job->partition_filter_p,
+                                               job->ps);
+        }
+        aerospike_scan_partitions(self->client->as, err, job->policy_p,
+                                  &self->scan, job->partition_filter_p,
+                                  results_iterator_each_result, iterator);
+    }
+    else if (job->nodename) {
+        aerospike_scan_node(self->client->as, err, job->policy_p, &self->scan,
+                            job->nodename, results_iterator_each_result,
+                            iterator);
+    }
+    else {
+        aerospike_scan_foreach(self->client->as, err, job->policy_p,
+                               &self->scan, results_iterator_each_result,
+                               iterator);
+    }
+}
+
+static void scan_job_destroy(void *udata)
+{
+    ScanJob *job = (ScanJob *)udata;
+
+    if (job->exp_list_p) {
+        as_exp_destroy(job->exp_list_p);
+    }
+    if (job->ps) {
+        as_partitions_status_release(job->ps);
+    }
+    Py_XDECREF(job->py_exp_owner);
+    if (job->nodename) {
+        cf_free(job->nodename);
+    }
+
+    cf_free(job);
+}
+
+PyObject *AerospikeScan_Iter_Results(AerospikeScan *self, PyObject *args,
+                                     PyObject *kwds)
+{
+    PyObject *py_policy = NULL;
+    PyObject *py_nodename = NULL;
+    unsigned int queue_size = DEFAULT_QUEUE_SIZE;
+    AerospikeResultsIterator *iterator = NULL;
+    int record_format = RECORD_FORMAT_TUPLE;
+    ScanJob *job = NULL;
+
+    static char *kwlist[] = {"policy", "nodename", "queue_size", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "|OOI:iter_results", kwlist,
+                                    &py_policy, &py_nodename,
+                                    &queue_size) == false) {
+        return NULL;
+    }
+
+    as_error err;
+    as_error_init(&err);
+
+    if (!self || !self->client->as) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+        goto CLEANUP;
+    }
+    if (!self->client->is_conn_16) {
+        as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    if (queue_size == 0) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                        "queue_size must be greater than 0");
+        goto CLEANUP;
+    }
+
+    job = cf_malloc(sizeof(ScanJob));
+    memset(job, 0, sizeof(ScanJob));
+    job->scan = self;
+
+    // Convert python policy object to as_policy_scan
+    pyobject_to_policy_scan(self->client, &err, py_policy, &job->policy,
+                            &job->policy_p,
+                            &self->client->as->config.policies.scan,
+                            &job->exp_list, &job->exp_list_p);
+    if (err.code != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+    if (job->policy.base.filter_exp && !job->exp_list_p) {
+        // Either a PreparedPolicy or a CompiledExpression owns the
+        // expression.
+        job->py_exp_owner =
+            prepared_policy_check(py_policy)
+                ? py_policy
+                : PyDict_GetItemString(py_policy, "expressions");
+        Py_INCREF(job->py_exp_owner);
+    }
+
+    if (pyobject_to_record_format(&err, py_policy, &record_format) !=
+        AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (py_policy) {
+        PyObject *py_partition_filter = PyDict_GetItemString(
+            prepared_policy_dict(py_policy), "partition_filter");
+        if (py_partition_filter) {
+            if (convert_partition_filter(self->client, py_partition_filter,
+                                         &job->partition_filter, &job->ps,
+                                         &err) != AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
+            job->partition_filter_p = &job->partition_filter;
+        }
+    }
+    as_error_reset(&err);
+
+    // The node name is copied, the job outlives py_nodename's buffer.
+    if (py_nodename) {
+        if (!PyUnicode_Check(py_nodename)) {
+            as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                            "nodename must be a string");
+            goto CLEANUP;
+        }
+        const char *nodename = PyUnicode_AsUTF8(py_nodename);
+        if (!nodename) {
+            PyErr_Clear();
+            as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                            "Invalid unicode nodename");
+            goto CLEANUP;
+        }
+        job->nodename = cf_strdup(nodename);
+    }
+
+    iterator = AerospikeResultsIterator_New(self->client, (PyObject *)self,
+                                            queue_size);
+    if (!iterator) {
+        goto CLEANUP;
+    }
+    iterator->record_format = record_format;
+
+    // The iterator owns the job from here on, even if starting fails.
+    AerospikeResultsIterator_Start(iterator, &err, job, scan_job_run,
+                                   scan_job_destroy);
+    job = NULL;
+
+CLEANUP:
+
+    if (job) {
+        scan_job_destroy(job);
+    }
+
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(iterator);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return (PyObject *)iterator;
+}
@@ -0,0 +1,173 @@
+/*******************************************************************************
+ * Copyright 2013-2021 Aerospike, Inc.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ ******************************************************************************/
+
+#include <Python.h>
+#include <stdbool.h>
+
+#include <aerospike/aerospike_scan.h>
+#include <aerospike/as_error.h>
+#include <aerospike/as_scan.h>
+
+#include "client.h"
+#include "columnar.h"
+#include "conversions.h"
+#include "exceptions.h"
+#include "policy.h"
+#include "prepared_policy.h"
+#include "scan.h"
+
+PyObject *AerospikeScan_Results_Columnar(AerospikeScan *self, PyObject *args,
+                                         PyObject *kwds)
+{
+    PyObject *py_bins = NULL;
+    PyObject *py_policy = NULL;
+    PyObject *py_nodename = NULL;
+    PyObject *py_columns = NULL;
+
+    as_policy_scan scan_policy;
+    as_policy_scan *scan_policy_p = NULL;
+
+    const char *nodename = NULL;
+    columnar_results results;
+    bool results_initialised = false;
+
+    static char *kwlist[] = {"bins", "policy", "nodename", NULL};
+
+    // For converting expressions.
+    as_exp exp_list;
+    as_exp *exp_list_p = NULL;
+
+    as_partition_filter partition_filter = {0};
+    as_partition_filter *partition_filter_p = NULL;
+    as_partitions_status *ps = NULL;
+
+    if (PyArg_ParseTupleAndKeywords(args, kwds, "O|OO:results_columnar",
+                                    kwlist, &py_bins, &py_policy,
+                                    &py_nodename) == false) {
+        return NULL;
+    }
+
+    as_error err;
+    as_error_init(&err);
+
+    if (!self || !self->client->as) {
+        as_error_update(&err, AEROSPIKE_ERR_PARAM, "Invalid aerospike object");
+        goto CLEANUP;
+    }
+    if (!self->client->is_conn_16) {
+        as_error_update(&err, AEROSPIKE_ERR_CLUSTER,
+                        "No connection to aerospike cluster");
+        goto CLEANUP;
+    }
+
+    results_initialised = true;
+    if (columnar_results_init(&err, &results, py_bins) != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    // Convert python policy object to as_policy_scan
+    pyobject_to_policy_scan(
+        self->client, &err, py_policy, &scan_policy, &scan_policy_p,
+        &self->client->as->config.policies.scan, &exp_list, &exp_list_p);
+    if (err.code != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    if (py_policy) {
+        PyObject *py_partition_filter = PyDict_GetItemString(
+            prepared_policy_dict(py_policy), "partition_filter");
+        if (py_partition_filter) {
+            if (convert_partition_filter(self->client, py_partition_filter,
+                                         &partition_filter, &ps,
+                                         &err) != AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
+            partition_filter_p = &partition_filter;
+        }
+    }
+    as_error_reset(&err);
+
+    if (py_nodename) {
+        if (!PyUnicode_Check(py_nodename)) {
+            as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                            "nodename must be a string");
+            goto CLEANUP;
+        }
+        nodename = PyUnicode_AsUTF8(py_nodename);
+        if (!nodename) {
+            PyErr_Clear();
+            as_error_update(&err, AEROSPIKE_ERR_PARAM,
+                            "Invalid unicode nodename");
+            goto CLEANUP;
+        }
+    }
+
+    // The callback never needs the GIL.
+    Py_BEGIN_ALLOW_THREADS
+
+    if (partition_filter_p) {
+        if (ps) {
+            as_partition_filter_set_partitions(partition_filter_p, ps);
+        }
+        aerospike_scan_partitions(self->client->as, &err, scan_policy_p,
+                                  &self->scan, partition_filter_p,
+                                  columnar_results_each, &results);
+        if (ps) {
+            as_partitions_status_release(ps);
+        }
+    }
+    else if (nodename) {
+        aerospike_scan_node(self->client->as, &err, scan_policy_p, &self->scan,
+                            nodename, columnar_results_each, &results);
+    }
+    else {
+        aerospike_scan_foreach(self->client->as, &err, scan_policy_p,
+                               &self->scan, columnar_results_each, &results);
+    }
+
+    Py_END_ALLOW_THREADS
+
+    if (err.code == AEROSPIKE_OK && results.error.code != AEROSPIKE_OK) {
+        as_error_copy(&err, &results.error);
+    }
+    if (err.code != AEROSPIKE_OK) {
+        goto CLEANUP;
+    }
+
+    py_columns = columnar_results_to_pyobject(&err, &results);
+
+CLEANUP:
+
+    if (exp_list_p) {
+        as_exp_destroy(exp_list_p);
+    }
+
+    if (results_initialised) {
+        columnar_results_destroy(&results);
+    }
+
+    if (err.code != AEROSPIKE_OK) {
+        Py_XDECREF(py_columns);
+        PyObject *py_err = NULL;
+        error_to_pyobject(&err, &py_err);
+        PyObject *exception_type = raise_exception(&err);
+        PyErr_SetObject(exception_type, py_err);
+        Py_DECREF(py_err);
+        return NULL;
+    }
+
+    return py_columns;
+}
@@ -39,6 +39,18 @@ PyDoc_STRVAR(foreach_doc, "foreach(callback[, policy[, options [, nodename]])\n\
 Invoke the callback function for each of the records streaming back from the scan. If provided \
 nodename should be the Node ID of a node to limit the scan to.");
 
+PyDoc_STRVAR(results_columnar_doc,
+             "results_columnar(bins[, policy[, nodename]]) -> {bin: (array, bytearray)}\n\
+\n\
+Collect the numeric values of the given bins from the scan into one array per bin, with a \
+bytearray marking which rows hold a value.");
+
+PyDoc_STRVAR(iter_results_doc,
+             "iter_results([policy [, nodename [, queue_size]]]) -> iterator of (key, meta, bins)\n\
+\n\
+Return an iterator over the records resulting from the scan. At most queue_size records are \
+buffered, the scan is paused while the buffer is full and aborted when the iterator is closed.");
+
 PyDoc_STRVAR(select_doc, "select(bin1[, bin2[, bin3..]])\n\
 \n\
 Set a filter on the record bins resulting from results() or foreach(). \
@@ -79,6 +91,12 @@ static PyMethodDef AerospikeScan_Type_Methods[] = {
     {"results", (PyCFunction)AerospikeScan_Results,
      METH_VARARGS | METH_KEYWORDS, results_doc},
 
+    {"iter_results", (PyCFunction)AerospikeScan_Iter_Results,
+     METH_VARARGS | METH_KEYWORDS, iter_results_doc},
+
+    {"results_columnar", (PyCFunction)AerospikeScan_Results_Columnar,
+     METH_VARARGS | METH_KEYWORDS, results_columnar_doc},
+
     {"execute_background", (PyCFunction)AerospikeScan_ExecuteBackground,
      METH_VARARGS | METH_KEYWORDS, results_doc},
 
@@ -155,12 +173,19 @@ static int AerospikeScan_Type_Init(AerospikeScan *self, PyObject *args,
     }
 
     self->unicodeStrVector = NULL;
-    self->static_pool = NULL;
+    // Values converted by add_ops() and apply() are kept in the scan, so the
+    // bytes they reference live as long as the scan object.
+    self->static_pool = cf_calloc(1, sizeof(as_static_pool));
     as_scan_init(&self->scan, namespace, set);
 
     if (py_ustr) {
         Py_DECREF(py_ustr);
     }
+
+    if (!self->static_pool) {
+        PyErr_NoMemory();
+        return -1;
+    }
     return 0;
 }
 
@@ -168,6 +193,12 @@ static void AerospikeScan_Type_Dealloc(AerospikeScan *self)
 {
     as_scan_destroy(&self->scan);
 
+    // The pooled bytes were destroyed along with the scan.
+    if (self->static_pool) {
+        POOL_FREE(self->static_pool);
+        cf_free(self->static_pool);
+    }
+
     if (self->unicodeStrVector != NULL) {
         for (unsigned int i = 0; i < self->unicodeStrVector->size; ++i) {
             free(as_vector_get_ptr(self->unicodeStrVector, i));
@@ -15,6 +15,7 @@
  ******************************************************************************/
 #include <Python.h>
 #include <stdbool.h>
+#include <stdint.h>
 
 #include <aerospike/aerospike_key.h>
 #include <aerospike/as_key.h>
@@ -26,12 +27,82 @@
 #include "exceptions.h"
 #include "policy.h"
 #include "serializer.h"
+#include "blob.h"
+#include "builtin_serializers.h"
 
 uint32_t is_user_serializer_registered = 0;
 uint32_t is_user_deserializer_registered = 0;
 
 user_serializer_callback user_serializer_call_info, user_deserializer_call_info;
 
+// pickle.dumps and pickle.loads, resolved once by get_pickle_functions.
+static PyObject *py_pickle_dumps = NULL;
+static PyObject *py_pickle_loads = NULL;
+
+/**
+ ******************************************************************************************************
+ * Looks up pickle.dumps and pickle.loads the first time they are needed and
+ * keeps them for the life of the module. The GIL must be held.
+ *
+ * @param error_p               The error object
+ * @param py_dumps              Set to a borrowed reference to pickle.dumps, if not NULL.
+ * @param py_loads              Set to a borrowed reference to pickle.loads, if not NULL.
+ ******************************************************************************************************
+ */
+static as_status get_pickle_functions(as_error *error_p, PyObject **py_dumps,
+                                      PyObject **py_loads)
+{
+    if (!py_pickle_dumps || !py_pickle_loads) {
+        PyObject *py_pickle = PyImport_ImportModule("pickle");
+        if (!py_pickle) {
+            PyErr_Clear();
+            return as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+                                   "Unable to load pickle module");
+        }
+        PyObject *dumps = PyObject_GetAttrString(py_pickle, "dumps");
+        PyObject *loads = PyObject_GetAttrString(py_pickle, "loads");
+        Py_DECREF(py_pickle);
+        if (!dumps || !loads) {
+            PyErr_Clear();
+            Py_XDECREF(dumps);
+            Py_XDECREF(loads);
+            return as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+                                   "Unable to load pickle functions");
+        }
+        py_pickle_dumps = dumps;
+        py_pickle_loads = loads;
+    }
+
+    if (py_dumps) {
+        *py_dumps = py_pickle_dumps;
+    }
+    if (py_loads) {
+        *py_loads = py_pickle_loads;
+    }
+    return AEROSPIKE_OK;
+}
+
+int pickle_highest_protocol(void)
+{
+    PyObject *py_pickle = PyImport_ImportModule("pickle");
+    if (!py_pickle) {
+        PyErr_Clear();
+        return -1;
+    }
+    PyObject *py_highest = PyObject_GetAttrString(py_pickle, "HIGHEST_PROTOCOL");
+    Py_DECREF(py_pickle);
+    if (!py_highest) {
+        PyErr_Clear();
+        return -1;
+    }
+    int highest = (int)PyLong_AsLong(py_highest);
+    Py_DECREF(py_highest);
+    if (highest == -1) {
+        PyErr_Clear();
+    }
+    return highest;
+}
+
 /**
  ******************************************************************************************************
  * Set a serializer in the aerospike database
@@ -293,6 +364,59 @@ CLEANUP:
     }
 }
 
+/*
+ *******************************************************************************************************
+ * Gets the memory of a buffer, such as bytes or a memoryview, to be sent as a
+ * blob. The buffer is kept by static_pool and its memory used as is, or the
+ * memory is copied if there is no pool to keep it.
+ *
+ * @param error_p                   The as_error to be populated on error.
+ * @param py_obj                    The object supporting the buffer protocol.
+ * @param static_pool               The pool of the command, or NULL.
+ * @param blob                      Set to the memory of the blob.
+ * @param blob_len                  Set to the size of the blob.
+ * @param blob_free                 Set if blob is a copy to be freed.
+ *******************************************************************************************************
+ */
+as_status pyobject_buffer_to_blob(as_error *error_p, PyObject *py_obj,
+                                  as_static_pool *static_pool, uint8_t **blob,
+                                  uint32_t *blob_len, bool *blob_free)
+{
+    Py_buffer view;
+    if (PyObject_GetBuffer(py_obj, &view, PyBUF_SIMPLE) != 0) {
+        PyErr_Clear();
+        return as_error_update(error_p, AEROSPIKE_ERR_PARAM,
+                               "blob buffer must be C contiguous");
+    }
+
+    if (view.len > UINT32_MAX) {
+        PyBuffer_Release(&view);
+        return as_error_update(error_p, AEROSPIKE_ERR_PARAM,
+                               "blob buffer is too large");
+    }
+
+    *blob_len = (uint32_t)view.len;
+
+    // The values converted for Query and Scan objects, and prepared
+    // operations, use pools that live as long as those objects.
+    if (static_pool && static_pool_hold_buffer(static_pool, &view)) {
+        *blob = (uint8_t *)view.buf;
+        *blob_free = false;
+        return AEROSPIKE_OK;
+    }
+
+    *blob = cf_malloc(view.len ? view.len : 1);
+    if (!*blob) {
+        PyBuffer_Release(&view);
+        return as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+                               "Cannot allocate blob");
+    }
+    memcpy(*blob, view.buf, view.len);
+    *blob_free = true;
+    PyBuffer_Release(&view);
+    return AEROSPIKE_OK;
+}
+
 /*
  *******************************************************************************************************
  * Checks serializer_policy.
@@ -303,15 +427,15 @@ CLEANUP:
  *                                  the serialization.
  * @param bytes                     The as_bytes to be set.
  * @param value                     The value to be serialized.
+ * @param static_pool               The pool of the command, which keeps the
+ *                                  buffers of blobs sent without a copy.
  * @param error_p                   The as_error to be populated by the function
  *                                  with encountered error if any.
  *******************************************************************************************************
  */
-extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
-                                                      int32_t serializer_policy,
-                                                      as_bytes **bytes,
-                                                      PyObject *value,
-                                                      as_error *error_p)
+extern as_status serialize_based_on_serializer_policy(
+    AerospikeClient *self, int32_t serializer_policy, as_bytes **bytes,
+    PyObject *value, as_static_pool *static_pool, as_error *error_p)
 {
     uint8_t use_client_serializer = true;
     PyObject *initresult = NULL;
@@ -326,6 +450,17 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
     else if (self->user_serializer_call_info.callback) {
         serializer_policy = SERIALIZER_USER;
     }
+    else if (self->builtin_serializer != SERIALIZER_NONE) {
+        serializer_policy = self->builtin_serializer;
+    }
+
+    // The built-in serializers store blobs as they are. Their own blobs start
+    // with a header, so raw blobs are never decoded as theirs.
+    if ((serializer_policy == SERIALIZER_JSON ||
+         serializer_policy == SERIALIZER_MSGPACK) &&
+        PyObject_CheckBuffer(value)) {
+        serializer_policy = SERIALIZER_PYTHON;
+    }
 
     switch (serializer_policy) {
     case SERIALIZER_NONE:
@@ -346,67 +481,61 @@ extern as_status serialize_based_on_serializer_policy(AerospikeClient *self,
             set_as_bytes(bytes, bytes_array, bytes_array_len, AS_BYTES_BLOB,
                          error_p);
         }
-        else if (PyBytes_Check(value)) {
-            uint8_t *my_bytes = (uint8_t *)PyBytes_AsString(value);
-            uint32_t my_bytes_len = (uint32_t)PyBytes_Size(value);
-            set_as_bytes(bytes, my_bytes, my_bytes_len, AS_BYTES_BLOB, error_p);
+        else if (PyObject_CheckBuffer(value)) {
+            /*
+             * Store bytes, memoryviews, numpy arrays, mmaps and any other
+             * buffer as a blob, without a copy where the pool can keep the
+             * buffer until the value is destroyed.
+             */
+            uint8_t *blob = NULL;
+            uint32_t blob_len = 0;
+            bool blob_free = false;
+            if (pyobject_buffer_to_blob(error_p, value, static_pool, &blob,
+                                        &blob_len,
+                                        &blob_free) != AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
+            as_bytes_init_wrap(*bytes, blob, blob_len, blob_free);
+            as_bytes_set_type(*bytes, AS_BYTES_BLOB);
         }
         else {
+            PyObject *py_dumps = NULL;
+            if (get_pickle_functions(error_p, &py_dumps, NULL) !=
+                AEROSPIKE_OK) {
+                goto CLEANUP;
+            }
 
-            /* get the sys.modules dictionary */
-            PyObject *sysmodules = PyImport_GetModuleDict();
-            PyObject *cpickle_module = NULL;
-            if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-                cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
+            if (self->pickle_protocol == PICKLE_PROTOCOL_DEFAULT) {
+                initresult =
+                    PyObject_CallFunctionObjArgs(py_dumps, value, NULL);
             }
             else {
-                cpickle_module = PyImport_ImportModule("pickle");
+                PyObject *py_protocol = PyLong_FromLong(self->pickle_protocol);
+                initresult = PyObject_CallFunctionObjArgs(py_dumps, value,
+                                                          py_protocol, NULL);
+                Py_DECREF(py_protocol);
             }
 
-            if (!cpickle_module) {
-                /* insert error handling here! and exit this function */
+            if (!initresult) {
                 as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-                                "Unable to load pickle module");
+                                "Unable to call dumps function");
                 goto CLEANUP;
             }
-            else {
-                PyObject *py_funcname = PyString_FromString("dumps");
-
-                Py_INCREF(cpickle_module);
-                initresult = PyObject_CallMethodObjArgs(
-                    cpickle_module, py_funcname, value, NULL);
-                Py_DECREF(cpickle_module);
-                Py_DECREF(py_funcname);
 
-                if (!initresult) {
-                    /* more error handling &c */
-                    as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-                                    "Unable to call dumps function");
-                    goto CLEANUP;
-                }
-                else {
-                    Py_INCREF(initresult);
-
-                    char *return_value;
-                    Py_ssize_t len;
-                    PyBytes_AsStringAndSize(initresult, &return_value, &len);
-                    set_as_bytes(bytes, (uint8_t *)return_value, len,
-                                 AS_BYTES_PYTHON, error_p);
-                    Py_DECREF(initresult);
-                }
-            }
-            Py_XDECREF(cpickle_module);
+            char *return_value;
+            Py_ssize_t len;
+            PyBytes_AsStringAndSize(initresult, &return_value, &len);
+            set_as_bytes(bytes, (uint8_t *)return_value, len, AS_BYTES_PYTHON,
+                         error_p);
         }
     } break;
     case SERIALIZER_JSON:
-        /*
-			 *   TODO:
-			 *     Handle JSON serialization after support for AS_BYTES_JSON
-			 *     is added in aerospike-client-c
-			 */
-        as_error_update(error_p, AEROSPIKE_ERR,
-                        "Unable to serialize using standard json serializer");
-        goto CLEANUP;
+    case SERIALIZER_MSGPACK:
+        if (builtin_serialize(self, error_p, serializer_policy, value,
+                              *bytes) != AEROSPIKE_OK) {
+            goto CLEANUP;
+        }
+        break;
 
     case SERIALIZER_USER:
         if (use_client_serializer) {
@@ -477,55 +606,34 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient *self,
 {
     switch (as_bytes_get_type(bytes)) {
     case AS_BYTES_PYTHON: {
-        PyObject *sysmodules = PyImport_GetModuleDict();
-        PyObject *cpickle_module = NULL;
-        if (PyMapping_HasKeyString(sysmodules, "pickle")) {
-            cpickle_module = PyMapping_GetItemString(sysmodules, "pickle");
-        }
-        else {
-            cpickle_module = PyImport_ImportModule("pickle");
-        }
-
-        PyObject *initresult = NULL;
-        if (!cpickle_module) {
-            /* insert error handling here! and exit this function */
-            as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-                            "Unable to load pickle module");
+        PyObject *py_loads = NULL;
+        if (get_pickle_functions(error_p, NULL, &py_loads) != AEROSPIKE_OK) {
             goto CLEANUP;
         }
-        else {
-            char *bytes_val_p = (char *)bytes->value;
-            PyObject *py_value =
-                PyBytes_FromStringAndSize(bytes_val_p, as_bytes_size(bytes));
-            PyObject *py_funcname = PyString_FromString("loads");
-
-            Py_INCREF(cpickle_module);
-            initresult = PyObject_CallMethodObjArgs(cpickle_module, py_funcname,
-                                                    py_value, NULL);
-            Py_DECREF(cpickle_module);
-            Py_DECREF(py_funcname);
-            Py_DECREF(py_value);
+
+        // loads takes any bytes-like object, so the payload is not copied.
+        PyObject *py_value = PyMemoryView_FromMemory(
+            (char *)as_bytes_get(bytes), as_bytes_size(bytes), PyBUF_READ);
+        PyObject *initresult =
+            py_value ? PyObject_CallFunctionObjArgs(py_loads, py_value, NULL)
+                     : NULL;
+        Py_XDECREF(py_value);
+        if (!initresult) {
+            PyErr_Clear();
+            // At this point we want to try to fallback to returning a byte array
+            uint32_t bval_size = as_bytes_size(bytes);
+            initresult = PyByteArray_FromStringAndSize(
+                (char *)as_bytes_get(bytes), bval_size);
+            // We couldn't convert the value into a byte array
             if (!initresult) {
-                // At this point we want to try to fallback to returning a byte array
-                uint32_t bval_size = as_bytes_size(bytes);
-                initresult = PyByteArray_FromStringAndSize(
-                    (char *)as_bytes_get(bytes), bval_size);
-                // We couldn't convert the value into a byte array
-                if (!initresult) {
-                    as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
-                                    "Unable to deserialize bytes");
-                    Py_XDECREF(cpickle_module);
-                    goto CLEANUP;
-                }
-                // The fallback deserialization succeeded
-                *retval = initresult;
-                as_error_update(error_p, AEROSPIKE_OK, NULL);
-            }
-            else {
-                *retval = initresult;
+                as_error_update(error_p, AEROSPIKE_ERR_CLIENT,
+                                "Unable to deserialize bytes");
+                goto CLEANUP;
             }
+            // The fallback deserialization succeeded
+            as_error_update(error_p, AEROSPIKE_OK, NULL);
         }
-        Py_XDECREF(cpickle_module);
+        *retval = initresult;
     } break;
     case AS_BYTES_BLOB: {
         if (self->user_deserializer_call_info.callback) {
@@ -545,6 +653,15 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient *self,
             }
         }
         else {
+            if (self->builtin_serializer != SERIALIZER_NONE) {
+                // Blobs that are not in the client's encoding are returned
+                // like any other blob.
+                *retval = builtin_deserialize(self, self->builtin_serializer,
+                                              bytes);
+                if (*retval) {
+                    break;
+                }
+            }
             if (is_user_deserializer_registered) {
                 execute_user_callback(&user_deserializer_call_info, &bytes,
                                       retval, false, error_p);
@@ -561,6 +678,13 @@ extern as_status deserialize_based_on_as_bytes_type(AerospikeClient *self,
                     *retval = py_val;
                 }
             }
+            else if (self->blob_memoryview) {
+                PyObject *py_val = AerospikeBlob_MemoryView(error_p, bytes);
+                if (!py_val) {
+                    goto CLEANUP;
+                }
+                *retval = py_val;
+            }
             else {
                 uint32_t bval_size = as_bytes_size(bytes);
                 PyObject *py_val = PyBytes_FromStringAndSize(
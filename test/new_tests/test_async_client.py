@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.awaitable import AsyncClient
+from aerospike_helpers.operations import operations
+
+
+aerospike.init_async()
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestAsyncClient:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "demo", "async-client-%d" % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {"i": i, "s": "str%d" % i})
+        self.client = AsyncClient(self.as_connection)
+
+        def teardown():
+            for key in self.keys:
+                try:
+                    self.as_connection.remove(key)
+                except e.RecordNotFound:
+                    pass
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_get_and_select(self):
+        _, meta, bins = await self.client.get(self.keys[0])
+        assert bins == {"i": 0, "s": "str0"}
+        assert meta["gen"] == 1
+
+        _, _, bins = await self.client.select(self.keys[1], ["s"])
+        assert bins == {"s": "str1"}
+
+    @pytest.mark.asyncio
+    async def test_pos_exists(self):
+        key, meta = await self.client.exists(self.keys[0])
+        assert meta["gen"] == 1
+
+        key, meta = await self.client.exists(("test", "demo", "async-client-missing"))
+        assert meta is None
+
+    @pytest.mark.asyncio
+    async def test_pos_put_operate_remove(self):
+        key = self.keys[2]
+        assert await self.client.put(key, {"i": 10}) == 0
+
+        _, _, bins = await self.client.operate(key, [operations.increment("i", 5), operations.read("i")])
+        assert bins == {"i": 15}
+
+        _, _, bins = await self.client.operate_ordered(key, [operations.read("i")])
+        assert bins == [("i", 15)]
+
+        assert await self.client.touch(key, 100) == 0
+        assert await self.client.remove(key) == 0
+        with pytest.raises(e.RecordNotFound):
+            await self.client.get(key)
+
+    @pytest.mark.asyncio
+    async def test_pos_batch_reads(self):
+        records = await self.client.get_many(self.keys)
+        assert [bins for _, _, bins in records] == [{"i": i, "s": "str%d" % i} for i in range(5)]
+
+        records = await self.client.select_many(self.keys, ["i"])
+        assert [bins for _, _, bins in records] == [{"i": i} for i in range(5)]
+
+        missing = ("test", "demo", "async-client-missing")
+        records = await self.client.exists_many(self.keys + [missing])
+        assert records[-1][1] is None
+        assert all(meta is not None for _, meta in records[:-1])
+
+    @pytest.mark.asyncio
+    async def test_pos_batch_operate_in_executor(self):
+        res = await self.client.batch_operate(self.keys, [operations.read("i")])
+        assert [rec.record[2] for rec in res.batch_records] == [{"i": i} for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_pos_concurrent_commands(self):
+        results = await asyncio.gather(*(self.client.get(key) for key in self.keys * 20))
+        assert len(results) == 100
+
+    @pytest.mark.asyncio
+    async def test_neg_remove_missing_record(self):
+        with pytest.raises(e.RecordNotFound):
+            await self.client.remove(("test", "demo", "async-client-missing"))
+
+    @pytest.mark.asyncio
+    async def test_neg_get_invalid_key(self):
+        with pytest.raises(e.ParamError):
+            await self.client.get(("test", "demo"))
+
+    @pytest.mark.asyncio
+    async def test_neg_concurrent_errors_are_per_command(self):
+        keys = [("test", "demo", "async-client-missing-%d" % i) for i in range(20)]
+        results = await asyncio.gather(*(self.client.remove(key) for key in keys), return_exceptions=True)
+
+        assert len({id(exc) for exc in results}) == len(keys)
+        for key, exc in zip(keys, results):
+            assert isinstance(exc, e.RecordNotFound)
+            assert exc.key[2] == key[2]
+            assert exc.msg == exc.args[1]
+
+    @pytest.mark.asyncio
+    async def test_neg_invalid_key_exception_attributes(self):
+        with pytest.raises(e.ParamError) as excinfo:
+            await self.client.get(("test", "demo"))
+
+        assert excinfo.value.msg == excinfo.value.args[1]
+        assert excinfo.value.code == -2
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import select
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.awaitable import io
+from .test_base_class import TestBaseClass
+
+
+class TestAsyncCompletionQueue:
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        # Event loops are recreated by init_async, so connect after it.
+        aerospike.init_async(completion_queue=True)
+        config = TestBaseClass.get_connection_config()
+        self.as_connection = aerospike.client(config).connect(config["user"], config["password"])
+        self.keys = [("test", "demo", "completion-queue-%d" % i) for i in range(10)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {"i": i})
+
+        def teardown():
+            for key in self.keys:
+                self.as_connection.remove(key)
+            self.as_connection.close()
+            aerospike.init_async()
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_get_through_completion_queue(self):
+        io.attach_completion_queue()
+        try:
+            results = await asyncio.gather(*(io.get(self.as_connection, key) for key in self.keys * 10))
+        finally:
+            io.detach_completion_queue()
+        assert [bins["i"] for _, _, bins in results] == list(range(10)) * 10
+
+    @pytest.mark.asyncio
+    async def test_pos_errors_through_completion_queue(self):
+        io.attach_completion_queue()
+        try:
+            with pytest.raises(e.RecordNotFound):
+                await io.get(self.as_connection, ("test", "demo", "completion-queue-missing"))
+            assert await io.put(self.as_connection, self.keys[0], {"i": 100}) == 0
+        finally:
+            io.detach_completion_queue()
+
+    @pytest.mark.asyncio
+    async def test_neg_errors_are_per_command_through_completion_queue(self):
+        keys = [("test", "demo", "completion-queue-missing-%d" % i) for i in range(10)]
+        io.attach_completion_queue()
+        try:
+            results = await asyncio.gather(*(io.get(self.as_connection, key) for key in keys), return_exceptions=True)
+        finally:
+            io.detach_completion_queue()
+
+        for key, exc in zip(keys, results):
+            assert isinstance(exc, e.RecordNotFound)
+            assert exc.key[2] == key[2]
+            assert exc.msg == exc.args[1]
+
+    def test_pos_manual_drain(self):
+        results = []
+
+        def callback(key, record, err, exce):
+            results.append(record)
+
+        self.as_connection.get_async(callback, self.keys[0])
+        fd = aerospike.async_completion_fd()
+        while not results:
+            select.select([fd], [], [], 1)
+            aerospike.process_async_completions()
+        assert results[0][2] == {"i": 0}
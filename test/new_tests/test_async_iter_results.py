@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.awaitable import io
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestAsyncIterResults:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_set = "async_iter"
+        self.keys = [("test", self.test_set, i) for i in range(50)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"i": i})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.asyncio
+    async def test_pos_scan(self):
+        scan = self.as_connection.scan("test", self.test_set)
+        records = [bins["i"] async for _, _, bins in io.iter_results(scan, queue_size=4, batch_size=3)]
+        assert sorted(records) == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_pos_query_with_options(self):
+        query = self.as_connection.query("test", self.test_set)
+        count = 0
+        async for _, _, bins in io.iter_results(query, options={"nobins": True}):
+            assert bins == {}
+            count += 1
+        assert count == 50
+
+    @pytest.mark.asyncio
+    async def test_pos_break_aborts(self):
+        scan = self.as_connection.scan("test", self.test_set)
+        results = io.iter_results(scan, queue_size=1)
+        async for _ in results:
+            break
+        await results.aclose()
+        # The scan object can be reused once the job has been aborted.
+        assert len(scan.results()) == 50
+
+    @pytest.mark.asyncio
+    async def test_pos_cancel_aborts(self):
+        scan = self.as_connection.scan("test", self.test_set)
+
+        async def consume():
+            async for _ in io.iter_results(scan, queue_size=1):
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_neg_error_raised(self):
+        expr = exp.Eq(exp.IntBin("i"), "bad_arg")
+        query = self.as_connection.query("test", self.test_set)
+        with pytest.raises(e.InvalidRequest):
+            async for _ in io.iter_results(query, {"expressions": expr.compile()}):
+                pass
@@ -29,3 +29,40 @@ class TestBatchRecords(TestBaseClass):
         bwr = br.BatchRecords()
 
         assert len(bwr.batch_records) == 0
+
+    def test_batch_records_slots_pos(self):
+        """
+        Test that batch records keep their fields in slots, with the batch
+        type on the class.
+        """
+
+        key = ("test", "demo", 1)
+        records = [
+            br.Write(key, ops=[]),
+            br.Read(key, ops=None, read_all_bins=True),
+            br.Apply(key, "module", "function", []),
+            br.Remove(key),
+        ]
+
+        for b, batch_type, has_write in zip(records, (1, 0, 2, 3), (True, False, True, True)):
+            assert not hasattr(b, "__dict__")
+            assert b.key == key
+            assert b.record is None
+            assert b.result == 0
+            assert b.in_doubt is False
+            assert b._type == batch_type
+            assert b._has_write is has_write
+
+    def test_batch_records_slots_neg(self):
+        """
+        Test that unknown attributes can't be set on batch records.
+        """
+
+        b = br.Write(("test", "demo", 1), ops=[])
+
+        try:
+            b.unknown = 1
+        except AttributeError:
+            pass
+        else:
+            assert False, "expected AttributeError"
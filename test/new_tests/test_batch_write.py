@@ -470,3 +470,38 @@ class TestBatchWrite(TestBaseClass):
         with pytest.raises(exp_res):
             bad_client = aerospike.client({"hosts": [("bad_addr", 3000)]})
             bad_client.batch_write(batch_records)
+
+    @pytest.mark.parametrize("chunk_size, max_in_flight", [(1, 1), (2, 1), (2, 3), (100, 2)])
+    def test_batch_write_pos_chunked(self, chunk_size, max_in_flight):
+        """
+        Test batch_write sending the records in chunks
+        """
+        batch_records = br.BatchRecords(
+            [br.Write(("test", "demo", i), [op.write("count", i * 10), op.read("count")]) for i in range(5)]
+        )
+
+        res = self.as_connection.batch_write(batch_records, None, chunk_size, max_in_flight)
+
+        assert res.result == AerospikeStatus.AEROSPIKE_OK
+        assert [rec.result for rec in res.batch_records] == [AerospikeStatus.AEROSPIKE_OK] * 5
+        assert [rec.record[2]["count"] for rec in res.batch_records] == [0, 10, 20, 30, 40]
+
+    def test_batch_write_neg_chunked_bad_record(self):
+        """
+        Test batch_write raising for a bad record after earlier chunks were written
+        """
+        batch_records = br.BatchRecords(
+            [br.Write(("test", "demo", 0), [op.write("count", 100)]), br.Write(("test", "demo", 1), "not ops")]
+        )
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write(batch_records, None, 1)
+
+        assert self.as_connection.get(("test", "demo", 0))[2]["count"] == 100
+
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": -1}, {"max_in_flight": 0}])
+    def test_batch_write_neg_chunked_bad_sizes(self, kwargs):
+        batch_records = br.BatchRecords([br.Read(("test", "demo", 1), [op.read("count")])])
+
+        with pytest.raises(e.ParamError):
+            self.as_connection.batch_write(batch_records, **kwargs)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import expression_operations as expr_ops
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestCompileExpression:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "demo", "compile-expression-%d" % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"age": i * 10})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_compile_expression(self):
+        compiled = self.as_connection.compile_expression(exp.Eq(exp.IntBin("bin1"), 6).compile())
+        assert isinstance(compiled, aerospike.CompiledExpression)
+        assert self.as_connection.get_expression_base64(compiled) == "kwGTUQKkYmluMQY="
+
+    def test_pos_compile_expression_twice(self):
+        compiled = self.as_connection.compile_expression(exp.Eq(exp.IntBin("bin1"), 6).compile())
+        assert self.as_connection.compile_expression(compiled) is compiled
+
+    def test_pos_policy_filter(self):
+        compiled = self.as_connection.compile_expression(exp.GE(exp.IntBin("age"), 20).compile())
+        policy = {"expressions": compiled}
+
+        _, _, bins = self.as_connection.get(self.keys[3], policy)
+        assert bins == {"age": 30}
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[1], policy)
+
+    def test_pos_reused_across_commands(self):
+        compiled = self.as_connection.compile_expression(exp.GE(exp.IntBin("age"), 20).compile())
+        policy = {"expressions": compiled}
+
+        for _ in range(100):
+            records = self.as_connection.get_many(self.keys, policy)
+            assert sum(1 for _, meta, _ in records if meta is not None) == 3
+
+        scan = self.as_connection.scan("test", "demo")
+        assert len([r for r in scan.iter_results(policy) if r[2].get("age", 0) >= 20]) >= 3
+
+    def test_pos_expression_read(self):
+        compiled = self.as_connection.compile_expression(exp.Add(exp.IntBin("age"), 1).compile())
+        _, _, bins = self.as_connection.operate(self.keys[2], [expr_ops.expression_read("plus_one", compiled)])
+        assert bins == {"plus_one": 21}
+
+    @pytest.mark.parametrize("expressions", [[], [1, 2], "not an expression", None])
+    def test_neg_invalid_expressions(self, expressions):
+        with pytest.raises(e.ParamError):
+            self.as_connection.compile_expression(expressions)
+
+    def test_neg_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.CompiledExpression()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from aerospike import exception as e
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestExceptionAttributes(object):
+    def test_pos_attributes_match_args(self):
+        key = ("test", "demo", "exception_attributes_missing")
+
+        with pytest.raises(e.RecordNotFound) as excinfo:
+            self.as_connection.get(key)
+
+        exc = excinfo.value
+        assert (exc.code, exc.msg, exc.file, exc.line, exc.in_doubt) == exc.args
+        assert exc.code == 2
+
+    def test_pos_attributes_are_per_instance(self):
+        with pytest.raises(e.RecordNotFound) as not_found:
+            self.as_connection.get(("test", "demo", "exception_attributes_missing"))
+        with pytest.raises(e.ParamError) as param_error:
+            self.as_connection.get(("test", "demo"))
+
+        assert not_found.value.msg == not_found.value.args[1]
+        assert param_error.value.msg == param_error.value.args[1]
+        assert not_found.value.msg != param_error.value.msg
+        assert e.RecordNotFound.msg is None
+
+    @pytest.mark.parametrize(
+        "exception_class, code",
+        [
+            (e.ParamError, -2),
+            (e.RecordNotFound, 2),
+            (e.RecordGenerationError, 3),
+            (e.RecordExistsError, 5),
+            (e.UDFNotFound, 1301),
+        ],
+    )
+    def test_pos_exception_for_code(self, exception_class, code):
+        assert exception_class.code == code
+
+    def test_pos_constructed_with_error_tuple(self):
+        exc = e.RecordNotFound(2, "not found", "src/main/client/get.c", 10, False)
+
+        assert exc.code == 2
+        assert exc.msg == "not found"
+        assert exc.file == "src/main/client/get.c"
+        assert exc.line == 10
+        assert exc.in_doubt is False
+
+    def test_pos_constructed_with_other_args(self):
+        exc = e.ParamError("bad value")
+
+        assert exc.args == ("bad value",)
+        assert exc.code == -2
+        assert exc.msg is None
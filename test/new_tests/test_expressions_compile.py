@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from aerospike_helpers.expressions import resources
+from aerospike_helpers.expressions import GT, Add, And, Def, Eq, FloatBin, IntBin, Let, ListBin, Not, Or, Var
+
+
+class TestExpressionsCompile:
+    def test_pos_compile_order(self):
+        expr = And(Eq(IntBin("a"), 1), Not(GT(IntBin("b"), "x")))
+        ops = [(op, fixed, count) for op, _, fixed, count in expr.compile()]
+
+        assert ops == [
+            (resources._ExprOp.AND, None, 3),
+            (resources._ExprOp.EQ, None, 2),
+            (resources._ExprOp.BIN, {"bin": "a"}, 0),
+            (resources._ExprOp.VAL, {"val": 1}, 0),
+            (resources._ExprOp.NOT, None, 1),
+            (resources._ExprOp.GT, None, 2),
+            (resources._ExprOp.BIN, {"bin": "b"}, 0),
+            (resources._ExprOp.VAL, {"val": "x"}, 0),
+            (resources._ExprOp._AS_EXP_CODE_END_OF_VA_ARGS, {}, 0),
+        ]
+
+    def test_pos_compile_shared_subtree(self):
+        shared = Eq(IntBin("a"), [1, 2])
+        expr = Or(shared, And(shared, Not(shared)))
+        compiled = expr.compile()
+        shared_ops = shared.compile()
+
+        assert compiled[1:4] == shared_ops
+        assert compiled[5:8] == shared_ops
+        assert compiled[9:12] == shared_ops
+
+    def test_pos_compile_literal_types_kept(self):
+        compiled = Eq(1, True).compile()
+        assert compiled[1][2] == {"val": 1}
+        assert compiled[2][2]["val"] is True
+
+    def test_pos_compile_signed_zero_kept(self):
+        compiled = Or(Eq(FloatBin("a"), 0.0), Eq(FloatBin("a"), -0.0)).compile()
+
+        assert str(compiled[3][2]["val"]) == "0.0"
+        assert str(compiled[6][2]["val"]) == "-0.0"
+
+    def test_pos_compile_equal_containers_kept(self):
+        compiled = Or(Eq(ListBin("a"), (1,)), Eq(ListBin("a"), (True,))).compile()
+
+        assert type(compiled[3][2]["val"][0]) is int
+        assert compiled[6][2]["val"][0] is True
+
+    def test_pos_compile_large_or(self):
+        terms = 100000
+        compiled = Or(*(Eq(IntBin("a"), i) for i in range(terms))).compile()
+
+        # Or, 3 ops per Eq, end of args marker.
+        assert len(compiled) == 1 + 3 * terms + 1
+        assert compiled[-2][2] == {"val": terms - 1}
+
+    def test_pos_compile_deep_nesting(self):
+        depth = 50000
+        expr = IntBin("a")
+        for _ in range(depth):
+            expr = Add(expr, 1)
+
+        assert len(expr.compile()) == 1 + depth * 3
+
+    def test_pos_compile_let(self):
+        expr = Let(Def("v", IntBin("a")), GT(Var("v"), 1))
+        assert expr.compile() == expr.compile()
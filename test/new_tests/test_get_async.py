@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import threading
 
 try:
     pass
@@ -55,6 +56,30 @@ class TestGet:
 
         await asyncio.gather(async_io(key))
 
+    def test_neg_get_async_callback_exception_attributes(self):
+        """
+        Invoke get_async() for missing records, each callback gets its own exception.
+        """
+        keys = [("test", "demo", "non-existent-key-%d" % i) for i in range(2)]
+        results = []
+        done = threading.Event()
+
+        def callback(key_tuple, record_tuple, err, exce):
+            results.append((err, exce))
+            if len(results) == len(keys):
+                done.set()
+
+        for key in keys:
+            self.as_connection.get_async(callback, key)
+        assert done.wait(5)
+
+        for err, exce in results:
+            assert isinstance(exce, e.RecordNotFound)
+            assert exce.args == err
+            assert exce.msg == err[1] and exce.msg
+            assert (exce.code, exce.file, exce.line) == (err[0], err[2], err[3])
+        assert sorted(exce.key[2] for _, exce in results) == [key[2] for key in keys]
+
     @pytest.mark.skip(reason="byte key not currently handled")
     @pytest.mark.asyncio
     async def test_get_information_using_bytes_key(self):
@@ -136,6 +161,20 @@ class TestGet:
 
         await asyncio.gather(async_io(key, policy))
 
+    @pytest.mark.asyncio
+    async def test_pos_get_same_key_concurrently(self, put_data):
+        """
+        Invoke many concurrent gets on the same key, each await gets its own result.
+        """
+        key = ("test", "demo", "async-same-key")
+        rec = {"name": "john"}
+        put_data(self.as_connection, key, rec)
+
+        results = await asyncio.gather(*(io.get(self.as_connection, key) for _ in range(100)))
+        assert len(results) == 100
+        for _, _, bins in results:
+            assert bins == rec
+
     # Negative get tests
     @pytest.mark.asyncio
     async def test_neg_get_with_no_parameter(self):
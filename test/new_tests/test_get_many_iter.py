@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import aerospike
+from aerospike import exception as e
+
+
+class TestGetManyIter(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "demo", "get_many_iter_%d" % i) for i in range(25)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"i": i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    @pytest.mark.parametrize("chunk_size, max_in_flight", [(1, 1), (4, 1), (4, 3), (1000, 2)])
+    def test_pos_records_in_key_order(self, chunk_size, max_in_flight):
+        keys = (key for key in self.keys)
+
+        records = list(
+            self.as_connection.get_many_iter(keys, chunk_size=chunk_size, max_in_flight=max_in_flight)
+        )
+
+        assert [bins["i"] for _, _, bins in records] == list(range(25))
+        assert [key[2] for key, _, _ in records] == [key[2] for key in self.keys]
+
+    def test_pos_missing_records(self):
+        keys = [self.keys[0], ("test", "demo", "get_many_iter_missing"), self.keys[1]]
+
+        records = list(self.as_connection.get_many_iter(keys, chunk_size=2))
+
+        assert records[1][1] is None and records[1][2] is None
+        assert records[2][2] == {"i": 1}
+
+    def test_pos_record_format(self):
+        records = list(self.as_connection.get_many_iter(self.keys, {"record_format": "compact"}))
+
+        assert all(isinstance(record, aerospike.Record) for record in records)
+
+    def test_pos_close_early(self):
+        with self.as_connection.get_many_iter(iter(self.keys), chunk_size=2) as records:
+            assert next(records)[2] == {"i": 0}
+
+        assert list(records) == []
+
+    def test_pos_empty(self):
+        assert list(self.as_connection.get_many_iter([])) == []
+
+    def test_neg_key_iterable_raises(self):
+        def keys():
+            yield self.keys[0]
+            raise ValueError("no more keys")
+
+        records = self.as_connection.get_many_iter(keys(), chunk_size=1)
+
+        assert next(records)[2] == {"i": 0}
+        with pytest.raises(e.ParamError):
+            next(records)
+
+    def test_neg_invalid_key(self):
+        with pytest.raises(e.ParamError):
+            list(self.as_connection.get_many_iter([self.keys[0], "not a key"]))
+
+    def test_neg_not_iterable(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many_iter(5)
+
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_in_flight": 0}])
+    def test_neg_invalid_sizes(self, kwargs):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many_iter(self.keys, **kwargs)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import threading
 from contextlib import contextmanager
 
 try:
@@ -894,3 +895,51 @@ class TestGetPut:
         assert 0 == self.as_connection.put(key, null_bin)
         with pytest.raises(e.RecordNotFound):
             res = self.as_connection.get(key)
+
+    def test_pos_put_more_blobs_than_static_pool(self):
+        """
+        Invoke put() with more blobs than used to fit in the bytes pool.
+        """
+        key = ("test", "demo", "many_blobs")
+        blobs = [bytearray(b"%d" % i) for i in range(5000)]
+        bins = {"blobs": blobs, "tuples": [(i,) for i in range(5000)]}
+
+        try:
+            assert 0 == self.as_connection.put(key, bins)
+            _, _, bins = self.as_connection.get(key)
+            assert bins["blobs"] == [bytes(b) for b in blobs]
+            assert bins["tuples"] == [(i,) for i in range(5000)]
+        finally:
+            self.as_connection.remove(key)
+
+    def test_pos_put_nested_from_threads(self):
+        """
+        Invoke put() with nested values from several threads at once.
+        """
+        def bins_for(i):
+            return {
+                "s": "str%d" % i,
+                "l": [i, 1.5, "a" * (i % 100), [i, {"k": "v%d" % i}]],
+                "m": {"n%d" % j: [j, "x" * j] for j in range(20)},
+            }
+
+        def put_records(thread_id):
+            for i in range(50):
+                key = ("test", "demo", "threaded_%d_%d" % (thread_id, i))
+                self.as_connection.put(key, bins_for(i))
+
+        threads = [threading.Thread(target=put_records, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        try:
+            for t in range(4):
+                for i in range(50):
+                    _, _, bins = self.as_connection.get(("test", "demo", "threaded_%d_%d" % (t, i)))
+                    assert bins == bins_for(i)
+        finally:
+            for t in range(4):
+                for i in range(50):
+                    self.as_connection.remove(("test", "demo", "threaded_%d_%d" % (t, i)))
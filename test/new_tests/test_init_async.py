@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.awaitable import io
+from .test_base_class import TestBaseClass
+
+
+def connect():
+    # Event loops must exist before a client connects, so every test that
+    # changes them needs its own client.
+    config = TestBaseClass.get_connection_config()
+    return aerospike.client(config).connect(config["user"], config["password"])
+
+
+class TestInitAsync:
+    @pytest.fixture(autouse=True)
+    def setup(self, request):
+        def teardown():
+            aerospike.init_async()
+
+        request.addfinalizer(teardown)
+
+    @pytest.mark.parametrize("assignment", [aerospike.ASYNC_LOOP_ROUND_ROBIN, aerospike.ASYNC_LOOP_PARTITION])
+    @pytest.mark.asyncio
+    async def test_pos_multiple_loops(self, assignment):
+        aerospike.init_async(loops=4, max_commands_in_process=50, loop_assignment=assignment)
+        stats = aerospike.async_loop_stats()
+        assert [loop["index"] for loop in stats] == [0, 1, 2, 3]
+        client = connect()
+
+        keys = [("test", "demo", "init-async-%d" % i) for i in range(20)]
+        await asyncio.gather(*(io.put(client, key, {"i": 1}) for key in keys))
+        results = await asyncio.gather(*(io.get(client, key) for key in keys * 10))
+        assert all(bins == {"i": 1} for _, _, bins in results)
+
+        for loop in aerospike.async_loop_stats():
+            assert loop["process_size"] == 0
+            assert loop["queue_size"] == 0
+
+        for key in keys:
+            client.remove(key)
+        client.close()
+
+    def test_pos_default_single_loop(self):
+        aerospike.init_async()
+        assert len(aerospike.async_loop_stats()) == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"loops": 0},
+            {"loop_assignment": 99},
+        ],
+    )
+    def test_neg_invalid_arguments(self, kwargs):
+        with pytest.raises(e.ParamError):
+            aerospike.init_async(**kwargs)
+
+    def test_neg_invalid_type(self):
+        with pytest.raises(TypeError):
+            aerospike.init_async(loops="4")
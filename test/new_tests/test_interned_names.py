@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from aerospike_helpers.operations import operations
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestInternedNames:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "demo", "interned-names-%d" % i) for i in range(3)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"name": "n%d" % i, "age": i, "ünïcode": i})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_names_shared_between_records(self):
+        records = [self.as_connection.get(key) for key in self.keys]
+
+        first_key, _, first_bins = records[0]
+        for key, _, bins in records[1:]:
+            assert key[0] is first_key[0]
+            assert key[1] is first_key[1]
+            for name in bins:
+                shared = next(n for n in first_bins if n == name)
+                assert name is shared
+
+    def test_pos_names_match_values(self):
+        _, _, bins = self.as_connection.get(self.keys[2])
+        assert bins == {"name": "n2", "age": 2, "ünïcode": 2}
+
+    def test_pos_batch_and_operate_ordered(self):
+        records = self.as_connection.get_many(self.keys)
+        names = [list(bins) for _, _, bins in records]
+        assert all(a is b for a, b in zip(names[0], names[1]))
+
+        _, _, ordered = self.as_connection.operate_ordered(self.keys[0], [operations.read("age")])
+        assert ordered[0][0] is next(n for n in names[0] if n == "age")
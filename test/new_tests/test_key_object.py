@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.batch import records as br
+from aerospike_helpers.operations import operations
+
+
+class TestKeyObject(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [aerospike.Key("test", "demo", "key_object_%d" % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            self.as_connection.put(key, {"i": i})
+
+        yield
+
+        for key in self.keys:
+            try:
+                self.as_connection.remove(key)
+            except e.AerospikeError:
+                pass
+
+    @pytest.mark.parametrize("value", ["abc", 12, bytearray(b"\x00\x01")])
+    def test_pos_matches_key_tuple(self, value):
+        key = aerospike.Key("test", "demo", value)
+        ns, set_name, primary_key, digest = key
+
+        assert (ns, set_name, primary_key) == ("test", "demo", value)
+        assert digest == self.as_connection.get_key_digest("test", "demo", value)
+        assert key.partition_id == self.as_connection.get_key_partition_id("test", "demo", value)
+
+    def test_pos_digest_key_equals_user_key(self):
+        key = self.keys[0]
+        digest_key = aerospike.Key("test", "demo", digest=bytes(key.digest))
+
+        assert digest_key.key is None
+        assert digest_key == key
+        assert hash(digest_key) == hash(key)
+        assert len({key, digest_key, self.keys[1]}) == 2
+
+    def test_pos_single_record_methods(self):
+        key = self.keys[0]
+
+        _, _, bins = self.as_connection.get(key)
+        assert bins == {"i": 0}
+
+        self.as_connection.increment(key, "i", 1)
+        _, _, bins = self.as_connection.operate(key, [operations.read("i")])
+        assert bins == {"i": 1}
+
+        _, meta = self.as_connection.exists(aerospike.Key("test", "demo", digest=key.digest))
+        assert meta is not None
+
+    def test_pos_batch_methods(self):
+        records = self.as_connection.get_many(self.keys)
+        assert [bins["i"] for _, _, bins in records] == list(range(5))
+
+        records = [r[1] for r in self.as_connection.exists_many(self.keys)]
+        assert all(meta is not None for meta in records)
+
+        res = self.as_connection.batch_write(br.BatchRecords([br.Read(key, ["i"]) for key in self.keys]))
+        assert [r.record[2]["i"] for r in res.batch_records] == list(range(5))
+
+    def test_pos_bytearray_key_is_copied(self):
+        value = bytearray(b"abc")
+        key = aerospike.Key("test", "demo", value)
+        value[0] = 0
+        key.key[0] = 0
+
+        assert key.key == bytearray(b"abc")
+        assert key.digest == self.as_connection.get_key_digest("test", "demo", bytearray(b"abc"))
+
+    def test_neg_immutable(self):
+        with pytest.raises(AttributeError):
+            self.keys[0].key = "other"
+
+    def test_neg_missing_key_and_digest(self):
+        with pytest.raises(e.ParamError):
+            aerospike.Key("test", "demo")
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            (1, "demo", "key"),
+            ("test", 1, "key"),
+            ("test", "demo", 1.5),
+            ("test", "demo", None, b"too short"),
+        ],
+    )
+    def test_neg_invalid_key(self, args):
+        with pytest.raises(e.ParamError):
+            aerospike.Key(*args)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.operations import operations
+from .test_base_class import TestBaseClass
+
+
+class TestMissingNone(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ("test", "demo", "missing_none")
+        self.missing_key = ("test", "demo", "missing_none_never_written")
+        self.as_connection.put(self.key, {"a": 1})
+
+        yield
+
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda client, key, policy: client.get(key, policy),
+            lambda client, key, policy: client.select(key, ["a"], policy),
+            lambda client, key, policy: client.exists(key, policy),
+            lambda client, key, policy: client.operate(key, [operations.read("a")], policy=policy),
+            lambda client, key, policy: client.operate_ordered(key, [operations.read("a")], policy=policy),
+        ],
+        ids=["get", "select", "exists", "operate", "operate_ordered"],
+    )
+    def test_pos_missing_none(self, call):
+        assert call(self.as_connection, self.missing_key, {"missing": "none"}) is None
+
+        _, meta, _ = call(self.as_connection, self.key, {"missing": "none"})
+        assert meta is not None
+
+    def test_pos_missing_raise(self):
+        with pytest.raises(e.RecordNotFound):
+            self.as_connection.get(self.missing_key, {"missing": "raise"})
+
+    def test_pos_exists_default_unchanged(self):
+        key, meta = self.as_connection.exists(self.missing_key)
+
+        assert key[2] == self.missing_key[2]
+        assert meta is None
+
+    def test_pos_client_config_missing(self):
+        config = TestBaseClass.get_connection_config()
+        config["missing"] = "none"
+        client = aerospike.client(config).connect(config["user"], config["password"])
+
+        try:
+            assert client.get(self.missing_key) is None
+            assert client.operate(self.missing_key, [operations.read("a")]) is None
+            with pytest.raises(e.RecordNotFound):
+                client.get(self.missing_key, {"missing": "raise"})
+        finally:
+            client.close()
+
+    def test_neg_invalid_policy_missing(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get(self.missing_key, {"missing": "ignore"})
+
+    def test_neg_invalid_client_config_missing(self):
+        config = TestBaseClass.get_connection_config()
+        config["missing"] = True
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
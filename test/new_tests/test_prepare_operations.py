@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.operations import list_operations
+from aerospike_helpers.operations import map_operations
+from aerospike_helpers.operations import operations
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestPrepareOperations:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ("test", "demo", "prepare-operations")
+        as_connection.put(self.key, {"hits": 0, "name": "a", "scores": {"x": 1}, "items": [1, 2]})
+
+        def teardown():
+            as_connection.remove(self.key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_prepare_operations(self):
+        ops = [operations.increment("hits", 1), operations.read("hits")]
+        prepared = self.as_connection.prepare_operations(ops)
+
+        assert isinstance(prepared, aerospike.PreparedOperations)
+        assert len(prepared) == 2
+        assert self.as_connection.prepare_operations(prepared) is prepared
+
+    def test_pos_operate_reused(self):
+        prepared = self.as_connection.prepare_operations(
+            [operations.increment("hits", 1), operations.read("hits")]
+        )
+
+        for i in range(1, 11):
+            _, _, bins = self.as_connection.operate(self.key, prepared)
+            assert bins == {"hits": i}
+
+    def test_pos_operate_ordered(self):
+        prepared = self.as_connection.prepare_operations(
+            [
+                operations.append("name", "b"),
+                map_operations.map_increment("scores", "x", 2),
+                list_operations.list_append("items", 3),
+                operations.read("name"),
+            ]
+        )
+
+        _, _, bins = self.as_connection.operate_ordered(self.key, prepared)
+        assert bins[-1] == ("name", "ab")
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins["scores"] == {"x": 3}
+        assert bins["items"] == [1, 2, 3]
+
+    def test_pos_operate_meta(self):
+        prepared = self.as_connection.prepare_operations([operations.write("name", "c")])
+
+        self.as_connection.operate(self.key, prepared, {"ttl": 1000})
+        _, meta = self.as_connection.exists(self.key)
+        assert 0 < meta["ttl"] <= 1000
+
+    def test_pos_list_copied(self):
+        ops = [operations.write("name", "before")]
+        prepared = self.as_connection.prepare_operations(ops)
+        ops[0]["val"] = "after"
+        ops.append(operations.write("hits", 5))
+
+        self.as_connection.operate(self.key, prepared)
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins["name"] == "before"
+        assert bins["hits"] == 0
+
+    @pytest.mark.parametrize(
+        "ops, ex",
+        [
+            ([], e.ParamError),
+            ("not a list", e.ParamError),
+            ([1], e.ParamError),
+            ([{"op": aerospike.OPERATOR_INCR, "bin": "hits"}], e.ParamError),
+        ],
+    )
+    def test_neg_prepare_operations(self, ops, ex):
+        with pytest.raises(ex):
+            self.as_connection.prepare_operations(ops)
+
+    def test_neg_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.PreparedOperations()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import operations
+from .test_base_class import TestBaseClass
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestPreparePolicy:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "demo", "prepare-policy-%d" % i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"age": i * 10})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_prepare_policy(self):
+        policy = self.as_connection.prepare_policy({"total_timeout": 1000})
+        assert isinstance(policy, aerospike.PreparedPolicy)
+        assert self.as_connection.prepare_policy(policy) is policy
+
+    def test_pos_shared_across_commands(self):
+        policy = self.as_connection.prepare_policy(
+            {"total_timeout": 1000, "max_retries": 1, "key": aerospike.POLICY_KEY_SEND}
+        )
+
+        for _ in range(10):
+            _, _, bins = self.as_connection.get(self.keys[1], policy)
+            assert bins == {"age": 10}
+            self.as_connection.put(self.keys[1], {"age": 10}, policy=policy)
+            self.as_connection.operate(self.keys[1], [operations.read("age")], policy=policy)
+            assert len(self.as_connection.get_many(self.keys, policy)) == len(self.keys)
+
+        key, _, _ = self.as_connection.get(self.keys[1], policy)
+        assert key[2] == "prepare-policy-1"
+
+    def test_pos_expressions(self):
+        policy = self.as_connection.prepare_policy({"expressions": exp.GE(exp.IntBin("age"), 20).compile()})
+
+        for _ in range(10):
+            _, _, bins = self.as_connection.get(self.keys[3], policy)
+            assert bins == {"age": 30}
+            with pytest.raises(e.FilteredOut):
+                self.as_connection.get(self.keys[1], policy)
+
+        scan = self.as_connection.scan("test", "demo")
+        ages = [bins["age"] for _, _, bins in scan.iter_results(policy) if "age" in bins]
+        assert all(age >= 20 for age in ages)
+
+    def test_pos_dict_copied(self):
+        policy_dict = {"expressions": exp.GE(exp.IntBin("age"), 20).compile()}
+        policy = self.as_connection.prepare_policy(policy_dict)
+        del policy_dict["expressions"]
+
+        with pytest.raises(e.FilteredOut):
+            self.as_connection.get(self.keys[1], policy)
+
+    def test_pos_new_client_defaults(self):
+        policy = self.as_connection.prepare_policy({"total_timeout": 1000})
+
+        # Each client may be allocated where the previous one was, it must
+        # still convert the policy against its own defaults.
+        for exists in [aerospike.POLICY_EXISTS_CREATE, aerospike.POLICY_EXISTS_IGNORE] * 2:
+            config = TestBaseClass.get_connection_config()
+            config["policies"] = dict(config.get("policies", {}), write={"exists": exists})
+            client = aerospike.client(config).connect(config["user"], config["password"])
+            try:
+                if exists == aerospike.POLICY_EXISTS_CREATE:
+                    with pytest.raises(e.RecordExistsError):
+                        client.put(self.keys[0], {"age": 0}, policy=policy)
+                else:
+                    client.put(self.keys[0], {"age": 0}, policy=policy)
+            finally:
+                client.close()
+            del client
+
+    def test_neg_invalid_field(self):
+        policy = self.as_connection.prepare_policy({"total_timeout": "soon"})
+
+        for _ in range(2):
+            with pytest.raises(e.ParamError):
+                self.as_connection.get(self.keys[1], policy)
+
+    @pytest.mark.parametrize("policy", [None, [], "policy", 1])
+    def test_neg_prepare_policy(self, policy):
+        with pytest.raises(e.ParamError):
+            self.as_connection.prepare_policy(policy)
+
+    def test_neg_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.PreparedPolicy()
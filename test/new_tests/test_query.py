@@ -598,6 +598,52 @@ class TestQuery(TestBaseClass):
         with pytest.raises(e.ParamError):
             query.results(options={"nobins": "false"})
 
+    def test_query_with_iter_results(self):
+        """
+        Invoke iter_results() with a buffer smaller than the result set
+        """
+        query = self.as_connection.query("test", "demo")
+        query.select("name", "test_age")
+        query.where(p.between("test_age", 1, 4))
+
+        records = list(query.iter_results(queue_size=1))
+        assert sorted(bins["test_age"] for _, _, bins in records) == [1, 2, 3, 4]
+
+    def test_query_with_iter_results_close(self):
+        """
+        Close the iterator of iter_results() before it is exhausted
+        """
+        query = self.as_connection.query("test", "demo")
+        query.where(p.between("test_age", 1, 4))
+
+        with query.iter_results(queue_size=1) as records:
+            first = next(records)
+        assert first is not None
+        assert list(records) == []
+
+    def test_query_with_iter_results_invalid_exp(self):
+        """
+        Errors from the query are raised by the iterator
+        """
+        expr = exp.Eq(exp.IntBin("test_age"), "bad_arg")
+
+        query = self.as_connection.query("test", "demo")
+        records = query.iter_results({"expressions": expr.compile()})
+        with pytest.raises(e.InvalidRequest):
+            list(records)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"options": False},
+            {"queue_size": 0},
+        ],
+    )
+    def test_query_with_iter_results_invalid_args(self, kwargs):
+        query = self.as_connection.query("test", "demo")
+        with pytest.raises(e.ParamError):
+            query.iter_results(**kwargs)
+
     def test_query_with_unicode_binnames_in_select_and_where(self):
         """
         Invoke query() with unicode bin names in select
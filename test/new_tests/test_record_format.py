@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Mapping
+
+import pytest
+
+import aerospike
+from aerospike import exception as e
+
+COMPACT = {"record_format": "compact"}
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestRecordFormat:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "record_format", i) for i in range(5)]
+        for i, key in enumerate(self.keys):
+            as_connection.put(key, {"i": i, "name": "rec-%d" % i})
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_many(self):
+        records = self.as_connection.get_many(self.keys, COMPACT)
+        tuples = self.as_connection.get_many(self.keys)
+
+        assert len(records) == len(self.keys)
+        for record, (key, meta, bins) in zip(records, tuples):
+            assert isinstance(record, aerospike.Record)
+            assert record.key == key
+            assert record.meta == meta
+            assert record.gen == meta["gen"]
+            assert record.ttl == meta["ttl"]
+            assert record.bins == bins
+
+    def test_pos_unpacks_like_tuple(self):
+        record = self.as_connection.get_many(self.keys[:1], COMPACT)[0]
+        key, meta, bins = record
+
+        assert len(record) == 3
+        assert (record[0], record[1], record[2]) == (key, meta, bins)
+        assert bins == {"i": 0, "name": "rec-0"}
+        with pytest.raises(IndexError):
+            record[3]
+
+    def test_pos_missing_record(self):
+        missing = ("test", "record_format", "missing")
+        record = self.as_connection.get_many([missing], COMPACT)[0]
+
+        assert record.key[2] == "missing"
+        assert record.gen is None
+        assert record.ttl is None
+        assert record.meta is None
+        assert record.bins is None
+
+    def test_pos_select_many(self):
+        records = self.as_connection.select_many(self.keys, ["i"], COMPACT)
+        assert sorted(record.bins["i"] for record in records) == list(range(5))
+        assert all("name" not in record.bins for record in records)
+
+    def test_pos_scan_results(self):
+        scan = self.as_connection.scan("test", "record_format")
+        records = scan.results(COMPACT)
+
+        assert len(records) == len(self.keys)
+        assert all(isinstance(record, aerospike.Record) for record in records)
+        assert sorted(record.bins["i"] for record in records) == list(range(5))
+
+    def test_pos_scan_foreach_and_iter_results(self):
+        records = []
+        scan = self.as_connection.scan("test", "record_format")
+        scan.foreach(records.append, COMPACT)
+        assert sorted(record.bins["i"] for record in records) == list(range(5))
+
+        scan = self.as_connection.scan("test", "record_format")
+        with scan.iter_results(COMPACT) as results:
+            assert sorted(record.bins["i"] for record in results) == list(range(5))
+
+    def test_pos_query_results(self):
+        query = self.as_connection.query("test", "record_format")
+        records = query.results(COMPACT)
+        assert all(isinstance(record, aerospike.Record) for record in records)
+        assert sorted(record.bins["i"] for record in records) == list(range(5))
+
+    def test_pos_prepared_policy(self):
+        policy = self.as_connection.prepare_policy(COMPACT)
+        records = self.as_connection.get_many(self.keys, policy)
+        assert all(isinstance(record, aerospike.Record) for record in records)
+
+    def test_pos_tuple_format(self):
+        records = self.as_connection.get_many(self.keys, {"record_format": "tuple"})
+        assert all(isinstance(record, tuple) for record in records)
+
+    @pytest.mark.parametrize("record_format", ["columns", 1, b"compact"])
+    def test_neg_invalid_record_format(self, record_format):
+        with pytest.raises(e.ParamError):
+            self.as_connection.get_many(self.keys, {"record_format": record_format})
+        with pytest.raises(e.ParamError):
+            self.as_connection.scan("test", "record_format").results({"record_format": record_format})
+
+    def test_neg_not_constructible(self):
+        with pytest.raises(TypeError):
+            aerospike.Record()
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestLazyRecordFormat:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = [("test", "record_format", "lazy-%d" % i) for i in range(3)]
+        self.bins = {
+            "i": 1,
+            "f": 1.5,
+            "s": "str",
+            "list": [1, 2, [3, 4]],
+            "map": {"a": {"b": [1, 2]}},
+        }
+        for key in self.keys:
+            as_connection.put(key, self.bins)
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def test_pos_get_many(self):
+        records = self.as_connection.get_many(self.keys, {"record_format": "lazy"})
+
+        for record in records:
+            assert isinstance(record, aerospike.Record)
+            bins = record.bins
+            assert isinstance(bins, aerospike.LazyBins)
+            assert isinstance(bins, Mapping)
+            assert len(bins) == len(self.bins)
+            assert sorted(bins) == sorted(self.bins)
+            assert sorted(bins.keys()) == sorted(self.bins)
+            assert bins["map"] == {"a": {"b": [1, 2]}}
+            assert bins["map"] is bins["map"]
+            assert bins["list"] == [1, 2, [3, 4]]
+            assert bins == self.bins
+            assert bins.to_dict() == self.bins
+            assert dict(bins.items()) == self.bins
+
+    def test_pos_access(self):
+        bins = self.as_connection.get_many(self.keys[:1], {"record_format": "lazy"})[0].bins
+
+        assert "i" in bins
+        assert "missing" not in bins
+        assert 1 not in bins
+        assert bins.get("missing") is None
+        assert bins.get("missing", 5) == 5
+        assert bins.get("s") == "str"
+        with pytest.raises(KeyError):
+            bins["missing"]
+        with pytest.raises(TypeError):
+            bins["i"] = 2
+
+    def test_pos_outlives_result_list(self):
+        scan = self.as_connection.scan("test", "record_format")
+        records = scan.results({"record_format": "lazy"})
+        bins = [record.bins for record in records if record.key[2] in ("lazy-0", "lazy-1", "lazy-2")]
+        del records
+
+        assert len(bins) == len(self.keys)
+        assert all(b["map"] == {"a": {"b": [1, 2]}} for b in bins)
+
+    def test_pos_iter_results(self):
+        query = self.as_connection.query("test", "record_format")
+        with query.iter_results({"record_format": "lazy"}) as results:
+            lists = [record.bins["list"] for record in results if "list" in record.bins]
+        assert lists == [[1, 2, [3, 4]]] * len(self.keys)
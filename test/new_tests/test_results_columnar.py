@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import array
+
+import pytest
+
+from aerospike import exception as e
+
+
+@pytest.mark.usefixtures("as_connection")
+class TestResultsColumnar:
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.keys = []
+        for i in range(10):
+            key = ("test", "columnar", i)
+            bins = {"i": i, "f": i / 2, "s": "str-%d" % i}
+            if i % 3 == 0:
+                del bins["f"]
+            if i == 5:
+                bins["mixed"] = 1.5
+            elif i % 2 == 0:
+                bins["mixed"] = i
+            as_connection.put(key, bins)
+            self.keys.append(key)
+
+        def teardown():
+            for key in self.keys:
+                as_connection.remove(key)
+
+        request.addfinalizer(teardown)
+
+    def rows(self, columns):
+        # Rows arrive in server order, so key them by the "i" column.
+        values, valid = columns["i"]
+        assert all(valid)
+        order = list(values)
+        return {
+            name: {order[row]: (col_values[row] if col_valid[row] else None) for row in range(len(order))}
+            for name, (col_values, col_valid) in columns.items()
+        }
+
+    def test_pos_scan(self):
+        columns = self.as_connection.scan("test", "columnar").results_columnar(["i", "f", "s", "mixed", "missing"])
+
+        assert set(columns) == {"i", "f", "s", "mixed", "missing"}
+        for values, valid in columns.values():
+            assert isinstance(values, array.array)
+            assert isinstance(valid, bytearray)
+            assert len(values) == len(valid) == len(self.keys)
+
+        assert columns["i"][0].typecode == "q"
+        assert columns["f"][0].typecode == "d"
+        assert columns["mixed"][0].typecode == "d"
+
+        rows = self.rows(columns)
+        assert rows["f"] == {i: (None if i % 3 == 0 else i / 2) for i in range(10)}
+        assert rows["s"] == {i: None for i in range(10)}
+        assert rows["missing"] == {i: None for i in range(10)}
+        assert rows["mixed"] == {i: (1.5 if i == 5 else float(i) if i % 2 == 0 else None) for i in range(10)}
+
+    def test_pos_invalid_rows_are_zero(self):
+        values, valid = self.as_connection.scan("test", "columnar").results_columnar(["s"])["s"]
+        assert list(values) == [0] * len(self.keys)
+        assert list(valid) == [0] * len(self.keys)
+
+    def test_pos_query(self):
+        query = self.as_connection.query("test", "columnar")
+        columns = query.results_columnar(["i", "f"])
+        assert sorted(columns["i"][0]) == list(range(10))
+
+    def test_pos_policy(self):
+        scan = self.as_connection.scan("test", "columnar")
+        columns = scan.results_columnar(["i"], {"total_timeout": 10000})
+        assert sorted(columns["i"][0]) == list(range(10))
+
+    def test_pos_empty_set(self):
+        values, valid = self.as_connection.scan("test", "columnar-empty").results_columnar(["i"])["i"]
+        assert len(values) == 0
+        assert len(valid) == 0
+
+    @pytest.mark.parametrize("bins", [None, [], "i", [1], ["i", "i"], ["a" * 16]])
+    def test_neg_invalid_bins(self, bins):
+        with pytest.raises(e.AerospikeError):
+            self.as_connection.scan("test", "columnar").results_columnar(bins)
+        with pytest.raises(e.AerospikeError):
+            self.as_connection.query("test", "columnar").results_columnar(bins)
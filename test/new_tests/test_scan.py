@@ -51,6 +51,36 @@ class TestScan(TestBaseClass):
 
         assert len(records) == self.record_count
 
+    def test_scan_with_iter_results(self):
+
+        scan_obj = self.as_connection.scan(self.test_ns, self.test_set)
+
+        records = list(scan_obj.iter_results(queue_size=2))
+
+        assert len(records) == self.record_count
+
+    def test_scan_with_iter_results_closed_early(self):
+
+        scan_obj = self.as_connection.scan(self.test_ns, self.test_set)
+
+        records = scan_obj.iter_results(queue_size=1)
+        next(records)
+        records.close()
+
+        assert list(records) == []
+        # The scan object can be run again once the iterator is closed.
+        assert len(scan_obj.results()) == self.record_count
+
+    def test_scan_with_iter_results_dropped(self):
+
+        scan_obj = self.as_connection.scan(self.test_ns, self.test_set)
+
+        records = scan_obj.iter_results(queue_size=1)
+        next(records)
+        del records
+
+        assert len(scan_obj.results()) == self.record_count
+
     def test_scan_with_existent_ns_and_none_set(self):
 
         records = []
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+import array
+import gc
+import mmap
+import time
+
+import pytest
+
+import aerospike
+from aerospike import exception as e
+from aerospike_helpers.operations import list_operations
+from .test_base_class import TestBaseClass
+
+
+class TestZeroCopyBlobs(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.key = ("test", "demo", "zero_copy_blob")
+        self.payload = bytes(range(256)) * 4096
+
+        config = TestBaseClass.get_connection_config()
+        config["blob_memoryview"] = True
+        self.view_client = aerospike.client(config).connect(config["user"], config["password"])
+
+        yield
+
+        self.view_client.close()
+        try:
+            self.as_connection.remove(self.key)
+        except e.AerospikeError:
+            pass
+
+    def test_pos_read_memoryview(self):
+        self.as_connection.put(self.key, {"blob": self.payload})
+
+        _, _, bins = self.view_client.get(self.key)
+
+        assert isinstance(bins["blob"], memoryview)
+        assert bins["blob"].readonly
+        assert bins["blob"] == self.payload
+        assert bytes(bins["blob"]) == self.payload
+
+    def test_pos_default_reads_bytes(self):
+        self.as_connection.put(self.key, {"blob": self.payload})
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert isinstance(bins["blob"], bytes)
+        assert bins["blob"] == self.payload
+
+    def test_pos_view_outlives_record(self):
+        self.as_connection.put(self.key, {"blob": self.payload})
+
+        view = self.view_client.get(self.key)[2]["blob"]
+        self.as_connection.remove(self.key)
+
+        assert view.tobytes() == self.payload
+
+    def test_pos_memoryview_in_list(self):
+        self.as_connection.put(self.key, {"blobs": [b"a", b"bc"]})
+
+        _, _, bins = self.view_client.get(self.key)
+
+        assert [bytes(v) for v in bins["blobs"]] == [b"a", b"bc"]
+        assert all(isinstance(v, memoryview) for v in bins["blobs"])
+
+    def test_pos_python_encoded_values_unchanged(self):
+        self.as_connection.put(self.key, {"tuple": (1, 2)})
+
+        _, _, bins = self.view_client.get(self.key)
+
+        assert bins["tuple"] == (1, 2)
+
+    def test_pos_write_memoryview(self):
+        self.as_connection.put(self.key, {"blob": memoryview(self.payload)[:1024]})
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert bins["blob"] == self.payload[:1024]
+
+    def test_pos_write_array_memoryview(self):
+        values = array.array("d", [1.5, 2.5, 3.5])
+        self.as_connection.put(self.key, {"blob": memoryview(values)})
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert array.array("d", bins["blob"]) == values
+
+    def test_pos_write_mmap_memoryview(self):
+        with mmap.mmap(-1, len(self.payload)) as mm:
+            mm.write(self.payload)
+            view = memoryview(mm)
+            self.as_connection.put(self.key, {"blob": view})
+            view.release()
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert bins["blob"] == self.payload
+
+    def test_pos_write_array(self):
+        values = array.array("d", [1.5, 2.5, 3.5])
+        self.as_connection.put(self.key, {"blob": values})
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert array.array("d", bins["blob"]) == values
+
+    def test_pos_write_mmap(self):
+        with mmap.mmap(-1, len(self.payload)) as mm:
+            mm.write(self.payload)
+            self.as_connection.put(self.key, {"blob": mm})
+
+        _, _, bins = self.as_connection.get(self.key)
+
+        assert bins["blob"] == self.payload
+
+    def test_pos_scan_apply_argument_outlives_call(self):
+        key = ("test", "zero_copy_apply", 1)
+        self.as_connection.put(key, {"blobs": []})
+        self.as_connection.udf_put("sample.lua", 0)
+        try:
+            scan = self.as_connection.scan("test", "zero_copy_apply")
+            scan.apply("sample", "list_append", ["blobs", bytes(self.payload[:1024])])
+            # The argument is no longer referenced from Python.
+            gc.collect()
+            [bytes(1024) for _ in range(64)]
+
+            job_id = scan.execute_background()
+            while True:
+                response = self.as_connection.job_info(job_id, aerospike.JOB_SCAN)
+                if response["status"] != aerospike.JOB_STATUS_INPROGRESS:
+                    break
+                time.sleep(0.1)
+
+            _, _, bins = self.as_connection.get(key)
+            assert bins["blobs"] == [self.payload[:1024]]
+        finally:
+            self.as_connection.remove(key)
+            self.as_connection.udf_remove("sample.lua")
+
+    def test_pos_write_memoryview_operation(self):
+        self.as_connection.put(self.key, {"blobs": []})
+        ops = [list_operations.list_append("blobs", memoryview(b"abc"))]
+
+        self.as_connection.operate(self.key, ops)
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins["blobs"] == [b"abc"]
+
+    def test_pos_round_trip_memoryview(self):
+        self.as_connection.put(self.key, {"blob": self.payload})
+        view = self.view_client.get(self.key)[2]["blob"]
+
+        self.view_client.put(self.key, {"copy": view})
+
+        _, _, bins = self.as_connection.get(self.key)
+        assert bins["copy"] == self.payload
+
+    def test_neg_write_non_contiguous_memoryview(self):
+        with pytest.raises(e.ParamError):
+            self.as_connection.put(self.key, {"blob": memoryview(self.payload)[::2]})
@@ -409,3 +409,156 @@ class TestPythonSerializer(object):
 
         assert response["normal"] == 1234
         assert isinstance(response["tuple"], bytes)
+
+
+class TestPickleProtocol(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_key = ("test", "demo", "TestPickleProtocol")
+        yield
+        try:
+            as_connection.remove(self.test_key)
+        except e.AerospikeError:
+            pass
+
+    @pytest.mark.parametrize("protocol", [0, 2, 4, -1, None])
+    def test_pickle_protocol_round_trip(self, protocol):
+        config = TestBaseClass.get_connection_config()
+        config["pickle_protocol"] = protocol
+        client = aerospike.client(config).connect(config["user"], config["password"])
+        record = {"tuple": (1, "a", 2.5), "set": {1, 2}, "some": SomeClass}
+
+        try:
+            client.put(self.test_key, record)
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert bins == record
+        _, _, bins = self.as_connection.get(self.test_key)
+        assert bins == record
+
+    @pytest.mark.parametrize("protocol", [1000, "5", True, 2.0])
+    def test_invalid_pickle_protocol(self, protocol):
+        config = TestBaseClass.get_connection_config()
+        config["pickle_protocol"] = protocol
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)
+
+
+class TestBuiltinSerializers(object):
+    @pytest.fixture(autouse=True)
+    def setup(self, request, as_connection):
+        self.test_key = ("test", "demo", "TestBuiltinSerializers")
+        yield
+        try:
+            as_connection.remove(self.test_key)
+        except e.AerospikeError:
+            pass
+
+    def builtin_client(self, name):
+        config = TestBaseClass.get_connection_config()
+        config["serialization"] = name
+        return aerospike.client(config).connect(config["user"], config["password"])
+
+    def test_json_per_call(self):
+        record = {"tuple": (1, "a", {"b": [2.5, None, True]})}
+        self.as_connection.put(self.test_key, record, serializer=aerospike.SERIALIZER_JSON)
+
+        _, _, bins = self.as_connection.get(self.test_key)
+
+        # Stored as a portable blob, a default client reads the header and the JSON text.
+        assert bins["tuple"][:4] == b"\xc1ASJ"
+        assert json.loads(bins["tuple"][4:]) == [1, "a", {"b": [2.5, None, True]}]
+
+    def test_msgpack_per_call(self):
+        self.as_connection.put(self.test_key, {"tuple": (1, "a")}, serializer=aerospike.SERIALIZER_MSGPACK)
+
+        _, _, bins = self.as_connection.get(self.test_key)
+
+        assert isinstance(bins["tuple"], bytes)
+        assert bins["tuple"][:4] == b"\xc1ASM"
+
+    @pytest.mark.parametrize("name", ["json", "msgpack"])
+    def test_client_round_trip(self, name):
+        client = self.builtin_client(name)
+        record = {
+            "tuple": (1, "a", (2, 3)),
+            "nested": {"values": [(1, 2), (3, 4)]},
+            "blob": b"\x00raw",
+        }
+
+        try:
+            client.put(self.test_key, record)
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert bins == {
+            "tuple": [1, "a", [2, 3]],
+            "nested": {"values": [[1, 2], [3, 4]]},
+            "blob": b"\x00raw",
+        }
+
+    @pytest.mark.parametrize("name", ["json", "msgpack"])
+    @pytest.mark.parametrize("blob", [b"\x01", b"1", b"42", b'"a"', b"\x91\x01", b"[1]"])
+    def test_client_raw_blob_round_trip(self, name, blob):
+        client = self.builtin_client(name)
+
+        try:
+            client.put(self.test_key, {"blob": blob, "nested": [blob]})
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert bins == {"blob": blob, "nested": [blob]}
+
+    @pytest.mark.parametrize("name", ["json", "msgpack"])
+    def test_client_reads_raw_blob_from_default_client(self, name):
+        self.as_connection.put(self.test_key, {"blob": b"42"})
+        client = self.builtin_client(name)
+
+        try:
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert bins == {"blob": b"42"}
+
+    def test_msgpack_client_set(self):
+        client = self.builtin_client("msgpack")
+
+        try:
+            client.put(self.test_key, {"set": {1, 2, 3}})
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert sorted(bins["set"]) == [1, 2, 3]
+
+    def test_client_reads_per_call_json(self):
+        self.as_connection.put(self.test_key, {"tuple": (1, 2)}, serializer=aerospike.SERIALIZER_JSON)
+        client = self.builtin_client("json")
+
+        try:
+            _, _, bins = client.get(self.test_key)
+        finally:
+            client.close()
+
+        assert bins["tuple"] == [1, 2]
+
+    @pytest.mark.parametrize(
+        "serializer, value",
+        [(aerospike.SERIALIZER_JSON, {1, 2}), (aerospike.SERIALIZER_MSGPACK, SomeClass())],
+    )
+    def test_unsupported_value(self, serializer, value):
+        with pytest.raises(e.ParamError):
+            self.as_connection.put(self.test_key, {"value": value}, serializer=serializer)
+
+    def test_unknown_builtin_serializer(self):
+        config = TestBaseClass.get_connection_config()
+        config["serialization"] = "yaml"
+
+        with pytest.raises(e.ParamError):
+            aerospike.client(config)